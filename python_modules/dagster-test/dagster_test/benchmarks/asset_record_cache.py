@@ -0,0 +1,105 @@
+# ruff: noqa: T201
+import argparse
+from collections.abc import Sequence
+
+import dagster as dg
+from dagster._core.instance import DagsterInstance
+from dagster._core.test_utils import environ
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Time repeated batched reads of the latest materializations and asset records of `--num-assets`
+assets, `--batch-size` assets at a time, with the instance's asset record caches disabled and
+enabled.
+
+Before each read, `--updates-per-read` of the assets are materialized again, so that the cached
+reads also pay for refetching the assets that were updated since the previous read.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="asset_record_cache",
+    description=DESC,
+)
+
+parser.add_argument("--num-assets", type=int, default=5000, help="Number of assets.")
+parser.add_argument(
+    "--batch-size", type=int, default=1000, help="Number of assets read in each call."
+)
+parser.add_argument(
+    "--num-reads", type=int, default=20, help="Number of reads of every batch for each mode."
+)
+parser.add_argument(
+    "--updates-per-read",
+    type=int,
+    default=10,
+    help="Number of assets materialized again before each read.",
+)
+
+
+def time_reads(
+    instance: DagsterInstance,
+    asset_keys: Sequence[dg.AssetKey],
+    batch_size: int,
+    num_reads: int,
+    updates_per_read: int,
+    session: ProfilingSession,
+    name: str,
+) -> None:
+    batches = [asset_keys[i : i + batch_size] for i in range(0, len(asset_keys), batch_size)]
+    updated_index = 0
+    with session.logged_execution_time(f"{name}, {num_reads} reads"):
+        for _ in range(num_reads):
+            for _ in range(updates_per_read):
+                instance.report_runless_asset_event(
+                    dg.AssetMaterialization(asset_keys[updated_index % len(asset_keys)])
+                )
+                updated_index += 1
+            for batch in batches:
+                instance.get_latest_materialization_events(batch)
+                instance.get_asset_records(batch)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, batch_size: int, num_reads: int, updates_per_read: int) -> None:
+    session = ProfilingSession(
+        name="Asset record cache",
+        experiment_settings={
+            "num_assets": num_assets,
+            "batch_size": batch_size,
+            "num_reads": num_reads,
+            "updates_per_read": updates_per_read,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    asset_keys = [dg.AssetKey(f"asset_{i}") for i in range(num_assets)]
+    with dg.instance_for_test() as instance:
+        with session.logged_execution_time("Materialize assets"):
+            for asset_key in asset_keys:
+                instance.report_runless_asset_event(dg.AssetMaterialization(asset_key))
+
+        time_reads(
+            instance, asset_keys, batch_size, num_reads, updates_per_read, session, "Uncached"
+        )
+
+        with environ({"DAGSTER_ASSET_RECORD_CACHE_SIZE": str(num_assets)}):
+            cached_instance = DagsterInstance.from_ref(instance.get_ref())
+        time_reads(
+            cached_instance, asset_keys, batch_size, num_reads, updates_per_read, session, "Cached"
+        )
+        for method_name, stats in cached_instance.get_asset_record_cache_stats().items():
+            print(f"{method_name}: {stats}")
+        cached_instance.dispose()
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.batch_size, args.num_reads, args.updates_per_read)
@@ -0,0 +1,152 @@
+# ruff: noqa: T201
+import argparse
+import datetime
+import random
+from collections.abc import Sequence
+from typing import AbstractSet  # noqa: UP035
+from unittest import mock
+
+import dagster as dg
+from dagster._core.definitions.asset_key import EntityKey
+from dagster._core.definitions.assets.graph.base_asset_graph import BaseAssetGraph
+from dagster._core.definitions.declarative_automation import automation_condition_evaluator
+from dagster._core.instance import DagsterInstance
+from dagster._time import get_current_datetime
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Time the evaluation of the automation conditions of a synthetic graph of `--num-assets` assets,
+split into disconnected components of `--component-size` assets each. Each component has a random
+number of topological levels, up to `--max-depth`, and each of its assets depends on up to two
+assets of the level above.
+
+Each evaluation is run with the independent components of the graph evaluated concurrently, and
+with every asset of a topological level evaluated before any asset of the next level, as the
+evaluator did before components were evaluated independently.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="automation_condition_components",
+    description=DESC,
+)
+
+parser.add_argument("--num-assets", type=int, default=50000, help="Number of assets in the graph.")
+parser.add_argument(
+    "--component-size", type=int, default=20, help="Number of assets in each component."
+)
+parser.add_argument(
+    "--max-depth", type=int, default=10, help="Maximum number of levels of a component."
+)
+parser.add_argument(
+    "--num-evaluations", type=int, default=2, help="Number of evaluations for each mode."
+)
+parser.add_argument("--seed", type=int, default=0, help="Seed for the generated graph.")
+
+
+def build_component_specs(
+    num_assets: int, component_size: int, max_depth: int, seed: int
+) -> Sequence[dg.AssetSpec]:
+    rng = random.Random(seed)
+    specs = []
+    for component_index in range(num_assets // component_size):
+        depth = rng.randint(1, min(max_depth, component_size))
+        levels: list[list[dg.AssetKey]] = [[] for _ in range(depth)]
+        for i in range(component_size):
+            level_index = i % depth
+            key = dg.AssetKey(f"c{component_index}_{i}")
+            parent_level = levels[level_index - 1] if level_index > 0 else []
+            specs.append(
+                dg.AssetSpec(
+                    key,
+                    deps=rng.sample(parent_level, k=min(2, len(parent_level))),
+                    automation_condition=dg.AutomationCondition.eager(),
+                )
+            )
+            levels[level_index].append(key)
+    return specs
+
+
+def build_defs(specs: Sequence[dg.AssetSpec]) -> dg.Definitions:
+    # a single subsettable multi-asset, so that each asset is its own execution set
+    @dg.multi_asset(specs=specs, can_subset=True)
+    def synthetic_assets(context: dg.AssetExecutionContext):
+        for key in context.selected_asset_keys:
+            yield dg.MaterializeResult(asset_key=key)
+
+    return dg.Definitions(assets=[synthetic_assets])
+
+
+def _get_level_by_level_groups(
+    asset_graph: BaseAssetGraph, entity_keys: AbstractSet[EntityKey]
+) -> Sequence[Sequence[Sequence[EntityKey]]]:
+    # a single group holding every key, so that each level waits on the whole previous level
+    levels = [
+        [key for key in topo_level if key in entity_keys]
+        for topo_level in asset_graph.toposorted_entity_keys_by_level
+    ]
+    return [[level for level in levels if level]]
+
+
+def time_evaluations(
+    defs: dg.Definitions, num_evaluations: int, session: ProfilingSession, name: str
+) -> None:
+    instance = DagsterInstance.ephemeral()
+    cursor = None
+    evaluation_time = get_current_datetime()
+    for i in range(num_evaluations):
+        with session.logged_execution_time(f"{name}, evaluation {i + 1}"):
+            result = dg.evaluate_automation_conditions(
+                defs=defs, instance=instance, cursor=cursor, evaluation_time=evaluation_time
+            )
+        cursor = result.cursor
+        evaluation_time += datetime.timedelta(minutes=1)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(
+    num_assets: int, component_size: int, max_depth: int, num_evaluations: int, seed: int
+) -> None:
+    session = ProfilingSession(
+        name="Automation condition evaluation of independent components",
+        experiment_settings={
+            "num_assets": num_assets,
+            "component_size": component_size,
+            "max_depth": max_depth,
+            "num_evaluations": num_evaluations,
+            "seed": seed,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    with session.logged_execution_time("Build definitions"):
+        defs = build_defs(build_component_specs(num_assets, component_size, max_depth, seed))
+        asset_graph = defs.resolve_asset_graph()
+        entity_keys = {node.key for node in asset_graph.nodes}
+
+    with session.logged_execution_time("Split graph into independent components"):
+        groups = automation_condition_evaluator.get_independent_entity_key_levels(
+            asset_graph, entity_keys
+        )
+    print(f"{len(groups)} independent components")
+
+    time_evaluations(defs, num_evaluations, session, "Independent components")
+
+    with mock.patch.object(
+        automation_condition_evaluator,
+        "get_independent_entity_key_levels",
+        _get_level_by_level_groups,
+    ):
+        time_evaluations(defs, num_evaluations, session, "Level by level")
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.component_size, args.max_depth, args.num_evaluations, args.seed)
@@ -0,0 +1,226 @@
+# ruff: noqa: T201
+import argparse
+import random
+import statistics
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from typing import AbstractSet, Optional  # noqa: UP035
+
+from dagster._core.execution.plan.critical_path import (
+    get_critical_path_lengths,
+    get_node_key,
+    simulate_makespan,
+)
+from dagster._core.execution.stats import StepEventStatus
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunsFilter
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the makespan of runs whose steps are started in the default order with that of the same runs
+when steps are prioritized by their remaining critical path (the `dagster/step_prioritization:
+critical_path` run tag), when at most `--max-concurrent` steps execute at once.
+
+Runs are simulated rather than executed. With `--job-name`, the benchmark replays the most recent
+`--num-runs` successful runs of the job recorded in the instance at DAGSTER_HOME, using the
+dependencies in each run's execution plan and the recorded duration of each of its steps. The
+critical path of each run is estimated from the durations of its steps in the other replayed runs,
+as it would be from the job's previous runs. Steps mapped over a dynamic output are replayed as a
+single step per node, taking the median duration of the node's steps.
+
+Without `--job-name`, the benchmark generates `--num-runs` random plans of `--num-steps` steps, in
+which each step depends on up to 3 earlier steps and takes a random duration, and estimates the
+critical path from durations perturbed by up to 50%.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="critical_path_prioritization",
+    description=DESC,
+)
+
+parser.add_argument("--job-name", type=str, default=None, help="Replay recorded runs of this job.")
+parser.add_argument("--num-runs", type=int, default=5, help="Number of runs to simulate.")
+parser.add_argument(
+    "--num-steps", type=int, default=200, help="Number of steps in each generated plan."
+)
+parser.add_argument(
+    "--max-concurrent", type=int, default=8, help="Number of steps executed concurrently."
+)
+parser.add_argument("--seed", type=int, default=0, help="Seed for generated plans.")
+
+
+class SimulatedRun:
+    def __init__(
+        self,
+        name: str,
+        step_deps: Mapping[str, AbstractSet[str]],
+        durations: Mapping[str, float],
+        estimated_durations: Mapping[str, float],
+    ):
+        self.name = name
+        self.step_deps = step_deps
+        self.durations = durations
+        self.estimated_durations = estimated_durations
+
+
+# ########################
+# ##### RECORDED RUNS
+# ########################
+
+
+def _get_recorded_node_deps(
+    instance: DagsterInstance, run: DagsterRun
+) -> Mapping[str, AbstractSet[str]]:
+    snapshot = instance.get_execution_plan_snapshot(run.execution_plan_snapshot_id)
+    node_deps: dict[str, set[str]] = defaultdict(set)
+    for step in snapshot.steps:
+        node = get_node_key(step.key)
+        node_deps[node].update(
+            get_node_key(handle.step_key)
+            for step_input in step.inputs
+            for handle in step_input.upstream_output_handles
+            if get_node_key(handle.step_key) != node
+        )
+    return node_deps
+
+
+def _get_recorded_node_durations(instance: DagsterInstance, run_id: str) -> Mapping[str, float]:
+    durations: dict[str, list[float]] = defaultdict(list)
+    for step_stats in instance.get_run_step_stats(run_id):
+        if (
+            step_stats.status == StepEventStatus.SUCCESS
+            and step_stats.start_time is not None
+            and step_stats.end_time is not None
+        ):
+            durations[get_node_key(step_stats.step_key)].append(
+                step_stats.end_time - step_stats.start_time
+            )
+    return {node: statistics.median(node_durations) for node, node_durations in durations.items()}
+
+
+def get_recorded_runs(job_name: str, num_runs: int) -> Sequence[SimulatedRun]:
+    with DagsterInstance.get() as instance:
+        runs = instance.get_runs(
+            filters=RunsFilter(job_name=job_name, statuses=[DagsterRunStatus.SUCCESS]),
+            limit=num_runs,
+        )
+        recorded = [
+            (
+                run.run_id,
+                _get_recorded_node_deps(instance, run),
+                _get_recorded_node_durations(instance, run.run_id),
+            )
+            for run in runs
+        ]
+
+    simulated_runs = []
+    for run_id, node_deps, durations in recorded:
+        # only the steps that executed in the run are replayed
+        step_deps = {
+            node: {dep for dep in deps if dep in durations}
+            for node, deps in node_deps.items()
+            if node in durations
+        }
+        other_durations: dict[str, list[float]] = defaultdict(list)
+        for other_run_id, _, other_run_durations in recorded:
+            if other_run_id != run_id:
+                for node, duration in other_run_durations.items():
+                    other_durations[node].append(duration)
+        estimated_durations = {
+            node: statistics.median(node_durations)
+            for node, node_durations in other_durations.items()
+        }
+        simulated_runs.append(SimulatedRun(run_id, step_deps, durations, estimated_durations))
+
+    return simulated_runs
+
+
+# ########################
+# ##### GENERATED RUNS
+# ########################
+
+
+def get_generated_runs(num_runs: int, num_steps: int, seed: int) -> Sequence[SimulatedRun]:
+    rng = random.Random(seed)
+    simulated_runs = []
+    for i in range(num_runs):
+        step_keys = [f"step_{j:04d}" for j in range(num_steps)]
+        step_deps = {
+            step_key: set(rng.sample(step_keys[:j], min(j, rng.randint(0, 3))))
+            for j, step_key in enumerate(step_keys)
+        }
+        # a few long steps among many short ones, as is typical of real jobs
+        durations = {step_key: rng.lognormvariate(0, 1.5) for step_key in step_keys}
+        estimated_durations = {
+            step_key: duration * rng.uniform(0.5, 1.5) for step_key, duration in durations.items()
+        }
+        simulated_runs.append(
+            SimulatedRun(f"generated_{i}", step_deps, durations, estimated_durations)
+        )
+    return simulated_runs
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(
+    job_name: Optional[str], num_runs: int, num_steps: int, max_concurrent: int, seed: int
+) -> None:
+    session = ProfilingSession(
+        name="Critical path prioritization",
+        experiment_settings={
+            "job_name": job_name,
+            "num_runs": num_runs,
+            "num_steps": num_steps if not job_name else None,
+            "max_concurrent": max_concurrent,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    with session.logged_execution_time("Load runs"):
+        simulated_runs = (
+            get_recorded_runs(job_name, num_runs)
+            if job_name
+            else get_generated_runs(num_runs, num_steps, seed)
+        )
+
+    makespans: list[tuple[str, float, float]] = []
+    with session.logged_execution_time(f"Simulate {len(simulated_runs)} runs"):
+        for simulated_run in simulated_runs:
+            lengths = get_critical_path_lengths(
+                simulated_run.step_deps, simulated_run.estimated_durations
+            )
+            makespans.append(
+                (
+                    simulated_run.name,
+                    simulate_makespan(
+                        simulated_run.step_deps,
+                        simulated_run.durations,
+                        max_concurrent,
+                        lambda _step_key: 0.0,
+                    ),
+                    simulate_makespan(
+                        simulated_run.step_deps,
+                        simulated_run.durations,
+                        max_concurrent,
+                        lambda step_key: -lengths[step_key],
+                    ),
+                )
+            )
+
+    session.log_result_summary()
+
+    print()
+    print("Simulated makespan in seconds, default order -> critical path order:")
+    for name, default_makespan, critical_path_makespan in makespans:
+        gain = 1 - critical_path_makespan / default_makespan if default_makespan else 0.0
+        print(f"  {name}: {default_makespan:.2f} -> {critical_path_makespan:.2f} ({gain:.1%} less)")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.job_name, args.num_runs, args.num_steps, args.max_concurrent, args.seed)
@@ -0,0 +1,160 @@
+# ruff: noqa: T201
+import argparse
+import multiprocessing
+import os
+import time
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+
+import dagster as dg
+from dagster._core.events import DagsterEventType
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze how long the multiprocess executor takes to start step processes, for a job whose code
+location is slow to load. The job has `--num-ops` independent no-op ops, and loading its definition
+sleeps for `--definition-load-seconds`, standing in for importing and building a large code
+location.
+
+The job is executed with each of the following start methods, each in a new process, since the
+forkserver is started only once per process:
+
+    spawn: each step process starts a new interpreter and loads the code location.
+    forkserver: step processes fork from a server that has imported the job's module, but still
+        build the definition.
+    warm forkserver: the forkserver has also loaded the job's definition (`preload_definitions`),
+        so step processes fork with it already loaded.
+    worker pool: steps run in long-lived worker processes that load the definition once each.
+
+Besides the total execution time, the mean time from a step's process being launched to the step
+starting is reported for each start method.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="multiprocess_step_startup",
+    description=DESC,
+)
+
+parser.add_argument("--num-ops", type=int, default=16, help="Number of ops in the job.")
+parser.add_argument(
+    "--max-concurrent", type=int, default=4, help="Number of steps executed concurrently."
+)
+parser.add_argument(
+    "--definition-load-seconds",
+    type=float,
+    default=1.0,
+    help="Seconds spent loading the job definition, in each process that loads it.",
+)
+
+_NUM_OPS_ENV_VAR = "DAGSTER_BENCHMARK_NUM_OPS"
+_DEFINITION_LOAD_SECONDS_ENV_VAR = "DAGSTER_BENCHMARK_DEFINITION_LOAD_SECONDS"
+
+START_METHOD_CONFIGS: Mapping[str, Mapping[str, object]] = {
+    "spawn": {"start_method": {"spawn": {}}},
+    "forkserver": {"start_method": {"forkserver": {}}},
+    "warm forkserver": {"start_method": {"forkserver": {"preload_definitions": True}}},
+    "worker pool": {"start_method": {"spawn": {}}, "worker_pool": {}},
+}
+
+
+def define_startup_benchmark_job() -> dg.JobDefinition:
+    time.sleep(float(os.environ[_DEFINITION_LOAD_SECONDS_ENV_VAR]))
+
+    @dg.op
+    def noop() -> None:
+        pass
+
+    @dg.job
+    def startup_benchmark_job():
+        for i in range(int(os.environ[_NUM_OPS_ENV_VAR])):
+            noop.alias(f"noop_{i}")()
+
+    return startup_benchmark_job
+
+
+def execute_startup_benchmark_job(
+    executor_config: Mapping[str, object],
+    num_ops: int,
+    max_concurrent: int,
+    definition_load_seconds: float,
+) -> float:
+    """Executes the job, returning the mean seconds between launching a step's process and the step
+    starting.
+    """
+    # read when the definition is loaded in step processes, which inherit the environment
+    os.environ[_NUM_OPS_ENV_VAR] = str(num_ops)
+    os.environ[_DEFINITION_LOAD_SECONDS_ENV_VAR] = str(definition_load_seconds)
+
+    with dg.instance_for_test() as instance:
+        with dg.execute_job(
+            dg.reconstructable(define_startup_benchmark_job),
+            instance=instance,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {"max_concurrent": max_concurrent, **executor_config}
+                    }
+                }
+            },
+        ) as result:
+            assert result.success
+            launched_at: dict[str, float] = {}
+            started_at: dict[str, float] = {}
+            for record in instance.all_logs(result.run_id):
+                if not record.dagster_event or not record.step_key:
+                    continue
+                if record.dagster_event_type == DagsterEventType.STEP_WORKER_STARTING:
+                    launched_at[record.step_key] = record.timestamp
+                elif record.dagster_event_type == DagsterEventType.STEP_START:
+                    started_at[record.step_key] = record.timestamp
+
+            return sum(started_at[key] - launched_at[key] for key in started_at) / len(started_at)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_ops: int, max_concurrent: int, definition_load_seconds: float) -> None:
+    session = ProfilingSession(
+        name="Multiprocess step startup",
+        experiment_settings={
+            "num_ops": num_ops,
+            "max_concurrent": max_concurrent,
+            "definition_load_seconds": definition_load_seconds,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    # submitted from the imported module rather than from __main__, so that the job is reconstructed
+    # from the module in every process
+    from dagster_test.benchmarks.multiprocess_step_startup import execute_startup_benchmark_job
+
+    mean_startup_seconds: dict[str, float] = {}
+    for name, executor_config in START_METHOD_CONFIGS.items():
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            with session.logged_execution_time(f"Execute {num_ops} ops, {name}"):
+                mean_startup_seconds[name] = executor.submit(
+                    execute_startup_benchmark_job,
+                    executor_config,
+                    num_ops,
+                    max_concurrent,
+                    definition_load_seconds,
+                ).result()
+
+    session.log_result_summary()
+
+    print()
+    print("Mean seconds from launching a step to the step starting:")
+    for name, seconds in mean_startup_seconds.items():
+        print(f"  {name}: {seconds:.2f}")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_ops, args.max_concurrent, args.definition_load_seconds)
@@ -0,0 +1,197 @@
+# ruff: noqa: T201
+import argparse
+import logging
+import os
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from unittest import mock
+
+import dagster as dg
+import sqlalchemy as db
+from dagster._core.instance import DagsterInstance
+from dagster._core.remote_representation.origin import InProcessCodeLocationOrigin
+from dagster._core.test_utils import freeze_time
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._core.workspace.context import WorkspaceProcessContext
+from dagster._core.workspace.load_target import InProcessWorkspaceLoadTarget
+from dagster._daemon.sensor import execute_sensor_iteration
+from dagster._time import get_current_datetime
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Count the database statements that each iteration of the sensor daemon executes against the
+instance's storage, for code locations with each of `--num-sensors` sensors.
+
+Every sensor is evaluated in each iteration. A `--failing-fraction` of the sensors raise an error
+when evaluated, so that the daemon must read their latest tick on each iteration to carry over
+their failure count, as it does for every sensor in the first iteration after the daemon starts.
+Each iteration is run with the latest ticks of the sensors read in one batched query, and with
+them read one sensor at a time, as for storages that do not support batched tick queries.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="sensor_daemon_db_calls",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-sensors",
+    type=int,
+    nargs="+",
+    default=[100, 500, 2000],
+    help="Numbers of sensors to measure.",
+)
+parser.add_argument(
+    "--failing-fraction",
+    type=float,
+    default=0.5,
+    help="Fraction of the sensors that raise an error when evaluated.",
+)
+parser.add_argument(
+    "--num-iterations", type=int, default=3, help="Number of iterations to run for each count."
+)
+
+_NUM_SENSORS_ENV_VAR = "DAGSTER_BENCHMARK_NUM_SENSORS"
+_FAILING_FRACTION_ENV_VAR = "DAGSTER_BENCHMARK_FAILING_FRACTION"
+
+# sensors are evaluated at most once per interval, so each iteration is run this far apart
+ITERATION_INTERVAL_SECONDS = 60
+
+
+@dg.op
+def noop() -> None:
+    pass
+
+
+@dg.job
+def sensor_target_job():
+    noop()
+
+
+def _build_sensor(i: int, fails: bool) -> dg.SensorDefinition:
+    @dg.sensor(
+        name=f"sensor_{i}",
+        job=sensor_target_job,
+        minimum_interval_seconds=ITERATION_INTERVAL_SECONDS,
+        default_status=dg.DefaultSensorStatus.RUNNING,
+    )
+    def _sensor():
+        if fails:
+            raise Exception("failed")
+        return dg.SkipReason("nothing to do")
+
+    return _sensor
+
+
+def define_sensor_benchmark_defs() -> dg.Definitions:
+    num_sensors = int(os.environ[_NUM_SENSORS_ENV_VAR])
+    num_failing = int(num_sensors * float(os.environ[_FAILING_FRACTION_ENV_VAR]))
+    return dg.Definitions(
+        jobs=[sensor_target_job],
+        sensors=[_build_sensor(i, fails=i < num_failing) for i in range(num_sensors)],
+    )
+
+
+@contextmanager
+def _count_statements() -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    # the sqlite storages create an engine per connection, so every engine is listened to
+    db.event.listen(db.engine.Engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        db.event.remove(db.engine.Engine, "before_cursor_execute", _before_cursor_execute)
+
+
+def count_iteration_statements(
+    num_sensors: int, failing_fraction: float, num_iterations: int, batched: bool
+) -> Sequence[int]:
+    """Runs the sensor daemon's iterations, returning the number of statements executed by each."""
+    os.environ[_NUM_SENSORS_ENV_VAR] = str(num_sensors)
+    os.environ[_FAILING_FRACTION_ENV_VAR] = str(failing_fraction)
+    logger = logging.getLogger("sensor_daemon_db_calls")
+    logger.setLevel(logging.CRITICAL)
+
+    counts = []
+    with (
+        dg.instance_for_test() as instance,
+        mock.patch.object(
+            DagsterInstance,
+            "supports_batch_tick_queries",
+            new_callable=mock.PropertyMock,
+            return_value=batched,
+        ),
+        WorkspaceProcessContext(
+            instance,
+            InProcessWorkspaceLoadTarget(
+                InProcessCodeLocationOrigin(
+                    LoadableTargetOrigin(
+                        module_name="dagster_test.benchmarks.sensor_daemon_db_calls",
+                        attribute="define_sensor_benchmark_defs",
+                    ),
+                ),
+            ),
+        ) as workspace_context,
+    ):
+        start = get_current_datetime()
+        for i in range(num_iterations):
+            with freeze_time(start.timestamp() + i * ITERATION_INTERVAL_SECONDS):
+                with _count_statements() as statements:
+                    list(
+                        execute_sensor_iteration(
+                            workspace_context,
+                            logger,
+                            threadpool_executor=None,
+                            submit_threadpool_executor=None,
+                        )
+                    )
+                counts.append(len(statements))
+
+    return counts
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_sensors: Sequence[int], failing_fraction: float, num_iterations: int) -> None:
+    session = ProfilingSession(
+        name="Sensor daemon DB calls",
+        experiment_settings={
+            "num_sensors": num_sensors,
+            "failing_fraction": failing_fraction,
+            "num_iterations": num_iterations,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    results: dict[tuple[int, bool], Sequence[int]] = {}
+    for count in num_sensors:
+        for batched in [True, False]:
+            name = "batched" if batched else "unbatched"
+            with session.logged_execution_time(f"{count} sensors, {name}"):
+                results[(count, batched)] = count_iteration_statements(
+                    count, failing_fraction, num_iterations, batched
+                )
+
+    session.log_result_summary()
+
+    print()
+    print("Database statements per iteration (first iteration, then later iterations):")
+    for (count, batched), counts in results.items():
+        name = "batched" if batched else "unbatched"
+        later = ", ".join(str(c) for c in counts[1:])
+        print(f"  {count} sensors, {name}: {counts[0]}; {later}")
+        print(f"    per sensor: {', '.join(f'{c / count:.2f}' for c in counts)}")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_sensors, args.failing_fraction, args.num_iterations)
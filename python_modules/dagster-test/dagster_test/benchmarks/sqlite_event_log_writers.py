@@ -0,0 +1,117 @@
+# ruff: noqa: T201
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log import SqliteEventLogStorage
+from dagster._core.test_utils import environ
+from dagster._core.utils import make_new_run_id
+from dagster._time import get_current_timestamp
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze event throughput of the run-sharded SQLite event log storage when many threads write events
+concurrently, as the daemon's sensor and backfill thread pools do. Each writer thread stores
+`--num-events` engine events for its own run, and also reads back the events for its run after each
+write, like a run's event watcher would.
+
+The same workload is run once with a new engine per connection (the default), and once with
+`DAGSTER_SQLITE_SHARD_POOL_SIZE` set to `--pool-size`, which keeps an engine and connection open
+for the most recently used shards.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="sqlite_event_log_writers",
+    description=DESC,
+)
+
+parser.add_argument("--num-writers", type=int, default=16, help="Number of writer threads.")
+parser.add_argument(
+    "--num-events", type=int, default=200, help="Number of events stored by each writer."
+)
+parser.add_argument(
+    "--pool-size",
+    type=int,
+    default=8,
+    help=(
+        "Value of DAGSTER_SQLITE_SHARD_POOL_SIZE for the pooled run. Set below `--num-writers` to"
+        " include the cost of evicting shard engines."
+    ),
+)
+
+
+def _engine_event(run_id: str, message: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message=message,
+        run_id=run_id,
+        timestamp=get_current_timestamp(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            "nonce",
+            event_specific_data=EngineEventData.in_process(999),
+        ),
+    )
+
+
+def _write_events(storage: SqliteEventLogStorage, num_events: int) -> None:
+    run_id = make_new_run_id()
+    for i in range(num_events):
+        storage.store_event(_engine_event(run_id, str(i)))
+        storage.get_records_for_run(run_id, limit=1, ascending=False)
+
+
+def run_workload(session: ProfilingSession, name: str, num_writers: int, num_events: int) -> None:
+    with tempfile.TemporaryDirectory() as base_dir:
+        storage = SqliteEventLogStorage(base_dir)
+        try:
+            with session.logged_execution_time(name):
+                with ThreadPoolExecutor(max_workers=num_writers) as executor:
+                    for future in [
+                        executor.submit(_write_events, storage, num_events)
+                        for _ in range(num_writers)
+                    ]:
+                        future.result()
+        finally:
+            storage.dispose()
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_writers: int, num_events: int, pool_size: int) -> None:
+    session = ProfilingSession(
+        name="SQLite event log writers",
+        experiment_settings={
+            "num_writers": num_writers,
+            "num_events": num_events,
+            "pool_size": pool_size,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    total_events = num_writers * num_events
+    with environ({"DAGSTER_SQLITE_SHARD_POOL_SIZE": "0"}):
+        run_workload(session, f"Store {total_events} events, unpooled", num_writers, num_events)
+
+    with environ({"DAGSTER_SQLITE_SHARD_POOL_SIZE": str(pool_size)}):
+        run_workload(
+            session,
+            f"Store {total_events} events, pooled ({pool_size} shards)",
+            num_writers,
+            num_events,
+        )
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_writers, args.num_events, args.pool_size)
@@ -255,6 +255,7 @@
     multi_or_in_process_executor as multi_or_in_process_executor,
     multiple_process_executor_requirements as multiple_process_executor_requirements,
     multiprocess_executor as multiprocess_executor,
+    threadpool_executor as threadpool_executor,
 )
 from dagster._core.definitions.freshness_policy import (
     LegacyFreshnessPolicy as LegacyFreshnessPolicy,
@@ -591,6 +592,7 @@
     custom_path_fs_io_manager as custom_path_fs_io_manager,
     fs_io_manager as fs_io_manager,
 )
+from dagster._core.storage.handoff_io_manager import HandoffIOManager as HandoffIOManager
 from dagster._core.storage.input_manager import (
     InputManager as InputManager,
     InputManagerDefinition as InputManagerDefinition,
@@ -509,6 +509,7 @@ def _execute_step_command_body(
             step_keys_to_execute=args.step_keys_to_execute,
             known_state=args.known_state,
             repository_load_data=repository_load_data,
+            job_snapshot_id=dagster_run.job_snapshot_id,
         )
 
         yield from execute_plan_iterator(
@@ -1,4 +1,5 @@
 import os
+from datetime import timedelta
 
 import click
 
@@ -87,6 +88,48 @@ def reindex_command():
         instance.reindex(click.echo)
 
 
+@instance_cli.command(
+    name="archive-event-logs",
+    help=(
+        "Move the events of finished runs out of the event log table and into the event log archive"
+        " configured in the `event_log_archive` instance settings."
+    ),
+)
+@click.option(
+    "--older-than-days",
+    type=click.INT,
+    help=(
+        "Archive runs that finished at least this many days ago. Defaults to the `older_than_days`"
+        " instance setting."
+    ),
+)
+@click.option("--limit", type=click.INT, help="The maximum number of runs to archive.")
+def archive_event_logs_command(older_than_days, limit):
+    from dagster._core.storage.event_log.archive import archive_event_logs
+
+    with get_instance_for_cli() as instance:
+        if instance.event_log_archive_store is None:
+            raise click.ClickException(
+                "No event log archive store is configured. Set `event_log_archive` in your"
+                " dagster.yaml to archive event logs."
+            )
+        if older_than_days is None and (
+            instance.get_settings("event_log_archive").get("older_than_days") is None
+        ):
+            raise click.ClickException(
+                "Must either pass `--older-than-days` or set `older_than_days` in the"
+                " `event_log_archive` instance settings."
+            )
+
+        archived_run_ids = archive_event_logs(
+            instance,
+            older_than=timedelta(days=older_than_days) if older_than_days is not None else None,
+            limit=limit,
+            print_fn=click.echo,
+        )
+        click.echo(f"Archived the event logs of {len(archived_run_ids)} runs.")
+
+
 @instance_cli.group(name="concurrency")
 def concurrency_cli():
     """Commands for working with the instance-wide op concurrency."""
@@ -1,5 +1,6 @@
 import asyncio
 import datetime
+import itertools
 import logging
 from collections import defaultdict
 from collections.abc import Mapping, Sequence
@@ -25,6 +26,58 @@
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 
+def get_independent_entity_key_levels(
+    asset_graph: BaseAssetGraph, entity_keys: AbstractSet[EntityKey]
+) -> Sequence[Sequence[Sequence[EntityKey]]]:
+    """Splits the entity keys into groups whose conditions can be evaluated independently of each
+    other, and returns the topological levels of each group.
+
+    Two keys are in the same group if one is a parent of the other, or if they belong to the same
+    execution set, as the evaluation of a key reads the requests of its parents, and sets the
+    requests of the other keys in its execution set. The groups are ordered by their first key in
+    topological order.
+    """
+    # union-find over the evaluated keys, along with the keys of their execution sets, which may
+    # not be evaluated but still have their requests set
+    component_roots: dict[EntityKey, EntityKey] = {}
+    entity_keys = {key for key in entity_keys if asset_graph.has(key)}
+
+    def _find(key: EntityKey) -> EntityKey:
+        root = component_roots.setdefault(key, key)
+        while component_roots[root] != root:
+            root = component_roots[root]
+        while component_roots[key] != root:
+            component_roots[key], key = root, component_roots[key]
+        return root
+
+    def _union(key: EntityKey, other_key: EntityKey) -> None:
+        root, other_root = _find(key), _find(other_key)
+        if root != other_root:
+            component_roots[other_root] = root
+
+    for key in entity_keys:
+        _find(key)
+        node = asset_graph.get(key)
+        if isinstance(node, BaseAssetNode):
+            for execution_set_key in node.execution_set_entity_keys:
+                _union(key, execution_set_key)
+
+    for key in entity_keys:
+        for parent_key in asset_graph.get(key).parent_entity_keys:
+            if parent_key in component_roots:
+                _union(key, parent_key)
+
+    levels_by_component: dict[EntityKey, dict[int, list[EntityKey]]] = {}
+    for level_index, topo_level in enumerate(asset_graph.toposorted_entity_keys_by_level):
+        for key in topo_level:
+            if key in entity_keys:
+                levels_by_component.setdefault(_find(key), defaultdict(list))[level_index].append(
+                    key
+                )
+
+    return [list(levels.values()) for levels in levels_by_component.values()]
+
+
 class AutomationConditionEvaluator:
     def __init__(
         self,
@@ -122,9 +175,11 @@ async def _async_evaluate(
         num_conditions = len(self.entity_keys)
         num_evaluated = 0
 
-        async def _evaluate_entity_async(entity_key: EntityKey, offset: int):
+        async def _evaluate_entity_async(entity_key: EntityKey):
+            nonlocal num_evaluated
+            num_evaluated += 1
             self.logger.debug(
-                f"Evaluating {entity_key.to_user_string()} ({num_evaluated + offset}/{num_conditions})"
+                f"Evaluating {entity_key.to_user_string()} ({num_evaluated}/{num_conditions})"
             )
 
             try:
@@ -147,18 +202,41 @@ async def _evaluate_entity_async(entity_key: EntityKey, offset: int):
                 f"({format(result.end_timestamp - result.start_timestamp, '.3f')} seconds)"
             )
 
-        for topo_level in self.asset_graph.toposorted_entity_keys_by_level:
-            coroutines = [
-                _evaluate_entity_async(entity_key, offset)
-                for offset, entity_key in enumerate(topo_level)
-                if entity_key in self.entity_keys
+        async def _evaluate_component_async(topo_levels: Sequence[Sequence[EntityKey]]):
+            for topo_level in topo_levels:
+                await asyncio.gather(
+                    *[_evaluate_entity_async(entity_key) for entity_key in topo_level]
+                )
+
+        # the levels of each independent part of the graph are evaluated in order, but the parts
+        # don't wait on each other, so that a deep part doesn't hold back the shallower ones
+        independent_entity_key_levels = get_independent_entity_key_levels(
+            self.asset_graph, self.entity_keys
+        )
+        self.logger.debug(
+            f"Evaluating {num_conditions} conditions in {len(independent_entity_key_levels)}"
+            " independent groups."
+        )
+        await asyncio.gather(
+            *[
+                _evaluate_component_async(topo_levels)
+                for topo_levels in independent_entity_key_levels
             ]
-            await asyncio.gather(*coroutines)
-            num_evaluated += len(coroutines)
+        )
 
-        return list(self.current_results_by_key.values()), [
-            v for v in self.request_subsets_by_key.values() if not v.is_empty
-        ]
+        # the groups finish in any order, so results are returned in topological order
+        topo_position_by_key = {
+            key: position
+            for position, key in enumerate(
+                itertools.chain.from_iterable(self.asset_graph.toposorted_entity_keys_by_level)
+            )
+        }
+        return sorted(
+            self.current_results_by_key.values(), key=lambda r: topo_position_by_key[r.key]
+        ), sorted(
+            (v for v in self.request_subsets_by_key.values() if not v.is_empty),
+            key=lambda v: topo_position_by_key[v.key],
+        )
 
     async def evaluate_entity(self, key: EntityKey) -> None:
         # evaluate the condition of this asset
@@ -8,7 +8,7 @@
 import dagster._check as check
 from dagster._annotations import public
 from dagster._builtins import Int
-from dagster._config import Field, Noneable, Selector, UserConfigSchema
+from dagster._config import Field, Noneable, Selector, Shape, UserConfigSchema
 from dagster._core.definitions.configurable import (
     ConfiguredDefinitionConfigSchema,
     NamedConfigurableDefinition,
@@ -28,6 +28,7 @@
     from dagster._core.executor.in_process import InProcessExecutor
     from dagster._core.executor.init import InitExecutorContext
     from dagster._core.executor.multiprocess import MultiprocessExecutor
+    from dagster._core.executor.threadpool import ThreadpoolExecutor
     from dagster._core.instance import DagsterInstance
 
 
@@ -322,6 +323,71 @@ def execute_in_process_executor(_) -> "InProcessExecutor":
     )
 
 
+def _core_threadpool_executor_creation(config: ExecutorConfig) -> "ThreadpoolExecutor":
+    from dagster._core.executor.threadpool import ThreadpoolExecutor
+
+    return ThreadpoolExecutor(
+        retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
+        max_concurrent=check.opt_int_elem(config, "max_concurrent"),
+        tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
+    )
+
+
+THREADPOOL_CONFIG = Field(
+    {
+        "max_concurrent": Field(
+            Noneable(Int),
+            default_value=None,
+            description=(
+                "The number of steps that may run concurrently, each in its own thread. By default,"
+                " this is the default number of workers of Python's"
+                " `concurrent.futures.ThreadPoolExecutor`, `min(32, os.cpu_count() + 4)`."
+            ),
+        ),
+        "tag_concurrency_limits": get_tag_concurrency_limits_config(),
+        "retries": get_retries_config(),
+    },
+    description="Execute steps concurrently in threads of a single process.",
+)
+
+
+@executor(
+    name="threadpool",
+    config_schema=THREADPOOL_CONFIG,
+)
+def threadpool_executor(init_context):
+    """The threadpool executor executes steps concurrently in a pool of threads in a single process.
+
+    Steps share the run's process and resources, without the cost of starting a process for each
+    step, which makes this executor a good fit for jobs whose ops mostly wait on IO, such as API
+    calls and warehouse queries. CPU-bound ops are still limited by the GIL and are better run with
+    the :py:func:`multiprocess_executor`.
+
+    The bodies of ``async def`` ops run on an event loop shared by all steps of the run, which is
+    also the loop their async resources were created on. Each step still occupies a thread while
+    its op is awaiting, so for jobs of many async ops that mostly await IO, raise
+    ``max_concurrent`` above its default to run more of them at once.
+
+    To configure it, include a fragment such as the following in your run config:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            max_concurrent: 8
+
+    The ``max_concurrent`` arg is optional and tells the execution engine how many steps may run
+    concurrently. By default, or if you set ``max_concurrent`` to be None or 0, this is
+    ``min(32, os.cpu_count() + 4)``. Steps may be further limited using ``tag_concurrency_limits``
+    and pools, as with the :py:func:`multiprocess_executor`.
+
+    Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
+    where the higher the number the higher the priority. 0 is the default and both positive
+    and negative numbers can be used.
+    """
+    return _core_threadpool_executor_creation(init_context.executor_config)
+
+
 def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "MultiprocessExecutor":
     from dagster._core.executor.multiprocess import MultiprocessExecutor
 
@@ -332,12 +398,18 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = next(iter(start_selector.items()))
 
+    worker_pool_cfg = check.opt_nullable_dict_elem(config, "worker_pool")
+
     return MultiprocessExecutor(
         max_concurrent=check.opt_int_elem(config, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        preload_definitions=bool(start_cfg.get("preload_definitions")),
+        use_worker_pool=worker_pool_cfg is not None,
+        max_steps_per_worker=(worker_pool_cfg or {}).get("max_steps_per_worker"),
+        max_worker_memory_growth_mb=(worker_pool_cfg or {}).get("max_memory_growth_mb"),
     )
 
 
@@ -375,6 +447,17 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                                     " `dagster` module is preloaded."
                                 ),
                             ),
+                            "preload_definitions": Field(
+                                bool,
+                                is_required=False,
+                                default_value=False,
+                                description=(
+                                    "Also load the job's definition, including its resource"
+                                    " definitions, in the forkserver, so that step processes do"
+                                    " not each load the code location again. Resources are still"
+                                    " initialized in each step process."
+                                ),
+                            ),
                         },
                         description=(
                             "Configure the multiprocess executor to start subprocesses "
@@ -391,6 +474,38 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
             ),
         ),
         "retries": get_retries_config(),
+        "worker_pool": Field(
+            Noneable(
+                Shape(
+                    {
+                        "max_steps_per_worker": Field(
+                            Noneable(Int),
+                            default_value=None,
+                            description=(
+                                "The number of steps a worker process executes before it is"
+                                " replaced. By default, workers are reused for the whole run."
+                            ),
+                        ),
+                        "max_memory_growth_mb": Field(
+                            Noneable(Int),
+                            default_value=None,
+                            description=(
+                                "Replace a worker process once its peak memory use has grown by"
+                                " more than this many megabytes since it finished its first step."
+                            ),
+                        ),
+                    }
+                )
+            ),
+            default_value=None,
+            is_required=False,
+            description=(
+                "Execute steps in a pool of long-lived worker processes instead of starting a new"
+                " process for each step, so that the job's code is only loaded once per worker."
+                " Each step still initializes its own resources. Set to `{}` to enable it with the"
+                " default settings; it is disabled by default."
+            ),
+        ),
     },
     description="Execute each step in an individual process.",
 )
@@ -419,6 +534,10 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be None or 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    Setting ``worker_pool`` executes steps in a pool of long-lived worker processes rather than
+    starting a new process for each step, which avoids reloading the job's code for every step of
+    jobs with many short steps.
+
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -1,5 +1,6 @@
 from collections.abc import Sequence
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
 
 import dagster._check as check
@@ -11,6 +12,7 @@
 from dagster._core.definitions.partitions.definition.partitions_definition import (
     PartitionsDefinition,
 )
+from dagster._core.definitions.partitions.subset.key_ranges import PartitionKeyIndex
 from dagster._core.definitions.partitions.utils.base import (
     raise_error_on_duplicate_partition_keys,
     raise_error_on_invalid_partition_key_substring,
@@ -73,6 +75,10 @@ def get_partition_keys(
         """
         return self._partition_keys
 
+    @cached_property
+    def partition_key_index(self) -> PartitionKeyIndex:
+        return PartitionKeyIndex(self._partition_keys)
+
     def get_paginated_partition_keys(
         self,
         context: PartitionLoadingContext,
@@ -1,6 +1,7 @@
 import functools
 import hashlib
 import re
+import time
 from collections.abc import Iterable, Sequence
 from datetime import date, datetime
 from functools import cached_property
@@ -20,6 +21,7 @@
     ScheduleType,
     cron_schedule_from_schedule_type_and_offsets,
 )
+from dagster._core.definitions.partitions.utils.cron_ticks import CronTicks, get_cron_ticks
 from dagster._core.definitions.partitions.utils.time_window import TimeWindow, TimeWindowCursor
 from dagster._core.definitions.timestamp import TimestampWithTimezone
 from dagster._core.errors import DagsterInvalidDefinitionError
@@ -44,6 +46,9 @@
     from dagster._core.definitions.partitions.subset.partitions_subset import PartitionsSubset
     from dagster._core.definitions.partitions.subset.time_window import TimeWindowPartitionsSubset
 
+# Format directives that depend on datetime attributes that a time.struct_time does not carry
+DATETIME_ONLY_FORMAT_DIRECTIVES = ("%z", "%Z", "%f", "%:")
+
 
 @whitelist_for_serdes
 @record_custom(
@@ -199,9 +204,48 @@ def _get_current_timestamp(self) -> float:
 
             return current_time.timestamp()
 
+    @cached_property
+    def _cron_ticks(self) -> Optional[CronTicks]:
+        # Set if the ticks of the cron schedule can be computed by arithmetic, in which case
+        # partition keys and time windows are generated without iterating over the schedule
+        return get_cron_ticks(self.cron_schedule, self.timezone)
+
+    def _datetime_for_tick(self, cron_ticks: CronTicks, index: int) -> datetime:
+        return datetime_from_timestamp(cron_ticks.timestamp_for_index(index), self.timezone)
+
+    @cached_property
+    def _can_format_partition_keys_with_gmtime(self) -> bool:
+        # ticks are only computed by arithmetic in UTC, where time.strftime on a UTC struct_time
+        # produces the same keys as datetime.strftime, several times faster
+        return not any(directive in self.fmt for directive in DATETIME_ONLY_FORMAT_DIRECTIVES)
+
+    def _partition_key_for_tick(self, cron_ticks: CronTicks, index: int) -> str:
+        if self._can_format_partition_keys_with_gmtime:
+            return time.strftime(self.fmt, time.gmtime(cron_ticks.timestamp_for_index(index)))
+        return self._datetime_for_tick(cron_ticks, index).strftime(self.fmt)
+
+    def _get_partition_tick_bounds(
+        self, cron_ticks: CronTicks, current_timestamp: float
+    ) -> tuple[int, int]:
+        """The tick indexes of the first and last partitions at the given time. The partitions
+        definition has no partitions if the last index is before the first.
+        """
+        first = cron_ticks.ceil_index(self.start_timestamp)
+        # the last partition that ends before the current time, extended by a positive end offset
+        last = max(cron_ticks.floor_index(current_timestamp), first) - 1 + max(self.end_offset, 0)
+        if self.end_timestamp is not None:
+            last = min(last, cron_ticks.floor_index(self.end_timestamp) - 1)
+        # a negative end offset removes partitions from the end of the range
+        return first, last + min(self.end_offset, 0)
+
     def get_num_partitions_in_window(self, time_window: TimeWindow) -> int:
         if time_window.start.timestamp() >= time_window.end.timestamp():
             return 0
+        cron_ticks = self._cron_ticks
+        if cron_ticks:
+            return cron_ticks.ceil_index(time_window.end.timestamp()) - cron_ticks.ceil_index(
+                time_window.start.timestamp()
+            )
         if self.is_basic_daily:
             return (
                 date(
@@ -241,6 +285,14 @@ def get_partition_keys_between_indexes(self, start_idx: int, end_idx: int) -> li
         # partition keys included within the indices.
         current_timestamp = self._get_current_timestamp()
 
+        cron_ticks = self._cron_ticks
+        if cron_ticks:
+            first, last = self._get_partition_tick_bounds(cron_ticks, current_timestamp)
+            return [
+                self._partition_key_for_tick(cron_ticks, index)
+                for index in range(first + max(start_idx, 0), min(first + end_idx, last + 1))
+            ]
+
         partitions_past_current_time = 0
         partition_keys = []
         reached_end = False
@@ -272,6 +324,37 @@ def get_partition_keys_between_indexes(self, start_idx: int, end_idx: int) -> li
 
         return partition_keys
 
+    def get_partition_key_at_index(self, index: int) -> str:
+        """Returns the partition key at the given position in the ordered partition keys."""
+        cron_ticks = self._cron_ticks
+        if cron_ticks:
+            first, last = self._get_partition_tick_bounds(cron_ticks, self._get_current_timestamp())
+            if index < 0 or first + index > last:
+                raise IndexError(f"Partition index {index} out of range")
+            return self._partition_key_for_tick(cron_ticks, first + index)
+
+        return self.get_partition_keys()[index]
+
+    def get_index_of_partition_key(self, partition_key: str) -> int:
+        """Returns the position of the given partition key in the ordered partition keys."""
+        cron_ticks = self._cron_ticks
+        if cron_ticks:
+            first, last = self._get_partition_tick_bounds(cron_ticks, self._get_current_timestamp())
+            index = cron_ticks.ceil_index(
+                dst_safe_strptime(partition_key, self.timezone, self.fmt).timestamp()
+            )
+            if (
+                index < first
+                or index > last
+                or self._partition_key_for_tick(cron_ticks, index) != partition_key
+            ):
+                raise ValueError(
+                    f"Partition key {partition_key} is not in the partitions definition"
+                )
+            return index - first
+
+        return list(self.get_partition_keys()).index(partition_key)
+
     def get_partition_keys(
         self,
         current_time: Optional[datetime] = None,
@@ -280,6 +363,14 @@ def get_partition_keys(
         with partition_loading_context(current_time, dynamic_partitions_store):
             current_timestamp = self._get_current_timestamp()
 
+            cron_ticks = self._cron_ticks
+            if cron_ticks:
+                first, last = self._get_partition_tick_bounds(cron_ticks, current_timestamp)
+                return [
+                    self._partition_key_for_tick(cron_ticks, index)
+                    for index in range(first, last + 1)
+                ]
+
             partitions_past_current_time = 0
             partition_keys: list[str] = []
             for time_window in self._iterate_time_windows(self.start_timestamp):
@@ -620,6 +711,15 @@ def _get_last_partition_window(self, current_timestamp: float) -> Optional[TimeW
 
         if self.end_offset == 0:
             return next(iter(self._reverse_iterate_time_windows(current_timestamp)))
+        elif self._cron_ticks:
+            cron_ticks = self._cron_ticks
+            first, last = self._get_partition_tick_bounds(cron_ticks, self._get_current_timestamp())
+            if last < first:
+                return None
+            return TimeWindow(
+                self._datetime_for_tick(cron_ticks, last),
+                self._datetime_for_tick(cron_ticks, last + 1),
+            )
         else:
             # TODO: make this efficient
             last_partition_key = super().get_last_partition_key()
@@ -651,6 +751,16 @@ def end_time_for_partition_key(self, partition_key: str) -> datetime:
 
     @functools.lru_cache(maxsize=5)
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
+        cron_ticks = self._cron_ticks
+        if cron_ticks:
+            return [
+                self._partition_key_for_tick(cron_ticks, index)
+                for index in range(
+                    cron_ticks.ceil_index(time_window.start.timestamp()),
+                    cron_ticks.ceil_index(time_window.end.timestamp()),
+                )
+            ]
+
         result: list[str] = []
         time_window_end_timestamp = time_window.end.timestamp()
         for partition_time_window in self._iterate_time_windows(time_window.start.timestamp()):
@@ -843,6 +953,16 @@ def get_cron_schedule(
 
     def _iterate_time_windows(self, start_timestamp: float) -> Iterable[TimeWindow]:
         """Returns an infinite generator of time windows that start after the given start time."""
+        cron_ticks = self._cron_ticks
+        if cron_ticks:
+            index = cron_ticks.ceil_index(start_timestamp)
+            prev_time = self._datetime_for_tick(cron_ticks, index)
+            while True:
+                index += 1
+                next_time = self._datetime_for_tick(cron_ticks, index)
+                yield TimeWindow(prev_time, next_time)
+                prev_time = next_time
+
         iterator = cron_string_iterator(
             start_timestamp=start_timestamp,
             cron_string=self.cron_schedule,
@@ -859,6 +979,16 @@ def _iterate_time_windows(self, start_timestamp: float) -> Iterable[TimeWindow]:
 
     def _reverse_iterate_time_windows(self, end_timestamp: float) -> Iterable[TimeWindow]:
         """Returns an infinite generator of time windows that end before the given end time."""
+        cron_ticks = self._cron_ticks
+        if cron_ticks:
+            index = cron_ticks.floor_index(end_timestamp)
+            prev_time = self._datetime_for_tick(cron_ticks, index)
+            while True:
+                index -= 1
+                next_time = self._datetime_for_tick(cron_ticks, index)
+                yield TimeWindow(next_time, prev_time)
+                prev_time = next_time
+
         iterator = reverse_cron_string_iterator(
             end_timestamp=end_timestamp,
             cron_string=self.cron_schedule,
@@ -879,6 +1009,15 @@ def get_partition_key_for_timestamp(self, timestamp: float, end_closed: bool = F
         timestamp (float): Timestamp from the unix epoch, UTC.
         end_closed (bool): Whether the interval is closed at the end or at the beginning.
         """
+        cron_ticks = self._cron_ticks
+        if cron_ticks:
+            index = (
+                cron_ticks.ceil_index(timestamp) - 1
+                if end_closed
+                else cron_ticks.floor_index(timestamp)
+            )
+            return self._partition_key_for_tick(cron_ticks, index)
+
         iterator = cron_string_iterator(
             timestamp, self.cron_schedule, self.timezone, start_offset=-1
         )
@@ -2,17 +2,45 @@
 from collections.abc import Iterable, Sequence, Set
 from typing import NamedTuple, Optional
 
+from dagster_shared.serdes import NamedTupleSerializer
+
 import dagster._check as check
 from dagster._core.definitions.partitions.definition.partitions_definition import (
     PartitionsDefinition,
 )
 from dagster._core.definitions.partitions.partition_key_range import PartitionKeyRange
+from dagster._core.definitions.partitions.subset.key_ranges import (
+    PartitionKeyIndex,
+    RangeEncodedPartitionKeySet,
+)
 from dagster._core.definitions.partitions.subset.partitions_subset import PartitionsSubset
-from dagster._core.errors import DagsterInvalidDeserializationVersionError
+from dagster._core.errors import (
+    DagsterDefinitionChangedDeserializationError,
+    DagsterInvalidDeserializationVersionError,
+)
 from dagster._serdes import whitelist_for_serdes
 
+# Static partitions definitions with at least this many partitions store their subsets as ranges
+# of partition key ordinals rather than as sets of strings
+RANGE_ENCODING_MIN_PARTITIONS = 1000
+
+
+def _get_partition_key_index(partitions_def: PartitionsDefinition) -> PartitionKeyIndex:
+    from dagster._core.definitions.partitions.definition.static import StaticPartitionsDefinition
+
+    if isinstance(partitions_def, StaticPartitionsDefinition):
+        return partitions_def.partition_key_index
+    return PartitionKeyIndex(partitions_def.get_partition_keys())
+
 
-@whitelist_for_serdes
+class DefaultPartitionsSubsetSerializer(NamedTupleSerializer):
+    # Range-encoded subsets are stored as plain sets of partition keys, so that the serialized
+    # form does not depend on the ordering of the partitions definition's keys
+    def before_pack(self, value: "DefaultPartitionsSubset") -> "DefaultPartitionsSubset":  # pyright: ignore[reportIncompatibleMethodOverride]
+        return value.to_serializable_subset()
+
+
+@whitelist_for_serdes(serializer=DefaultPartitionsSubsetSerializer)
 class DefaultPartitionsSubset(
     PartitionsSubset,
     NamedTuple("_DefaultPartitionsSubset", [("subset", Set[str])]),
@@ -20,17 +48,38 @@ class DefaultPartitionsSubset(
     # Every time we change the serialization format, we should increment the version number.
     # This will ensure that we can gracefully degrade when deserializing old data.
     SERIALIZATION_VERSION = 1
+    # Version of the serialization format used for range-encoded subsets, which stores inclusive
+    # ranges of partition keys instead of every key. The ranges are only meaningful for the ordered
+    # keys they were encoded against, so the payload also stores the unique id of those keys.
+    RANGES_SERIALIZATION_VERSION = 2
 
     def __new__(
         cls,
         subset: Optional[Set[str]] = None,
     ):
-        check.opt_set_param(subset, "subset")
-        return super().__new__(cls, subset or set())
+        check.opt_inst_param(subset, "subset", (set, frozenset, RangeEncodedPartitionKeySet))
+        return super().__new__(cls, subset if subset is not None else set())
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.subset) == 0
+
+    def _get_range_encoded_subset(
+        self, partitions_def: PartitionsDefinition
+    ) -> Optional[RangeEncodedPartitionKeySet]:
+        # the range-encoded key set, if it is encoded against the given definition's keys
+        if isinstance(self.subset, RangeEncodedPartitionKeySet) and self.subset.index.is_equivalent(
+            _get_partition_key_index(partitions_def)
+        ):
+            return self.subset
+        return None
 
     def get_partition_keys_not_in_subset(
         self, partitions_def: PartitionsDefinition
     ) -> Iterable[str]:
+        range_encoded_subset = self._get_range_encoded_subset(partitions_def)
+        if range_encoded_subset is not None:
+            return list(range_encoded_subset.iter_keys_not_in_set())
         return set(partitions_def.get_partition_keys()) - set(self.subset)
 
     def get_partition_keys(self) -> Iterable[str]:
@@ -101,6 +150,13 @@ def get_partition_key_ranges(
             return results
 
         else:
+            range_encoded_subset = self._get_range_encoded_subset(partitions_def)
+            if range_encoded_subset is not None:
+                return [
+                    PartitionKeyRange(start, end)
+                    for start, end in range_encoded_subset.get_key_ranges()
+                ]
+
             partition_keys = partitions_def.get_partition_keys()
 
             return self.get_ranges_for_keys(partition_keys)
@@ -110,7 +166,37 @@ def with_partition_keys(self, partition_keys: Iterable[str]) -> "DefaultPartitio
             self.subset | set(partition_keys),
         )
 
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if isinstance(other, DefaultPartitionsSubset):
+            return DefaultPartitionsSubset(self.subset | other.subset)
+        return super().__or__(other)
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if isinstance(other, DefaultPartitionsSubset):
+            return DefaultPartitionsSubset(self.subset - other.subset)
+        return super().__sub__(other)
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if isinstance(other, DefaultPartitionsSubset):
+            return DefaultPartitionsSubset(self.subset & other.subset)
+        return super().__and__(other)
+
+    def to_serializable_subset(self) -> "DefaultPartitionsSubset":
+        if isinstance(self.subset, RangeEncodedPartitionKeySet):
+            return DefaultPartitionsSubset(set(self.subset))
+        return self
+
     def serialize(self) -> str:
+        if isinstance(self.subset, RangeEncodedPartitionKeySet):
+            return json.dumps(
+                {
+                    "version": self.RANGES_SERIALIZATION_VERSION,
+                    "partition_keys_id": self.subset.index.unique_id,
+                    "ranges": self.subset.get_key_ranges(),
+                    "subset": sorted(self.subset.extra_keys),
+                }
+            )
+
         # Serialize version number, so attempting to deserialize old versions can be handled gracefully.
         # Any time the serialization format changes, we should increment the version number.
         return json.dumps(
@@ -131,6 +217,23 @@ def from_serialized(
         if isinstance(data, list):
             # backwards compatibility
             return cls(subset=set(data))
+        elif data.get("version") == cls.RANGES_SERIALIZATION_VERSION:
+            index = _get_partition_key_index(partitions_def)
+            subset = (
+                RangeEncodedPartitionKeySet.from_key_ranges(
+                    index,
+                    [(start, end) for start, end in data["ranges"]],
+                    extra_keys=set(data["subset"]),
+                )
+                if data.get("partition_keys_id") == index.unique_id
+                else None
+            )
+            if subset is None:
+                raise DagsterDefinitionChangedDeserializationError(
+                    "Attempted to deserialize a range-encoded partition subset, but the partition"
+                    " keys of the partitions definition have changed since it was serialized."
+                )
+            return cls(subset=subset)
         else:
             if data.get("version") != cls.SERIALIZATION_VERSION:
                 raise DagsterInvalidDeserializationVersionError(
@@ -147,10 +250,19 @@ def can_deserialize(
         serialized_partitions_def_unique_id: Optional[str],
         serialized_partitions_def_class_name: Optional[str],
     ) -> bool:
+        data = json.loads(serialized)
+        if isinstance(data, dict) and data.get("version") == cls.RANGES_SERIALIZATION_VERSION:
+            # the ranges refer to the ordered keys of the definition they were encoded against
+            return (
+                serialized_partitions_def_class_name is None
+                or serialized_partitions_def_class_name == partitions_def.__class__.__name__
+            ) and data.get("partition_keys_id") == _get_partition_key_index(
+                partitions_def
+            ).unique_id
+
         if serialized_partitions_def_class_name is not None:
             return serialized_partitions_def_class_name == partitions_def.__class__.__name__
 
-        data = json.loads(serialized)
         return isinstance(data, list) or (
             data.get("subset") is not None and data.get("version") == cls.SERIALIZATION_VERSION
         )
@@ -171,9 +283,20 @@ def __repr__(self) -> str:
     def create_empty_subset(
         cls, partitions_def: Optional[PartitionsDefinition] = None
     ) -> "DefaultPartitionsSubset":
+        from dagster._core.definitions.partitions.definition.static import (
+            StaticPartitionsDefinition,
+        )
+
+        if (
+            isinstance(partitions_def, StaticPartitionsDefinition)
+            and len(partitions_def.get_partition_keys()) >= RANGE_ENCODING_MIN_PARTITIONS
+        ):
+            return cls(subset=RangeEncodedPartitionKeySet(partitions_def.partition_key_index))
         return cls()
 
     def empty_subset(
         self,
     ) -> "DefaultPartitionsSubset":
+        if isinstance(self.subset, RangeEncodedPartitionKeySet):
+            return DefaultPartitionsSubset(RangeEncodedPartitionKeySet(self.subset.index))
         return DefaultPartitionsSubset()
@@ -0,0 +1,267 @@
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Mapping, Sequence, Set
+from functools import cached_property
+from typing import AbstractSet, Optional  # noqa: UP035
+
+from dagster._core.definitions.partitions.utils.base import (
+    generate_partition_key_based_definition_id,
+)
+
+# A half-open [start, end) range of partition key ordinals
+OrdinalRange = tuple[int, int]
+
+
+class PartitionKeyIndex:
+    """An ordered sequence of partition keys, along with the ordinal position of each key. Shared
+    between all range-encoded key sets of a partitions definition, so that the key to ordinal
+    mapping is only built once.
+    """
+
+    def __init__(self, partition_keys: Sequence[str]):
+        self._partition_keys = partition_keys
+
+    @property
+    def partition_keys(self) -> Sequence[str]:
+        return self._partition_keys
+
+    @cached_property
+    def ordinals(self) -> Mapping[str, int]:
+        return {partition_key: i for i, partition_key in enumerate(self._partition_keys)}
+
+    @cached_property
+    def unique_id(self) -> str:
+        # identifies the keys and their order, which the ordinals of range-encoded sets refer to
+        return generate_partition_key_based_definition_id(self._partition_keys)
+
+    def __len__(self) -> int:
+        return len(self._partition_keys)
+
+    def is_equivalent(self, other: "PartitionKeyIndex") -> bool:
+        return self is other or self._partition_keys == other.partition_keys
+
+
+def _ranges_from_ordinals(ordinals: Iterable[int]) -> Sequence[OrdinalRange]:
+    ranges: list[OrdinalRange] = []
+    for ordinal in sorted(set(ordinals)):
+        if ranges and ranges[-1][1] == ordinal:
+            ranges[-1] = (ranges[-1][0], ordinal + 1)
+        else:
+            ranges.append((ordinal, ordinal + 1))
+    return ranges
+
+
+def _union_ranges(
+    left: Sequence[OrdinalRange], right: Sequence[OrdinalRange]
+) -> Sequence[OrdinalRange]:
+    if not left:
+        return right
+    if not right:
+        return left
+
+    ranges: list[OrdinalRange] = []
+    for start, end in sorted([*left, *right]):
+        if ranges and start <= ranges[-1][1]:
+            if end > ranges[-1][1]:
+                ranges[-1] = (ranges[-1][0], end)
+        else:
+            ranges.append((start, end))
+    return ranges
+
+
+def _intersect_ranges(
+    left: Sequence[OrdinalRange], right: Sequence[OrdinalRange]
+) -> Sequence[OrdinalRange]:
+    ranges: list[OrdinalRange] = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        start = max(left[i][0], right[j][0])
+        end = min(left[i][1], right[j][1])
+        if start < end:
+            ranges.append((start, end))
+        if left[i][1] < right[j][1]:
+            i += 1
+        else:
+            j += 1
+    return ranges
+
+
+def _subtract_ranges(
+    left: Sequence[OrdinalRange], right: Sequence[OrdinalRange]
+) -> Sequence[OrdinalRange]:
+    if not left or not right:
+        return left
+
+    ranges: list[OrdinalRange] = []
+    j = 0
+    for left_start, end in left:
+        # skip the ranges to subtract that end before this range starts
+        while j < len(right) and right[j][1] <= left_start:
+            j += 1
+        start = left_start
+        k = j
+        while k < len(right) and right[k][0] < end:
+            if right[k][0] > start:
+                ranges.append((start, right[k][0]))
+            start = max(start, right[k][1])
+            k += 1
+        if start < end:
+            ranges.append((start, end))
+    return ranges
+
+
+class RangeEncodedPartitionKeySet(Set[str]):
+    """An immutable set of partition keys, stored as sorted, disjoint ranges of ordinals into the
+    ordered keys of a partitions definition rather than as individual strings.
+
+    Memory use and the cost of set operations between sets over the same keys scale with the
+    number of contiguous ranges rather than the number of keys. Keys that are not part of the
+    definition are held separately, so that the set behaves exactly like a set of strings.
+    """
+
+    __slots__ = ("_extra_keys", "_index", "_len", "_ranges")
+
+    def __init__(
+        self,
+        index: PartitionKeyIndex,
+        ranges: Sequence[OrdinalRange] = (),
+        extra_keys: AbstractSet[str] = frozenset(),
+    ):
+        self._index = index
+        self._ranges = tuple(ranges)
+        self._extra_keys = frozenset(extra_keys)
+        self._len = sum(end - start for start, end in self._ranges) + len(self._extra_keys)
+
+    @classmethod
+    def from_keys(
+        cls, index: PartitionKeyIndex, partition_keys: Iterable[str]
+    ) -> "RangeEncodedPartitionKeySet":
+        ordinals = index.ordinals
+        in_index: list[int] = []
+        extra_keys: set[str] = set()
+        for partition_key in partition_keys:
+            ordinal = ordinals.get(partition_key)
+            if ordinal is None:
+                extra_keys.add(partition_key)
+            else:
+                in_index.append(ordinal)
+        return cls(index, _ranges_from_ordinals(in_index), extra_keys)
+
+    @classmethod
+    def from_key_ranges(
+        cls,
+        index: PartitionKeyIndex,
+        key_ranges: Iterable[tuple[str, str]],
+        extra_keys: AbstractSet[str] = frozenset(),
+    ) -> Optional["RangeEncodedPartitionKeySet"]:
+        """Builds a set from inclusive (start key, end key) ranges, returning None if any range
+        endpoint is not in the index.
+        """
+        ordinals = index.ordinals
+        ranges: list[OrdinalRange] = []
+        for start_key, end_key in key_ranges:
+            start, end = ordinals.get(start_key), ordinals.get(end_key)
+            if start is None or end is None or start > end:
+                return None
+            ranges.append((start, end + 1))
+        return cls(index, _union_ranges(ranges, []) if ranges else (), extra_keys)
+
+    @property
+    def index(self) -> PartitionKeyIndex:
+        return self._index
+
+    @property
+    def ranges(self) -> Sequence[OrdinalRange]:
+        return self._ranges
+
+    @property
+    def extra_keys(self) -> AbstractSet[str]:
+        return self._extra_keys
+
+    def get_key_ranges(self) -> Sequence[tuple[str, str]]:
+        """The inclusive (start key, end key) ranges of keys in the set that are in the index."""
+        partition_keys = self._index.partition_keys
+        return [(partition_keys[start], partition_keys[end - 1]) for start, end in self._ranges]
+
+    def iter_keys_not_in_set(self) -> Iterator[str]:
+        """Iterates over the keys in the index that are not in the set, in index order."""
+        partition_keys = self._index.partition_keys
+        for start, end in _subtract_ranges([(0, len(partition_keys))], self._ranges):
+            yield from partition_keys[start:end]
+
+    def __contains__(self, value: object) -> bool:
+        ordinal = self._index.ordinals.get(value) if isinstance(value, str) else None
+        if ordinal is None:
+            return value in self._extra_keys
+        i = bisect_right(self._ranges, (ordinal, float("inf"))) - 1
+        return i >= 0 and self._ranges[i][0] <= ordinal < self._ranges[i][1]
+
+    def __iter__(self) -> Iterator[str]:
+        partition_keys = self._index.partition_keys
+        for start, end in self._ranges:
+            yield from partition_keys[start:end]
+        yield from self._extra_keys
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _coerce(self, other: Iterable[str]) -> "RangeEncodedPartitionKeySet":
+        if isinstance(other, RangeEncodedPartitionKeySet) and self._index.is_equivalent(
+            other.index
+        ):
+            return other
+        return RangeEncodedPartitionKeySet.from_keys(self._index, other)
+
+    def __or__(self, other: Iterable[str]) -> "RangeEncodedPartitionKeySet":  # pyright: ignore[reportIncompatibleMethodOverride]
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        other = self._coerce(other)
+        return RangeEncodedPartitionKeySet(
+            self._index,
+            _union_ranges(self._ranges, other.ranges),
+            self._extra_keys | other.extra_keys,
+        )
+
+    __ror__ = __or__  # pyright: ignore[reportAssignmentType]
+
+    def __and__(self, other: Iterable[str]) -> "RangeEncodedPartitionKeySet":  # pyright: ignore[reportIncompatibleMethodOverride]
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        other = self._coerce(other)
+        return RangeEncodedPartitionKeySet(
+            self._index,
+            _intersect_ranges(self._ranges, other.ranges),
+            self._extra_keys & other.extra_keys,
+        )
+
+    __rand__ = __and__  # pyright: ignore[reportAssignmentType]
+
+    def __sub__(self, other: Iterable[str]) -> "RangeEncodedPartitionKeySet":  # pyright: ignore[reportIncompatibleMethodOverride]
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        other = self._coerce(other)
+        return RangeEncodedPartitionKeySet(
+            self._index,
+            _subtract_ranges(self._ranges, other.ranges),
+            self._extra_keys - other.extra_keys,
+        )
+
+    def __rsub__(self, other: Iterable[str]) -> "RangeEncodedPartitionKeySet":  # pyright: ignore[reportIncompatibleMethodOverride]
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        return self._coerce(other) - self
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RangeEncodedPartitionKeySet) and self._index.is_equivalent(
+            other.index
+        ):
+            return self._ranges == other.ranges and self._extra_keys == other.extra_keys
+        return super().__eq__(other)
+
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+    def _from_iterable(self, it: Iterable[str]) -> AbstractSet[str]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        # used by the remaining set operations inherited from collections.abc.Set
+        return RangeEncodedPartitionKeySet.from_keys(self._index, it)
+
+    def __repr__(self) -> str:
+        return f"RangeEncodedPartitionKeySet(key_ranges={self.get_key_ranges()}, extra_keys={set(self._extra_keys)})"
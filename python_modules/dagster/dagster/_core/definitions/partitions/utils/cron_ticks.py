@@ -0,0 +1,123 @@
+import math
+import re
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Optional
+
+from dagster._utils.cronstring import get_fixed_minute_interval
+
+# Timezones that never observe a UTC offset change, so cron ticks can be computed directly on
+# unix timestamps
+FIXED_OFFSET_UTC_TIMEZONES = {"UTC", "ETC/UTC", "GMT", "ETC/GMT", "UNIVERSAL", "ZULU"}
+
+_HOURLY_CRON_REGEX = re.compile(r"(\d+) \* \* \* \*")
+_DAILY_CRON_REGEX = re.compile(r"(\d+) (\d+) \* \* \*")
+_WEEKLY_CRON_REGEX = re.compile(r"(\d+) (\d+) \* \* (\d+)")
+_MONTHLY_CRON_REGEX = re.compile(r"(\d+) (\d+) (\d+) \* \*")
+
+_SECONDS_PER_HOUR = 60 * 60
+_SECONDS_PER_DAY = 24 * _SECONDS_PER_HOUR
+
+# The unix epoch fell on a Thursday, which is day 4 in cron's day of week numbering
+_EPOCH_CRON_DAY_OF_WEEK = 4
+
+
+class CronTicks(ABC):
+    """Computes the ticks of a cron schedule by arithmetic rather than by iterating over them.
+
+    Ticks are numbered by integer indexes that increase with time. The numbering is only meaningful
+    relative to other indexes from the same instance.
+    """
+
+    @abstractmethod
+    def timestamp_for_index(self, index: int) -> float:
+        """The timestamp of the tick with the given index."""
+
+    @abstractmethod
+    def floor_index(self, timestamp: float) -> int:
+        """The index of the latest tick at or before the given timestamp."""
+
+    def ceil_index(self, timestamp: float) -> int:
+        """The index of the earliest tick at or after the given timestamp."""
+        index = self.floor_index(timestamp)
+        return index if self.timestamp_for_index(index) == timestamp else index + 1
+
+
+class FixedIntervalCronTicks(CronTicks):
+    """Ticks that occur at a fixed number of seconds after every multiple of a fixed interval since
+    the unix epoch.
+    """
+
+    def __init__(self, interval_seconds: int, offset_seconds: int):
+        self._interval_seconds = interval_seconds
+        self._offset_seconds = offset_seconds
+
+    def timestamp_for_index(self, index: int) -> float:
+        return float(index * self._interval_seconds + self._offset_seconds)
+
+    def floor_index(self, timestamp: float) -> int:
+        return math.floor((timestamp - self._offset_seconds) / self._interval_seconds)
+
+
+class MonthlyCronTicks(CronTicks):
+    """Ticks that occur at a fixed day and time of every month. Indexes count months since year 0."""
+
+    def __init__(self, day: int, hour: int, minute: int):
+        self._day = day
+        self._hour = hour
+        self._minute = minute
+
+    def timestamp_for_index(self, index: int) -> float:
+        year, month_idx = divmod(index, 12)
+        return datetime(
+            year, month_idx + 1, self._day, self._hour, self._minute, tzinfo=timezone.utc
+        ).timestamp()
+
+    def floor_index(self, timestamp: float) -> int:
+        dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        index = dt.year * 12 + dt.month - 1
+        return index if self.timestamp_for_index(index) <= timestamp else index - 1
+
+
+def get_cron_ticks(cron_schedule: str, timezone_name: str) -> Optional[CronTicks]:
+    """Returns a CronTicks for the given schedule if its ticks can be computed by arithmetic, i.e.
+    if it is an every-n-minutes, hourly, daily, weekly or monthly schedule in a timezone without
+    UTC offset changes. Returns None otherwise.
+    """
+    if timezone_name.upper() not in FIXED_OFFSET_UTC_TIMEZONES:
+        return None
+
+    fixed_minute_interval = get_fixed_minute_interval(cron_schedule)
+    if fixed_minute_interval and cron_schedule.split()[1:] == ["*"] * 4:
+        return FixedIntervalCronTicks(interval_seconds=fixed_minute_interval * 60, offset_seconds=0)
+
+    if match := _HOURLY_CRON_REGEX.fullmatch(cron_schedule):
+        minute = int(match.group(1))
+        if minute < 60:
+            return FixedIntervalCronTicks(
+                interval_seconds=_SECONDS_PER_HOUR, offset_seconds=minute * 60
+            )
+    elif match := _DAILY_CRON_REGEX.fullmatch(cron_schedule):
+        minute, hour = int(match.group(1)), int(match.group(2))
+        if minute < 60 and hour < 24:
+            return FixedIntervalCronTicks(
+                interval_seconds=_SECONDS_PER_DAY,
+                offset_seconds=hour * _SECONDS_PER_HOUR + minute * 60,
+            )
+    elif match := _WEEKLY_CRON_REGEX.fullmatch(cron_schedule):
+        minute, hour, day_of_week = int(match.group(1)), int(match.group(2)), int(match.group(3))
+        if minute < 60 and hour < 24 and day_of_week <= 7:
+            days_after_epoch = (day_of_week - _EPOCH_CRON_DAY_OF_WEEK) % 7
+            return FixedIntervalCronTicks(
+                interval_seconds=7 * _SECONDS_PER_DAY,
+                offset_seconds=days_after_epoch * _SECONDS_PER_DAY
+                + hour * _SECONDS_PER_HOUR
+                + minute * 60,
+            )
+    elif match := _MONTHLY_CRON_REGEX.fullmatch(cron_schedule):
+        minute, hour, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
+        # days after the 28th do not occur in every month, so those schedules skip months
+        if minute < 60 and hour < 24 and 1 <= day <= 28:
+            return MonthlyCronTicks(day=day, hour=hour, minute=minute)
+
+    return None
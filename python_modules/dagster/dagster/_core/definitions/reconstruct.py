@@ -23,10 +23,12 @@
 
 import dagster._check as check
 from dagster._core.code_pointer import (
+    AutoloadDefsModuleCodePointer,
     CodePointer,
     CustomPointer,
     FileCodePointer,
     ModuleCodePointer,
+    PackageCodePointer,
     get_python_file_from_target,
 )
 from dagster._core.definitions.asset_checks.asset_check_spec import AssetCheckKey
@@ -165,6 +167,11 @@ def __hash__(self) -> int:
             self._hash = hash_collection(self)
         return self._hash
 
+    # The cached hash depends on the process's string hash seed, so it is not pickled. Otherwise an
+    # equal object in another process could hash differently, and miss the `lru_cache`.
+    def __getstate__(self) -> None:
+        return None
+
 
 class ReconstructableJobSerializer(NamedTupleSerializer):
     def before_unpack(self, _, unpacked_dict: dict[str, Any]) -> dict[str, Any]:  # pyright: ignore[reportIncompatibleMethodOverride]
@@ -316,10 +323,16 @@ def get_python_origin_id(self) -> str:
         return self.get_python_origin().get_id()
 
     def get_module(self) -> Optional[str]:
-        """Return the module the job is found in, the origin is a module code pointer."""
+        """Return the module the job is found in, if the origin is a module or package code
+        pointer, or a custom pointer whose reconstructor is in a module.
+        """
         pointer = self.get_python_origin().get_repo_pointer()
-        if isinstance(pointer, ModuleCodePointer):
+        if isinstance(
+            pointer, (ModuleCodePointer, PackageCodePointer, AutoloadDefsModuleCodePointer)
+        ):
             return pointer.module
+        if isinstance(pointer, CustomPointer):
+            return pointer.reconstructor_pointer.module
 
         return None
 
@@ -329,6 +342,11 @@ def __hash__(self) -> int:
             self._hash = hash_collection(self)
         return self._hash
 
+    # The cached hash depends on the process's string hash seed, so it is not pickled. Otherwise an
+    # equal object in another process could hash differently, and miss the `lru_cache`.
+    def __getstate__(self) -> None:
+        return None
+
 
 def reconstructable(target: Callable[..., "JobDefinition"]) -> ReconstructableJob:
     """Create a :py:class:`~dagster._core.definitions.reconstructable.ReconstructableJob` from a
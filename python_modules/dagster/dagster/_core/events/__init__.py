@@ -274,6 +274,17 @@ class DagsterEventType(str, Enum):
     DagsterEventType.ASSET_FAILED_TO_MATERIALIZE,
 }
 
+# These are the events that `SqlEventLogStorage` may hold in a per-run write buffer when buffered
+# event writes are enabled. All other events flush the buffer for their run before being written,
+# so that run status, step lifecycle, and asset events keep their ordering guarantees.
+BUFFERABLE_EVENTS = {
+    DagsterEventType.ENGINE_EVENT,
+    DagsterEventType.STEP_INPUT,
+    DagsterEventType.STEP_OUTPUT,
+    DagsterEventType.LOADED_INPUT,
+    DagsterEventType.HANDLED_OUTPUT,
+}
+
 ASSET_EVENTS = {
     DagsterEventType.ASSET_MATERIALIZATION,
     DagsterEventType.ASSET_OBSERVATION,
@@ -22,6 +22,10 @@
 from dagster._core.execution.job_execution_result import JobExecutionResult
 from dagster._core.execution.plan.execute_plan import inner_plan_execution_iterator
 from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.plan_cache import (
+    build_execution_plan_with_cache,
+    get_execution_plan_cache_dir,
+)
 from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.execution.retries import RetryMode
 from dagster._core.instance import DagsterInstance, InstanceRef
@@ -665,6 +669,7 @@ def _get_execution_plan_from_run(
         known_state=(
             execution_plan_snapshot.initial_known_state if execution_plan_snapshot else None
         ),
+        job_snapshot_id=dagster_run.job_snapshot_id,
     )
 
 
@@ -676,7 +681,14 @@ def create_execution_plan(
     instance_ref: Optional[InstanceRef] = None,
     tags: Optional[Mapping[str, str]] = None,
     repository_load_data: Optional[RepositoryLoadData] = None,
+    job_snapshot_id: Optional[str] = None,
 ) -> ExecutionPlan:
+    """Builds the execution plan for a job.
+
+    When the DAGSTER_EXECUTION_PLAN_CACHE_DIR environment variable is set and the id of the job's
+    snapshot is provided, the plan is rehydrated from a snapshot cached in that directory by an
+    earlier build for the same job snapshot and run config, if there is one.
+    """
     if isinstance(job, IJob):
         # If you have repository_load_data, make sure to use it when building plan
         if isinstance(job, ReconstructableJob) and repository_load_data is not None:
@@ -699,8 +711,22 @@ def create_execution_plan(
         repository_load_data, "repository_load_data", RepositoryLoadData
     )
 
+    check.opt_str_param(job_snapshot_id, "job_snapshot_id")
+
     resolved_run_config = ResolvedRunConfig.build(job_def, run_config)
 
+    plan_cache_dir = get_execution_plan_cache_dir()
+    if plan_cache_dir and job_snapshot_id:
+        return build_execution_plan_with_cache(
+            plan_cache_dir,
+            job_snapshot_id,
+            job_def,
+            resolved_run_config,
+            step_keys_to_execute=step_keys_to_execute,
+            known_state=known_state,
+            repository_load_data=repository_load_data,
+        )
+
     return ExecutionPlan.build(
         job_def,
         resolved_run_config,
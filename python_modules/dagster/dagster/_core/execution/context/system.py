@@ -52,6 +52,7 @@
 from dagster._core.execution.plan.outputs import StepOutputHandle
 from dagster._core.execution.plan.step import ExecutionStep
 from dagster._core.execution.retries import RetryMode
+from dagster._core.execution.step_profiler import StepProfiler
 from dagster._core.executor.base import Executor
 from dagster._core.log_manager import DagsterLogManager
 from dagster._core.storage.dagster_run import DagsterRun
@@ -478,6 +479,8 @@ def __init__(
         self._requires_typed_event_stream = False
         self._typed_event_stream_error_message = None
 
+        self._step_profiler = StepProfiler.for_step(step, plan_data.dagster_run)
+
     # In this mode no conversion is done on returned values and missing but expected outputs are not
     # allowed.
     @property
@@ -497,6 +500,11 @@ def set_requires_typed_event_stream(self, *, error_message: Optional[str] = None
     def step(self) -> ExecutionStep:
         return self._step
 
+    @property
+    def step_profiler(self) -> Optional[StepProfiler]:
+        """Profiles the execution of the step, if enabled by the tags of the op or run."""
+        return self._step_profiler
+
     @property
     def node_handle(self) -> "NodeHandle":
         return self.step.node_handle
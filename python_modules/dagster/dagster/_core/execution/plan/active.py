@@ -1,4 +1,5 @@
 import time
+from collections import defaultdict
 from collections.abc import Iterator, Mapping, Sequence
 from types import TracebackType
 from typing import Any, Callable, Optional, Union, cast
@@ -68,6 +69,9 @@ def __init__(
             or _default_sort_key
         )
 
+        # sort keys are a function of the step alone, so are computed once per step
+        self._sort_keys: dict[str, float] = {}
+
         self._max_concurrent = check.opt_int_param(max_concurrent, "max_concurrent")
         self._tag_concurrency_limits = check.opt_list_param(
             tag_concurrency_limits, "tag_concurrency_limits"
@@ -79,7 +83,18 @@ def __init__(
         self._step_outputs: set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: dict[str, set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: dict[str, set[str]] = {}
+
+        # Instead of checking every pending step against the resolved steps on each _update,
+        # pending steps are indexed by the steps they depend on, and count down their unresolved
+        # dependencies as those steps are resolved. Steps with no unresolved dependencies are
+        # _ready to be moved out of _pending on the next _update, in the order they were added to
+        # _pending.
+        self._resolved: set[str] = set()
+        self._pending_dependents: dict[str, set[str]] = defaultdict(set)
+        self._unresolved_dep_counts: dict[str, int] = {}
+        self._pending_order: dict[str, int] = {}
+        self._ready: set[str] = set()
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -115,6 +130,9 @@ def __init__(
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -190,16 +208,52 @@ def _pending_state_str(self) -> str:
             ),
         )
 
-    def _should_skip_step(self, step_key: str, successful_or_skipped_steps: set[str]) -> bool:
+    def _add_pending(self, step_key: str, depends_on_steps: set[str]) -> None:
+        if step_key in self._pending:
+            self._remove_pending(step_key)
+
+        self._pending[step_key] = depends_on_steps
+        self._pending_order[step_key] = len(self._pending_order)
+        unresolved_count = 0
+        for dep_key in depends_on_steps:
+            if dep_key not in self._resolved:
+                self._pending_dependents[dep_key].add(step_key)
+                unresolved_count += 1
+        self._unresolved_dep_counts[step_key] = unresolved_count
+        if unresolved_count == 0:
+            self._ready.add(step_key)
+
+    def _remove_pending(self, step_key: str) -> None:
+        for dep_key in self._pending.pop(step_key):
+            dependents = self._pending_dependents.get(dep_key)
+            if dependents:
+                dependents.discard(step_key)
+        del self._unresolved_dep_counts[step_key]
+        del self._pending_order[step_key]
+        self._ready.discard(step_key)
+
+    def _mark_resolved(self, step_key: str) -> None:
+        """Counts down the unresolved dependencies of the pending steps downstream of a step that
+        reached a terminal state.
+        """
+        if step_key in self._resolved:
+            return
+        self._resolved.add(step_key)
+        for dependent_key in self._pending_dependents.pop(step_key, ()):
+            self._unresolved_dep_counts[dependent_key] -= 1
+            if self._unresolved_dep_counts[dependent_key] == 0:
+                self._ready.add(dependent_key)
+
+    def _should_skip_step(self, step_key: str) -> bool:
         step = self.get_step_by_key(step_key)
         for step_input in step.step_inputs:
             missing_source_handles = []
 
             for source_handle in step_input.get_step_output_handle_dependencies():
                 if (
-                    source_handle.step_key in successful_or_skipped_steps
-                    and source_handle not in self._step_outputs
-                ):
+                    source_handle.step_key in self._success
+                    or source_handle.step_key in self._skipped
+                ) and source_handle not in self._step_outputs:
                     missing_source_handles.append(source_handle)
 
             if missing_source_handles:
@@ -220,37 +274,36 @@ def _update(self) -> None:
         new_steps_to_skip: list[str] = []
         new_steps_to_abandon: list[str] = []
 
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-        resolved_steps = self._success | self._skipped | self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._completed_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, depends_on_steps in self._pending.items():
-            if depends_on_steps.issubset(resolved_steps):
-                if self._should_skip_step(step_key, successful_or_skipped_steps):
-                    new_steps_to_skip.append(step_key)
-                elif depends_on_steps.intersection(failed_or_abandoned_steps):
-                    new_steps_to_abandon.append(step_key)
-                else:
-                    new_steps_to_execute.append(step_key)
+        for step_key in sorted(self._ready, key=self._pending_order.__getitem__):
+            depends_on_steps = self._pending[step_key]
+            if self._should_skip_step(step_key):
+                new_steps_to_skip.append(step_key)
+            elif any(
+                dep_key in self._failed or dep_key in self._abandoned
+                for dep_key in depends_on_steps
+            ):
+                new_steps_to_abandon.append(step_key)
+            else:
+                new_steps_to_execute.append(step_key)
 
         for key in new_steps_to_execute:
             self._executable.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         for key in new_steps_to_skip:
             self._pending_skip.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         for key in new_steps_to_abandon:
             self._pending_abandon.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         ready_to_retry = []
         tick_time = time.time()
@@ -311,10 +364,8 @@ def get_steps_to_execute(
 
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
+        # a stable sort keeps steps with equal sort keys in the order they became executable
+        self._executable.sort(key=self._get_sort_key)
 
         run_scoped_concurrency_limits_counter = None
         if self._tag_concurrency_limits:
@@ -326,7 +377,7 @@ def get_steps_to_execute(
 
         batch: list[ExecutionStep] = []
 
-        for step in steps:
+        for step_key in self._executable:
             if limit is not None and len(batch) >= limit:
                 break
 
@@ -336,6 +387,7 @@ def get_steps_to_execute(
             ):
                 break
 
+            step = self.get_step_by_key(step_key)
             if run_scoped_concurrency_limits_counter:
                 if run_scoped_concurrency_limits_counter.is_blocked(step):
                     continue
@@ -358,13 +410,22 @@ def get_steps_to_execute(
 
             batch.append(step)
 
+        if batch:
+            batch_keys = {step.key for step in batch}
+            self._executable = [key for key in self._executable if key not in batch_keys]
         for step in batch:
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
         return batch
 
+    def _get_sort_key(self, step_key: str) -> float:
+        sort_key = self._sort_keys.get(step_key)
+        if sort_key is None:
+            sort_key = self._sort_key_fn(self.get_step_by_key(step_key))
+            self._sort_keys[step_key] = sort_key
+        return sort_key
+
     def get_steps_to_skip(self) -> Sequence[ExecutionStep]:
         self._update()
 
@@ -439,20 +500,24 @@ def plan_events_iterator(
 
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
+        self._mark_resolved(step_key)
         self._mark_complete(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
+        self._mark_resolved(step_key)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
+        self._mark_resolved(step_key)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
+        self._mark_resolved(step_key)
         self._mark_complete(step_key)
 
     def mark_interrupted(self) -> None:
@@ -473,11 +538,12 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._plan.get_executable_step_deps()[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._mark_resolved(step_key)
 
         self._retry_state.mark_attempt(step_key)
 
@@ -1,3 +1,4 @@
+import asyncio
 import inspect
 from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
 from typing import Any, TypeVar, Union
@@ -122,13 +123,32 @@ def _validate_event(event: Any, step_context: StepExecutionContext) -> OpOutputU
     return event
 
 
+def _is_running_in_another_thread(event_loop: asyncio.AbstractEventLoop) -> bool:
+    if not event_loop.is_running():
+        return False
+    try:
+        return asyncio.get_running_loop() is not event_loop
+    except RuntimeError:
+        return True
+
+
+async def _anext(async_gen: AsyncIterator[T]) -> T:
+    return await async_gen.__anext__()
+
+
 def gen_from_async_gen(
     context: StepExecutionContext,
     async_gen: AsyncIterator[T],
 ) -> Iterator[T]:
+    event_loop = context.event_loop
     while True:
         try:
-            yield context.event_loop.run_until_complete(async_gen.__anext__())
+            if _is_running_in_another_thread(event_loop):
+                # the loop is shared by steps executing in other threads, e.g. by the threadpool
+                # executor, so the op is scheduled on it rather than driving it from this thread
+                yield asyncio.run_coroutine_threadsafe(_anext(async_gen), event_loop).result()
+            else:
+                yield event_loop.run_until_complete(async_gen.__anext__())
         except StopAsyncIteration:
             return
 
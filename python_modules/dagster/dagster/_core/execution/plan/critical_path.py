@@ -0,0 +1,179 @@
+"""Prioritization of the steps of a run by the critical path that each step unlocks.
+
+When a run is tagged with ``dagster/step_prioritization: critical_path``, executable steps of equal
+priority are started in decreasing order of the remaining critical path length of each step: the
+total duration of the longest chain of steps from the step to the end of the plan, estimated from
+the durations of the job's steps in its recent runs. When the number of steps that can execute at
+once is limited, this starts the long chains of the plan first, rather than leaving them to finish
+alone after the rest of the steps of the run.
+"""
+
+import heapq
+import statistics
+from collections import defaultdict
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, AbstractSet, Callable, Optional  # noqa: UP035
+
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.step import ExecutionStep
+from dagster._core.execution.stats import StepEventStatus
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunsFilter
+from dagster._core.storage.tags import (
+    CRITICAL_PATH_PRIORITIZATION,
+    PRIORITY_TAG,
+    STEP_PRIORITIZATION_TAG,
+)
+from dagster._core.utils import toposort
+
+if TYPE_CHECKING:
+    from dagster._core.instance import DagsterInstance
+
+DEFAULT_HISTORICAL_RUN_LIMIT = 5
+
+# used for every step when there are no durations to estimate from
+DEFAULT_STEP_DURATION = 1.0
+
+
+def get_node_key(step_key: str) -> str:
+    # steps mapped over a dynamic output, e.g. `op[0]`, `op[1]` and the unresolved `op[?]`, share
+    # the durations and dependencies of their node
+    return step_key.split("[")[0]
+
+
+def get_historical_step_durations(
+    instance: "DagsterInstance",
+    job_name: str,
+    run_limit: int = DEFAULT_HISTORICAL_RUN_LIMIT,
+) -> Mapping[str, float]:
+    """Returns the median duration in seconds of each node of the job over the steps that
+    succeeded in its most recent finished runs, keyed by node.
+    """
+    runs = instance.get_runs(
+        filters=RunsFilter(
+            job_name=job_name,
+            statuses=[DagsterRunStatus.SUCCESS, DagsterRunStatus.FAILURE],
+        ),
+        limit=run_limit,
+    )
+    durations_by_node: dict[str, list[float]] = defaultdict(list)
+    for run in runs:
+        for step_stats in instance.get_run_step_stats(run.run_id):
+            if (
+                step_stats.status != StepEventStatus.SUCCESS
+                or step_stats.start_time is None
+                or step_stats.end_time is None
+            ):
+                continue
+            durations_by_node[get_node_key(step_stats.step_key)].append(
+                step_stats.end_time - step_stats.start_time
+            )
+
+    return {node: statistics.median(durations) for node, durations in durations_by_node.items()}
+
+
+def get_critical_path_lengths(
+    step_deps: Mapping[str, AbstractSet[str]], durations: Mapping[str, float]
+) -> Mapping[str, float]:
+    """Returns the remaining critical path length of each step: the total duration of the longest
+    chain of steps from the step, inclusive, to the end of the plan. Steps without a known duration
+    are assumed to take the median of the known durations.
+    """
+    default_duration = statistics.median(durations.values()) if durations else DEFAULT_STEP_DURATION
+    downstream: dict[str, set[str]] = defaultdict(set)
+    for step_key, deps in step_deps.items():
+        for dep in deps:
+            downstream[dep].add(step_key)
+
+    lengths: dict[str, float] = {}
+    # steps are visited downstream first, so the lengths of their downstream steps are known
+    for level in reversed(toposort(step_deps)):
+        for step_key in level:
+            lengths[step_key] = durations.get(step_key, default_duration) + max(
+                (lengths[downstream_key] for downstream_key in downstream[step_key]), default=0.0
+            )
+    return lengths
+
+
+def get_node_deps(execution_plan: ExecutionPlan) -> Mapping[str, AbstractSet[str]]:
+    """Returns the dependencies between the nodes of the steps to execute in the plan."""
+    nodes_to_execute = {get_node_key(key) for key in execution_plan.step_keys_to_execute}
+    node_deps: dict[str, set[str]] = {node: set() for node in nodes_to_execute}
+    for step_key, deps in execution_plan.get_all_step_deps().items():
+        node = get_node_key(step_key)
+        if node not in nodes_to_execute:
+            continue
+        node_deps[node].update(
+            dep_node
+            for dep_node in (get_node_key(dep) for dep in deps)
+            if dep_node in nodes_to_execute and dep_node != node
+        )
+    return node_deps
+
+
+def get_critical_path_sort_key_fn(
+    execution_plan: ExecutionPlan, durations: Mapping[str, float]
+) -> Callable[[ExecutionStep], float]:
+    """Returns a sort key function for ActiveExecution that orders steps by their priority tag,
+    and steps of equal priority by decreasing remaining critical path length.
+    """
+    lengths = get_critical_path_lengths(get_node_deps(execution_plan), durations)
+    # scales priorities so that a difference in priority outweighs any difference in length
+    priority_scale = max(lengths.values(), default=0.0) + 1
+
+    def _sort_key(step: ExecutionStep) -> float:
+        priority = int(step.tags.get(PRIORITY_TAG, 0))
+        return -priority * priority_scale - lengths.get(get_node_key(step.key), 0.0)
+
+    return _sort_key
+
+
+def get_step_sort_key_fn(
+    instance: "DagsterInstance", dagster_run: DagsterRun, execution_plan: ExecutionPlan
+) -> Optional[Callable[[ExecutionStep], float]]:
+    """Returns the sort key function for the step prioritization selected by the tags of the run,
+    or None to order steps by their priority tag alone. The tag is validated when the run is
+    created, so runs stored before it was validated with an unknown prioritization are also
+    ordered by their priority tag alone.
+    """
+    if dagster_run.tags.get(STEP_PRIORITIZATION_TAG) != CRITICAL_PATH_PRIORITIZATION:
+        return None
+
+    return get_critical_path_sort_key_fn(
+        execution_plan, get_historical_step_durations(instance, dagster_run.job_name)
+    )
+
+
+def simulate_makespan(
+    step_deps: Mapping[str, AbstractSet[str]],
+    durations: Mapping[str, float],
+    max_concurrent: int,
+    sort_key_fn: Callable[[str], float],
+) -> float:
+    """Simulates executing the steps with at most max_concurrent of them at once, starting the
+    executable steps in the order of sort_key_fn whenever a slot is free, as ActiveExecution
+    does, and returns the time at which the last step finishes.
+    """
+    remaining_deps = {
+        step_key: {dep for dep in deps if dep in step_deps} for step_key, deps in step_deps.items()
+    }
+    downstream: dict[str, list[str]] = defaultdict(list)
+    for step_key, deps in remaining_deps.items():
+        for dep in deps:
+            downstream[dep].append(step_key)
+
+    executable = [step_key for step_key, deps in remaining_deps.items() if not deps]
+    running: list[tuple[float, str]] = []
+    now = 0.0
+    while executable or running:
+        executable.sort(key=lambda step_key: (sort_key_fn(step_key), step_key), reverse=True)
+        while executable and len(running) < max_concurrent:
+            step_key = executable.pop()
+            heapq.heappush(running, (now + durations[step_key], step_key))
+
+        now, finished_key = heapq.heappop(running)
+        for downstream_key in downstream[finished_key]:
+            remaining_deps[downstream_key].discard(finished_key)
+            if not remaining_deps[downstream_key]:
+                executable.append(downstream_key)
+
+    return now
@@ -1,5 +1,5 @@
 import sys
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from contextlib import ExitStack
 from typing import Optional, cast
 
@@ -7,6 +7,7 @@
 
 import dagster._check as check
 from dagster._core.definitions import Failure, HookExecutionResult, RetryRequested
+from dagster._core.definitions.metadata import MetadataValue
 from dagster._core.errors import (
     DagsterExecutionInterruptedError,
     DagsterMaxRetriesExceededError,
@@ -262,6 +263,7 @@ def dagster_event_sequence_for_step(
                 step_failure_data=StepFailureData(
                     error=fail_err,
                     user_failure_data=_user_failure_data_for_exc(retry_request.__cause__),
+                    metadata=_get_step_profile_metadata(step_context),
                 ),
             )
         else:  # retries.enabled or retries.deferred
@@ -281,6 +283,7 @@ def dagster_event_sequence_for_step(
                         user_failure_data=_user_failure_data_for_exc(retry_request.__cause__),
                         # set the flag to omit the outer stack if we have a cause to show
                         error_source=ErrorSource.USER_CODE_ERROR if fail_err.cause else None,
+                        metadata=_get_step_profile_metadata(step_context),
                     ),
                 )
                 if step_context.raise_on_error:
@@ -301,6 +304,7 @@ def dagster_event_sequence_for_step(
             step_context,
             sys.exc_info(),
             _user_failure_data_for_exc(failure),
+            metadata=_get_step_profile_metadata(step_context),
         )
         if step_context.raise_on_error:
             raise failure
@@ -312,6 +316,7 @@ def dagster_event_sequence_for_step(
             step_context,
             sys.exc_info(),
             error_source=ErrorSource.USER_CODE_ERROR,
+            metadata=_get_step_profile_metadata(step_context),
         )
 
         if step_context.raise_on_error:
@@ -324,6 +329,7 @@ def dagster_event_sequence_for_step(
             step_context,
             sys.exc_info(),
             error_source=ErrorSource.INTERRUPT,
+            metadata=_get_step_profile_metadata(step_context),
         )
         raise interrupt_error
 
@@ -338,7 +344,19 @@ def dagster_event_sequence_for_step(
                 if isinstance(error, DagsterError)
                 else ErrorSource.UNEXPECTED_ERROR
             ),
+            metadata=_get_step_profile_metadata(step_context),
         )
 
         if step_context.raise_on_error:
             raise error
+
+    finally:
+        # stops profiling steps that did not fail or succeed, such as those up for retry
+        if step_context.step_profiler:
+            step_context.step_profiler.finish()
+
+
+def _get_step_profile_metadata(
+    step_context: StepExecutionContext,
+) -> Optional[Mapping[str, MetadataValue]]:
+    return step_context.step_profiler.get_metadata() if step_context.step_profiler else None
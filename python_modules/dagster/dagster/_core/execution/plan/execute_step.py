@@ -1,7 +1,7 @@
 import inspect
 from collections import defaultdict
 from collections.abc import Iterable, Iterator, Mapping
-from typing import Any, Optional, Union, cast
+from typing import Any, Optional, TypeVar, Union, cast
 
 from typing_extensions import TypedDict
 
@@ -60,6 +60,11 @@
 from dagster._core.execution.plan.objects import StepSuccessData, TypeCheckData
 from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
 from dagster._core.execution.plan.utils import op_execution_error_boundary
+from dagster._core.execution.step_profiler import (
+    COMPUTE_PHASE,
+    INPUT_LOADING_PHASE,
+    OUTPUT_HANDLING_PHASE,
+)
 from dagster._core.storage.dagster_run import assets_are_externally_managed
 from dagster._core.storage.tags import BACKFILL_ID_TAG
 from dagster._core.types.dagster_type import DagsterType
@@ -67,6 +72,8 @@
 from dagster._utils.timing import time_execution_scope
 from dagster._utils.warnings import beta_warning, disable_dagster_warnings
 
+T = TypeVar("T")
+
 
 class AssetResultOutput(Output):
     """This is a marker subclass that represents an Output that was produced from an AssetResult."""
@@ -434,6 +441,12 @@ def _type_check_output(
         )
 
 
+def _profiled(step_context: StepExecutionContext, phase: str, iterator: Iterator[T]) -> Iterator[T]:
+    if step_context.step_profiler:
+        return step_context.step_profiler.profile_iterator(phase, iterator)
+    return iterator
+
+
 def core_dagster_event_sequence_for_step(
     step_context: StepExecutionContext,
 ) -> Iterator[DagsterEvent]:
@@ -449,6 +462,9 @@ def core_dagster_event_sequence_for_step(
     else:
         yield DagsterEvent.step_start_event(step_context)
 
+    if step_context.step_profiler:
+        step_context.step_profiler.start()
+
     with (
         time_execution_scope() as timer_result,
         enter_execution_context(step_context) as compute_context,
@@ -465,8 +481,10 @@ def core_dagster_event_sequence_for_step(
             if dagster_type.is_nothing:
                 continue
 
-            for event_or_input_value in step_input.source.load_input_object(
-                step_context, input_def
+            for event_or_input_value in _profiled(
+                step_context,
+                INPUT_LOADING_PHASE,
+                step_input.source.load_input_object(step_context, input_def),
             ):
                 if isinstance(event_or_input_value, DagsterEvent):
                     yield event_or_input_value
@@ -475,8 +493,12 @@ def core_dagster_event_sequence_for_step(
                     inputs[step_input.name] = event_or_input_value
 
         for input_name, input_value in inputs.items():
-            for evt in check.generator(
-                _type_checked_event_sequence_for_input(step_context, input_name, input_value)
+            for evt in _profiled(
+                step_context,
+                INPUT_LOADING_PHASE,
+                check.generator(
+                    _type_checked_event_sequence_for_input(step_context, input_name, input_value)
+                ),
             ):
                 yield evt
 
@@ -490,11 +512,15 @@ def core_dagster_event_sequence_for_step(
         else:
             core_gen = step_context.op_def.compute_fn
 
-        user_event_sequence = execute_core_compute(
+        user_event_sequence = _profiled(
             step_context,
-            inputs,
-            core_gen,
-            compute_context,
+            COMPUTE_PHASE,
+            execute_core_compute(
+                step_context,
+                inputs,
+                core_gen,
+                compute_context,
+            ),
         )
 
         failed_blocking_asset_check_evaluations = []
@@ -508,7 +534,11 @@ def core_dagster_event_sequence_for_step(
             if isinstance(user_event, DagsterEvent):
                 yield user_event
             elif isinstance(user_event, (Output, DynamicOutput)):
-                for evt in _type_check_and_store_output(step_context, user_event):
+                for evt in _profiled(
+                    step_context,
+                    OUTPUT_HANDLING_PHASE,
+                    _type_check_and_store_output(step_context, user_event),
+                ):
                     yield evt
             # for now, I'm ignoring AssetMaterializations yielded manually, but we might want
             # to do something with these in the above path eventually
@@ -544,7 +574,13 @@ def core_dagster_event_sequence_for_step(
         )
 
     yield DagsterEvent.step_success_event(
-        step_context, StepSuccessData(duration_ms=timer_result.millis)
+        step_context,
+        StepSuccessData(
+            duration_ms=timer_result.millis,
+            metadata=(
+                step_context.step_profiler.get_metadata() if step_context.step_profiler else None
+            ),
+        ),
     )
 
 
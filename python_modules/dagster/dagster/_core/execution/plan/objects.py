@@ -84,7 +84,10 @@ class ErrorSource(Enum):
     INTERRUPT = "INTERRUPT"
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(
+    skip_when_empty_fields={"metadata"},
+    field_serializers={"metadata": MetadataFieldSerializer},
+)
 class StepFailureData(
     NamedTuple(
         "_StepFailureData",
@@ -92,10 +95,11 @@ class StepFailureData(
             ("error", Optional[SerializableErrorInfo]),
             ("user_failure_data", Optional[UserFailureData]),
             ("error_source", ErrorSource),
+            ("metadata", Mapping[str, MetadataValue]),
         ],
     )
 ):
-    def __new__(cls, error, user_failure_data, error_source=None):
+    def __new__(cls, error, user_failure_data, error_source=None, metadata=None):
         return super().__new__(
             cls,
             error=truncate_event_error_info(
@@ -107,6 +111,9 @@ def __new__(cls, error, user_failure_data, error_source=None):
             error_source=check.opt_inst_param(
                 error_source, "error_source", ErrorSource, default=ErrorSource.FRAMEWORK_ERROR
             ),
+            metadata=normalize_metadata(
+                check.opt_mapping_param(metadata, "metadata", key_type=str)
+            ),
         )
 
     @property
@@ -138,6 +145,7 @@ def step_failure_event_from_exc_info(
     exc_info: ExcInfo,
     user_failure_data: Optional[UserFailureData] = None,
     error_source: Optional[ErrorSource] = None,
+    metadata: Optional[Mapping[str, MetadataValue]] = None,
 ):
     from dagster._core.events import DagsterEvent
 
@@ -147,6 +155,7 @@ def step_failure_event_from_exc_info(
             error=serializable_error_info_from_exc_info(exc_info),
             user_failure_data=user_failure_data,
             error_source=error_source,
+            metadata=metadata,
         ),
     )
 
@@ -170,7 +179,21 @@ def __new__(cls, error, seconds_to_wait=None):
         )
 
 
-@whitelist_for_serdes
-class StepSuccessData(NamedTuple("_StepSuccessData", [("duration_ms", float)])):
-    def __new__(cls, duration_ms):
-        return super().__new__(cls, duration_ms=check.float_param(duration_ms, "duration_ms"))
+@whitelist_for_serdes(
+    skip_when_empty_fields={"metadata"},
+    field_serializers={"metadata": MetadataFieldSerializer},
+)
+class StepSuccessData(
+    NamedTuple(
+        "_StepSuccessData",
+        [("duration_ms", float), ("metadata", Mapping[str, MetadataValue])],
+    )
+):
+    def __new__(cls, duration_ms, metadata=None):
+        return super().__new__(
+            cls,
+            duration_ms=check.float_param(duration_ms, "duration_ms"),
+            metadata=normalize_metadata(
+                check.opt_mapping_param(metadata, "metadata", key_type=str)
+            ),
+        )
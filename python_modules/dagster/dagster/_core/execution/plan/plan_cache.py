@@ -0,0 +1,164 @@
+"""An on-disk cache of execution plan snapshots, shared by the processes that build the plan of a
+run: the launcher, the run worker and each step worker.
+
+The cache is enabled by setting the DAGSTER_EXECUTION_PLAN_CACHE_DIR environment variable to a
+directory. Each entry is the snapshot of the plan for a job snapshot and the parts of the run config
+that shape the plan, built without a step selection or known state, which are applied when the plan
+is rehydrated from the snapshot. This way the plans of every step of a run, and of its retries and
+re-executions, share one entry, as do runs of the job that only differ in config values. The least
+recently used entries are deleted once there are more than DAGSTER_EXECUTION_PLAN_CACHE_MAX_ENTRIES.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Mapping, Sequence
+from contextlib import suppress
+from typing import Optional
+
+from dagster._core.definitions.job_definition import JobDefinition
+from dagster._core.definitions.repository_definition import RepositoryLoadData
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.state import KnownExecutionState
+from dagster._core.snap.execution_plan_snapshot import (
+    ExecutionPlanSnapshot,
+    snapshot_from_execution_plan,
+)
+from dagster._core.system_config.objects import ResolvedRunConfig
+from dagster._serdes import deserialize_value, serialize_value
+from dagster._utils import mkdir_p
+from dagster.version import __version__
+
+EXECUTION_PLAN_CACHE_DIR_ENV_VAR = "DAGSTER_EXECUTION_PLAN_CACHE_DIR"
+EXECUTION_PLAN_CACHE_MAX_ENTRIES_ENV_VAR = "DAGSTER_EXECUTION_PLAN_CACHE_MAX_ENTRIES"
+DEFAULT_EXECUTION_PLAN_CACHE_MAX_ENTRIES = 1000
+
+
+def get_execution_plan_cache_dir() -> Optional[str]:
+    return os.getenv(EXECUTION_PLAN_CACHE_DIR_ENV_VAR) or None
+
+
+def get_execution_plan_cache_max_entries() -> int:
+    return int(
+        os.getenv(
+            EXECUTION_PLAN_CACHE_MAX_ENTRIES_ENV_VAR, str(DEFAULT_EXECUTION_PLAN_CACHE_MAX_ENTRIES)
+        )
+    )
+
+
+def _get_plan_shaping_config(resolved_run_config: ResolvedRunConfig) -> Mapping[str, object]:
+    # The plan depends on the executor and on which inputs and outputs are set in the run config,
+    # but not on the configured values, which are only read as steps execute. Leaving the values
+    # out of the key keeps runs with per-run config, like dates or ids, on one entry.
+    return {
+        "execution": [
+            resolved_run_config.execution.execution_engine_name,
+            resolved_run_config.execution.execution_engine_config,
+        ],
+        "inputs": sorted(resolved_run_config.inputs),
+        "ops": {
+            handle: [sorted(op_config.inputs), sorted(op_config.outputs.output_names)]
+            for handle, op_config in resolved_run_config.ops.items()
+            if op_config.inputs or op_config.outputs.output_names
+        },
+    }
+
+
+def get_execution_plan_cache_key(
+    job_snapshot_id: str, resolved_run_config: ResolvedRunConfig
+) -> str:
+    # the dagster version is included since the way plans are built may change between versions
+    unhashed = json.dumps(
+        [__version__, job_snapshot_id, _get_plan_shaping_config(resolved_run_config)],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha1(unhashed.encode("utf-8")).hexdigest()
+
+
+def _load_cached_snapshot(path: str) -> Optional[ExecutionPlanSnapshot]:
+    try:
+        with open(path, encoding="utf8") as f:
+            snapshot = deserialize_value(f.read(), ExecutionPlanSnapshot)
+    except Exception:
+        # a missing, corrupt or incompatible entry is rebuilt and replaced
+        return None
+
+    # the modification time orders the entries by last use, for eviction
+    with suppress(OSError):
+        os.utime(path)
+    return snapshot
+
+
+def _evict_least_recently_used(cache_dir: str, max_entries: int) -> None:
+    mtimes_by_path = {}
+    with suppress(OSError):
+        for entry in os.scandir(cache_dir):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                with suppress(OSError):
+                    mtimes_by_path[entry.path] = entry.stat().st_mtime_ns
+
+    if len(mtimes_by_path) <= max_entries:
+        return
+
+    for path in sorted(mtimes_by_path, key=mtimes_by_path.__getitem__)[
+        : len(mtimes_by_path) - max_entries
+    ]:
+        # another process may be evicting the same entries
+        with suppress(OSError):
+            os.remove(path)
+
+
+def _write_cached_snapshot(path: str, snapshot: ExecutionPlanSnapshot) -> None:
+    try:
+        mkdir_p(os.path.dirname(path))
+        # written under a temporary name, so that concurrent readers never see a partial entry
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf8") as f:
+            f.write(serialize_value(snapshot))
+        os.replace(tmp_path, path)
+    except OSError:
+        # the cache is an optimization, so failing to write to it does not fail the build
+        return
+
+    _evict_least_recently_used(os.path.dirname(path), get_execution_plan_cache_max_entries())
+
+
+def build_execution_plan_with_cache(
+    cache_dir: str,
+    job_snapshot_id: str,
+    job_def: JobDefinition,
+    resolved_run_config: ResolvedRunConfig,
+    step_keys_to_execute: Optional[Sequence[str]],
+    known_state: KnownExecutionState,
+    repository_load_data: Optional[RepositoryLoadData],
+) -> ExecutionPlan:
+    """Builds the same plan as ExecutionPlan.build, rehydrating it from the cached snapshot of the
+    job's full plan if there is one, and otherwise building the full plan and caching it.
+    """
+    path = os.path.join(
+        cache_dir, get_execution_plan_cache_key(job_snapshot_id, resolved_run_config)
+    )
+    snapshot = _load_cached_snapshot(path)
+    if snapshot is None:
+        full_plan = ExecutionPlan.build(
+            job_def, resolved_run_config, repository_load_data=repository_load_data
+        )
+        snapshot = snapshot_from_execution_plan(full_plan, job_snapshot_id)
+        _write_cached_snapshot(path, snapshot)
+
+        if step_keys_to_execute is None and known_state == KnownExecutionState():
+            return full_plan
+
+    # resolving dynamic outputs from the known state happens as the plan is rebuilt, as it does
+    # when the plan is built, before any step selection is applied
+    plan = ExecutionPlan.rebuild_from_snapshot(
+        job_def.name,
+        snapshot._replace(
+            initial_known_state=known_state, repository_load_data=repository_load_data
+        ),
+    )
+    if step_keys_to_execute is not None and step_keys_to_execute != plan.step_keys_to_execute:
+        plan = plan.build_subset_plan(step_keys_to_execute, job_def, resolved_run_config)
+
+    return plan
@@ -0,0 +1,239 @@
+"""Opt-in profiling of the execution of individual steps.
+
+When a run or an op is tagged with ``dagster/step_profiling``, each of its steps measures the wall
+time, CPU time and memory allocated while loading inputs, executing the op's compute function and
+handling outputs, and reports them as metadata on its STEP_SUCCESS or STEP_FAILURE event. Tagging
+it with ``dagster/step_profiling_sample_interval`` additionally samples the stack of the step's
+thread at that interval, in seconds, and reports the sampled stacks in the folded format read by
+flame graph tools.
+"""
+
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import Optional, TypeVar
+
+from dagster._core.definitions.metadata import MetadataValue
+from dagster._core.execution.plan.step import ExecutionStep
+from dagster._core.storage.dagster_run import DagsterRun
+from dagster._core.storage.tags import STEP_PROFILING_SAMPLE_INTERVAL_TAG, STEP_PROFILING_TAG
+from dagster._utils.tags import get_boolean_tag_value, get_step_profiling_sample_interval
+
+T = TypeVar("T")
+
+STEP_PROFILE_METADATA_PREFIX = "dagster/profile/"
+
+INPUT_LOADING_PHASE = "input_loading"
+COMPUTE_PHASE = "compute"
+OUTPUT_HANDLING_PHASE = "output_handling"
+STEP_PHASES = [INPUT_LOADING_PHASE, COMPUTE_PHASE, OUTPUT_HANDLING_PHASE]
+
+MAX_REPORTED_STACKS = 100
+
+# tracemalloc traces the allocations of the whole process, so it is started by the first step
+# profiled concurrently in the process and stopped by the last, unless it was already tracing
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_step_count = 0
+_tracemalloc_started = False
+# incremented each time a step starts being profiled, to detect the steps that started while a
+# phase of another step was being measured
+_tracemalloc_generation = 0
+
+
+def _start_tracemalloc() -> None:
+    global _tracemalloc_step_count, _tracemalloc_started, _tracemalloc_generation  # noqa: PLW0603
+    with _tracemalloc_lock:
+        if _tracemalloc_step_count == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracemalloc_started = True
+        _tracemalloc_step_count += 1
+        _tracemalloc_generation += 1
+
+
+def _get_tracemalloc_state() -> tuple[int, int]:
+    with _tracemalloc_lock:
+        return _tracemalloc_step_count, _tracemalloc_generation
+
+
+def _stop_tracemalloc() -> None:
+    global _tracemalloc_step_count, _tracemalloc_started  # noqa: PLW0603
+    with _tracemalloc_lock:
+        _tracemalloc_step_count -= 1
+        if _tracemalloc_step_count == 0 and _tracemalloc_started:
+            tracemalloc.stop()
+            _tracemalloc_started = False
+
+
+def _get_peak_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        # not available on Windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macOS and in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _get_folded_stack(frame) -> str:
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(stack))
+
+
+class _PhaseProfile:
+    def __init__(self):
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.net_allocated_bytes = 0
+        self.peak_allocated_bytes = 0
+        # the peak is reset for the whole process at the start of each phase, so it is not
+        # reported for a phase measured while another step was profiled in the same process
+        self.shared_process = False
+
+
+class StepProfiler:
+    """Measures the resources used by each phase of the execution of a step, in the thread
+    executing the step.
+
+    CPU time is that of the thread executing the step. Allocations are traced for the whole
+    process, so include those of any steps executing concurrently in other threads of the process,
+    and peak RSS is the high-water mark of the process. The peak allocation of a phase is not
+    reported if another step was profiled in the same process while it was measured.
+    """
+
+    def __init__(self, stack_sample_interval: Optional[float] = None):
+        self._stack_sample_interval = stack_sample_interval
+        self._phases = {phase: _PhaseProfile() for phase in STEP_PHASES}
+        self._stack_counts: Counter[str] = Counter()
+        self._sampler_thread: Optional[threading.Thread] = None
+        self._shutdown_event = threading.Event()
+        self._started = False
+        self._finished = False
+
+    @staticmethod
+    def for_step(step: ExecutionStep, dagster_run: DagsterRun) -> Optional["StepProfiler"]:
+        """Returns a profiler for the step if profiling is enabled by the tags of its op or run."""
+        tags = {**dagster_run.tags, **(step.tags or {})}
+        # the tag is validated when the op or run is created, so an invalid value can only be set
+        # on runs created before it was, and disables stack sampling
+        stack_sample_interval = get_step_profiling_sample_interval(
+            tags.get(STEP_PROFILING_SAMPLE_INTERVAL_TAG)
+        )
+        if not get_boolean_tag_value(tags.get(STEP_PROFILING_TAG)) and not stack_sample_interval:
+            return None
+
+        return StepProfiler(stack_sample_interval=stack_sample_interval)
+
+    def start(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        _start_tracemalloc()
+
+        if self._stack_sample_interval:
+            self._sampler_thread = threading.Thread(
+                target=self._sample_stacks,
+                args=(threading.get_ident(),),
+                name="dagster-step-profiler",
+                daemon=True,
+            )
+            self._sampler_thread.start()
+
+    def _sample_stacks(self, thread_id: int) -> None:
+        interval = self._stack_sample_interval
+        while not self._shutdown_event.wait(interval):
+            frame = sys._current_frames().get(thread_id)  # noqa: SLF001
+            if frame is not None:
+                self._stack_counts[_get_folded_stack(frame)] += 1
+
+    @contextmanager
+    def profile_phase(self, phase: str) -> Iterator[None]:
+        profile = self._phases[phase]
+        tracing = tracemalloc.is_tracing()
+        start_traced = 0
+        start_step_count, start_generation = _get_tracemalloc_state()
+        if tracing:
+            tracemalloc.reset_peak()
+            start_traced, _ = tracemalloc.get_traced_memory()
+        start_wall = time.perf_counter()
+        start_cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            profile.wall_time += time.perf_counter() - start_wall
+            profile.cpu_time += time.thread_time() - start_cpu
+            if tracing and tracemalloc.is_tracing():
+                end_traced, peak_traced = tracemalloc.get_traced_memory()
+                profile.net_allocated_bytes += end_traced - start_traced
+                profile.peak_allocated_bytes = max(
+                    profile.peak_allocated_bytes, peak_traced - start_traced
+                )
+            end_step_count, end_generation = _get_tracemalloc_state()
+            if start_step_count > 1 or end_step_count > 1 or end_generation != start_generation:
+                profile.shared_process = True
+
+    def profile_iterator(self, phase: str, iterator: Iterator[T]) -> Iterator[T]:
+        """Profiles the work done to produce each item of the iterator as part of the phase, but
+        not the work done by the consumer of the items between them.
+        """
+        while True:
+            with self.profile_phase(phase):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def finish(self) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        if not self._started:
+            return
+
+        if self._sampler_thread:
+            self._shutdown_event.set()
+            self._sampler_thread.join()
+        _stop_tracemalloc()
+
+    def get_metadata(self) -> Mapping[str, MetadataValue]:
+        """Finishes profiling the step and returns the measurements as metadata."""
+        self.finish()
+
+        metadata: dict[str, MetadataValue] = {}
+        for phase, profile in self._phases.items():
+            prefix = f"{STEP_PROFILE_METADATA_PREFIX}{phase}/"
+            metadata[f"{prefix}wall_time_ms"] = MetadataValue.float(profile.wall_time * 1000)
+            metadata[f"{prefix}cpu_time_ms"] = MetadataValue.float(profile.cpu_time * 1000)
+            metadata[f"{prefix}net_allocated_bytes"] = MetadataValue.int(
+                profile.net_allocated_bytes
+            )
+            if not profile.shared_process:
+                metadata[f"{prefix}peak_allocated_bytes"] = MetadataValue.int(
+                    profile.peak_allocated_bytes
+                )
+
+        peak_rss_bytes = _get_peak_rss_bytes()
+        if peak_rss_bytes is not None:
+            metadata[f"{STEP_PROFILE_METADATA_PREFIX}peak_rss_bytes"] = MetadataValue.int(
+                peak_rss_bytes
+            )
+
+        if self._stack_sample_interval:
+            metadata[f"{STEP_PROFILE_METADATA_PREFIX}stack_samples"] = MetadataValue.text(
+                "\n".join(
+                    f"{stack} {count}"
+                    for stack, count in self._stack_counts.most_common(MAX_REPORTED_STACKS)
+                )
+            )
+
+        return metadata
@@ -1,14 +1,17 @@
 """Facilities for running arbitrary commands in child processes."""
 
 import os
-import queue
 import sys
+import threading
+import time
+import traceback
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Iterator
-from multiprocessing import Queue
+from multiprocessing.connection import Connection, wait
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
 
 from typing_extensions import Literal
 
@@ -67,31 +70,153 @@ def __init__(self, pid, exit_code=None):
         super().__init__()
 
 
-def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessCommand):
+class ChildProcessEventSender:
+    """Sends events from a child process to its parent over the write end of a pipe.
+
+    Like a multiprocessing queue, events are sent from a background thread, so that putting an event
+    never blocks the command. Events put while an earlier batch is being sent are sent together as
+    the next batch, so a command that yields events faster than the parent reads them results in
+    fewer, larger writes rather than one write per event.
+    """
+
+    def __init__(self, connection: Connection):
+        self._connection = connection
+        self._pending: list[object] = []
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._send_batches, name="child-process-event-sender", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, event: object) -> None:
+        with self._condition:
+            self._pending.append(event)
+            self._condition.notify()
+
+    def _send_batches(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                batch, self._pending = self._pending, []
+
+            if not batch:
+                return
+
+            try:
+                self._connection.send(batch)
+            except (OSError, EOFError):
+                # the parent process has stopped reading events
+                return
+            except Exception:
+                # an event could not be pickled; send the others, as a queue would
+                for event in batch:
+                    try:
+                        self._connection.send([event])
+                    except (OSError, EOFError):
+                        return
+                    except Exception:
+                        traceback.print_exc()
+
+    def close(self) -> None:
+        """Sends any pending events and closes the connection."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        self._connection.close()
+
+
+class ChildProcessEventReader:
+    """Reads the batches of events sent by a ChildProcessEventSender over the read end of a pipe."""
+
+    def __init__(self, connection: Connection):
+        self.connection = connection
+        self._events: deque[object] = deque()
+        self._at_eof = False
+
+    @property
+    def at_eof(self) -> bool:
+        """Whether every process holding the write end has closed it, so no more events will
+        arrive. The read end then always polls as readable, so it must not be waited on.
+        """
+        return self._at_eof
+
+    def get(self, timeout: float) -> Optional[object]:
+        """Returns the next event, waiting up to timeout seconds for one to arrive, or None if there
+        is none.
+        """
+        if not self._events and not self._at_eof and self.connection.poll(timeout):
+            try:
+                self._events.extend(self.connection.recv())
+            except EOFError:
+                self._at_eof = True
+        return self._events.popleft() if self._events else None
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class ChildProcessEventMultiplexer:
+    """Waits until any of a set of child processes has sent events or exited.
+
+    A parent process that executes several commands at once registers each command's event reader
+    and process here, reads their events without blocking, and calls wait when none of them had an
+    event. The parent then wakes as soon as any child makes progress, instead of polling each child
+    in turn with a timeout.
+    """
+
+    def __init__(self):
+        self._registered: dict[int, tuple[ChildProcessEventReader, BaseProcess]] = {}
+
+    def register(self, event_reader: ChildProcessEventReader, process: BaseProcess) -> None:
+        self._registered[id(event_reader)] = (event_reader, process)
+
+    def unregister(self, event_reader: ChildProcessEventReader) -> None:
+        self._registered.pop(id(event_reader), None)
+
+    def wait(self, timeout: float) -> None:
+        waitables: list[Any] = []
+        for event_reader, process in self._registered.values():
+            # once a child has closed its pipe, only its exit is waited on
+            if not event_reader.at_eof:
+                waitables.append(event_reader.connection)
+            waitables.append(process.sentinel)
+        if waitables:
+            wait(waitables, timeout=timeout)
+        else:
+            time.sleep(timeout)
+
+
+def _execute_command_in_child_process(event_connection: Connection, command: ChildProcessCommand):
     """Wraps the execution of a ChildProcessCommand.
 
-    Handles errors and communicates across a queue with the parent process.
+    Handles errors and communicates across a pipe with the parent process.
     """
     check.inst_param(command, "command", ChildProcessCommand)
 
+    event_sender = ChildProcessEventSender(event_connection)
     with capture_interrupts():
         pid = os.getpid()
-        event_queue.put(ChildProcessStartEvent(pid=pid))
+        event_sender.put(ChildProcessStartEvent(pid=pid))
         try:
             for step_event in command.execute():
-                event_queue.put(step_event)
-            event_queue.put(ChildProcessDoneEvent(pid=pid))
+                event_sender.put(step_event)
+            event_sender.put(ChildProcessDoneEvent(pid=pid))
 
         except (
             Exception,
             KeyboardInterrupt,
             DagsterExecutionInterruptedError,
         ):
-            event_queue.put(
+            event_sender.put(
                 ChildProcessSystemErrorEvent(
                     pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
                 )
             )
+        finally:
+            event_sender.close()
 
 
 TICK = 20.0 * 1.0 / 1000.0
@@ -102,32 +227,34 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
 
 
 def _poll_for_event(
-    process, event_queue
+    process, event_reader: ChildProcessEventReader, timeout: float = TICK
 ) -> Optional[Union["DagsterEvent", Literal["PROCESS_DEAD_AND_QUEUE_EMPTY"]]]:
-    try:
-        return event_queue.get(block=True, timeout=TICK)
-    except queue.Empty:
-        if not process.is_alive():
-            # There is a possibility that after the last queue.get the
-            # process created another event and then died. In that case
-            # we want to continue draining the queue.
-            try:
-                return event_queue.get(block=False)
-            except queue.Empty:
-                # If the queue empty we know that there are no more events
-                # and that the process has died.
-                return PROCESS_DEAD_AND_QUEUE_EMPTY
-    return None
+    event = event_reader.get(timeout)
+    if event is None and event_reader.at_eof:
+        # no more events will arrive, so wait for the process to exit instead of the pipe
+        process.join(timeout)
+    if event is None and not process.is_alive():
+        # There is a possibility that after the last read the
+        # process sent another batch of events and then died. In that case
+        # we want to continue draining the pipe.
+        event = event_reader.get(0)
+        if event is None:
+            # If the pipe is empty we know that there are no more events
+            # and that the process has died.
+            return PROCESS_DEAD_AND_QUEUE_EMPTY
+    return event  # pyright: ignore[reportReturnType]
 
 
 def execute_child_process_command(
-    multiprocessing_ctx: MultiprocessingBaseContext, command: ChildProcessCommand
+    multiprocessing_ctx: MultiprocessingBaseContext,
+    command: ChildProcessCommand,
+    event_multiplexer: Optional[ChildProcessEventMultiplexer] = None,
 ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, BaseProcess]]]:
     """Execute a ChildProcessCommand in a new process.
 
     This function starts a new process whose execution target is a ChildProcessCommand wrapped by
-    _execute_command_in_child_process; polls the queue for events yielded by the child process
-    until the process dies and the queue is empty.
+    _execute_command_in_child_process; polls the pipe for events yielded by the child process
+    until the process dies and the pipe is empty.
 
     This function yields a complex set of objects to enable having multiple child process
     executions in flight:
@@ -142,24 +269,36 @@ def execute_child_process_command(
     Args:
         multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
         command (ChildProcessCommand): The command to execute in the child process.
+        event_multiplexer (Optional[ChildProcessEventMultiplexer]): If provided, the child process
+            is registered with the multiplexer, and polling for its events does not block. The
+            caller is then responsible for waiting on the multiplexer between polls.
 
     Warning: if the child process is in an infinite loop, this will
     also infinitely loop.
     """
     check.inst_param(command, "command", ChildProcessCommand)
 
-    event_queue = multiprocessing_ctx.Queue()
+    read_connection, write_connection = multiprocessing_ctx.Pipe(duplex=False)
+    event_reader = ChildProcessEventReader(read_connection)
+    poll_timeout = TICK if event_multiplexer is None else 0
     try:
         process = multiprocessing_ctx.Process(  # type: ignore
-            target=_execute_command_in_child_process, args=(event_queue, command)
+            target=_execute_command_in_child_process, args=(write_connection, command)
         )
-        process.start()
+        try:
+            process.start()
+        finally:
+            # only the child process writes events, so that reads see the end of the pipe once it
+            # exits
+            write_connection.close()
+        if event_multiplexer:
+            event_multiplexer.register(event_reader, process)
         yield process
 
         completed_properly = False
 
         while not completed_properly:
-            event = _poll_for_event(process, event_queue)
+            event = _poll_for_event(process, event_reader, poll_timeout)
 
             if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
                 break
@@ -175,4 +314,6 @@ def execute_child_process_command(
 
         process.join()
     finally:
-        event_queue.close()
+        if event_multiplexer:
+            event_multiplexer.unregister(event_reader)
+        event_reader.close()
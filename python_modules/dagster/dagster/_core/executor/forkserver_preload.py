@@ -0,0 +1,31 @@
+"""Preloads a job's definition in the multiprocess executor's forkserver process.
+
+The multiprocess executor adds this module to the forkserver's preload list when
+``preload_definitions`` is set. Importing it loads the definition of the job serialized in the
+DAGSTER_FORKSERVER_PRELOAD_JOB environment variable, so that step processes forked from the
+forkserver find the definition in the ReconstructableJob cache, instead of each importing the user's
+code and building the repository definition again.
+"""
+
+import os
+
+from dagster._core.definitions.reconstruct import ReconstructableJob
+from dagster._core.executor.multiprocess import FORKSERVER_PRELOAD_JOB_ENV_VAR
+from dagster._serdes import deserialize_value
+
+
+def _preload_job_definition() -> None:
+    # removed so that processes forked from the forkserver do not inherit it
+    serialized_job = os.environ.pop(FORKSERVER_PRELOAD_JOB_ENV_VAR, None)
+    if not serialized_job:
+        return
+
+    try:
+        deserialize_value(serialized_job, ReconstructableJob).get_definition()
+    except Exception:
+        # the forkserver only tolerates import errors in preloaded modules, and step processes will
+        # surface any error loading the job when they load it themselves
+        pass
+
+
+_preload_job_definition()
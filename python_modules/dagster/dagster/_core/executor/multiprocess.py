@@ -3,7 +3,7 @@
 import sys
 import threading
 from collections.abc import Iterator, Mapping, Sequence
-from contextlib import ExitStack
+from contextlib import ExitStack, contextmanager
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
 from typing import TYPE_CHECKING, Any, Optional
@@ -22,6 +22,7 @@
 from dagster._core.execution.context.system import IStepContext, PlanOrchestrationContext
 from dagster._core.execution.context_creation_job import create_context_free_log_manager
 from dagster._core.execution.plan.active import ActiveExecution
+from dagster._core.execution.plan.critical_path import get_step_sort_key_fn
 from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.plan.state import KnownExecutionState
@@ -32,10 +33,13 @@
     ChildProcessCommand,
     ChildProcessCrashException,
     ChildProcessEvent,
+    ChildProcessEventMultiplexer,
     ChildProcessSystemErrorEvent,
     execute_child_process_command,
 )
+from dagster._core.executor.step_worker_pool import StepWorker, StepWorkerPool
 from dagster._core.instance import DagsterInstance
+from dagster._serdes import serialize_value
 from dagster._utils import get_run_crash_explanation, start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.timing import TimerResult, format_duration, time_execution_scope
@@ -46,6 +50,13 @@
 
 DELEGATE_MARKER = "multiprocess_subprocess_init"
 
+MAX_EVENT_WAIT_SECONDS = 1.0
+"""The longest the executor blocks waiting for child process events, after which it checks for
+interrupts, steps ready to retry and concurrency claims even if no child process made progress."""
+
+FORKSERVER_PRELOAD_MODULE = "dagster._core.executor.forkserver_preload"
+FORKSERVER_PRELOAD_JOB_ENV_VAR = "DAGSTER_FORKSERVER_PRELOAD_JOB"
+
 
 class MultiprocessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
@@ -93,6 +104,7 @@ def execute(self) -> Iterator[DagsterEvent]:
                     step_keys_to_execute=[self.step_key],
                     known_state=self.known_state,
                     repository_load_data=self.repository_load_data,
+                    job_snapshot_id=self.dagster_run.job_snapshot_id,
                 )
                 yield from execute_plan_iterator(
                     execution_plan,
@@ -116,6 +128,10 @@ def __init__(
         tag_concurrency_limits: Optional[list[dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        preload_definitions: bool = False,
+        use_worker_pool: bool = False,
+        max_steps_per_worker: Optional[int] = None,
+        max_worker_memory_growth_mb: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -141,6 +157,14 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._preload_definitions = check.bool_param(preload_definitions, "preload_definitions")
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker"
+        )
+        self._max_worker_memory_growth_mb = check.opt_int_param(
+            max_worker_memory_growth_mb, "max_worker_memory_growth_mb"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -174,8 +198,18 @@ def execute(
             if "dagster._core.executor.multiprocess" not in preload:
                 preload = ["dagster._core.executor.multiprocess", *preload]
 
+            if self._preload_definitions and FORKSERVER_PRELOAD_MODULE not in preload:
+                preload = [*preload, FORKSERVER_PRELOAD_MODULE]
+
             multiproc_ctx.set_forkserver_preload(list(preload))
 
+            if self._preload_definitions:
+                # step processes load the job with the plan's repository load data applied, and
+                # definitions are cached by equality of the ReconstructableJob
+                start_forkserver_with_preloaded_job(
+                    job.with_repository_load_data(execution_plan.repository_load_data)
+                )
+
         limit = self._max_concurrent
         tag_concurrency_limits = self._tag_concurrency_limits
 
@@ -198,20 +232,37 @@ def execute(
                 ActiveExecution(
                     execution_plan,
                     retry_mode=self.retries,
+                    sort_key_fn=get_step_sort_key_fn(
+                        plan_context.instance, plan_context.dagster_run, execution_plan
+                    ),
                     max_concurrent=limit,
                     tag_concurrency_limits=tag_concurrency_limits,
                     instance_concurrency_context=instance_concurrency_context,
                 )
             )
+            worker_pool = (
+                stack.enter_context(
+                    StepWorkerPool(
+                        multiproc_ctx,
+                        max_steps_per_worker=self._max_steps_per_worker,
+                        max_memory_growth_mb=self._max_worker_memory_growth_mb,
+                    )
+                )
+                if self._use_worker_pool
+                else None
+            )
             active_iters: dict[str, Iterator[Optional[DagsterEvent]]] = {}
             errors: dict[int, SerializableErrorInfo] = {}
             processes: dict[str, BaseProcess] = {}
             term_events: dict[str, Any] = {}
+            event_multiplexer = ChildProcessEventMultiplexer()
             stopping: bool = False
 
             try:
                 while (not stopping and not active_execution.is_complete) or active_iters:
+                    made_progress = False
                     if active_execution.check_for_interrupts():
+                        made_progress = True
                         yield DagsterEvent.engine_event(
                             plan_context,
                             "Multiprocess executor: received termination signal - "
@@ -236,21 +287,40 @@ def execute(
                         if not steps:
                             break
 
+                        made_progress = True
                         for step in steps:
                             step_context = plan_context.for_step(step)
-                            term_events[step.key] = multiproc_ctx.Event()
-                            active_iters[step.key] = execute_step_out_of_process(
-                                multiproc_ctx,
-                                job,
-                                step_context,
-                                step,
-                                errors,
-                                processes,
-                                term_events,
-                                self.retries,
-                                active_execution.get_known_state(),
-                                execution_plan.repository_load_data,
-                            )
+                            if worker_pool:
+                                worker = worker_pool.checkout()
+                                term_events[step.key] = worker.term_event
+                                active_iters[step.key] = execute_step_in_worker(
+                                    worker_pool,
+                                    worker,
+                                    job,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    processes,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                    event_multiplexer=event_multiplexer,
+                                )
+                            else:
+                                term_events[step.key] = multiproc_ctx.Event()
+                                active_iters[step.key] = execute_step_out_of_process(
+                                    multiproc_ctx,
+                                    job,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    processes,
+                                    term_events,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                    event_multiplexer=event_multiplexer,
+                                )
 
                     # process active iterators
                     empty_iters = []
@@ -260,6 +330,7 @@ def execute(
                             if event_or_none is None:
                                 continue
                             else:
+                                made_progress = True
                                 yield event_or_none
                                 active_execution.handle_event(event_or_none)
 
@@ -291,6 +362,8 @@ def execute(
                             empty_iters.append(key)
 
                     # clear and mark complete finished iterators
+                    if empty_iters:
+                        made_progress = True
                     for key in empty_iters:
                         del active_iters[key]
                         del term_events[key]
@@ -298,7 +371,19 @@ def execute(
                         active_execution.verify_complete(plan_context, key)
 
                     # process skipped and abandoned steps
-                    yield from active_execution.plan_events_iterator(plan_context)
+                    for plan_event in active_execution.plan_events_iterator(plan_context):
+                        made_progress = True
+                        yield plan_event
+
+                    # block until a child process sends events or exits, rather than polling each
+                    # child process in turn
+                    if not made_progress:
+                        sleep_interval = active_execution.sleep_interval()
+                        event_multiplexer.wait(
+                            max(0, min(sleep_interval, MAX_EVENT_WAIT_SECONDS))
+                            if sleep_interval
+                            else MAX_EVENT_WAIT_SECONDS
+                        )
             except Exception:
                 if not stopping and active_iters:
                     serializable_error = serializable_error_info_from_exc_info(sys.exc_info())
@@ -362,6 +447,33 @@ def execute(
             )
 
 
+@contextmanager
+def _forkserver_preload_job_env_var(recon_job: ReconstructableJob) -> Iterator[None]:
+    previous_value = os.environ.get(FORKSERVER_PRELOAD_JOB_ENV_VAR)
+    os.environ[FORKSERVER_PRELOAD_JOB_ENV_VAR] = serialize_value(recon_job)
+    try:
+        yield
+    finally:
+        if previous_value is None:
+            del os.environ[FORKSERVER_PRELOAD_JOB_ENV_VAR]
+        else:
+            os.environ[FORKSERVER_PRELOAD_JOB_ENV_VAR] = previous_value
+
+
+def start_forkserver_with_preloaded_job(recon_job: ReconstructableJob) -> None:
+    """Starts the forkserver with the given job's definition loaded, by passing the job to the
+    FORKSERVER_PRELOAD_MODULE through the forkserver's environment. The forkserver preload modules
+    must already be set, and must include FORKSERVER_PRELOAD_MODULE.
+
+    Like the preload modules, this has no effect if the forkserver is already running, since it is
+    started once per process.
+    """
+    from multiprocessing import forkserver
+
+    with _forkserver_preload_job_env_var(recon_job):
+        forkserver.ensure_running()
+
+
 def execute_step_out_of_process(
     multiproc_ctx: MultiprocessingBaseContext,
     recon_job: ReconstructableJob,
@@ -373,6 +485,7 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    event_multiplexer: Optional[ChildProcessEventMultiplexer] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
@@ -392,7 +505,7 @@ def execute_step_out_of_process(
         metadata={},
     )
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    for ret in execute_child_process_command(multiproc_ctx, command, event_multiplexer):
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -402,3 +515,46 @@ def execute_step_out_of_process(
             processes[step.key] = ret
         else:
             check.failed(f"Unexpected return value from child process {type(ret)}")
+
+
+def execute_step_in_worker(
+    worker_pool: StepWorkerPool,
+    worker: StepWorker,
+    recon_job: ReconstructableJob,
+    step_context: IStepContext,
+    step: ExecutionStep,
+    errors: dict[int, SerializableErrorInfo],
+    processes: dict[str, BaseProcess],
+    retries: RetryMode,
+    known_state: KnownExecutionState,
+    repository_load_data: Optional[RepositoryLoadData],
+    event_multiplexer: Optional[ChildProcessEventMultiplexer] = None,
+) -> Iterator[Optional[DagsterEvent]]:
+    command = MultiprocessExecutorChildProcessCommand(
+        run_config=step_context.run_config,
+        dagster_run=step_context.dagster_run,
+        step_key=step.key,
+        instance_ref=step_context.instance.get_ref(),
+        term_event=None,
+        recon_pipeline=recon_job,
+        retry_mode=retries,
+        known_state=known_state,
+        repository_load_data=repository_load_data,
+    )
+
+    yield DagsterEvent.step_worker_starting(
+        step_context,
+        f'Sending "{step.key}" to worker process (pid: {worker.process.pid}).',
+        metadata={},
+    )
+
+    for ret in worker_pool.execute_command(worker, command, event_multiplexer):
+        if ret is None or isinstance(ret, DagsterEvent):
+            yield ret
+        elif isinstance(ret, ChildProcessEvent):
+            if isinstance(ret, ChildProcessSystemErrorEvent):
+                errors[ret.pid] = ret.error_info
+        elif isinstance(ret, BaseProcess):
+            processes[step.key] = ret
+        else:
+            check.failed(f"Unexpected return value from worker process {type(ret)}")
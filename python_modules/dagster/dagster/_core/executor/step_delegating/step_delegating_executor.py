@@ -12,6 +12,7 @@
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.execution.context.system import PlanOrchestrationContext
 from dagster._core.execution.plan.active import ActiveExecution
+from dagster._core.execution.plan.critical_path import get_step_sort_key_fn
 from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
 from dagster._core.execution.plan.objects import StepFailureData
 from dagster._core.execution.plan.plan import ExecutionPlan
@@ -158,6 +159,56 @@ def _get_step_handler_context(
             dagster_run=plan_context.dagster_run,
         )
 
+    def _check_steps_health(
+        self,
+        plan_context: PlanOrchestrationContext,
+        active_execution: ActiveExecution,
+        steps: Sequence["ExecutionStep"],
+    ) -> None:
+        if not steps:
+            return
+
+        step_handler_contexts = [
+            self._get_step_handler_context(plan_context, [step], active_execution) for step in steps
+        ]
+        try:
+            health_check_results = self._step_handler.check_steps_health(step_handler_contexts)
+        except Exception:
+            # check each step separately instead, so that an error only fails the steps it affects
+            health_check_results = {}
+
+        for step, step_handler_context in zip(steps, step_handler_contexts):
+            step_context = plan_context.for_step(step)
+
+            try:
+                health_check_result = health_check_results.get(step.key)
+                if health_check_result is None:
+                    health_check_result = self._step_handler.check_step_health(step_handler_context)
+                if not health_check_result.is_healthy:
+                    health_check_error = SerializableErrorInfo(
+                        message=f"Step {step.key} failed health check: {health_check_result.unhealthy_reason}",
+                        stack=[],
+                        cls_name=None,
+                    )
+
+                    self.get_failure_or_retry_event_after_crash(
+                        step_context,
+                        health_check_error,
+                        active_execution.get_known_state(),
+                    )
+
+            except Exception:
+                serializable_error = serializable_error_info_from_exc_info(sys.exc_info())
+                # Log a step failure event if there was an error during the health
+                # check
+                DagsterEvent.step_failure_event(
+                    step_context=step_context,
+                    step_failure_data=StepFailureData(
+                        error=serializable_error,
+                        user_failure_data=None,
+                    ),
+                )
+
     def execute(self, plan_context: PlanOrchestrationContext, execution_plan: ExecutionPlan):
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
@@ -174,6 +225,9 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
             with ActiveExecution(
                 execution_plan,
                 retry_mode=self.retries,
+                sort_key_fn=get_step_sort_key_fn(
+                    plan_context.instance, plan_context.dagster_run, execution_plan
+                ),
                 max_concurrent=self._max_concurrent,
                 tag_concurrency_limits=self._tag_concurrency_limits,
                 instance_concurrency_context=instance_concurrency_context,
@@ -326,41 +380,9 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                             curr_time - last_check_step_health_time
                         ).total_seconds() >= self._check_step_health_interval_seconds:
                             last_check_step_health_time = curr_time
-                            for step in running_steps.values():
-                                step_context = plan_context.for_step(step)
-
-                                try:
-                                    health_check_result = self._step_handler.check_step_health(
-                                        self._get_step_handler_context(
-                                            plan_context, [step], active_execution
-                                        )
-                                    )
-                                    if not health_check_result.is_healthy:
-                                        health_check_error = SerializableErrorInfo(
-                                            message=f"Step {step.key} failed health check: {health_check_result.unhealthy_reason}",
-                                            stack=[],
-                                            cls_name=None,
-                                        )
-
-                                        self.get_failure_or_retry_event_after_crash(
-                                            step_context,
-                                            health_check_error,
-                                            active_execution.get_known_state(),
-                                        )
-
-                                except Exception:
-                                    serializable_error = serializable_error_info_from_exc_info(
-                                        sys.exc_info()
-                                    )
-                                    # Log a step failure event if there was an error during the health
-                                    # check
-                                    DagsterEvent.step_failure_event(
-                                        step_context=plan_context.for_step(step),
-                                        step_failure_data=StepFailureData(
-                                            error=serializable_error,
-                                            user_failure_data=None,
-                                        ),
-                                    )
+                            self._check_steps_health(
+                                plan_context, active_execution, list(running_steps.values())
+                            )
 
                         if self._max_concurrent is not None:
                             max_steps_to_run = self._max_concurrent - len(running_steps)
@@ -373,15 +395,22 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         # process events from concurrency blocked steps
                         list(active_execution.concurrency_event_iterator(plan_context))
 
-                        for step in active_execution.get_steps_to_execute(max_steps_to_run):
-                            running_steps[step.key] = step
+                        steps_to_launch = active_execution.get_steps_to_execute(max_steps_to_run)
+                        if steps_to_launch:
                             list(
-                                self._step_handler.launch_step(
-                                    self._get_step_handler_context(
-                                        plan_context, [step], active_execution
-                                    )
+                                self._step_handler.launch_steps(
+                                    [
+                                        self._get_step_handler_context(
+                                            plan_context, [step], active_execution
+                                        )
+                                        for step in steps_to_launch
+                                    ]
                                 )
                             )
+                        # steps are only tracked as running once they have been launched, so that a
+                        # failed launch does not terminate steps that were never started
+                        for step in steps_to_launch:
+                            running_steps[step.key] = step
 
                         time.sleep(self._sleep_seconds)
                 except Exception:
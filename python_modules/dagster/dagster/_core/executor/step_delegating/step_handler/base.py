@@ -94,3 +94,33 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckSt
     @abstractmethod
     def terminate_step(self, step_handler_context: StepHandlerContext) -> Iterator[DagsterEvent]:
         pass
+
+    def launch_steps(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> Iterator[DagsterEvent]:
+        """Launches a batch of steps, each with its own context. Step handlers that can launch
+        several steps with fewer calls than launching each step separately should override this.
+
+        The executor only tracks the steps as running once the whole batch has been launched, so
+        steps of a batch that raises an error are not terminated by the executor.
+        """
+        for step_handler_context in step_handler_contexts:
+            yield from self.launch_step(step_handler_context)
+
+    def check_steps_health(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> Mapping[str, CheckStepHealthResult]:
+        """Checks the health of a batch of in-flight steps, each with its own context, returning
+        the result for each step by step key. Step handlers that can check the health of several
+        steps with fewer calls than checking each step separately, for example with a single list
+        call, should override this.
+
+        If an error is raised, the health of each step is checked separately with
+        check_step_health.
+        """
+        results = {}
+        for step_handler_context in step_handler_contexts:
+            result = self.check_step_health(step_handler_context)
+            for step_key in step_handler_context.execute_step_args.step_keys_to_execute or []:
+                results[step_key] = result
+        return results
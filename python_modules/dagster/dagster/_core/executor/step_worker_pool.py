@@ -0,0 +1,279 @@
+"""A pool of long-lived worker processes that execute multiprocess executor steps."""
+
+import os
+import sys
+from collections.abc import Iterator
+from multiprocessing import Queue
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext as MultiprocessingBaseContext
+from multiprocessing.process import BaseProcess
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
+
+from typing_extensions import Self
+
+import dagster._check as check
+from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._core.executor.child_process_executor import (
+    PROCESS_DEAD_AND_QUEUE_EMPTY,
+    TICK,
+    ChildProcessCrashException,
+    ChildProcessDoneEvent,
+    ChildProcessEvent,
+    ChildProcessEventMultiplexer,
+    ChildProcessEventReader,
+    ChildProcessEventSender,
+    ChildProcessStartEvent,
+    ChildProcessSystemErrorEvent,
+    _poll_for_event,
+)
+from dagster._utils.error import serializable_error_info_from_exc_info
+from dagster._utils.interrupts import capture_interrupts, pop_captured_interrupt
+
+if TYPE_CHECKING:
+    from dagster._core.events import DagsterEvent
+    from dagster._core.executor.multiprocess import MultiprocessExecutorChildProcessCommand
+
+WORKER_SHUTDOWN_TIMEOUT = 15
+"""Seconds to wait for a worker process to exit after asking it to shut down."""
+
+
+class StepWorkerStatusEvent(
+    NamedTuple("StepWorkerStatusEvent", [("pid", int), ("should_retire", bool)]),
+    ChildProcessEvent,
+):
+    """Sent by a worker after each command, before the command's done or error event, to tell the
+    parent process whether the worker should be replaced instead of receiving more commands.
+    """
+
+
+def _get_max_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macOS, and in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _run_step_worker(
+    command_queue: Queue,
+    event_connection: Connection,
+    term_event: Any,
+    max_memory_growth_mb: Optional[int],
+) -> None:
+    """The target of each worker process. Executes the commands sent over the command queue one at
+    a time, until it receives None, reporting events over the event pipe in the same way as
+    _execute_command_in_child_process.
+    """
+    event_sender = ChildProcessEventSender(event_connection)
+    with capture_interrupts():
+        pid = os.getpid()
+        baseline_rss = None
+        while True:
+            command: Optional[MultiprocessExecutorChildProcessCommand] = command_queue.get()
+            if command is None:
+                event_sender.close()
+                return
+
+            # interrupts sent while the worker was idle belong to an earlier command
+            pop_captured_interrupt()
+            term_event.clear()
+            command.term_event = term_event
+
+            event_sender.put(ChildProcessStartEvent(pid=pid))
+            should_retire = False
+            try:
+                for step_event in command.execute():
+                    event_sender.put(step_event)
+                done_event = ChildProcessDoneEvent(pid=pid)
+            except (
+                Exception,
+                KeyboardInterrupt,
+                DagsterExecutionInterruptedError,
+            ):
+                # the process may be left in a bad state by a failed command, so it is replaced
+                should_retire = True
+                done_event = ChildProcessSystemErrorEvent(
+                    pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+                )
+
+            # the memory used after the first command, which has imported the user's code, is the
+            # baseline that later growth is measured against
+            rss = _get_max_rss_bytes()
+            if baseline_rss is None:
+                baseline_rss = rss
+            elif (
+                max_memory_growth_mb is not None
+                and rss is not None
+                and rss - baseline_rss > max_memory_growth_mb * 1024 * 1024
+            ):
+                should_retire = True
+
+            event_sender.put(StepWorkerStatusEvent(pid=pid, should_retire=should_retire))
+            event_sender.put(done_event)
+
+
+class StepWorker:
+    """A long-lived worker process, along with the queue used to send it commands, the pipe used to
+    receive its events, and the event used to interrupt the command it is executing.
+    """
+
+    def __init__(
+        self, multiprocessing_ctx: MultiprocessingBaseContext, max_memory_growth_mb: Optional[int]
+    ):
+        self.command_queue = multiprocessing_ctx.Queue()
+        read_connection, write_connection = multiprocessing_ctx.Pipe(duplex=False)
+        self.event_reader = ChildProcessEventReader(read_connection)
+        self.term_event = multiprocessing_ctx.Event()
+        self.process: BaseProcess = multiprocessing_ctx.Process(  # type: ignore
+            target=_run_step_worker,
+            args=(self.command_queue, write_connection, self.term_event, max_memory_growth_mb),
+        )
+        try:
+            self.process.start()
+        finally:
+            write_connection.close()
+        self.num_commands = 0
+        self.should_retire = False
+
+    def shutdown(self) -> None:
+        if self.process.is_alive():
+            self.command_queue.put(None)
+
+    def close(self) -> None:
+        self.process.join(timeout=WORKER_SHUTDOWN_TIMEOUT)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.command_queue.close()
+        self.event_reader.close()
+
+
+class StepWorkerPool:
+    """Executes multiprocess executor step commands in reusable worker processes, instead of
+    starting a new process for each step.
+
+    Workers are started on demand, so the number of workers is bounded by the number of steps the
+    executor runs concurrently. Since modules, the reconstructed job definition and other
+    process-level caches survive between commands, only the first step run by each worker pays for
+    loading the user's code. A worker is replaced after ``max_steps_per_worker`` commands, after its
+    peak memory grows by more than ``max_memory_growth_mb`` since its first command, or after a
+    command raises a system error. A worker that dies while executing a command is reported with a
+    ChildProcessCrashException, as a crashed step process would be.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_steps_per_worker: Optional[int] = None,
+        max_memory_growth_mb: Optional[int] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker"
+        )
+        self._max_memory_growth_mb = check.opt_int_param(
+            max_memory_growth_mb, "max_memory_growth_mb"
+        )
+        self._idle_workers: list[StepWorker] = []
+        self._busy_workers: set[StepWorker] = set()
+        self._retired_workers: list[StepWorker] = []
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def checkout(self) -> StepWorker:
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.process.is_alive():
+                self._busy_workers.add(worker)
+                return worker
+            self._retired_workers.append(worker)
+
+        worker = StepWorker(self._multiprocessing_ctx, self._max_memory_growth_mb)
+        self._busy_workers.add(worker)
+        return worker
+
+    def _release(self, worker: StepWorker) -> None:
+        self._busy_workers.discard(worker)
+        if (
+            worker.should_retire
+            or not worker.process.is_alive()
+            or (
+                self._max_steps_per_worker is not None
+                and worker.num_commands >= self._max_steps_per_worker
+            )
+        ):
+            worker.shutdown()
+            self._retired_workers.append(worker)
+        else:
+            self._idle_workers.append(worker)
+
+    def execute_command(
+        self,
+        worker: StepWorker,
+        command: "MultiprocessExecutorChildProcessCommand",
+        event_multiplexer: Optional[ChildProcessEventMultiplexer] = None,
+    ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, BaseProcess]]]:
+        """Executes a command in a checked out worker, yielding the same sequence of objects as
+        execute_child_process_command, and returns the worker to the pool when done.
+        """
+        check.invariant(worker in self._busy_workers, "Worker is not checked out from this pool")
+        # the worker's own term event is used, since events can not be sent over a queue
+        command.term_event = None
+        completed_properly = False
+        poll_timeout = TICK if event_multiplexer is None else 0
+        try:
+            worker.command_queue.put(command)
+            worker.num_commands += 1
+            if event_multiplexer:
+                event_multiplexer.register(worker.event_reader, worker.process)
+            yield worker.process
+
+            while not completed_properly:
+                event = _poll_for_event(worker.process, worker.event_reader, poll_timeout)
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    break
+
+                if isinstance(event, StepWorkerStatusEvent):
+                    worker.should_retire = event.should_retire
+                    continue
+
+                yield event
+
+                if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                    completed_properly = True
+
+            if not completed_properly:
+                raise ChildProcessCrashException(
+                    pid=worker.process.pid, exit_code=worker.process.exitcode
+                )
+        finally:
+            if event_multiplexer:
+                event_multiplexer.unregister(worker.event_reader)
+            # a worker whose command was abandoned part way through may still be executing it
+            if not completed_properly:
+                worker.should_retire = True
+            self._release(worker)
+
+    def close(self) -> None:
+        workers = [*self._idle_workers, *self._busy_workers, *self._retired_workers]
+        self._idle_workers = []
+        self._busy_workers = set()
+        self._retired_workers = []
+        for worker in workers:
+            worker.shutdown()
+        for worker in workers:
+            worker.close()
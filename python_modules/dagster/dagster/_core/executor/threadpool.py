@@ -0,0 +1,281 @@
+import os
+import queue
+import sys
+import threading
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor as _ThreadPool
+from contextlib import ExitStack, contextmanager
+from typing import Any, NamedTuple, Optional, Union, cast
+
+import dagster._check as check
+from dagster._core.events import DagsterEvent, EngineEventData
+from dagster._core.execution.api import ExecuteRunWithPlanIterable
+from dagster._core.execution.compute_logs import create_compute_log_file_key
+from dagster._core.execution.context.system import (
+    PlanExecutionContext,
+    PlanOrchestrationContext,
+    StepExecutionContext,
+)
+from dagster._core.execution.context_creation_job import PlanExecutionContextManager
+from dagster._core.execution.plan.critical_path import get_step_sort_key_fn
+from dagster._core.execution.plan.execute_plan import (
+    _handle_compute_log_setup_error,
+    _handle_compute_log_teardown_error,
+    _trigger_hook,
+    dagster_event_sequence_for_step,
+)
+from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.retries import RetryMode
+from dagster._core.executor.base import Executor
+from dagster._utils.timing import format_duration, time_execution_scope
+
+MAX_EVENT_WAIT_SECONDS = 1.0
+"""The longest the executor blocks waiting for step threads to report events, after which it checks
+for interrupts, steps ready to retry and concurrency claims even if no step made progress."""
+
+
+def get_default_threadpool_max_concurrent() -> int:
+    # the default number of workers of concurrent.futures.ThreadPoolExecutor
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class _StepThreadDone(NamedTuple("_StepThreadDone", [("error", Optional[BaseException])])):
+    """Sent by a step thread once it has finished executing the step, along with any error raised
+    while executing it.
+    """
+
+
+def _execute_step_in_thread(
+    step_context: StepExecutionContext,
+    event_queue: "queue.Queue[tuple[str, Union[DagsterEvent, _StepThreadDone]]]",
+) -> None:
+    step_key = step_context.step.key
+    try:
+        for step_event in check.generator(dagster_event_sequence_for_step(step_context)):
+            event_queue.put((step_key, check.inst(step_event, DagsterEvent)))
+    except BaseException as e:
+        # raised in the orchestrating thread, as it would have been by the in-process executor
+        event_queue.put((step_key, _StepThreadDone(error=e)))
+    else:
+        event_queue.put((step_key, _StepThreadDone(error=None)))
+
+
+@contextmanager
+def _run_event_loop_in_thread(job_context: PlanExecutionContext) -> Iterator[None]:
+    """Runs the run's event loop in a background thread while steps execute, so that async ops in
+    every step thread are scheduled on the one shared loop instead of each driving the loop
+    themselves, which a loop does not allow from more than one thread at a time.
+    """
+    event_loop = job_context.event_loop
+    loop_thread = threading.Thread(
+        target=event_loop.run_forever, name="dagster-threadpool-event-loop", daemon=True
+    )
+    loop_thread.start()
+    try:
+        yield
+    finally:
+        # resources are torn down on the calling thread, using the loop, once it has stopped
+        event_loop.call_soon_threadsafe(event_loop.stop)
+        loop_thread.join()
+
+
+def threadpool_execution_iterator(
+    job_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    max_concurrent: int,
+    tag_concurrency_limits: Optional[Sequence[dict[str, Any]]] = None,
+) -> Iterator[DagsterEvent]:
+    check.inst_param(job_context, "job_context", PlanExecutionContext)
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.int_param(max_concurrent, "max_concurrent")
+
+    compute_log_manager = job_context.instance.compute_log_manager
+    step_keys = [step.key for step in execution_plan.get_steps_to_execute_in_topo_order()]
+    with ExitStack() as stack:
+        instance_concurrency_context = stack.enter_context(
+            InstanceConcurrencyContext(job_context.instance, job_context.dagster_run)
+        )
+        active_execution = stack.enter_context(
+            execution_plan.start(
+                retry_mode=job_context.retry_mode,
+                sort_key_fn=get_step_sort_key_fn(
+                    job_context.instance, job_context.dagster_run, execution_plan
+                ),
+                max_concurrent=max_concurrent,
+                tag_concurrency_limits=list(tag_concurrency_limits or []),
+                instance_concurrency_context=instance_concurrency_context,
+            )
+        )
+        with ExitStack() as capture_stack:
+            # begin capturing logs for the whole process, which includes every step thread
+            file_key = create_compute_log_file_key()
+            log_key = compute_log_manager.build_log_key_for_run(job_context.run_id, file_key)
+            try:
+                log_context = capture_stack.enter_context(compute_log_manager.capture_logs(log_key))
+                yield DagsterEvent.capture_logs(job_context, step_keys, log_key, log_context)
+            except Exception:
+                yield from _handle_compute_log_setup_error(job_context, sys.exc_info())
+
+            event_queue: queue.Queue[tuple[str, Union[DagsterEvent, _StepThreadDone]]] = (
+                queue.Queue()
+            )
+            active_steps: dict[str, StepExecutionContext] = {}
+            step_event_lists: dict[str, list[DagsterEvent]] = {}
+            stopping = False
+
+            stack.enter_context(_run_event_loop_in_thread(job_context))
+            with _ThreadPool(
+                max_workers=max_concurrent, thread_name_prefix="dagster-step"
+            ) as thread_pool:
+                while (not stopping and not active_execution.is_complete) or active_steps:
+                    if active_execution.check_for_interrupts():
+                        yield DagsterEvent.engine_event(
+                            job_context,
+                            "Threadpool executor: received termination signal - waiting for"
+                            " running steps to finish",
+                            EngineEventData.interrupted(list(active_steps.keys())),
+                        )
+                        stopping = True
+                        active_execution.mark_interrupted()
+
+                    if not stopping:
+                        steps = active_execution.get_steps_to_execute()
+                        yield from active_execution.concurrency_event_iterator(job_context)
+
+                        for step in steps:
+                            step_context = cast(
+                                "StepExecutionContext",
+                                job_context.for_step(step, active_execution.get_known_state()),
+                            )
+                            active_steps[step.key] = step_context
+                            step_event_lists[step.key] = []
+                            thread_pool.submit(_execute_step_in_thread, step_context, event_queue)
+
+                    if not active_steps:
+                        # waiting on steps to retry or on concurrency claims
+                        if not stopping:
+                            active_execution.sleep_til_ready()
+                        continue
+
+                    sleep_interval = active_execution.sleep_interval()
+                    try:
+                        step_key, event_or_done = event_queue.get(
+                            timeout=max(0, min(sleep_interval, MAX_EVENT_WAIT_SECONDS))
+                            if sleep_interval
+                            else MAX_EVENT_WAIT_SECONDS
+                        )
+                    except queue.Empty:
+                        continue
+
+                    while True:
+                        if isinstance(event_or_done, _StepThreadDone):
+                            step_context = active_steps.pop(step_key)
+                            step_event_list = step_event_lists.pop(step_key)
+                            if event_or_done.error:
+                                raise event_or_done.error
+
+                            active_execution.verify_complete(job_context, step_key)
+
+                            # process skips from failures or uncovered inputs
+                            for event in active_execution.plan_events_iterator(job_context):
+                                step_event_list.append(event)
+                                yield event
+
+                            # pass a list of step events to hooks
+                            yield from _trigger_hook(step_context, step_event_list)
+                        else:
+                            step_event_lists[step_key].append(event_or_done)
+                            yield event_or_done
+                            active_execution.handle_event(event_or_done)
+
+                        try:
+                            step_key, event_or_done = event_queue.get_nowait()
+                        except queue.Empty:
+                            break
+
+            try:
+                capture_stack.close()
+            except Exception:
+                yield from _handle_compute_log_teardown_error(job_context, sys.exc_info())
+
+
+class ThreadpoolExecutor(Executor):
+    """Executes the steps of a plan concurrently in a pool of threads in the run's process.
+
+    Steps are executed in the same process as the run, sharing its resources, so the executor is
+    best suited to IO-bound ops, which release the GIL while they wait. Async ops are run on the
+    run's event loop, which is shared by every step thread.
+    """
+
+    def __init__(
+        self,
+        retries: RetryMode,
+        max_concurrent: Optional[int] = None,
+        tag_concurrency_limits: Optional[list[dict[str, Any]]] = None,
+    ):
+        self._retries = check.inst_param(retries, "retries", RetryMode)
+        self._max_concurrent = check.int_param(
+            max_concurrent or get_default_threadpool_max_concurrent(), "max_concurrent"
+        )
+        self._tag_concurrency_limits = check.opt_list_param(
+            tag_concurrency_limits, "tag_concurrency_limits"
+        )
+
+    @property
+    def retries(self) -> RetryMode:
+        return self._retries
+
+    @property
+    def max_concurrent(self) -> int:
+        return self._max_concurrent
+
+    def _execution_iterator(
+        self, job_context: PlanExecutionContext, execution_plan: ExecutionPlan
+    ) -> Iterator[DagsterEvent]:
+        return threadpool_execution_iterator(
+            job_context,
+            execution_plan,
+            max_concurrent=self._max_concurrent,
+            tag_concurrency_limits=self._tag_concurrency_limits,
+        )
+
+    def execute(
+        self, plan_context: PlanOrchestrationContext, execution_plan: ExecutionPlan
+    ) -> Iterator[DagsterEvent]:
+        check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
+        check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+
+        step_keys_to_execute = execution_plan.step_keys_to_execute
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            f"Executing steps in up to {self._max_concurrent} threads in process (pid:"
+            f" {os.getpid()})",
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
+
+        with time_execution_scope() as timer_result:
+            yield from iter(
+                ExecuteRunWithPlanIterable(
+                    execution_plan=plan_context.execution_plan,
+                    iterator=self._execution_iterator,
+                    execution_context_manager=PlanExecutionContextManager(
+                        job=plan_context.job,
+                        retry_mode=plan_context.retry_mode,
+                        execution_plan=plan_context.execution_plan,
+                        run_config=plan_context.run_config,
+                        dagster_run=plan_context.dagster_run,
+                        instance=plan_context.instance,
+                        raise_on_error=plan_context.raise_on_error,
+                        output_capture=plan_context.output_capture,
+                    ),
+                )
+            )
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            f"Finished steps in threads in process (pid: {os.getpid()}) in"
+            f" {format_duration(timer_result.millis)}",
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
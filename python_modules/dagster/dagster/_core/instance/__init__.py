@@ -182,7 +182,9 @@
     )
     from dagster._core.storage.compute_log_manager import ComputeLogManager
     from dagster._core.storage.daemon_cursor import DaemonCursorStorage
-    from dagster._core.storage.event_log import EventLogStorage
+    from dagster._core.storage.event_log import EventLogStorage, SqlEventLogStorage
+    from dagster._core.storage.event_log.archive import EventLogArchiveStore
+    from dagster._core.storage.event_log.asset_record_cache import AssetRecordCacheStats
     from dagster._core.storage.event_log.base import (
         AssetRecord,
         EventLogConnection,
@@ -452,7 +454,12 @@ def __init__(
         from dagster._core.scheduler import Scheduler
         from dagster._core.secrets import SecretsLoader
         from dagster._core.storage.compute_log_manager import ComputeLogManager
-        from dagster._core.storage.event_log import EventLogStorage
+        from dagster._core.storage.event_log import EventLogStorage, SqlEventLogStorage
+        from dagster._core.storage.event_log.asset_record_cache import (
+            AssetRecordCache,
+            get_asset_record_cache_size,
+            get_asset_record_cache_ttl_seconds,
+        )
         from dagster._core.storage.root import LocalArtifactStorage
         from dagster._core.storage.runs import RunStorage
         from dagster._core.storage.schedules import ScheduleStorage
@@ -529,6 +536,22 @@ def __init__(
         # Used for batched event handling
         self._event_buffer: dict[str, list[EventLogEntry]] = defaultdict(list)
 
+        # Lazily loaded from the `event_log_archive` settings
+        self._event_log_archive_store: Optional[EventLogArchiveStore] = None
+
+        # Read-through caches of asset state, enabled by setting DAGSTER_ASSET_RECORD_CACHE_SIZE
+        self._latest_materialization_cache: Optional[AssetRecordCache[EventLogEntry]] = None
+        self._asset_record_cache: Optional[AssetRecordCache[AssetRecord]] = None
+        asset_record_cache_size = get_asset_record_cache_size()
+        if asset_record_cache_size > 0 and isinstance(self._event_storage, SqlEventLogStorage):
+            asset_record_cache_ttl_seconds = get_asset_record_cache_ttl_seconds()
+            self._latest_materialization_cache = AssetRecordCache(
+                asset_record_cache_size, asset_record_cache_ttl_seconds
+            )
+            self._asset_record_cache = AssetRecordCache(
+                asset_record_cache_size, asset_record_cache_ttl_seconds
+            )
+
     # ctors
 
     @public
@@ -866,6 +889,22 @@ def compute_log_manager(self) -> "ComputeLogManager":
             self._compute_log_manager.register_instance(self)
         return self._compute_log_manager
 
+    # event log archive
+
+    @property
+    def event_log_archive_store(self) -> Optional["EventLogArchiveStore"]:
+        from dagster._core.instance.ref import configurable_class_data
+        from dagster._core.storage.event_log.archive import EventLogArchiveStore
+
+        if not self._event_log_archive_store:
+            archive_store_config = self.get_settings("event_log_archive").get("archive_store")
+            if not archive_store_config:
+                return None
+            self._event_log_archive_store = configurable_class_data(archive_store_config).rehydrate(
+                as_type=EventLogArchiveStore
+            )
+        return self._event_log_archive_store
+
     def get_settings(self, settings_key: str) -> Any:
         check.str_param(settings_key, "settings_key")
         if self._settings and settings_key in self._settings:
@@ -2111,12 +2150,35 @@ def update_asset_cached_status_data(
         self, asset_key: AssetKey, cache_values: "AssetStatusCacheValue"
     ) -> None:
         self._event_storage.update_asset_cached_status_data(asset_key, cache_values)
+        self._invalidate_asset_record_caches([asset_key])
 
     @traced
     def wipe_asset_cached_status(self, asset_keys: Sequence[AssetKey]) -> None:
         check.list_param(asset_keys, "asset_keys", of_type=AssetKey)
         for asset_key in asset_keys:
             self._event_storage.wipe_asset_cached_status(asset_key)
+        self._invalidate_asset_record_caches(asset_keys)
+
+    def _invalidate_asset_record_caches(self, asset_keys: Sequence[AssetKey]) -> None:
+        # Cached entries are checked against the asset events written since they were fetched,
+        # which catches updates made in other processes. Updates that are not accompanied by an
+        # asset event, like status cache writes, are invalidated right away in this process, and
+        # only once the entries expire in other processes.
+        if self._latest_materialization_cache:
+            self._latest_materialization_cache.invalidate(asset_keys)
+        if self._asset_record_cache:
+            self._asset_record_cache.invalidate(asset_keys)
+
+    def get_asset_record_cache_stats(self) -> Mapping[str, "AssetRecordCacheStats"]:
+        """Returns the hit/miss counters of the asset record caches enabled by setting
+        DAGSTER_ASSET_RECORD_CACHE_SIZE, keyed by the name of the cached method.
+        """
+        stats = {}
+        if self._latest_materialization_cache:
+            stats["get_latest_materialization_events"] = self._latest_materialization_cache.stats
+        if self._asset_record_cache:
+            stats["get_asset_records"] = self._asset_record_cache.stats
+        return stats
 
     @traced
     def all_asset_keys(self) -> Sequence[AssetKey]:
@@ -2156,7 +2218,22 @@ def has_asset_key(self, asset_key: AssetKey) -> bool:
     def get_latest_materialization_events(
         self, asset_keys: Iterable[AssetKey]
     ) -> Mapping[AssetKey, Optional["EventLogEntry"]]:
-        return self._event_storage.get_latest_materialization_events(asset_keys)
+        from dagster._core.storage.event_log.asset_record_cache import (
+            LATEST_MATERIALIZATION_CACHE_EVENT_TYPES,
+        )
+
+        if self._latest_materialization_cache is None:
+            return self._event_storage.get_latest_materialization_events(asset_keys)
+
+        event_storage = cast("SqlEventLogStorage", self._event_storage)
+        return self._latest_materialization_cache.get_or_fetch(
+            asset_keys,
+            event_storage.get_max_asset_event_storage_id(LATEST_MATERIALIZATION_CACHE_EVENT_TYPES),
+            lambda after_storage_id, limit: event_storage.get_asset_keys_with_events_after(
+                after_storage_id, LATEST_MATERIALIZATION_CACHE_EVENT_TYPES, limit
+            ),
+            self._event_storage.get_latest_materialization_events,
+        )
 
     @public
     @traced
@@ -2170,7 +2247,7 @@ def get_latest_materialization_event(self, asset_key: AssetKey) -> Optional["Eve
             Optional[EventLogEntry]: The latest materialization event for the given asset
                 key, or `None` if the asset has not been materialized.
         """
-        return self._event_storage.get_latest_materialization_events([asset_key]).get(asset_key)
+        return self.get_latest_materialization_events([asset_key]).get(asset_key)
 
     @traced
     def get_latest_asset_check_evaluation_record(
@@ -2435,7 +2512,30 @@ def get_asset_records(
         Returns:
             Sequence[AssetRecord]: List of asset records.
         """
-        return self._event_storage.get_asset_records(asset_keys)
+        from dagster._core.storage.event_log.asset_record_cache import (
+            ASSET_RECORD_CACHE_EVENT_TYPES,
+        )
+
+        if self._asset_record_cache is None or asset_keys is None:
+            return self._event_storage.get_asset_records(asset_keys)
+
+        event_storage = cast("SqlEventLogStorage", self._event_storage)
+        records_by_key = self._asset_record_cache.get_or_fetch(
+            asset_keys,
+            event_storage.get_max_asset_event_storage_id(ASSET_RECORD_CACHE_EVENT_TYPES),
+            lambda after_storage_id, limit: event_storage.get_asset_keys_with_events_after(
+                after_storage_id, ASSET_RECORD_CACHE_EVENT_TYPES, limit
+            ),
+            lambda to_fetch: {
+                record.asset_entry.asset_key: record
+                for record in self._event_storage.get_asset_records(to_fetch)
+            },
+        )
+        return [
+            record
+            for record in (records_by_key[asset_key] for asset_key in dict.fromkeys(asset_keys))
+            if record is not None
+        ]
 
     @traced
     def get_event_tags_for_asset(
@@ -2469,6 +2569,7 @@ def wipe_assets(self, asset_keys: Sequence[AssetKey]) -> None:
         from dagster._core.events import AssetWipedData, DagsterEvent, DagsterEventType
 
         check.list_param(asset_keys, "asset_keys", of_type=AssetKey)
+        self._invalidate_asset_record_caches(asset_keys)
         for asset_key in asset_keys:
             self._event_storage.wipe_asset(asset_key)
             self.report_dagster_event(
@@ -2494,6 +2595,7 @@ def wipe_asset_partitions(
         from dagster._core.events import AssetWipedData, DagsterEvent, DagsterEventType
 
         self._event_storage.wipe_asset_partitions(asset_key, partition_keys)
+        self._invalidate_asset_record_caches([asset_key])
         self.report_dagster_event(
             run_id=RUNLESS_RUN_ID,
             dagster_event=DagsterEvent(
@@ -3287,6 +3389,33 @@ def get_batch_ticks(
             return {}
         return self._schedule_storage.get_batch_ticks(selector_ids, limit, statuses)
 
+    @traced
+    def get_latest_ticks(
+        self, instigator_ids: Sequence[tuple[str, str]]
+    ) -> Mapping[str, Optional["InstigatorTick"]]:
+        """Returns the most recent tick of each of the given instigators, keyed by selector id.
+
+        Args:
+            instigator_ids (Sequence[Tuple[str, str]]): The origin id and selector id of each
+                instigator.
+        """
+        if not instigator_ids:
+            return {}
+
+        if self.supports_batch_tick_queries:
+            ticks_by_selector_id = self.get_batch_ticks(
+                [selector_id for _, selector_id in instigator_ids], limit=1
+            )
+            return {
+                selector_id: next(iter(ticks_by_selector_id.get(selector_id, [])), None)
+                for _, selector_id in instigator_ids
+            }
+
+        return {
+            selector_id: next(iter(self.get_ticks(origin_id, selector_id, limit=1)), None)
+            for origin_id, selector_id in instigator_ids
+        }
+
     @traced
     def get_tick(
         self, origin_id: str, selector_id: str, timestamp: float
@@ -3321,6 +3450,9 @@ def create_tick(self, tick_data: "TickData") -> "InstigatorTick":
     def update_tick(self, tick: "InstigatorTick"):
         return check.not_none(self._schedule_storage).update_tick(tick)
 
+    def update_ticks(self, ticks: Sequence["InstigatorTick"]) -> Sequence["InstigatorTick"]:
+        return check.not_none(self._schedule_storage).update_ticks(ticks)
+
     def purge_ticks(
         self,
         origin_id: str,
@@ -323,6 +323,16 @@ def _tick_retention_config_schema() -> Field:
     )
 
 
+def event_log_archive_config_schema() -> Field:
+    return Field(
+        {
+            "archive_store": config_field_for_configurable_class(),
+            "older_than_days": Field(int, is_required=False),
+        },
+        is_required=False,
+    )
+
+
 def retention_config_schema() -> Field:
     return Field(
         {
@@ -609,6 +619,7 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
         ),
         "freshness": Field({"enabled": Field(Bool)}, is_required=False),
         "concurrency": get_concurrency_config(),
+        "event_log_archive": event_log_archive_config_schema(),
     }
 
 
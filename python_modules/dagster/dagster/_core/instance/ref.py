@@ -461,6 +461,7 @@ def from_dir(
             "auto_materialize",
             "concurrency",
             "freshness",
+            "event_log_archive",
         }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
@@ -11,7 +11,7 @@
     _check as check,
 )
 from dagster._builtins import Bool
-from dagster._config import Array, Field, Noneable, ScalarUnion, Shape
+from dagster._config import Array, Enum, EnumValue, Field, Noneable, ScalarUnion, Shape
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.instance import T_DagsterInstance
 from dagster._core.run_coordinator.base import RunCoordinator, SubmitRunContext
@@ -79,6 +79,41 @@ def with_concurrency_settings(
         )
 
 
+class RunQueueShardingConfig(
+    NamedTuple(
+        "_RunQueueShardingConfig",
+        [
+            ("num_shards", int),
+            ("shard_by", str),
+            ("lease_duration_seconds", int),
+        ],
+    )
+):
+    def __new__(
+        cls,
+        num_shards: int,
+        shard_by: Optional[str] = None,
+        lease_duration_seconds: Optional[int] = None,
+    ):
+        num_shards = check.int_param(num_shards, "num_shards")
+        check.invariant(num_shards >= 1, "num_shards must be at least 1")
+        shard_by = check.opt_str_param(shard_by, "shard_by", "run_id")
+        check.invariant(
+            shard_by in ("run_id", "code_location"),
+            "shard_by must be one of 'run_id' or 'code_location'",
+        )
+        lease_duration_seconds = check.opt_int_param(
+            lease_duration_seconds, "lease_duration_seconds", 60
+        )
+        check.invariant(lease_duration_seconds > 0, "lease_duration_seconds must be positive")
+        return super().__new__(
+            cls,
+            num_shards=num_shards,
+            shard_by=shard_by,
+            lease_duration_seconds=lease_duration_seconds,
+        )
+
+
 class QueuedRunCoordinator(RunCoordinator[T_DagsterInstance], ConfigurableClass):
     """Enqueues runs via the run storage, to be deqeueued by the Dagster Daemon process. Requires
     the Dagster Daemon process to be alive in order for runs to be launched.
@@ -91,6 +126,8 @@ def __init__(
         dequeue_interval_seconds: Optional[int] = None,
         dequeue_use_threads: Optional[bool] = None,
         dequeue_num_workers: Optional[int] = None,
+        dequeue_full_sync_interval_seconds: Optional[int] = None,
+        dequeue_sharding: Optional[Mapping[str, Any]] = None,
         max_user_code_failure_retries: Optional[int] = None,
         user_code_failure_retry_delay: Optional[int] = None,
         block_op_concurrency_limited_runs: Optional[Mapping[str, Any]] = None,
@@ -120,6 +157,19 @@ def __init__(
         self._dequeue_num_workers: Optional[int] = check.opt_int_param(
             dequeue_num_workers, "dequeue_num_workers"
         )
+        self._dequeue_full_sync_interval_seconds: Optional[int] = check.opt_int_param(
+            dequeue_full_sync_interval_seconds, "dequeue_full_sync_interval_seconds"
+        )
+        check.opt_mapping_param(dequeue_sharding, "dequeue_sharding")
+        self._dequeue_sharding_config: Optional[RunQueueShardingConfig] = (
+            RunQueueShardingConfig(
+                num_shards=dequeue_sharding["num_shards"],
+                shard_by=dequeue_sharding.get("shard_by"),
+                lease_duration_seconds=dequeue_sharding.get("lease_duration_seconds"),
+            )
+            if dequeue_sharding
+            else None
+        )
         self._max_user_code_failure_retries: int = check.opt_int_param(
             max_user_code_failure_retries, "max_user_code_failure_retries", 0
         )
@@ -174,6 +224,14 @@ def dequeue_use_threads(self) -> bool:
     def dequeue_num_workers(self) -> Optional[int]:
         return self._dequeue_num_workers
 
+    @property
+    def dequeue_full_sync_interval_seconds(self) -> Optional[int]:
+        return self._dequeue_full_sync_interval_seconds
+
+    @property
+    def dequeue_sharding_config(self) -> Optional[RunQueueShardingConfig]:
+        return self._dequeue_sharding_config
+
     @property
     def should_block_op_concurrency_limited_runs(self) -> bool:
         return self._should_block_op_concurrency_limited_runs
@@ -243,6 +301,58 @@ def config_type(cls) -> UserConfigSchema:
                     "If dequeue_use_threads is true, limit the number of concurrent worker threads."
                 ),
             ),
+            "dequeue_full_sync_interval_seconds": Field(
+                config=IntSource,
+                is_required=False,
+                description=(
+                    "If set, the Dagster Daemon keeps the queued and in-progress runs in memory"
+                    " between dequeue iterations, and updates them from the run status changes"
+                    " stored in the event log, instead of reading every queued run on each"
+                    " iteration. All the runs are read again at this interval in seconds."
+                ),
+            ),
+            "dequeue_sharding": Field(
+                config=Shape(
+                    {
+                        "num_shards": Field(
+                            IntSource,
+                            description=(
+                                "The number of shards that the queued runs are split into. Each"
+                                " shard is dequeued by a single daemon replica at a time."
+                            ),
+                        ),
+                        "shard_by": Field(
+                            Enum(
+                                "RunQueueShardBy",
+                                [EnumValue("run_id"), EnumValue("code_location")],
+                            ),
+                            is_required=False,
+                            default_value="run_id",
+                            description=(
+                                "Whether runs are assigned to shards by hashing their run id or"
+                                " the name of their code location."
+                            ),
+                        ),
+                        "lease_duration_seconds": Field(
+                            IntSource,
+                            is_required=False,
+                            default_value=60,
+                            description=(
+                                "How long a replica holds its shards without renewing them. The"
+                                " shards of a replica that stops are moved to the other replicas"
+                                " after this long."
+                            ),
+                        ),
+                    }
+                ),
+                is_required=False,
+                description=(
+                    "If set, several Dagster Daemon processes can dequeue runs at once. The queued"
+                    " runs are split into shards that the daemon replicas claim through leases"
+                    " stored in the run storage, and rebalanced as replicas start and stop. Global"
+                    " concurrency limits are still enforced across all the replicas."
+                ),
+            ),
             "max_user_code_failure_retries": Field(
                 config=IntSource,
                 is_required=False,
@@ -293,6 +403,10 @@ def from_config_value(
             dequeue_interval_seconds=config_value.get("dequeue_interval_seconds"),
             dequeue_use_threads=config_value.get("dequeue_use_threads"),
             dequeue_num_workers=config_value.get("dequeue_num_workers"),
+            dequeue_full_sync_interval_seconds=config_value.get(
+                "dequeue_full_sync_interval_seconds"
+            ),
+            dequeue_sharding=config_value.get("dequeue_sharding"),
             max_user_code_failure_retries=config_value.get("max_user_code_failure_retries"),
             user_code_failure_retry_delay=config_value.get("user_code_failure_retry_delay"),
             block_op_concurrency_limited_runs=config_value.get("block_op_concurrency_limited_runs"),
@@ -0,0 +1,85 @@
+"""add run_stats and run_step_stats tables
+
+Revision ID: b1e4b7d2c3a9
+Revises: 7e2f3204cf8e
+Create Date: 2026-10-18 10:12:41.264113
+
+"""
+
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from dagster._core.storage.sql import MySQLCompatabilityTypes, get_sql_current_timestamp
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "b1e4b7d2c3a9"
+down_revision = "7e2f3204cf8e"
+branch_labels = None
+depends_on = None
+
+RUN_STATS_TABLE_NAME = "run_stats"
+RUN_STEP_STATS_TABLE_NAME = "run_step_stats"
+RUN_STEP_STATS_INDEX_NAME = "idx_run_step_stats"
+
+
+def upgrade():
+    # only the event log storage has an event_logs table
+    if not has_table("event_logs"):
+        return
+
+    if not has_table(RUN_STATS_TABLE_NAME):
+        op.create_table(
+            RUN_STATS_TABLE_NAME,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), unique=True, nullable=False),
+            db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+            db.Column("steps_failed", db.Integer, nullable=False, default=0),
+            db.Column("materializations", db.Integer, nullable=False, default=0),
+            db.Column("expectations", db.Integer, nullable=False, default=0),
+            db.Column("enqueued_timestamp", db.types.TIMESTAMP),
+            db.Column("launch_timestamp", db.types.TIMESTAMP),
+            db.Column("start_timestamp", db.types.TIMESTAMP),
+            db.Column("end_timestamp", db.types.TIMESTAMP),
+            db.Column("update_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
+        )
+
+    if not has_table(RUN_STEP_STATS_TABLE_NAME):
+        op.create_table(
+            RUN_STEP_STATS_TABLE_NAME,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("step_key", db.Text, nullable=False),
+            db.Column("stats", MySQLCompatabilityTypes.LongText, nullable=False),
+            db.Column("revision", db.Integer, nullable=False, default=0),
+            db.Column("update_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
+        )
+
+    if not has_index(RUN_STEP_STATS_TABLE_NAME, RUN_STEP_STATS_INDEX_NAME):
+        op.create_index(
+            RUN_STEP_STATS_INDEX_NAME,
+            RUN_STEP_STATS_TABLE_NAME,
+            ["run_id", "step_key"],
+            unique=True,
+            mysql_length={"step_key": 255},
+        )
+
+
+def downgrade():
+    if has_table(RUN_STEP_STATS_TABLE_NAME):
+        if has_index(RUN_STEP_STATS_TABLE_NAME, RUN_STEP_STATS_INDEX_NAME):
+            op.drop_index(RUN_STEP_STATS_INDEX_NAME, RUN_STEP_STATS_TABLE_NAME)
+        op.drop_table(RUN_STEP_STATS_TABLE_NAME)
+
+    if has_table(RUN_STATS_TABLE_NAME):
+        op.drop_table(RUN_STATS_TABLE_NAME)
@@ -0,0 +1,59 @@
+"""add daemon_leases table
+
+Revision ID: c4d2e8a1f7b6
+Revises: b1e4b7d2c3a9
+Create Date: 2026-10-18 14:36:02.518770
+
+"""
+
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from dagster._core.storage.sql import get_sql_current_timestamp
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "c4d2e8a1f7b6"
+down_revision = "b1e4b7d2c3a9"
+branch_labels = None
+depends_on = None
+
+DAEMON_LEASES_TABLE_NAME = "daemon_leases"
+DAEMON_LEASES_INDEX_NAME = "idx_daemon_leases"
+
+
+def upgrade():
+    # only the run storage has a runs table
+    if not has_table("runs"):
+        return
+
+    if not has_table(DAEMON_LEASES_TABLE_NAME):
+        op.create_table(
+            DAEMON_LEASES_TABLE_NAME,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("lease_group", db.String(255), nullable=False),
+            db.Column("lease_key", db.String(255), nullable=False),
+            db.Column("owner_id", db.String(255), nullable=False),
+            db.Column("expiration_timestamp", db.types.TIMESTAMP, nullable=False),
+            db.Column("update_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
+        )
+
+    if not has_index(DAEMON_LEASES_TABLE_NAME, DAEMON_LEASES_INDEX_NAME):
+        op.create_index(
+            DAEMON_LEASES_INDEX_NAME,
+            DAEMON_LEASES_TABLE_NAME,
+            ["lease_group", "lease_key"],
+            unique=True,
+        )
+
+
+def downgrade():
+    if has_table(DAEMON_LEASES_TABLE_NAME):
+        if has_index(DAEMON_LEASES_TABLE_NAME, DAEMON_LEASES_INDEX_NAME):
+            op.drop_index(DAEMON_LEASES_INDEX_NAME, DAEMON_LEASES_TABLE_NAME)
+        op.drop_table(DAEMON_LEASES_TABLE_NAME)
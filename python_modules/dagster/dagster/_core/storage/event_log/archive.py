@@ -0,0 +1,420 @@
+import json
+import os
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from datetime import timedelta
+from typing import TYPE_CHECKING, AbstractSet, Any, NamedTuple, Optional  # noqa: UP035
+
+from typing_extensions import Self
+
+import dagster._check as check
+from dagster._config import StringSource
+from dagster._config.config_schema import UserConfigSchema
+from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS, EVENT_TYPE_TO_PIPELINE_RUN_STATUS
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log.base import EventLogRecord
+from dagster._serdes import (
+    ConfigurableClass,
+    ConfigurableClassData,
+    deserialize_value,
+    serialize_value,
+    whitelist_for_serdes,
+)
+from dagster._time import datetime_from_timestamp, get_current_datetime
+from dagster._utils import PrintFn, mkdir_p
+
+if TYPE_CHECKING:
+    from dagster._core.instance import DagsterInstance
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+# Prefixed to every archive blob, identifying the format so that it can be evolved
+EVENT_LOG_ARCHIVE_HEADER = b"DAGSTER_EVENT_LOG_ARCHIVE_V1\n"
+
+# Events that are kept in the event log table when a run is archived, since they are read by
+# cross-run queries (run status changes, asset and asset check history) that are not served from
+# the archive
+UNARCHIVED_EVENT_TYPES = {
+    *ASSET_EVENTS,
+    *ASSET_CHECK_EVENTS,
+    *EVENT_TYPE_TO_PIPELINE_RUN_STATUS.keys(),
+}
+
+
+class ArchivedEventLogRecords(
+    NamedTuple(
+        "_ArchivedEventLogRecords",
+        [
+            ("storage_ids", Sequence[int]),
+            ("dagster_event_types", Sequence[Optional[str]]),
+            ("events", Sequence[str]),
+        ],
+    )
+):
+    """The archived event log records for a single run, stored column-wise so that records can be
+    filtered by event type without deserializing every event.
+
+    Args:
+        storage_ids (Sequence[int]): The storage ids of the archived records, in ascending order.
+        dagster_event_types (Sequence[Optional[str]]): The dagster event type value of each record,
+            or None for plain log messages.
+        events (Sequence[str]): The serialized EventLogEntry of each record.
+    """
+
+    def __new__(
+        cls,
+        storage_ids: Sequence[int],
+        dagster_event_types: Sequence[Optional[str]],
+        events: Sequence[str],
+    ):
+        check.invariant(
+            len(storage_ids) == len(dagster_event_types) == len(events),
+            "Archived event log columns must have the same length",
+        )
+        return super().__new__(
+            cls,
+            storage_ids=check.sequence_param(storage_ids, "storage_ids", of_type=int),
+            dagster_event_types=check.sequence_param(dagster_event_types, "dagster_event_types"),
+            events=check.sequence_param(events, "events", of_type=str),
+        )
+
+    def __len__(self) -> int:
+        return len(self.storage_ids)
+
+    def get_records(
+        self, dagster_event_types: Optional[AbstractSet[str]] = None
+    ) -> Sequence[EventLogRecord]:
+        return [
+            EventLogRecord(
+                storage_id=storage_id,
+                event_log_entry=deserialize_value(event, EventLogEntry),
+            )
+            for storage_id, dagster_event_type, event in zip(
+                self.storage_ids, self.dagster_event_types, self.events
+            )
+            if not dagster_event_types or dagster_event_type in dagster_event_types
+        ]
+
+    def merge(self, other: "ArchivedEventLogRecords") -> "ArchivedEventLogRecords":
+        by_storage_id = {
+            storage_id: (dagster_event_type, event)
+            for archive in (self, other)
+            for storage_id, dagster_event_type, event in zip(
+                archive.storage_ids, archive.dagster_event_types, archive.events
+            )
+        }
+        storage_ids = sorted(by_storage_id)
+        return ArchivedEventLogRecords(
+            storage_ids=storage_ids,
+            dagster_event_types=[by_storage_id[storage_id][0] for storage_id in storage_ids],
+            events=[by_storage_id[storage_id][1] for storage_id in storage_ids],
+        )
+
+
+def serialize_event_log_archive(archived: ArchivedEventLogRecords) -> bytes:
+    payload = json.dumps(
+        {
+            "storage_ids": list(archived.storage_ids),
+            "dagster_event_types": list(archived.dagster_event_types),
+            "events": list(archived.events),
+        }
+    )
+    return EVENT_LOG_ARCHIVE_HEADER + zlib.compress(payload.encode("utf-8"))
+
+
+def deserialize_event_log_archive(data: bytes) -> ArchivedEventLogRecords:
+    check.invariant(
+        data.startswith(EVENT_LOG_ARCHIVE_HEADER), "Unrecognized event log archive format"
+    )
+    payload = json.loads(zlib.decompress(data[len(EVENT_LOG_ARCHIVE_HEADER) :]).decode("utf-8"))
+    return ArchivedEventLogRecords(
+        storage_ids=payload["storage_ids"],
+        dagster_event_types=payload["dagster_event_types"],
+        events=payload["events"],
+    )
+
+
+class EventLogArchiveStore(ABC):
+    """Abstract base class for the blob store that holds per-run event log archives.
+
+    Configured on the instance via the ``event_log_archive`` settings block in ``dagster.yaml``:
+
+    .. code-block:: YAML
+
+        event_log_archive:
+          archive_store:
+            module: dagster._core.storage.event_log.archive
+            class: LocalEventLogArchiveStore
+            config:
+              base_dir: /path/to/dir
+          older_than_days: 30
+    """
+
+    @abstractmethod
+    def get(self, run_id: str) -> Optional[bytes]:
+        """Returns the archive blob for the given run, or None if the run has not been archived."""
+
+    @abstractmethod
+    def has(self, run_id: str) -> bool:
+        """Whether an archive blob exists for the given run."""
+
+    @abstractmethod
+    def put(self, run_id: str, data: bytes) -> None:
+        """Writes the archive blob for the given run, replacing any existing blob."""
+
+    @abstractmethod
+    def delete(self, run_id: str) -> None:
+        """Removes the archive blob for the given run, if one exists."""
+
+
+class LocalEventLogArchiveStore(EventLogArchiveStore, ConfigurableClass):
+    """Stores event log archives as files on the local filesystem."""
+
+    def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = None):
+        self._base_dir = os.path.abspath(check.str_param(base_dir, "base_dir"))
+        self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        mkdir_p(self._base_dir)
+
+    @property
+    def inst_data(self) -> Optional[ConfigurableClassData]:
+        return self._inst_data
+
+    @classmethod
+    def config_type(cls) -> UserConfigSchema:
+        return {"base_dir": StringSource}
+
+    @classmethod
+    def from_config_value(
+        cls, inst_data: Optional[ConfigurableClassData], config_value: Mapping[str, Any]
+    ) -> Self:
+        return cls(inst_data=inst_data, **config_value)
+
+    def _path_for_run(self, run_id: str) -> str:
+        # bucket by run id prefix to keep directory sizes bounded
+        return os.path.join(self._base_dir, run_id[:2], f"{run_id}.archive")
+
+    def get(self, run_id: str) -> Optional[bytes]:
+        try:
+            with open(self._path_for_run(run_id), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def has(self, run_id: str) -> bool:
+        return os.path.exists(self._path_for_run(run_id))
+
+    def put(self, run_id: str, data: bytes) -> None:
+        path = self._path_for_run(run_id)
+        mkdir_p(os.path.dirname(path))
+        # write to a temporary file first so that readers never see a partial archive
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def delete(self, run_id: str) -> None:
+        try:
+            os.remove(self._path_for_run(run_id))
+        except FileNotFoundError:
+            pass
+
+
+ARCHIVE_RUNS_PAGE_SIZE = 100
+
+EVENT_LOG_ARCHIVE_CURSOR_KEY = "EVENT_LOG_ARCHIVE_CURSOR"
+
+# overlap between consecutive windows, so that runs last updated exactly at the end of a window are
+# archived by the next one
+ARCHIVE_WINDOW_OVERLAP_SECONDS = 0.001
+
+
+@whitelist_for_serdes
+class EventLogArchiveCursor(
+    NamedTuple(
+        "_EventLogArchiveCursor",
+        [
+            ("updated_after", Optional[float]),
+            ("updated_before", Optional[float]),
+            ("run_id", Optional[str]),
+        ],
+    )
+):
+    """The progress of event log archival, stored in the daemon cursor storage of the instance so
+    that each call resumes where the last one stopped rather than paging through every finished
+    run again.
+
+    Finished runs are archived in windows of their update timestamps. Every finished run last
+    updated before ``updated_after`` has been archived. While a window is in progress,
+    ``updated_before`` is its end and ``run_id`` is the last run archived in it, in the order the
+    runs were created.
+
+    Args:
+        updated_after (Optional[float]): The timestamp before which every finished run has been
+            archived, or None if no window has been finished.
+        updated_before (Optional[float]): The end timestamp of the window in progress, or None if
+            no window is in progress.
+        run_id (Optional[str]): The last run processed in the window in progress.
+    """
+
+    def __new__(
+        cls,
+        updated_after: Optional[float] = None,
+        updated_before: Optional[float] = None,
+        run_id: Optional[str] = None,
+    ):
+        return super().__new__(
+            cls,
+            updated_after=check.opt_float_param(updated_after, "updated_after"),
+            updated_before=check.opt_float_param(updated_before, "updated_before"),
+            run_id=check.opt_str_param(run_id, "run_id"),
+        )
+
+
+def get_event_log_archive_cursor(instance: "DagsterInstance") -> EventLogArchiveCursor:
+    serialized_cursor = instance.daemon_cursor_storage.get_cursor_values(
+        {EVENT_LOG_ARCHIVE_CURSOR_KEY}
+    ).get(EVENT_LOG_ARCHIVE_CURSOR_KEY)
+    if not serialized_cursor:
+        return EventLogArchiveCursor()
+    return deserialize_value(serialized_cursor, EventLogArchiveCursor)
+
+
+def _set_event_log_archive_cursor(
+    instance: "DagsterInstance", cursor: EventLogArchiveCursor
+) -> None:
+    instance.daemon_cursor_storage.set_cursor_values(
+        {EVENT_LOG_ARCHIVE_CURSOR_KEY: serialize_value(cursor)}
+    )
+
+
+def archive_event_logs(
+    instance: "DagsterInstance",
+    older_than: Optional[timedelta] = None,
+    limit: Optional[int] = None,
+    print_fn: Optional[PrintFn] = None,
+) -> Sequence[str]:
+    """Moves the per-run events of finished runs that were last updated before the cutoff out of the
+    event log table and into the instance's configured event log archive. Each call resumes from
+    the :py:class:`EventLogArchiveCursor` stored by the previous one, so runs that have already been
+    archived are not paged through again.
+
+    Args:
+        instance (DagsterInstance): The instance whose event logs should be archived.
+        older_than (Optional[timedelta]): Archive runs that finished at least this long ago.
+            Defaults to the ``older_than_days`` value of the ``event_log_archive`` instance
+            settings.
+        limit (Optional[int]): The maximum number of runs to archive.
+        print_fn (Optional[PrintFn]): Function used to report progress.
+
+    Returns:
+        Sequence[str]: The ids of the runs whose events were archived.
+    """
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    event_log_storage = instance.event_log_storage
+    check.invariant(
+        isinstance(event_log_storage, SqlEventLogStorage),
+        "Event log archival is only supported for SQL-backed event log storages",
+    )
+    assert isinstance(event_log_storage, SqlEventLogStorage)
+    check.invariant(
+        instance.event_log_archive_store is not None,
+        "No event log archive store configured for this instance",
+    )
+
+    if older_than is None:
+        older_than_days = instance.get_settings("event_log_archive").get("older_than_days")
+        check.invariant(
+            older_than_days is not None,
+            "`older_than` must be provided if `older_than_days` is not set in the instance settings",
+        )
+        older_than = timedelta(days=older_than_days)
+
+    check.opt_int_param(limit, "limit")
+    cutoff = get_current_datetime() - older_than
+    cursor = get_event_log_archive_cursor(instance)
+
+    archived_run_ids: list[str] = []
+    while limit is None or len(archived_run_ids) < limit:
+        resuming = cursor.updated_before is not None
+        if not resuming:
+            cursor = cursor._replace(updated_before=cutoff.timestamp())
+
+        cursor, finished = _archive_event_logs_in_window(
+            instance,
+            event_log_storage,
+            cursor,
+            None if limit is None else limit - len(archived_run_ids),
+            archived_run_ids,
+            print_fn,
+        )
+        if finished:
+            # every finished run last updated before the end of the window has been archived.
+            # Windows are exclusive of their bounds, so the next one starts just before this end
+            assert cursor.updated_before is not None
+            cursor = EventLogArchiveCursor(
+                updated_after=cursor.updated_before - ARCHIVE_WINDOW_OVERLAP_SECONDS,
+                updated_before=None,
+                run_id=None,
+            )
+        _set_event_log_archive_cursor(instance, cursor)
+
+        # a window left by an earlier call that stopped at its limit ends at that call's cutoff,
+        # so a new window up to this call's cutoff follows it
+        if not finished or not resuming:
+            break
+
+    return archived_run_ids
+
+
+def _archive_event_logs_in_window(
+    instance: "DagsterInstance",
+    event_log_storage: "SqlEventLogStorage",
+    cursor: "EventLogArchiveCursor",
+    limit: Optional[int],
+    archived_run_ids: list[str],
+    print_fn: Optional[PrintFn],
+) -> tuple["EventLogArchiveCursor", bool]:
+    """Archives the finished runs last updated within the window of the cursor, in the order they
+    were created, starting after the run id of the cursor. Returns the cursor of the last run
+    processed and whether the window was finished before the limit was reached.
+    """
+    from dagster._core.storage.dagster_run import FINISHED_STATUSES, RunsFilter
+
+    assert cursor.updated_before is not None
+    runs_filter = RunsFilter(
+        statuses=FINISHED_STATUSES,
+        updated_after=(
+            datetime_from_timestamp(cursor.updated_after)
+            if cursor.updated_after is not None
+            else None
+        ),
+        updated_before=datetime_from_timestamp(cursor.updated_before),
+    )
+    # the run id is only a valid cursor for as long as the run exists, so a window is started over
+    # if its last processed run has since been deleted
+    if cursor.run_id is not None and not instance.has_run(cursor.run_id):
+        cursor = cursor._replace(run_id=None)
+
+    num_archived_runs = 0
+    while True:
+        run_records = instance.get_run_records(
+            filters=runs_filter,
+            limit=ARCHIVE_RUNS_PAGE_SIZE,
+            ascending=True,
+            cursor=cursor.run_id,
+        )
+        if not run_records:
+            return cursor, True
+
+        for run_record in run_records:
+            run_id = run_record.dagster_run.run_id
+            num_archived = event_log_storage.archive_events_for_run(run_id)
+            cursor = cursor._replace(run_id=run_id)
+            if num_archived:
+                archived_run_ids.append(run_id)
+                num_archived_runs += 1
+                if print_fn:
+                    print_fn(f"Archived {num_archived} events for run {run_id}")
+            if limit is not None and num_archived_runs >= limit:
+                return cursor, False
@@ -0,0 +1,184 @@
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import AbstractSet, Generic, NamedTuple, Optional, TypeVar  # noqa: UP035
+
+import dagster._check as check
+from dagster._core.definitions.events import AssetKey
+from dagster._core.events import ASSET_EVENTS, DagsterEventType
+from dagster._time import get_current_timestamp
+
+T = TypeVar("T")
+
+# Events that mark the cached latest materialization of an asset as stale
+LATEST_MATERIALIZATION_CACHE_EVENT_TYPES = {
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.ASSET_WIPED,
+}
+
+# Events that mark the cached asset record of an asset as stale
+ASSET_RECORD_CACHE_EVENT_TYPES = {*ASSET_EVENTS, DagsterEventType.ASSET_WIPED}
+
+
+def get_asset_record_cache_size() -> int:
+    # the maximum number of asset keys held by each of the instance's asset record caches, or 0 to
+    # disable caching
+    return int(os.getenv("DAGSTER_ASSET_RECORD_CACHE_SIZE", "0"))
+
+
+def get_asset_record_cache_ttl_seconds() -> float:
+    # the maximum age of a cached entry, which bounds how long updates that are not caught by the
+    # storage id checks (see AssetRecordCache) can be missed
+    return float(os.getenv("DAGSTER_ASSET_RECORD_CACHE_TTL_SECONDS", "60"))
+
+
+class AssetRecordCacheStats(NamedTuple):
+    """Counters for an AssetRecordCache, used to tune its size.
+
+    Args:
+        hits (int): The number of asset key lookups served from the cache.
+        misses (int): The number of asset key lookups that had to be fetched from storage.
+        size (int): The number of asset keys currently held in the cache.
+        max_size (int): The maximum number of asset keys held in the cache.
+    """
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class AssetRecordCache(Generic[T]):
+    """Bounded, thread-safe LRU cache of per-asset values read from the event log storage.
+
+    The cache holds the max storage id of the relevant asset events at the time its entries were
+    last validated. Readers look up the current max storage id (a single index lookup) and pass it
+    in: if it has not moved, every entry is still current. If it has moved, the asset keys with
+    relevant events since the previous max storage id are read from the index and only their
+    entries are dropped. This keeps the cache consistent with writes made by other processes,
+    without requiring cross-process invalidation.
+
+    Events that commit out of storage id order, and updates that are not accompanied by an asset
+    event, can be missed by these checks, so entries are also refetched once they are older than
+    `ttl_seconds`.
+
+    LOCKING INFO:
+        INVARIANTS: _lock protects _entries, _max_storage_id, _hits and _misses
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self._max_size = check.int_param(max_size, "max_size")
+        check.invariant(self._max_size > 0, "AssetRecordCache max_size must be positive")
+        self._ttl_seconds = check.numeric_param(ttl_seconds, "ttl_seconds")
+        self._lock = threading.Lock()
+        # asset key => (timestamp when fetched, fetched value)
+        self._entries: OrderedDict[AssetKey, tuple[float, Optional[T]]] = OrderedDict()
+        # the max storage id of the relevant events when the entries were last validated
+        self._max_storage_id: Optional[int] = None
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> AssetRecordCacheStats:
+        with self._lock:
+            return AssetRecordCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                max_size=self._max_size,
+            )
+
+    def get_or_fetch(
+        self,
+        asset_keys: Iterable[AssetKey],
+        max_storage_id: Optional[int],
+        get_updated_asset_keys_fn: Callable[[Optional[int], int], Optional[AbstractSet[AssetKey]]],
+        fetch_fn: Callable[[Sequence[AssetKey]], Mapping[AssetKey, T]],
+    ) -> Mapping[AssetKey, Optional[T]]:
+        """Returns the value for each of the given asset keys, or None if storage has no value.
+
+        Args:
+            asset_keys (Iterable[AssetKey]): The asset keys to look up.
+            max_storage_id (Optional[int]): The current max storage id of the relevant events, or
+                None if there are none.
+            get_updated_asset_keys_fn (Callable[[Optional[int], int], Optional[AbstractSet[AssetKey]]]):
+                Returns the asset keys with relevant events after the given storage id, or None if
+                there are more than the given limit.
+            fetch_fn (Callable[[Sequence[AssetKey]], Mapping[AssetKey, T]]): Fetches the values
+                for all of the given asset keys from storage, omitting keys without a value.
+        """
+        self._validate(max_storage_id, get_updated_asset_keys_fn)
+
+        results: dict[AssetKey, Optional[T]] = {}
+        to_fetch: dict[AssetKey, None] = {}
+        min_fetched_at = get_current_timestamp() - self._ttl_seconds
+        with self._lock:
+            for asset_key in asset_keys:
+                if asset_key in results or asset_key in to_fetch:
+                    continue
+                entry = self._entries.get(asset_key)
+                if entry is not None and entry[0] >= min_fetched_at:
+                    self._entries.move_to_end(asset_key)
+                    results[asset_key] = entry[1]
+                    self._hits += 1
+                else:
+                    to_fetch[asset_key] = None
+                    self._misses += 1
+
+        if not to_fetch:
+            return results
+
+        # Fetched values are at least as new as the max storage id looked up before fetching, so
+        # an update between the two only causes an extra refetch later.
+        fetched_at = get_current_timestamp()
+        fetched = fetch_fn(list(to_fetch))
+        with self._lock:
+            for asset_key in to_fetch:
+                value = fetched.get(asset_key)
+                results[asset_key] = value
+                self._entries[asset_key] = (fetched_at, value)
+                self._entries.move_to_end(asset_key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+        return results
+
+    def _validate(
+        self,
+        max_storage_id: Optional[int],
+        get_updated_asset_keys_fn: Callable[[Optional[int], int], Optional[AbstractSet[AssetKey]]],
+    ) -> None:
+        with self._lock:
+            prev_max_storage_id = self._max_storage_id
+            if max_storage_id == prev_max_storage_id:
+                return
+            if not self._entries:
+                self._max_storage_id = max_storage_id
+                return
+
+        if max_storage_id is None or (
+            prev_max_storage_id is not None and max_storage_id < prev_max_storage_id
+        ):
+            # events were deleted, or another thread validated against a newer storage id
+            updated_asset_keys = None
+        else:
+            updated_asset_keys = get_updated_asset_keys_fn(prev_max_storage_id, self._max_size)
+
+        with self._lock:
+            if updated_asset_keys is None:
+                self._entries.clear()
+            else:
+                for asset_key in updated_asset_keys:
+                    self._entries.pop(asset_key, None)
+            if self._max_storage_id == prev_max_storage_id:
+                self._max_storage_id = max_storage_id
+
+    def invalidate(self, asset_keys: Iterable[AssetKey]) -> None:
+        with self._lock:
+            for asset_key in asset_keys:
+                self._entries.pop(asset_key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -11,9 +11,11 @@
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+RUN_STATS_TABLES = "run_stats_tables"  # builds the run_stats and run_step_stats tables
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
+    RUN_STATS_TABLES: lambda: migrate_run_stats_data,
 }
 ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
 
@@ -72,6 +74,28 @@ def migrate_asset_key_data(event_log_storage, print_fn=None):
                 pass
 
 
+def migrate_run_stats_data(event_log_storage, print_fn=None):
+    """Utility method to backfill the materialized run and step stats from the data in existing
+    event log records, so that stats reads for existing runs do not need to scan their events.
+    Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying runs.")
+    run_ids = event_log_storage.get_all_run_ids()
+    if print_fn:
+        print_fn(f"Found {len(run_ids)} runs to index")
+        run_ids = tqdm(run_ids)
+
+    for run_id in run_ids:
+        if event_log_storage.has_run_stats_tables(run_id):
+            event_log_storage.rebuild_run_stats(run_id)
+
+
 def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
     from dagster._core.definitions.events import AssetKey
     from dagster._core.storage.event_log.schema import AssetKeyTable, SqlEventLogStorageTable
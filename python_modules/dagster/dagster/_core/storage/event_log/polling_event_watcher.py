@@ -1,13 +1,13 @@
 import os
 import threading
-from typing import TYPE_CHECKING, Callable, NamedTuple, Optional
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from typing import Callable, NamedTuple, Optional
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
-
-if TYPE_CHECKING:
-    from collections.abc import MutableMapping
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventLogStorage
+from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 
 INIT_POLL_PERIOD = 0.250  # 250ms
 MAX_POLL_PERIOD = 16.0  # 16s
@@ -25,31 +25,99 @@ class CallbackAfterCursor(NamedTuple):
     callback: Callable[[EventLogEntry, str], None]
 
 
+class EventWatcherNotifier(ABC):
+    """Pluggable notification backend for the SqlPollingEventWatcher.
+
+    A notifier pushes the run ids of newly stored events to the watcher, which then fetches new
+    events immediately instead of waiting for its next poll. Polling continues at a backed-off
+    cadence regardless, so a notifier that misses a notification only delays event delivery.
+    """
+
+    @abstractmethod
+    def start(self, on_new_event: Callable[[Optional[str]], None]) -> None:
+        """Begin calling `on_new_event` with the run id of each newly stored event, or None if the
+        run id is not known.
+        """
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stop delivering notifications and release any held resources."""
+
+
+class LocalEventWatcherNotifier(EventWatcherNotifier):
+    """In-process notifier, for storages that write events in the same process that watches them
+    (and for tests). Writers call `notify` after storing an event.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._callbacks: list[Callable[[Optional[str]], None]] = []
+
+    def start(self, on_new_event: Callable[[Optional[str]], None]) -> None:
+        with self._lock:
+            self._callbacks.append(on_new_event)
+
+    def stop(self) -> None:
+        with self._lock:
+            self._callbacks = []
+
+    def notify(self, run_id: Optional[str]) -> None:
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            callback(run_id)
+
+
+class _WatchedRun:
+    def __init__(self):
+        # storage id of the last record for this run that was dispatched to callbacks
+        self.storage_id: Optional[int] = None
+        self.callbacks: list[CallbackAfterCursor] = []
+
+
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that uses a single shared polling thread to retrieve new events for all
+    watched run_ids.
+
+    For storages that are not run-sharded, each poll fetches new events for every watched run in a
+    single query, with one condition per run on the storage id of its last fetched record. Runs that
+    have just been watched are fetched from the cursors of their callbacks in a separate query per
+    run, so that reading their history does not hold up the events of the other runs. Run-sharded
+    storages fall back to fetching each watched run in turn from the same thread.
+
+    An optional `EventWatcherNotifier` can wake the polling thread as soon as new events are
+    written, instead of waiting for the next poll.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _lock protects _watched_runs
     """
 
-    def __init__(self, event_log_storage: EventLogStorage):
+    def __init__(
+        self,
+        event_log_storage: EventLogStorage,
+        notifier: Optional[EventWatcherNotifier] = None,
+    ):
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", EventLogStorage
         )
+        self._notifier = check.opt_inst_param(notifier, "notifier", EventWatcherNotifier)
+        self._can_fetch_across_runs = (
+            isinstance(event_log_storage, SqlEventLogStorage)
+            and not event_log_storage.is_run_sharded
+        )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
-        self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        # INVARIANT: _lock protects _watched_runs. Reentrant, since callbacks may unwatch runs.
+        self._lock: threading.RLock = threading.RLock()
+        self._watched_runs: dict[str, _WatchedRun] = {}
+        self._wake = threading.Event()
+        self._should_thread_exit = threading.Event()
+        self._thread: Optional[threading.Thread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
-        with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
-        return _has_run_id
+        with self._lock:
+            return run_id in self._watched_runs
 
     def watch_run(
         self,
@@ -62,14 +130,20 @@ def watch_run(
         callback = check.callable_param(callback, "callback")
         check.invariant(not self._disposed, "Attempted to watch_run after close")
 
-        with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
+        with self._lock:
+            if run_id not in self._watched_runs:
+                self._watched_runs[run_id] = _WatchedRun()
+            self._watched_runs[run_id].callbacks.append(CallbackAfterCursor(cursor, callback))
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sql-event-watch", daemon=True
                 )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+                self._thread.start()
+                if self._notifier:
+                    self._notifier.start(self._on_new_event)
+
+        self._wake.set()
 
     def unwatch_run(
         self,
@@ -78,113 +152,161 @@ def unwatch_run(
     ) -> None:
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
-        with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+        with self._lock:
+            watched_run = self._watched_runs.get(run_id)
+            if watched_run is None:
+                return
+            watched_run.callbacks = [
+                callback_with_cursor
+                for callback_with_cursor in watched_run.callbacks
+                if callback_with_cursor.callback != handler
+            ]
+            if not watched_run.callbacks:
+                del self._watched_runs[run_id]
 
     def close(self) -> None:
         if not self._disposed:
             self._disposed = True
-            with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                self._run_id_to_watcher_dict = {}
-
-
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
-
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
-    Exits when `self.should_thread_exit` is set.
-
-    LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
-
-    """
-
-    def __init__(self, event_log_storage: EventLogStorage, run_id: str):
-        super().__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", EventLogStorage
-        )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: list[CallbackAfterCursor] = []
-        self._should_thread_exit = threading.Event()
-        self.name = f"sql-event-watch-run-id-{self._run_id}"
-
-    @property
-    def should_thread_exit(self) -> threading.Event:
-        return self._should_thread_exit
-
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
-        """Observer has started watching this run.
-            Add a callback to execute on new EventLogEntrys after the given cursor.
-
-        Args:
-            cursor (Optional[str]): event log cursor for the callback to execute
-            callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
-        """
-        cursor = check.opt_str_param(cursor, "cursor")
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
-
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
-        """Observer has stopped watching this run;
-            Remove a callback from the list of callbacks to execute on new EventLogEntrys.
-
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
-
-        Args:
-            callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
-        """
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
-            ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
-
-    def run(self) -> None:
+            if self._notifier:
+                self._notifier.stop()
+            self._should_thread_exit.set()
+            self._wake.set()
+            if self._thread:
+                self._thread.join()
+                self._thread = None
+            with self._lock:
+                self._watched_runs = {}
+
+    def _on_new_event(self, run_id: Optional[str]) -> None:
+        if run_id is None or self.has_run_id(run_id):
+            self._wake.set()
+
+    def _run(self) -> None:
         """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
+        Wakes every poll period (or on notification) &
+            1. executes a SELECT query to get new EventLogEntrys for the watched runs
             2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
+        Uses the max storage id fetched so far for each run as a cursor in the DB to make sure that
+        only new records are retrieved.
         """
-        cursor = None
         wait_time = INIT_POLL_PERIOD
 
         chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
 
-        while not self._should_thread_exit.wait(wait_time):
+        while True:
+            self._wake.wait(wait_time)
+            if self._should_thread_exit.is_set():
+                return
+            # clear before polling, so that notifications received during the poll trigger
+            # another poll immediately
+            self._wake.clear()
+
+            with self._lock:
+                # snapshot of the watched runs and the storage id each had reached before polling
+                watched_runs = {
+                    run_id: (watched_run, watched_run.storage_id)
+                    for run_id, watched_run in self._watched_runs.items()
+                }
+
+            if not watched_runs:
+                wait_time = MAX_POLL_PERIOD
+                continue
+
+            if self._can_fetch_across_runs:
+                has_new_records = self._poll_across_runs(watched_runs, chunk_limit)
+            else:
+                has_new_records = self._poll_per_run(watched_runs, chunk_limit)
+
+            wait_time = INIT_POLL_PERIOD if has_new_records else min(wait_time * 2, MAX_POLL_PERIOD)
+
+    def _poll_across_runs(
+        self,
+        watched_runs: Mapping[str, tuple[_WatchedRun, Optional[int]]],
+        chunk_limit: int,
+    ) -> bool:
+        storage = check.inst(self._event_log_storage, SqlEventLogStorage)
+        new_runs = {
+            run_id: watched_run_and_storage_id
+            for run_id, watched_run_and_storage_id in watched_runs.items()
+            if watched_run_and_storage_id[1] is None
+        }
+        has_new_records = self._poll_per_run(new_runs, chunk_limit) if new_runs else False
+
+        after_storage_id_by_run_id = {
+            run_id: storage_id
+            for run_id, (_, storage_id) in watched_runs.items()
+            if storage_id is not None
+        }
+        if not after_storage_id_by_run_id:
+            return has_new_records
+
+        records = storage.get_records_for_runs(after_storage_id_by_run_id, limit=chunk_limit)
+        # the cursor of each run only moves past the records dispatched for it, since an event of
+        # another run can be given a lower storage id than these records but be committed later
+        self._dispatch(records)
+
+        return has_new_records or bool(records)
+
+    def _poll_per_run(
+        self,
+        watched_runs: Mapping[str, tuple[_WatchedRun, Optional[int]]],
+        chunk_limit: int,
+    ) -> bool:
+        has_new_records = False
+        for run_id, (watched_run, last_storage_id) in watched_runs.items():
+            storage_id = (
+                last_storage_id
+                if last_storage_id is not None
+                else self._get_initial_storage_id(watched_run)
+            )
             conn = self._event_log_storage.get_records_for_run(
-                self._run_id,
-                cursor=cursor,
+                run_id,
+                cursor=(
+                    EventLogCursor.from_storage_id(storage_id).to_string()
+                    if storage_id is not None
+                    else None
+                ),
                 limit=chunk_limit,
             )
-            cursor = conn.cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
-            wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+            self._dispatch(conn.records)
+            has_new_records = has_new_records or bool(conn.records)
+            if not conn.records:
+                # start the cursor of a run without new events from where it was read, so that it
+                # is not read from the start again on the next poll
+                with self._lock:
+                    if (
+                        self._watched_runs.get(run_id) is watched_run
+                        and watched_run.storage_id is None
+                    ):
+                        watched_run.storage_id = storage_id if storage_id is not None else 0
+        return has_new_records
+
+    def _get_initial_storage_id(self, watched_run: _WatchedRun) -> Optional[int]:
+        # a run that has not been fetched yet only needs to be read from the earliest cursor of
+        # its callbacks
+        with self._lock:
+            cursors = [callback.cursor for callback in watched_run.callbacks]
+        if not cursors or any(cursor is None for cursor in cursors):
+            return None
+        return min(EventLogCursor.parse(cursor).storage_id() for cursor in cursors if cursor)
+
+    def _dispatch(self, records: Sequence[EventLogRecord]) -> None:
+        for event_record in records:
+            with self._lock:
+                watched_run = self._watched_runs.get(event_record.event_log_entry.run_id)
+                if watched_run is None or (
+                    watched_run.storage_id is not None
+                    and event_record.storage_id <= watched_run.storage_id
+                ):
+                    continue
+                watched_run.storage_id = event_record.storage_id
+                for callback_with_cursor in list(watched_run.callbacks):
+                    if (
+                        callback_with_cursor.cursor is None
+                        or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+                        < event_record.storage_id
+                    ):
+                        callback_with_cursor.callback(
+                            event_record.event_log_entry,
+                            str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                        )
@@ -183,6 +183,49 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
 )
 
+# Materialized run-level stats, incrementally updated as run events are stored so that
+# `get_stats_for_run` does not need to aggregate over the run's events.  A row is only present for
+# runs whose stats have been tracked since the start of the run, or which have been backfilled.
+RunStatsTable = db.Table(
+    "run_stats",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), unique=True, nullable=False),
+    db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+    db.Column("steps_failed", db.Integer, nullable=False, default=0),
+    db.Column("materializations", db.Integer, nullable=False, default=0),
+    db.Column("expectations", db.Integer, nullable=False, default=0),
+    db.Column("enqueued_timestamp", db.types.TIMESTAMP),
+    db.Column("launch_timestamp", db.types.TIMESTAMP),
+    db.Column("start_timestamp", db.types.TIMESTAMP),
+    db.Column("end_timestamp", db.types.TIMESTAMP),
+    db.Column("update_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
+)
+
+# Materialized per-step stats, stored as a serialized RunStepStatsSnapshot for each step of a
+# tracked run.  `revision` is incremented on every update, and is used for optimistic concurrency
+# control between processes that store events for the same step.
+RunStepStatsTable = db.Table(
+    "run_step_stats",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.Text, nullable=False),
+    db.Column("stats", MySQLCompatabilityTypes.LongText, nullable=False),
+    db.Column("revision", db.Integer, nullable=False, default=0),
+    db.Column("update_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
+)
+
 db.Index(
     "idx_asset_check_executions",
     AssetCheckExecutionsTable.c.asset_key,
@@ -273,3 +316,10 @@
     mysql_length={"concurrency_key": 255, "run_id": 255, "step_key": 32},
     unique=True,
 )
+db.Index(
+    "idx_run_step_stats",
+    RunStepStatsTable.c.run_id,
+    RunStepStatsTable.c.step_key,
+    mysql_length={"step_key": 255},
+    unique=True,
+)
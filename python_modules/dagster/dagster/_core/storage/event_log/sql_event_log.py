@@ -1,8 +1,11 @@
 import logging
 import os
+import threading
+import time
+import zlib
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
-from collections.abc import Iterable, Iterator, Mapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from functools import cached_property
@@ -44,7 +47,9 @@
 from dagster._core.events import (
     ASSET_CHECK_EVENTS,
     ASSET_EVENTS,
+    BUFFERABLE_EVENTS,
     EVENT_TYPE_TO_PIPELINE_RUN_STATUS,
+    MARKER_EVENTS,
     DagsterEventType,
 )
 from dagster._core.events.log import EventLogEntry
@@ -52,7 +57,10 @@
     RUN_STATS_EVENT_TYPES,
     STEP_STATS_EVENT_TYPES,
     RunStepKeyStatsSnapshot,
+    RunStepStatsSnapshot,
+    build_run_stats_from_events,
     build_run_step_stats_from_events,
+    build_run_step_stats_snapshot_from_events,
 )
 from dagster._core.storage.asset_check_execution_record import (
     COMPLETED_ASSET_CHECK_EXECUTION_RECORD_STATUSES,
@@ -60,6 +68,13 @@
     AssetCheckExecutionRecordStatus,
 )
 from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot
+from dagster._core.storage.event_log.archive import (
+    UNARCHIVED_EVENT_TYPES,
+    ArchivedEventLogRecords,
+    EventLogArchiveStore,
+    deserialize_event_log_archive,
+    serialize_event_log_archive,
+)
 from dagster._core.storage.event_log.base import (
     AssetCheckSummaryRecord,
     AssetEntry,
@@ -86,6 +101,8 @@
     ConcurrencySlotsTable,
     DynamicPartitionsTable,
     PendingStepsTable,
+    RunStatsTable,
+    RunStepStatsTable,
     SecondaryIndexMigrationTable,
     SqlEventLogStorageTable,
 )
@@ -93,12 +110,18 @@
 from dagster._core.storage.sqlalchemy_compat import (
     db_case,
     db_fetch_mappings,
+    db_scalar_subquery,
     db_select,
     db_subquery,
 )
 from dagster._core.types.pagination import PaginatedResults, StorageIdCursor
 from dagster._serdes import deserialize_value, serialize_value
-from dagster._time import datetime_from_timestamp, get_current_timestamp, utc_datetime_from_naive
+from dagster._time import (
+    datetime_from_timestamp,
+    get_current_datetime,
+    get_current_timestamp,
+    utc_datetime_from_naive,
+)
 from dagster._utils import PrintFn
 from dagster._utils.concurrency import (
     ClaimedSlotInfo,
@@ -118,6 +141,12 @@
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
 MIN_ASSET_ROWS = 25
+ARCHIVE_DELETE_BATCH_SIZE = 500
+# Number of runs for which the newest archived storage id is kept in memory, and for how long. Runs
+# archived by another process may be read without their archive for up to the TTL.
+ARCHIVE_LOOKUP_CACHE_SIZE = 1000
+ARCHIVE_LOOKUP_CACHE_TTL_SECONDS = 60.0
+RUN_STEP_STATS_UPDATE_RETRIES = 10
 DEFAULT_MAX_LIMIT_EVENT_RECORDS = 10000
 
 
@@ -139,6 +168,154 @@ def enforce_max_records_limit(limit: int):
         )
 
 
+# Sets the number of bufferable events (see `BUFFERABLE_EVENTS`, plus plain log messages) that will
+# be held per run before being written to the event log in a single insert. Defaults to 0, which
+# turns off buffering entirely. As with `DAGSTER_EVENT_BATCH_SIZE`, the values are read on each call
+# so that they can be changed without a process restart.
+def _get_event_write_buffer_size() -> int:
+    return int(os.getenv("DAGSTER_EVENT_LOG_BUFFER_SIZE", "0"))
+
+
+# The maximum number of seconds a buffered event will be held before its run's buffer is flushed.
+# This is checked whenever a new event is stored for the run, and by a background thread that
+# flushes the buffers of runs that have stopped storing events, e.g. during a long step.
+def _get_event_write_buffer_interval() -> float:
+    return float(os.getenv("DAGSTER_EVENT_LOG_BUFFER_INTERVAL_SECONDS", "1.0"))
+
+
+def _is_event_write_buffering_enabled() -> bool:
+    return _get_event_write_buffer_size() > 0
+
+
+class EventWriteBuffer:
+    """Thread-safe per-run buffer of events that are waiting to be written in a single batch.
+
+    Buffers are written by `write_fn`. A background thread writes the buffers that have been held
+    for longer than the interval, so that buffered events become visible even if no other event is
+    stored for their run.
+    """
+
+    def __init__(self, write_fn: Callable[[str, Sequence[EventLogEntry]], None]):
+        self._write_fn = write_fn
+        self._lock = threading.Lock()
+        # INVARIANT: held while popping buffered events and writing them, so that a flush does not
+        # race with the background thread and write a run's events out of order
+        self._write_lock = threading.Lock()
+        self._events_by_run_id: dict[str, list[EventLogEntry]] = {}
+        self._first_buffered_at_by_run_id: dict[str, float] = {}
+        self._shutdown_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+    def add(self, event: EventLogEntry, max_size: int, max_interval: float) -> None:
+        """Adds an event to its run's buffer, writing the buffered events for the run if either the
+        size or the time limit has been reached.
+        """
+        now = time.monotonic()
+        with self._lock:
+            events = self._events_by_run_id.setdefault(event.run_id, [])
+            first_buffered_at = self._first_buffered_at_by_run_id.setdefault(event.run_id, now)
+            events.append(event)
+            should_write = len(events) >= max_size or now - first_buffered_at >= max_interval
+            if self._flush_thread is None and not self._shutdown_event.is_set():
+                self._flush_thread = threading.Thread(
+                    target=self._flush_periodically,
+                    name="event-log-buffer-flush",
+                    daemon=True,
+                )
+                self._flush_thread.start()
+
+        if should_write:
+            self.write(event.run_id)
+
+    def write(self, run_id: Optional[str] = None) -> None:
+        """Writes the events buffered for a run, or for every run if `run_id` is not provided."""
+        with self._write_lock:
+            with self._lock:
+                run_ids = [run_id] if run_id is not None else list(self._events_by_run_id)
+                events_by_run_id = {run_id: self._pop(run_id) for run_id in run_ids}
+            for buffered_run_id, events in events_by_run_id.items():
+                if events:
+                    self._write_fn(buffered_run_id, events)
+
+    def discard(self, run_id: Optional[str] = None) -> None:
+        """Drops the events buffered for a run, or for every run if `run_id` is not provided."""
+        with self._write_lock, self._lock:
+            if run_id is not None:
+                self._pop(run_id)
+            else:
+                self._events_by_run_id.clear()
+                self._first_buffered_at_by_run_id.clear()
+
+    def close(self) -> None:
+        """Writes every buffered event and stops the background thread."""
+        self._shutdown_event.set()
+        self.write()
+        flush_thread = self._flush_thread
+        if flush_thread is not None and flush_thread is not threading.current_thread():
+            flush_thread.join()
+
+    def _flush_periodically(self) -> None:
+        # wakes up at least every second, so that changes to the interval are picked up
+        while not self._shutdown_event.wait(min(_get_event_write_buffer_interval(), 1.0)):
+            now = time.monotonic()
+            interval = _get_event_write_buffer_interval()
+            with self._lock:
+                expired_run_ids = [
+                    run_id
+                    for run_id, first_buffered_at in self._first_buffered_at_by_run_id.items()
+                    if now - first_buffered_at >= interval
+                ]
+            for run_id in expired_run_ids:
+                try:
+                    self.write(run_id)
+                except Exception:
+                    logging.exception(f"Failed to write the buffered events for run {run_id}")
+
+    def _pop(self, run_id: str) -> Sequence[EventLogEntry]:
+        self._first_buffered_at_by_run_id.pop(run_id, None)
+        return self._events_by_run_id.pop(run_id, [])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(events) for events in self._events_by_run_id.values())
+
+
+_EVENT_WRITE_BUFFER_INIT_LOCK = threading.Lock()
+
+# Events that start tracking materialized stats for a run, if its stats are not already tracked
+RUN_STATS_TRACKING_EVENTS = {
+    DagsterEventType.RUN_ENQUEUED,
+    DagsterEventType.RUN_STARTING,
+    DagsterEventType.RUN_START,
+}
+
+
+def _naive_utc_from_timestamp(timestamp: Optional[float]) -> Optional[datetime]:
+    # matches the representation of event timestamps in the event log table
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+def _is_run_stats_event(event: EventLogEntry) -> bool:
+    return event.is_dagster_event and event.get_dagster_event().event_type in RUN_STATS_EVENT_TYPES
+
+
+def _is_step_stats_event(event: EventLogEntry) -> bool:
+    if not event.is_dagster_event:
+        return False
+    dagster_event = event.get_dagster_event()
+    if not dagster_event.step_key or dagster_event.event_type not in STEP_STATS_EVENT_TYPES:
+        return False
+    if dagster_event.event_type in MARKER_EVENTS:
+        # only engine events that start or end a marker contribute to step stats
+        return bool(
+            dagster_event.engine_event_data.marker_start
+            or dagster_event.engine_event_data.marker_end
+        )
+    return True
+
+
 # We are using third-party library objects for DB connections-- at this time, these libraries are
 # untyped. When/if we upgrade to typed variants, the `Any` here can be replaced or the alias as a
 # whole can be dropped.
@@ -367,6 +544,89 @@ def _tags_for_asset_event(self, event: EventLogEntry) -> Mapping[str, str]:
         keys_to_index = self.get_asset_tags_to_index(set(tags.keys()))
         return {k: v for k, v in tags.items() if k in keys_to_index}
 
+    @property
+    def _event_write_buffer(self) -> EventWriteBuffer:
+        # Lazily initialized, since subclasses do not share a common constructor
+        write_buffer = self.__dict__.get("_event_write_buffer_instance")
+        if write_buffer is None:
+            with _EVENT_WRITE_BUFFER_INIT_LOCK:
+                write_buffer = self.__dict__.get("_event_write_buffer_instance")
+                if write_buffer is None:
+                    write_buffer = EventWriteBuffer(self._write_buffered_events)
+                    self.__dict__["_event_write_buffer_instance"] = write_buffer
+        return write_buffer
+
+    def _is_bufferable_event(self, event: EventLogEntry) -> bool:
+        if not event.is_dagster_event:
+            # plain log messages
+            return True
+        return event.get_dagster_event().event_type in BUFFERABLE_EVENTS
+
+    def buffer_event_write(self, event: EventLogEntry) -> bool:
+        """Called at the start of `store_event` to apply buffered event writes, when enabled via
+        the `DAGSTER_EVENT_LOG_BUFFER_SIZE` environment variable.
+
+        Bufferable events are added to a per-run buffer, which is written with a single batch insert
+        once it reaches the configured size or age. Any other event first flushes the buffer for its
+        run, so that events are always written in the order they were received within a run.
+
+        Returns:
+            bool: True if the event has been handled by the buffer and should not be written by the
+                caller.
+        """
+        if _is_event_write_buffering_enabled() and self._is_bufferable_event(event):
+            self._event_write_buffer.add(
+                event,
+                max_size=_get_event_write_buffer_size(),
+                max_interval=_get_event_write_buffer_interval(),
+            )
+            return True
+
+        self.flush_buffered_events(event.run_id)
+        return False
+
+    def flush_buffered_events(self, run_id: Optional[str] = None) -> None:
+        """Writes any buffered events to the event log.
+
+        Args:
+            run_id (Optional[str]): If provided, only the events buffered for this run are written.
+        """
+        if "_event_write_buffer_instance" not in self.__dict__:
+            return
+
+        self._event_write_buffer.write(run_id)
+
+    def discard_buffered_events(self, run_id: Optional[str] = None) -> None:
+        """Drops any buffered events without writing them, e.g. when the run's events are deleted.
+
+        Args:
+            run_id (Optional[str]): If provided, only the events buffered for this run are dropped.
+        """
+        if "_event_write_buffer_instance" not in self.__dict__:
+            return
+
+        self._event_write_buffer.discard(run_id)
+
+    def close_event_write_buffer(self) -> None:
+        """Writes any buffered events and stops flushing buffers in the background. Called when the
+        storage is disposed.
+        """
+        if "_event_write_buffer_instance" not in self.__dict__:
+            return
+
+        self._event_write_buffer.close()
+
+    def _write_buffered_events(self, run_id: str, events: Sequence[EventLogEntry]) -> None:
+        if not events:
+            return
+
+        # buffered events are never asset or asset check events, so only the event log table needs
+        # to be written
+        with self.run_connection(run_id) as conn:
+            conn.execute(self.prepare_insert_event_batch(events))
+
+        self.update_run_stats_for_events(events)
+
     def store_event(self, event: EventLogEntry) -> None:
         """Store an event corresponding to a pipeline run.
 
@@ -374,6 +634,9 @@ def store_event(self, event: EventLogEntry) -> None:
             event (EventLogEntry): The event to store.
         """
         check.inst_param(event, "event", EventLogEntry)
+        if self.buffer_event_write(event):
+            return
+
         insert_event_statement = self.prepare_insert_event(event)
         run_id = event.run_id
 
@@ -400,6 +663,8 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+        self.update_run_stats_for_events([event])
+
     def get_records_for_run(
         self,
         run_id,
@@ -422,12 +687,21 @@ def get_records_for_run(
 
         check.invariant(not of_type or isinstance(of_type, (DagsterEventType, frozenset, set)))
 
+        # make events buffered by this process visible to its own reads
+        self.flush_buffered_events(run_id)
+
         dagster_event_types = (
             {of_type}
             if isinstance(of_type, DagsterEventType)
             else check.opt_set_param(of_type, "dagster_event_type", of_type=DagsterEventType)
         )
 
+        archived = self._get_archived_event_log_records_for_read(run_id, cursor, ascending)
+        if archived is not None:
+            return self._get_records_for_archived_run(
+                run_id, archived, cursor, dagster_event_types, limit, ascending
+            )
+
         query = (
             db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
@@ -493,9 +767,311 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    @property
+    def event_log_archive_store(self) -> Optional[EventLogArchiveStore]:
+        """Optional[EventLogArchiveStore]: The blob store holding archived per-run events, configured
+        through the ``event_log_archive`` instance settings.
+        """
+        if not self.has_instance:
+            return None
+        return self._instance.event_log_archive_store
+
+    def _has_event_log_archive(self, run_id: str) -> bool:
+        archive_store = self.event_log_archive_store
+        return archive_store is not None and archive_store.has(run_id)
+
+    @cached_property
+    def _archive_lookup_lock(self) -> threading.Lock:
+        return threading.Lock()
+
+    @cached_property
+    def _archive_lookup_cache(self) -> "OrderedDict[str, tuple[float, Optional[int]]]":
+        # run id -> (time of the lookup, newest archived storage id or None if not archived)
+        return OrderedDict()
+
+    def _cache_archive_lookup(
+        self, run_id: str, archived: Optional[ArchivedEventLogRecords]
+    ) -> None:
+        max_archived_storage_id = archived.storage_ids[-1] if archived else None
+        with self._archive_lookup_lock:
+            self._archive_lookup_cache[run_id] = (time.monotonic(), max_archived_storage_id)
+            self._archive_lookup_cache.move_to_end(run_id)
+            while len(self._archive_lookup_cache) > ARCHIVE_LOOKUP_CACHE_SIZE:
+                self._archive_lookup_cache.popitem(last=False)
+
+    def _get_archived_event_log_records_for_read(
+        self, run_id: str, cursor: Optional[str], ascending: bool
+    ) -> Optional[ArchivedEventLogRecords]:
+        """Returns the archived records of a run if a read from the given cursor needs them, or
+        None if the read can be served from the event log table alone.
+
+        Fetching and decompressing an archive is expensive, so the newest archived storage id of
+        recently read runs is cached. Reads past it, e.g. the polls of an event watcher, skip the
+        archive.
+        """
+        if self.event_log_archive_store is None:
+            return None
+
+        cursor_storage_id = None
+        if cursor is not None and ascending:
+            cursor_obj = EventLogCursor.parse(cursor)
+            if cursor_obj.is_id_cursor():
+                cursor_storage_id = cursor_obj.storage_id()
+
+        with self._archive_lookup_lock:
+            cached = self._archive_lookup_cache.get(run_id)
+        if cached is not None and time.monotonic() - cached[0] < ARCHIVE_LOOKUP_CACHE_TTL_SECONDS:
+            _, max_archived_storage_id = cached
+            if max_archived_storage_id is None or (
+                cursor_storage_id is not None and cursor_storage_id >= max_archived_storage_id
+            ):
+                return None
+
+        archived = self._get_archived_event_log_records(run_id)
+        self._cache_archive_lookup(run_id, archived)
+        if archived is None or (
+            cursor_storage_id is not None and cursor_storage_id >= archived.storage_ids[-1]
+        ):
+            return None
+        return archived
+
+    def _get_archived_event_log_records(self, run_id: str) -> Optional[ArchivedEventLogRecords]:
+        archive_store = self.event_log_archive_store
+        if archive_store is None:
+            return None
+        data = archive_store.get(run_id)
+        if data is None:
+            return None
+        try:
+            return deserialize_event_log_archive(data)
+        except (check.CheckError, ValueError, zlib.error) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+    def _get_records_for_archived_run(
+        self,
+        run_id: str,
+        archived: ArchivedEventLogRecords,
+        cursor: Optional[str],
+        dagster_event_types: AbstractSet[DagsterEventType],
+        limit: Optional[int],
+        ascending: bool,
+    ) -> EventLogConnection:
+        # The events left in the event log table for an archived run are the few that serve
+        # cross-run queries, so they are fetched in full and merged with the archived events
+        query = db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]).where(
+            SqlEventLogStorageTable.c.run_id == run_id
+        )
+        event_type_values = {dagster_event_type.value for dagster_event_type in dagster_event_types}
+        if event_type_values:
+            query = query.where(SqlEventLogStorageTable.c.dagster_event_type.in_(event_type_values))
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        try:
+            records = [
+                *archived.get_records(event_type_values),
+                *[
+                    EventLogRecord(
+                        storage_id=record_id,
+                        event_log_entry=deserialize_value(json_str, EventLogEntry),
+                    )
+                    for record_id, json_str in results
+                ],
+            ]
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        records = sorted(records, key=lambda record: record.storage_id, reverse=not ascending)
+        if cursor is not None:
+            cursor_obj = EventLogCursor.parse(cursor)
+            if cursor_obj.is_offset_cursor():
+                records = records[cursor_obj.offset() :]
+            elif cursor_obj.is_id_cursor():
+                cursor_storage_id = cursor_obj.storage_id()
+                records = [
+                    record
+                    for record in records
+                    if (
+                        record.storage_id > cursor_storage_id
+                        if ascending
+                        else record.storage_id < cursor_storage_id
+                    )
+                ]
+
+        has_more = bool(limit and len(records) > limit)
+        if limit:
+            records = records[:limit]
+
+        if records:
+            next_cursor = EventLogCursor.from_storage_id(records[-1].storage_id).to_string()
+        elif cursor:
+            next_cursor = cursor
+        else:
+            next_cursor = EventLogCursor.from_storage_id(-1).to_string()
+
+        return EventLogConnection(records=records, cursor=next_cursor, has_more=has_more)
+
+    def archive_events_for_run(self, run_id: str) -> int:
+        """Moves the events of a run that are only read on a per-run basis out of the event log
+        table and into the configured event log archive store, merging with any existing archive for
+        the run. Events that serve cross-run queries (run status changes, asset and asset check
+        events) are kept in the event log table.
+
+        Archived events continue to be returned by `get_records_for_run` and the run stats methods.
+        Only finished runs should be archived.
+
+        Args:
+            run_id (str): The id of the run whose events should be archived.
+
+        Returns:
+            int: The number of events that were archived.
+        """
+        check.str_param(run_id, "run_id")
+        archive_store = self.event_log_archive_store
+        if archive_store is None:
+            raise DagsterInvariantViolationError(
+                "Cannot archive events without an event log archive store configured in the "
+                "`event_log_archive` instance settings."
+            )
+
+        self.flush_buffered_events(run_id)
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(
+                db.or_(
+                    SqlEventLogStorageTable.c.dagster_event_type == None,  # noqa: E711
+                    SqlEventLogStorageTable.c.dagster_event_type.notin_(
+                        [event_type.value for event_type in UNARCHIVED_EVENT_TYPES]
+                    ),
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        if not results:
+            return 0
+
+        archived = ArchivedEventLogRecords(
+            storage_ids=[record_id for record_id, _, _ in results],
+            dagster_event_types=[dagster_event_type for _, dagster_event_type, _ in results],
+            events=[json_str for _, _, json_str in results],
+        )
+        existing = self._get_archived_event_log_records(run_id)
+        if existing is not None:
+            archived = existing.merge(archived)
+
+        # write the archive before deleting, so that a failure leaves events readable from the
+        # event log table
+        archive_store.put(run_id, serialize_event_log_archive(archived))
+        self._cache_archive_lookup(run_id, archived)
+
+        archived_ids = [record_id for record_id, _, _ in results]
+        with self.run_connection(run_id) as conn:
+            for start in range(0, len(archived_ids), ARCHIVE_DELETE_BATCH_SIZE):
+                conn.execute(
+                    SqlEventLogStorageTable.delete().where(
+                        SqlEventLogStorageTable.c.id.in_(
+                            archived_ids[start : start + ARCHIVE_DELETE_BATCH_SIZE]
+                        )
+                    )
+                )
+
+        return len(results)
+
+    def get_records_for_runs(
+        self,
+        after_storage_id_by_run_id: Mapping[str, Optional[int]],
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Get the event log records for a set of runs in a single query, ordered by ascending
+        storage id. Only supported by storages that are not run-sharded, where storage ids are
+        comparable across runs.
+
+        Args:
+            after_storage_id_by_run_id (Mapping[str, Optional[int]]): The ids of the runs for which
+                to fetch logs, each mapped to the storage id after which its records are returned,
+                or None to return all of its records.
+            limit (Optional[int]): the maximum number of records to fetch
+        """
+        check.mapping_param(after_storage_id_by_run_id, "after_storage_id_by_run_id", key_type=str)
+        check.opt_int_param(limit, "limit")
+        check.invariant(
+            not self.is_run_sharded, "Cannot fetch records across runs from a run-sharded storage"
+        )
+
+        if not after_storage_id_by_run_id:
+            return []
+
+        run_ids_from_start = [
+            run_id
+            for run_id, after_storage_id in after_storage_id_by_run_id.items()
+            if after_storage_id is None
+        ]
+        # one condition per run, so that each run is only read from its own cursor
+        conditions = [
+            db.and_(
+                SqlEventLogStorageTable.c.run_id == run_id,
+                SqlEventLogStorageTable.c.id > after_storage_id,
+            )
+            for run_id, after_storage_id in after_storage_id_by_run_id.items()
+            if after_storage_id is not None
+        ]
+        if run_ids_from_start:
+            conditions.append(SqlEventLogStorageTable.c.run_id.in_(run_ids_from_start))
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(db.or_(*conditions))
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if limit:
+            query = query.limit(limit)
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        for record_id, run_id, json_str in results:
+            try:
+                records.append(
+                    EventLogRecord(
+                        storage_id=record_id,
+                        event_log_entry=deserialize_value(json_str, EventLogEntry),
+                    )
+                )
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        return records
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
+        run_stats = self._get_materialized_run_stats(run_id)
+        if run_stats is not None:
+            return run_stats
+
+        if self._has_event_log_archive(run_id):
+            # build from the merged archived and event log table records
+            return super().get_stats_for_run(run_id)
+
         query = (
             db_select(
                 [
@@ -564,6 +1140,17 @@ def get_step_stats_for_run(
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
+        # step stats are partially derived from engine event markers, which may be buffered
+        self.flush_buffered_events(run_id)
+
+        step_stats = self._get_materialized_run_step_stats(run_id, step_keys)
+        if step_stats is not None:
+            return step_stats
+
+        if self._has_event_log_archive(run_id):
+            # build from the merged archived and event log table records
+            return super().get_step_stats_for_run(run_id, step_keys)
+
         # Originally, this was two different queries:
         # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
         #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
@@ -601,6 +1188,311 @@ def get_step_stats_for_run(
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+    def get_all_run_ids(self) -> Sequence[str]:
+        """Returns the ids of all runs with events in the event log."""
+        query = db_select([SqlEventLogStorageTable.c.run_id]).distinct()
+        with self.index_connection() as conn:
+            return [run_id for (run_id,) in conn.execute(query).fetchall() if run_id]
+
+    def has_run_stats_tables(self, run_id: str) -> bool:
+        """Whether the tables holding materialized run and step stats exist for the given run."""
+        return self.has_table(RunStatsTable.name) and self.has_table(RunStepStatsTable.name)
+
+    def update_run_stats_for_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Folds newly stored events into the materialized run and step stats of their runs.
+
+        Stats are only materialized for runs that are tracked, i.e. runs that were started after the
+        stats tables were created, or that have been backfilled via `reindex_events`. The stats of
+        untracked runs are computed from the event log on read.
+        """
+        events_by_run_id: dict[str, list[EventLogEntry]] = defaultdict(list)
+        for event in events:
+            if _is_run_stats_event(event) or _is_step_stats_event(event):
+                events_by_run_id[event.run_id].append(event)
+
+        for run_id, run_events in events_by_run_id.items():
+            if not run_id or not self.has_run_stats_tables(run_id):
+                continue
+
+            with self.run_connection(run_id) as conn:
+                is_tracked = bool(
+                    conn.execute(
+                        db_select([RunStatsTable.c.id]).where(RunStatsTable.c.run_id == run_id)
+                    ).fetchone()
+                )
+
+            if not is_tracked:
+                if any(
+                    event.get_dagster_event().event_type in RUN_STATS_TRACKING_EVENTS
+                    for event in run_events
+                ):
+                    # the run is just starting, so building its stats from the events stored so
+                    # far is cheap, and includes the events being folded in here
+                    self.rebuild_run_stats(run_id)
+                continue
+
+            self._update_materialized_run_stats(
+                run_id, [event for event in run_events if _is_run_stats_event(event)]
+            )
+            self._update_materialized_run_step_stats(
+                run_id, [event for event in run_events if _is_step_stats_event(event)]
+            )
+
+    def _update_materialized_run_stats(self, run_id: str, events: Sequence[EventLogEntry]) -> None:
+        if not events:
+            return
+
+        counts: dict[DagsterEventType, int] = defaultdict(int)
+        values = {}
+        for event in events:
+            event_type = event.get_dagster_event().event_type
+            counts[event_type] += 1
+            if event_type == DagsterEventType.RUN_ENQUEUED:
+                values["enqueued_timestamp"] = self._event_insert_timestamp(event)
+            elif event_type == DagsterEventType.RUN_STARTING:
+                values["launch_timestamp"] = self._event_insert_timestamp(event)
+            elif event_type == DagsterEventType.RUN_START:
+                values["start_timestamp"] = self._event_insert_timestamp(event)
+            elif event_type in (
+                DagsterEventType.RUN_SUCCESS,
+                DagsterEventType.RUN_FAILURE,
+                DagsterEventType.RUN_CANCELED,
+            ):
+                values["end_timestamp"] = self._event_insert_timestamp(event)
+
+        # counters are incremented in the database, so that concurrent writers for the same run do
+        # not lose updates
+        for column, event_type in (
+            (RunStatsTable.c.steps_succeeded, DagsterEventType.STEP_SUCCESS),
+            (RunStatsTable.c.steps_failed, DagsterEventType.STEP_FAILURE),
+            (RunStatsTable.c.materializations, DagsterEventType.ASSET_MATERIALIZATION),
+            (RunStatsTable.c.expectations, DagsterEventType.STEP_EXPECTATION_RESULT),
+        ):
+            if counts[event_type]:
+                values[column.name] = column + counts[event_type]
+
+        if not values:
+            return
+
+        with self.run_connection(run_id) as conn:
+            conn.execute(
+                RunStatsTable.update()
+                .where(RunStatsTable.c.run_id == run_id)
+                .values(update_timestamp=get_current_datetime(), **values)
+            )
+
+    def _update_materialized_run_step_stats(
+        self, run_id: str, events: Sequence[EventLogEntry]
+    ) -> None:
+        events_by_step_key: dict[str, list[EventLogEntry]] = defaultdict(list)
+        for event in events:
+            events_by_step_key[check.not_none(event.get_dagster_event().step_key)].append(event)
+
+        for step_key, step_events in events_by_step_key.items():
+            for _ in range(RUN_STEP_STATS_UPDATE_RETRIES):
+                if self._try_update_materialized_step_stats(run_id, step_key, step_events):
+                    break
+            else:
+                logging.warning(
+                    f"Could not update the materialized stats for step {step_key} of run {run_id}"
+                    " due to concurrent updates, removing them so that the stats are computed from"
+                    " the event log instead."
+                )
+                with self.run_connection(run_id) as conn:
+                    conn.execute(
+                        RunStepStatsTable.delete().where(RunStepStatsTable.c.run_id == run_id)
+                    )
+                    conn.execute(RunStatsTable.delete().where(RunStatsTable.c.run_id == run_id))
+                return
+
+    def _try_update_materialized_step_stats(
+        self, run_id: str, step_key: str, events: Sequence[EventLogEntry]
+    ) -> bool:
+        # Step stats depend on sequences of events (attempts, markers) and are not expressible as
+        # column updates, so they are updated as a read-modify-write guarded by the row revision.
+        with self.run_connection(run_id) as conn:
+            row = conn.execute(
+                db_select([RunStepStatsTable.c.stats, RunStepStatsTable.c.revision]).where(
+                    db.and_(
+                        RunStepStatsTable.c.run_id == run_id,
+                        RunStepStatsTable.c.step_key == step_key,
+                    )
+                )
+            ).fetchone()
+
+            if row is None:
+                snapshot = build_run_step_stats_snapshot_from_events(run_id, events)
+                try:
+                    conn.execute(
+                        RunStepStatsTable.insert().values(
+                            run_id=run_id,
+                            step_key=step_key,
+                            stats=serialize_value(snapshot),
+                            revision=0,
+                        )
+                    )
+                except db_exc.IntegrityError:
+                    return False
+                return True
+
+            stats, revision = row
+            snapshot = build_run_step_stats_snapshot_from_events(
+                run_id, events, deserialize_value(stats, RunStepStatsSnapshot)
+            )
+            result = conn.execute(
+                RunStepStatsTable.update()
+                .where(
+                    db.and_(
+                        RunStepStatsTable.c.run_id == run_id,
+                        RunStepStatsTable.c.step_key == step_key,
+                        RunStepStatsTable.c.revision == revision,
+                    )
+                )
+                .values(
+                    stats=serialize_value(snapshot),
+                    revision=revision + 1,
+                    update_timestamp=get_current_datetime(),
+                )
+            )
+            return result.rowcount > 0
+
+    def rebuild_run_stats(self, run_id: str) -> None:
+        """Rebuilds the materialized run and step stats for the given run from its events, and
+        starts tracking them as new events are stored.
+        """
+        check.str_param(run_id, "run_id")
+
+        run_stats = build_run_stats_from_events(
+            run_id, self.get_logs_for_run(run_id, of_type=RUN_STATS_EVENT_TYPES)
+        )
+        step_events_by_step_key: dict[str, list[EventLogEntry]] = defaultdict(list)
+        for event in self.get_logs_for_run(run_id, of_type=STEP_STATS_EVENT_TYPES):
+            if _is_step_stats_event(event):
+                step_events_by_step_key[check.not_none(event.get_dagster_event().step_key)].append(
+                    event
+                )
+
+        with self.run_connection(run_id) as conn:
+            conn.execute(RunStepStatsTable.delete().where(RunStepStatsTable.c.run_id == run_id))
+            conn.execute(RunStatsTable.delete().where(RunStatsTable.c.run_id == run_id))
+            if step_events_by_step_key:
+                conn.execute(
+                    RunStepStatsTable.insert().values(
+                        [
+                            dict(
+                                run_id=run_id,
+                                step_key=step_key,
+                                stats=serialize_value(
+                                    build_run_step_stats_snapshot_from_events(run_id, step_events)
+                                ),
+                                revision=0,
+                            )
+                            for step_key, step_events in step_events_by_step_key.items()
+                        ]
+                    )
+                )
+            conn.execute(
+                RunStatsTable.insert().values(
+                    run_id=run_id,
+                    steps_succeeded=run_stats.steps_succeeded,
+                    steps_failed=run_stats.steps_failed,
+                    materializations=run_stats.materializations,
+                    expectations=run_stats.expectations,
+                    enqueued_timestamp=_naive_utc_from_timestamp(run_stats.enqueued_time),
+                    launch_timestamp=_naive_utc_from_timestamp(run_stats.launch_time),
+                    start_timestamp=_naive_utc_from_timestamp(run_stats.start_time),
+                    end_timestamp=_naive_utc_from_timestamp(run_stats.end_time),
+                )
+            )
+
+    def _get_materialized_run_stats(self, run_id: str) -> Optional[DagsterRunStatsSnapshot]:
+        if not self.has_run_stats_tables(run_id):
+            return None
+
+        with self.run_connection(run_id) as conn:
+            row = conn.execute(
+                db_select(
+                    [
+                        RunStatsTable.c.steps_succeeded,
+                        RunStatsTable.c.steps_failed,
+                        RunStatsTable.c.materializations,
+                        RunStatsTable.c.expectations,
+                        RunStatsTable.c.enqueued_timestamp,
+                        RunStatsTable.c.launch_timestamp,
+                        RunStatsTable.c.start_timestamp,
+                        RunStatsTable.c.end_timestamp,
+                    ]
+                ).where(RunStatsTable.c.run_id == run_id)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        (
+            steps_succeeded,
+            steps_failed,
+            materializations,
+            expectations,
+            enqueued_timestamp,
+            launch_timestamp,
+            start_timestamp,
+            end_timestamp,
+        ) = row
+        return DagsterRunStatsSnapshot(
+            run_id=run_id,
+            steps_succeeded=steps_succeeded,
+            steps_failed=steps_failed,
+            materializations=materializations,
+            expectations=expectations,
+            enqueued_time=(
+                utc_datetime_from_naive(enqueued_timestamp).timestamp()
+                if enqueued_timestamp
+                else None
+            ),
+            launch_time=(
+                utc_datetime_from_naive(launch_timestamp).timestamp() if launch_timestamp else None
+            ),
+            start_time=(
+                utc_datetime_from_naive(start_timestamp).timestamp() if start_timestamp else None
+            ),
+            end_time=(
+                utc_datetime_from_naive(end_timestamp).timestamp() if end_timestamp else None
+            ),
+        )
+
+    def _get_materialized_run_step_stats(
+        self, run_id: str, step_keys: Optional[Sequence[str]]
+    ) -> Optional[Sequence[RunStepKeyStatsSnapshot]]:
+        if not self.has_run_stats_tables(run_id):
+            return None
+
+        query = (
+            db_select([RunStepStatsTable.c.stats])
+            .where(RunStepStatsTable.c.run_id == run_id)
+            .order_by(RunStepStatsTable.c.id.asc())
+        )
+        if step_keys:
+            query = query.where(RunStepStatsTable.c.step_key.in_(step_keys))
+
+        with self.run_connection(run_id) as conn:
+            is_tracked = bool(
+                conn.execute(
+                    db_select([RunStatsTable.c.id]).where(RunStatsTable.c.run_id == run_id)
+                ).fetchone()
+            )
+            if not is_tracked:
+                return None
+            results = conn.execute(query).fetchall()
+
+        try:
+            return [
+                step_stats
+                for (stats,) in results
+                for step_stats in deserialize_value(stats, RunStepStatsSnapshot).step_key_stats
+            ]
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
             if not force:
@@ -629,6 +1521,8 @@ def wipe(self) -> None:
         # Should be overridden by SqliteEventLogStorage and other storages that shard based on
         # run_id
 
+        self.discard_buffered_events()
+
         # https://stackoverflow.com/a/54386260/324449
         with self.run_connection(run_id=None) as conn:
             conn.execute(SqlEventLogStorageTable.delete())
@@ -652,6 +1546,12 @@ def wipe(self) -> None:
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self.has_table("run_stats"):
+                conn.execute(RunStatsTable.delete())
+
+            if self.has_table("run_step_stats"):
+                conn.execute(RunStepStatsTable.delete())
+
         self._wipe_index()
 
     def _wipe_index(self):
@@ -674,7 +1574,22 @@ def _wipe_index(self):
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self.has_table("run_stats"):
+                conn.execute(RunStatsTable.delete())
+
+            if self.has_table("run_step_stats"):
+                conn.execute(RunStepStatsTable.delete())
+
     def delete_events(self, run_id: str) -> None:
+        self.discard_buffered_events(run_id)
+        archive_store = self.event_log_archive_store
+        if archive_store is not None:
+            archive_store.delete(run_id)
+            self._cache_archive_lookup(run_id, None)
+        if self.has_run_stats_tables(run_id):
+            with self.run_connection(run_id) as conn:
+                conn.execute(RunStatsTable.delete().where(RunStatsTable.c.run_id == run_id))
+                conn.execute(RunStepStatsTable.delete().where(RunStepStatsTable.c.run_id == run_id))
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
         with self.index_connection() as conn:
@@ -1368,6 +2283,67 @@ def get_latest_materialization_events(
             ).items()
         }
 
+    def get_max_asset_event_storage_id(
+        self, event_types: AbstractSet[DagsterEventType]
+    ) -> Optional[int]:
+        """Returns the max storage id of the events of the given types, or None if there are none.
+        Each event type is looked up separately, so that every lookup is a single index read.
+        """
+        check.set_param(event_types, "event_types", of_type=DagsterEventType)
+        if not event_types:
+            return None
+
+        query = db_select(
+            [
+                db_scalar_subquery(
+                    db_select([db.func.max(SqlEventLogStorageTable.c.id)]).where(
+                        SqlEventLogStorageTable.c.dagster_event_type == event_type.value
+                    )
+                )
+                for event_type in sorted(event_types, key=lambda event_type: event_type.value)
+            ]
+        )
+        with self.index_connection() as conn:
+            row = conn.execute(query).fetchone()
+
+        storage_ids = [storage_id for storage_id in row or [] if storage_id is not None]
+        return max(storage_ids) if storage_ids else None
+
+    def get_asset_keys_with_events_after(
+        self,
+        after_storage_id: Optional[int],
+        event_types: AbstractSet[DagsterEventType],
+        limit: int,
+    ) -> Optional[AbstractSet[AssetKey]]:
+        """Returns the asset keys with events of the given types after the given storage id, or
+        None if there are more than `limit` of them.
+        """
+        check.opt_int_param(after_storage_id, "after_storage_id")
+        check.set_param(event_types, "event_types", of_type=DagsterEventType)
+        check.int_param(limit, "limit")
+
+        query = (
+            db_select([SqlEventLogStorageTable.c.asset_key])
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [event_type.value for event_type in event_types]
+                    ),
+                    SqlEventLogStorageTable.c.asset_key.isnot(None),
+                )
+            )
+            .distinct()
+            .limit(limit + 1)
+        )
+        if after_storage_id is not None:
+            query = query.where(SqlEventLogStorageTable.c.id > after_storage_id)
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        if len(rows) > limit:
+            return None
+        return {check.not_none(AssetKey.from_db_string(row[0])) for row in rows}
+
     def _fetch_asset_rows(
         self,
         asset_keys=None,
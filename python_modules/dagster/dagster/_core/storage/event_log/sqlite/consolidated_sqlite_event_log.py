@@ -188,6 +188,7 @@ def end_watch(self, run_id, handler):
             del self._watchers[run_id][handler]
 
     def dispose(self):
+        self.close_event_write_buffer()
         if self._obs:
             self._obs.stop()
             self._obs.join(timeout=15)
@@ -6,7 +6,7 @@
 import sqlite3
 import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
 from functools import cached_property
@@ -18,7 +18,7 @@
 from dagster_shared.serdes import deserialize_value
 from dagster_shared.serdes.errors import DeserializationError
 from sqlalchemy.engine import Connection, Engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, QueuePool
 from tqdm import tqdm
 from watchdog.events import FileSystemEvent, PatternMatchingEventHandler
 from watchdog.observers import Observer
@@ -40,6 +40,8 @@
 from dagster._core.storage.dagster_run import DagsterRunStatus, RunsFilter
 from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventRecordsFilter
 from dagster._core.storage.event_log.schema import (
+    RunStatsTable,
+    RunStepStatsTable,
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
 )
@@ -66,6 +68,12 @@
 INDEX_SHARD_NAME = "index"
 
 
+def get_sqlite_shard_pool_size() -> int:
+    # the maximum number of shards whose engine and connection are kept open for reuse by each
+    # storage, or 0 to open a new engine for every connection
+    return int(os.getenv("DAGSTER_SQLITE_SHARD_POOL_SIZE", "0"))
+
+
 class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """SQLite-backed event log storage.
 
@@ -89,6 +97,11 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     The ``base_dir`` param tells the event log storage where on disk to store the databases. To
     improve concurrent performance, event logs are stored in a separate SQLite database for each
     run.
+
+    Setting the ``DAGSTER_SQLITE_SHARD_POOL_SIZE`` environment variable keeps an engine with a single
+    open connection for up to that many of the most recently used shards, instead of opening a new
+    engine and connection every time a shard is accessed. Reusing engines also reuses their compiled
+    statement caches, which benefits long-lived, multi-threaded processes like the daemon.
     """
 
     def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = None):
@@ -110,6 +123,14 @@ def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = N
         # Ensure that multiple threads (like the event log watcher) interact safely with each other
         self._db_lock = threading.Lock()
 
+        # Pooled engines by shard, in least recently used order, along with the pid of the process
+        # that created them, since pooled connections must not be used by forked processes. Only
+        # accessed while holding _db_lock.
+        self._shard_engines: OrderedDict[str, Engine] = OrderedDict()
+        self._shard_engines_pid = os.getpid()
+        # Tables known to exist in the index shard, cached when shard pooling is enabled
+        self._index_table_names: set[str] = set()
+
         if not os.path.exists(self.path_for_shard(INDEX_SHARD_NAME)):
             conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
             engine = create_engine(conn_string, poolclass=NullPool)
@@ -157,10 +178,26 @@ def get_all_run_ids(self) -> Sequence[str]:
         ]
 
     def has_table(self, table_name: str) -> bool:
+        if table_name in self._index_table_names:
+            return True
+
         conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
         engine = create_engine(conn_string, poolclass=NullPool)
         with engine.connect() as conn:
-            return bool(engine.dialect.has_table(conn, table_name))
+            has_table = bool(engine.dialect.has_table(conn, table_name))
+
+        # tables are only ever added by migrations, so their existence can be cached
+        if has_table and get_sqlite_shard_pool_size() > 0:
+            self._index_table_names.add(table_name)
+        return has_table
+
+    def has_run_stats_tables(self, run_id: str) -> bool:
+        # materialized stats are stored in the run shard, which may predate the stats tables
+        with self.run_connection(run_id) as conn:
+            return bool(
+                conn.dialect.has_table(conn, RunStatsTable.name)
+                and conn.dialect.has_table(conn, RunStepStatsTable.name)
+            )
 
     def path_for_shard(self, run_id: str) -> str:
         return os.path.join(self._base_dir, f"{run_id}.db")
@@ -221,13 +258,50 @@ def _initdb(self, engine: Engine, for_index_shard=False) -> None:
                     time.sleep(0.2)
                     retry_limit -= 1
 
+    def _get_pooled_engine(self, shard: str, pool_size: int) -> Engine:
+        if self._shard_engines_pid != os.getpid():
+            # drop the engines inherited from the parent process without closing their connections,
+            # which are still in use by the parent
+            self._shard_engines = OrderedDict()
+            self._shard_engines_pid = os.getpid()
+
+        engine = self._shard_engines.get(shard)
+        if engine is None:
+            # A single retained connection per shard suffices, since _db_lock serializes all
+            # connections, and it may be used by any thread that acquires the lock. Overflow
+            # connections are only used transiently when initializing the shard.
+            engine = create_engine(
+                self.conn_string_for_shard(shard),
+                poolclass=QueuePool,
+                pool_size=1,
+                max_overflow=-1,
+                connect_args={"check_same_thread": False},
+            )
+            self._shard_engines[shard] = engine
+        self._shard_engines.move_to_end(shard)
+
+        while len(self._shard_engines) > pool_size:
+            _, evicted_engine = self._shard_engines.popitem(last=False)
+            evicted_engine.dispose()
+
+        return engine
+
+    def _dispose_pooled_engines(self) -> None:
+        with self._db_lock:
+            for engine in self._shard_engines.values():
+                engine.dispose()
+            self._shard_engines.clear()
+
     @contextmanager
     def _connect(self, shard: str) -> Iterator[Connection]:
         with self._db_lock:
             check.str_param(shard, "shard")
 
-            conn_string = self.conn_string_for_shard(shard)
-            engine = create_engine(conn_string, poolclass=NullPool)
+            pool_size = get_sqlite_shard_pool_size()
+            if pool_size > 0:
+                engine = self._get_pooled_engine(shard, pool_size)
+            else:
+                engine = create_engine(self.conn_string_for_shard(shard), poolclass=NullPool)
 
             if shard not in self._initialized_dbs:
                 self._initdb(engine)
@@ -236,7 +310,8 @@ def _connect(self, shard: str) -> Iterator[Connection]:
             with engine.connect() as conn:
                 with conn.begin():
                     yield conn
-            engine.dispose()
+            if pool_size <= 0:
+                engine.dispose()
 
     def run_connection(self, run_id: Optional[str] = None) -> Any:
         return self._connect(run_id)  # type: ignore  # bad sig
@@ -252,6 +327,9 @@ def store_event(self, event: EventLogEntry) -> None:
             event (EventLogEntry): The event to store.
         """
         check.inst_param(event, "event", EventLogEntry)
+        if self.buffer_event_write(event):
+            return
+
         insert_event_statement = self.prepare_insert_event(event)
         run_id = event.run_id
 
@@ -283,6 +361,8 @@ def store_event(self, event: EventLogEntry) -> None:
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
+        self.update_run_stats_for_events([event])
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -439,6 +519,8 @@ def fetch_run_status_changes(
 
     def wipe(self) -> None:
         # should delete all the run-sharded db files and drop the contents of the index
+        self.discard_buffered_events()
+        self._dispose_pooled_engines()
         for filename in (
             glob.glob(os.path.join(self._base_dir, "*.db"))
             + glob.glob(os.path.join(self._base_dir, "*.db-wal"))
@@ -488,9 +570,11 @@ def end_watch(self, run_id: str, handler: EventHandlerFn) -> None:
             del self._watchers[run_id][handler]
 
     def dispose(self) -> None:
+        self.close_event_write_buffer()
         if self._obs:
             self._obs.stop()
             self._obs.join(timeout=15)
+        self._dispose_pooled_engines()
 
     def alembic_version(self) -> AlembicVersion:
         alembic_config = get_alembic_config(__file__)
@@ -522,7 +606,14 @@ def __init__(
         self._cb = check.callable_param(callback, "callback")
         self._log_path = event_log_storage.path_for_shard(run_id)
         self._cursor = cursor
-        super().__init__(patterns=[self._log_path], **kwargs)
+        # Writes through a pooled connection stay in the write-ahead log until it is checkpointed,
+        # rather than modifying the database file when the connection is closed
+        self._watched_paths = (
+            [self._log_path, f"{self._log_path}-wal"]
+            if get_sqlite_shard_pool_size() > 0
+            else [self._log_path]
+        )
+        super().__init__(patterns=self._watched_paths, **kwargs)
 
     def _process_log(self) -> None:
         connection = self._event_log_storage.get_records_for_run(self._run_id, self._cursor)
@@ -545,5 +636,5 @@ def _process_log(self) -> None:
                 self._event_log_storage.end_watch(self._run_id, self._cb)
 
     def on_modified(self, event: FileSystemEvent) -> None:
-        check.invariant(event.src_path == self._log_path)
+        check.invariant(event.src_path in self._watched_paths)
         self._process_log()
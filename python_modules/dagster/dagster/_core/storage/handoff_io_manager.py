@@ -0,0 +1,318 @@
+import json
+import os
+import shutil
+import sys
+import threading
+from collections.abc import Sequence
+from contextlib import suppress
+from typing import Any, Optional
+
+from pydantic import Field
+
+import dagster._check as check
+from dagster._annotations import beta, public
+from dagster._config.pythonic_config import ConfigurableIOManagerFactory, ResourceDependency
+from dagster._core.definitions.executor_definition import ExecutorRequirement
+from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.execution.context.init import InitResourceContext
+from dagster._core.execution.context.input import InputContext
+from dagster._core.execution.context.output import OutputContext
+from dagster._core.execution.plan.outputs import StepOutputHandle
+from dagster._core.execution.plan.step import ExecutionStep
+from dagster._core.storage.dagster_run import FINISHED_STATUSES, RunsFilter
+from dagster._core.storage.io_manager import IOManager
+from dagster._utils import mkdir_p
+
+NUMPY_SUFFIX = ".npy"
+ARROW_SUFFIX = ".arrow"
+# Suffix of the file listing the steps that load a memory-mapped output
+CONSUMERS_SUFFIX = ".consumers"
+# Suffix of the marker file written by each step once it has loaded a memory-mapped output
+LOADED_SUFFIX = ".loaded"
+
+
+def _steps_share_process(context: OutputContext) -> bool:
+    """Whether every step of the run executes in the process executing this step, as with the
+    in-process and threadpool executors, so that outputs never need to leave the process.
+    """
+    try:
+        step_context = context.step_context
+    except DagsterInvariantViolationError:
+        # e.g. a context built with build_output_context, outside of a run
+        return False
+
+    requirements = step_context.job_def.executor_def.get_requirements(
+        step_context.resolved_run_config.execution.execution_engine_config
+    )
+    return ExecutorRequirement.PERSISTENT_OUTPUTS not in requirements
+
+
+def _get_consumer_step_keys(context: OutputContext) -> Optional[Sequence[str]]:
+    """The keys of the steps of the run that load the output, or None if they are not known yet, as
+    for outputs loaded by dynamically mapped or collecting steps that have not been resolved.
+    """
+    step_context = context.step_context
+    step_output_handle = StepOutputHandle(context.step_key, context.name, context.mapping_key)
+    run_step_keys = step_context.dagster_run.step_keys_to_execute
+    consumer_step_keys = []
+    for step in step_context.execution_plan.steps:
+        if not isinstance(step, ExecutionStep):
+            if context.step_key in step.get_all_dependency_keys():
+                return None
+        elif (run_step_keys is None or step.key in run_step_keys) and any(
+            step_output_handle in step_input.get_step_output_handle_dependencies()
+            for step_input in step.step_inputs
+        ):
+            consumer_step_keys.append(step.key)
+    return consumer_step_keys
+
+
+def _get_mappable_suffix(obj: object) -> Optional[str]:
+    # numpy and pyarrow are optional, and an object can only be one of their types if the module
+    # defining the type has already been imported
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(obj, numpy.ndarray) and not obj.dtype.hasobject:
+        return NUMPY_SUFFIX
+
+    pyarrow = sys.modules.get("pyarrow")
+    if pyarrow is not None and isinstance(obj, pyarrow.Table):
+        return ARROW_SUFFIX
+
+    return None
+
+
+class InMemoryHandoffIOManager(IOManager):
+    """Hands step outputs to downstream steps in memory where possible, and stores them with a
+    fallback IO manager. See HandoffIOManager.
+    """
+
+    def __init__(
+        self,
+        fallback_io_manager: IOManager,
+        base_dir: str,
+        persist_mapped_outputs: bool = False,
+    ):
+        self.fallback_io_manager = check.inst_param(
+            fallback_io_manager, "fallback_io_manager", IOManager
+        )
+        self.base_dir = check.str_param(base_dir, "base_dir")
+        self.persist_mapped_outputs = check.bool_param(
+            persist_mapped_outputs, "persist_mapped_outputs"
+        )
+        # steps executed by the threadpool executor load and store values concurrently
+        self._lock = threading.Lock()
+        self.values: dict[tuple[object, ...], object] = {}
+        # the steps that have yet to load each value, or None if they are not known yet
+        self._unloaded_consumer_step_keys: dict[tuple[object, ...], Optional[set[str]]] = {}
+
+    def _get_path(self, identifier: tuple[object, ...], suffix: str) -> str:
+        return os.path.join(self.base_dir, *(str(part) for part in identifier)) + suffix
+
+    def _write_mappable(
+        self, path: str, suffix: str, obj: Any, consumer_step_keys: Sequence[str]
+    ) -> None:
+        mkdir_p(os.path.dirname(path))
+        with open(path + CONSUMERS_SUFFIX, "w") as f:
+            json.dump(consumer_step_keys, f)
+        # written under a temporary name, so that a reader never maps a partially written file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        if suffix == NUMPY_SUFFIX:
+            import numpy
+
+            with open(tmp_path, "wb") as f:
+                numpy.save(f, obj, allow_pickle=False)
+        else:
+            import pyarrow
+
+            with pyarrow.OSFile(tmp_path, "wb") as sink:
+                with pyarrow.ipc.new_file(sink, obj.schema) as writer:
+                    writer.write_table(obj)
+        os.replace(tmp_path, path)
+
+    def _load_mappable(self, identifier: tuple[object, ...]) -> tuple[Optional[str], Any]:
+        numpy_path = self._get_path(identifier, NUMPY_SUFFIX)
+        if os.path.exists(numpy_path):
+            import numpy
+
+            # copy-on-write, so that the pages are shared until the loading step modifies them
+            return numpy_path, numpy.load(numpy_path, mmap_mode="c", allow_pickle=False)
+
+        arrow_path = self._get_path(identifier, ARROW_SUFFIX)
+        if os.path.exists(arrow_path):
+            import pyarrow
+
+            return arrow_path, pyarrow.ipc.open_file(pyarrow.memory_map(arrow_path, "r")).read_all()
+
+        return None, None
+
+    def _mark_loaded(self, path: str, step_key: str) -> None:
+        # Called when the output is also stored by the fallback. The file is deleted once every
+        # step of the run that loads it has mapped it, which keeps the mapped pages alive. A later
+        # load, e.g. by a retried step, reads from the fallback.
+        with open(f"{path}.{step_key}{LOADED_SUFFIX}", "w"):
+            pass
+        try:
+            with open(path + CONSUMERS_SUFFIX) as f:
+                consumer_step_keys = json.load(f)
+        except FileNotFoundError:
+            # already deleted by another consumer
+            return
+
+        loaded_paths = [f"{path}.{key}{LOADED_SUFFIX}" for key in consumer_step_keys]
+        if all(os.path.exists(loaded_path) for loaded_path in loaded_paths):
+            for done_path in [path, path + CONSUMERS_SUFFIX, *loaded_paths]:
+                with suppress(FileNotFoundError):
+                    os.remove(done_path)
+
+    def _pop_value(self, identifier: tuple[object, ...], step_key: str) -> tuple[bool, object]:
+        """Returns whether the value of the output is kept by reference, and the value, which is no
+        longer kept once every step that loads it has loaded it.
+        """
+        with self._lock:
+            if identifier not in self.values:
+                return False, None
+
+            value = self.values[identifier]
+            unloaded_step_keys = self._unloaded_consumer_step_keys[identifier]
+            if unloaded_step_keys is not None:
+                unloaded_step_keys.discard(step_key)
+                if not unloaded_step_keys:
+                    # a later load, e.g. by a retried step, reads from the fallback
+                    del self.values[identifier]
+                    del self._unloaded_consumer_step_keys[identifier]
+            return True, value
+
+    def handle_output(self, context: OutputContext, obj: Any) -> None:
+        if context.has_asset_key:
+            self.fallback_io_manager.handle_output(context, obj)
+            return
+
+        identifier = tuple(context.get_identifier())
+        if _steps_share_process(context):
+            # stored by the fallback IO manager, from which retries and re-executions load it
+            self.fallback_io_manager.handle_output(context, obj)
+            consumer_step_keys = _get_consumer_step_keys(context)
+            if consumer_step_keys is None or consumer_step_keys:
+                # kept by reference for the steps that load it, until each of them has
+                with self._lock:
+                    self.values[identifier] = obj
+                    self._unloaded_consumer_step_keys[identifier] = (
+                        set(consumer_step_keys) if consumer_step_keys is not None else None
+                    )
+            return
+
+        suffix = _get_mappable_suffix(obj)
+        consumer_step_keys = _get_consumer_step_keys(context) if suffix else None
+        if suffix and consumer_step_keys:
+            self._write_mappable(
+                self._get_path(identifier, suffix), suffix, obj, consumer_step_keys
+            )
+            if not self.persist_mapped_outputs:
+                return
+
+        self.fallback_io_manager.handle_output(context, obj)
+
+    def load_input(self, context: InputContext) -> Any:
+        if context.upstream_output is None or context.has_asset_key:
+            return self.fallback_io_manager.load_input(context)
+
+        identifier = tuple(context.get_identifier())
+        step_key = context.step_context.step.key
+        is_kept, value = self._pop_value(identifier, step_key)
+        if is_kept:
+            return value
+
+        path, obj = self._load_mappable(identifier)
+        if path is not None:
+            if self.persist_mapped_outputs:
+                self._mark_loaded(path, step_key)
+            return obj
+
+        return self.fallback_io_manager.load_input(context)
+
+    def delete_finished_runs(self, context: InitResourceContext) -> None:
+        """Deletes the memory-mapped files of finished runs that were not deleted by the steps
+        that loaded them.
+        """
+        if context.instance is None or not os.path.isdir(self.base_dir):
+            return
+
+        run_ids = [run_id for run_id in os.listdir(self.base_dir) if run_id != context.run_id]
+        if not run_ids:
+            return
+
+        for run in context.instance.get_runs(
+            RunsFilter(run_ids=run_ids, statuses=FINISHED_STATUSES)
+        ):
+            shutil.rmtree(os.path.join(self.base_dir, run.run_id), ignore_errors=True)
+
+
+@beta
+@public
+class HandoffIOManager(ConfigurableIOManagerFactory[InMemoryHandoffIOManager]):
+    """IO manager that hands op outputs to downstream steps of the same run in memory where
+    possible, and stores outputs with another IO manager otherwise.
+
+    When every step executes in the same process, for example with the in-process or threadpool
+    executors, outputs are stored with ``fallback_io_manager``, from which retries and
+    re-executions load them, and are also kept by reference, so a downstream step receives the
+    upstream object itself rather than a copy loaded from storage. The reference is dropped once
+    every step that loads the output has loaded it.
+
+    When steps execute in separate processes, op outputs that are NumPy arrays or PyArrow tables
+    are instead written to ``base_dir`` as ``.npy`` and Arrow IPC files, which downstream steps
+    memory-map, so that steps on the same host share the pages of each payload. These outputs are
+    not stored with ``fallback_io_manager`` unless ``persist_mapped_outputs`` is set, so the steps
+    that load them can be retried within the run but not re-executed in a later run. The files of a
+    run are deleted once it has finished, or, with ``persist_mapped_outputs``, once every step that
+    loads them has mapped them. Asset outputs and all other outputs are stored with
+    ``fallback_io_manager``.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from dagster import FilesystemIOManager, HandoffIOManager, job, op
+
+        @job(
+            resource_defs={
+                "io_manager": HandoffIOManager(fallback_io_manager=FilesystemIOManager())
+            }
+        )
+        def job():
+            op_b(op_a())
+    """
+
+    fallback_io_manager: ResourceDependency[IOManager]
+    base_dir: Optional[str] = Field(
+        default=None,
+        description=(
+            "Base directory for the memory-mapped files of NumPy and Arrow outputs. Defaults to a"
+            " directory in the instance's storage directory. A directory on a memory-backed"
+            " filesystem, such as /dev/shm, avoids writing the files to disk."
+        ),
+    )
+
+    persist_mapped_outputs: bool = Field(
+        default=False,
+        description=(
+            "Whether to also store the outputs that are memory-mapped by downstream steps with"
+            " fallback_io_manager, so that runs can be re-executed from them."
+        ),
+    )
+
+    @classmethod
+    def _is_dagster_maintained(cls) -> bool:
+        return True
+
+    def create_io_manager(self, context: InitResourceContext) -> InMemoryHandoffIOManager:
+        base_dir = self.base_dir or os.path.join(
+            check.not_none(context.instance).storage_directory(), "handoff"
+        )
+        io_manager = InMemoryHandoffIOManager(
+            fallback_io_manager=self.fallback_io_manager,
+            base_dir=base_dir,
+            persist_mapped_outputs=self.persist_mapped_outputs,
+        )
+        io_manager.delete_finished_runs(context)
+        return io_manager
@@ -70,7 +70,7 @@
         TagBucket,
     )
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
-    from dagster._daemon.types import DaemonHeartbeat
+    from dagster._daemon.types import DaemonHeartbeat, DaemonLease
 
 
 class CompositeStorage(DagsterStorage, ConfigurableClass):
@@ -324,6 +324,25 @@ def get_daemon_heartbeats(self) -> Mapping[str, "DaemonHeartbeat"]:
     def wipe_daemon_heartbeats(self) -> None:
         return self._storage.run_storage.wipe_daemon_heartbeats()
 
+    def supports_daemon_leases(self) -> bool:
+        return self._storage.run_storage.supports_daemon_leases()
+
+    def claim_daemon_lease(
+        self, lease_group: str, lease_key: str, owner_id: str, lease_duration_seconds: float
+    ) -> bool:
+        return self._storage.run_storage.claim_daemon_lease(
+            lease_group, lease_key, owner_id, lease_duration_seconds
+        )
+
+    def release_daemon_lease(self, lease_group: str, lease_key: str, owner_id: str) -> None:
+        return self._storage.run_storage.release_daemon_lease(lease_group, lease_key, owner_id)
+
+    def get_daemon_leases(self, lease_group: str) -> Sequence["DaemonLease"]:
+        return self._storage.run_storage.get_daemon_leases(lease_group)
+
+    def delete_expired_daemon_leases(self, lease_group: str) -> None:
+        return self._storage.run_storage.delete_expired_daemon_leases(lease_group)
+
     def get_backfills(
         self,
         filters: Optional["BulkActionsFilter"] = None,
@@ -857,6 +876,9 @@ def create_tick(self, tick_data: "TickData") -> "InstigatorTick":
     def update_tick(self, tick: "InstigatorTick") -> "InstigatorTick":
         return self._storage.schedule_storage.update_tick(tick)
 
+    def update_ticks(self, ticks: Sequence["InstigatorTick"]) -> Sequence["InstigatorTick"]:
+        return self._storage.schedule_storage.update_ticks(ticks)
+
     def purge_ticks(
         self,
         origin_id: str,
@@ -1,3 +1,4 @@
+import os
 from collections.abc import Iterable, Sequence
 from enum import Enum
 from typing import TYPE_CHECKING, NamedTuple, Optional
@@ -45,6 +46,13 @@
 RUN_FETCH_BATCH_SIZE = 100
 
 
+def get_asset_status_cache_write_interval() -> int:
+    # the number of storage ids that the persisted status cache value of an asset may lag behind
+    # its latest materialization or planned event before the updated value is written back, or 0 to
+    # write on every change
+    return int(os.getenv("DAGSTER_ASSET_STATUS_CACHE_WRITE_INTERVAL", "0"))
+
+
 class AssetPartitionStatus(Enum):
     """The status of asset partition."""
 
@@ -297,63 +305,70 @@ def _build_status_cache(
     if not partitions_def or not is_cacheable_partition_type(partitions_def):
         return AssetStatusCacheValue(latest_storage_id=latest_storage_id)
 
-    failed_subset = (
-        partitions_def.deserialize_subset(stored_cache_value.serialized_failed_partition_subset)
-        if stored_cache_value and stored_cache_value.serialized_failed_partition_subset
-        else None
-    )
-
-    cached_in_progress_cursor = (
-        (
-            stored_cache_value.earliest_in_progress_materialization_event_id - 1
-            if stored_cache_value.earliest_in_progress_materialization_event_id
-            else stored_cache_value.latest_storage_id
-        )
-        if stored_cache_value
-        else None
-    )
-
-    if stored_cache_value:
-        # fetch the incremental new materialized partitions, and update the cached materialized
-        # subset
-        new_partitions = set()
-        if (
-            last_materialization_storage_id
-            and last_materialization_storage_id > stored_cache_value.latest_storage_id
-        ):
-            new_partitions = get_validated_partition_keys(
+    if not stored_cache_value:
+        materialized_subset = partitions_def.empty_subset().with_partition_keys(
+            get_validated_partition_keys(
                 partitions_def,
-                instance.get_materialized_partitions(
-                    asset_key, after_cursor=stored_cache_value.latest_storage_id
-                ),
-            )
-
-        materialized_subset: PartitionsSubset = (
-            partitions_def.deserialize_subset(
-                stored_cache_value.serialized_materialized_partition_subset
+                instance.get_materialized_partitions(asset_key),
             )
-            if stored_cache_value.serialized_materialized_partition_subset
-            else partitions_def.empty_subset()
+        )
+        (
+            failed_subset,
+            in_progress_subset,
+            earliest_in_progress_materialization_event_id,
+        ) = build_failed_and_in_progress_partition_subset(
+            instance,
+            asset_key,
+            partitions_def,
+            last_planned_materialization_storage_id=last_planned_materialization_storage_id,
+        )
+        return AssetStatusCacheValue(
+            latest_storage_id=latest_storage_id,
+            partitions_def_id=partitions_def.get_serializable_unique_identifier(),
+            serialized_materialized_partition_subset=materialized_subset.serialize(),
+            serialized_failed_partition_subset=failed_subset.serialize(),
+            serialized_in_progress_partition_subset=in_progress_subset.serialize(),
+            earliest_in_progress_materialization_event_id=earliest_in_progress_materialization_event_id,
         )
 
-        if new_partitions:
-            materialized_subset = materialized_subset.with_partition_keys(new_partitions)
+    # Apply only the events stored since the cached value was computed. The serialized subsets are
+    # carried over as-is unless the new events actually change them, so that large subsets are not
+    # deserialized and reserialized on every update.
+    serialized_materialized_subset = stored_cache_value.serialized_materialized_partition_subset
+    serialized_failed_subset = stored_cache_value.serialized_failed_partition_subset
 
-        if failed_subset and new_partitions:
-            failed_subset = failed_subset - partitions_def.empty_subset().with_partition_keys(
-                new_partitions
-            )
+    new_partitions = set()
+    if (
+        last_materialization_storage_id
+        and last_materialization_storage_id > stored_cache_value.latest_storage_id
+    ):
+        new_partitions = get_validated_partition_keys(
+            partitions_def,
+            instance.get_materialized_partitions(
+                asset_key, after_cursor=stored_cache_value.latest_storage_id
+            ),
+        )
 
-    else:
-        materialized_subset = partitions_def.empty_subset().with_partition_keys(
-            get_validated_partition_keys(
-                partitions_def,
-                instance.get_materialized_partitions(asset_key),
-            )
+    if new_partitions:
+        new_subset = partitions_def.empty_subset().with_partition_keys(new_partitions)
+        materialized_subset = stored_cache_value.deserialize_materialized_partition_subsets(
+            partitions_def
         )
+        if not (new_subset - materialized_subset).is_empty:
+            serialized_materialized_subset = (materialized_subset | new_subset).serialize()
+
+        if serialized_failed_subset:
+            failed_subset = partitions_def.deserialize_subset(serialized_failed_subset)
+            if not (failed_subset & new_subset).is_empty:
+                serialized_failed_subset = (failed_subset - new_subset).serialize()
 
+    cached_in_progress_cursor = (
+        stored_cache_value.earliest_in_progress_materialization_event_id - 1
+        if stored_cache_value.earliest_in_progress_materialization_event_id
+        else stored_cache_value.latest_storage_id
+    )
     (
-        failed_subset,
+        new_failed_subset,
         in_progress_subset,
         earliest_in_progress_materialization_event_id,
     ) = build_failed_and_in_progress_partition_subset(
@@ -361,15 +376,26 @@ def _build_status_cache(
         asset_key,
         partitions_def,
         last_planned_materialization_storage_id=last_planned_materialization_storage_id,
-        failed_subset=failed_subset,
         after_storage_id=cached_in_progress_cursor,
     )
+    if not new_failed_subset.is_empty:
+        failed_subset = (
+            partitions_def.deserialize_subset(serialized_failed_subset)
+            if serialized_failed_subset
+            else partitions_def.empty_subset()
+        )
+        if not (new_failed_subset - failed_subset).is_empty:
+            serialized_failed_subset = (failed_subset | new_failed_subset).serialize()
 
     return AssetStatusCacheValue(
         latest_storage_id=latest_storage_id,
         partitions_def_id=partitions_def.get_serializable_unique_identifier(),
-        serialized_materialized_partition_subset=materialized_subset.serialize(),
-        serialized_failed_partition_subset=failed_subset.serialize(),
+        serialized_materialized_partition_subset=(
+            serialized_materialized_subset or partitions_def.empty_subset().serialize()
+        ),
+        serialized_failed_partition_subset=(
+            serialized_failed_subset or partitions_def.empty_subset().serialize()
+        ),
         serialized_in_progress_partition_subset=in_progress_subset.serialize(),
         earliest_in_progress_materialization_event_id=earliest_in_progress_materialization_event_id,
     )
@@ -448,6 +474,23 @@ def build_failed_and_in_progress_partition_subset(
     )
 
 
+def _should_write_status_cache_value(
+    stored_cache_value: Optional[AssetStatusCacheValue],
+    updated_cache_value: AssetStatusCacheValue,
+) -> bool:
+    # Incremental updates are applied on every read, so writing them back can be deferred until
+    # enough new events have accumulated. This avoids rewriting the full serialized subsets of
+    # frequently materialized assets on every update, while bounding the number of events that
+    # need to be reapplied to the stored value.
+    if not stored_cache_value:
+        return True
+
+    return (
+        updated_cache_value.latest_storage_id - stored_cache_value.latest_storage_id
+        >= get_asset_status_cache_write_interval()
+    )
+
+
 def get_and_update_asset_status_cache_value(
     instance: DagsterInstance,
     asset_key: AssetKey,
@@ -485,6 +528,9 @@ def get_and_update_asset_status_cache_value(
             updated_cache_value is not None
             and instance.event_log_storage.can_write_asset_status_cache()
             and updated_cache_value != stored_cache_value
+            and _should_write_status_cache_value(
+                stored_cache_value if use_cached_value else None, updated_cache_value
+            )
         ):
             instance.update_asset_cached_status_data(asset_key, updated_cache_value)
 
@@ -20,7 +20,7 @@
     TagBucket,
 )
 from dagster._core.storage.sql import AlembicVersion
-from dagster._daemon.types import DaemonHeartbeat
+from dagster._daemon.types import DaemonHeartbeat, DaemonLease
 from dagster._utils import PrintFn
 
 if TYPE_CHECKING:
@@ -363,6 +363,36 @@ def add_run_telemetry(
     def wipe_daemon_heartbeats(self) -> None:
         """Wipe all daemon heartbeats."""
 
+    # Daemon leases
+    #
+    # Divide work between several replicas of a daemon. Each lease is held by at most one replica
+    # at a time, until the replica releases it or it expires.
+
+    def supports_daemon_leases(self) -> bool:
+        """Whether the storage supports daemon leases."""
+        return False
+
+    def claim_daemon_lease(
+        self, lease_group: str, lease_key: str, owner_id: str, lease_duration_seconds: float
+    ) -> bool:
+        """Claim the lease on a key for the given owner, if the lease is not held by another owner
+        or has expired, and extend it for the given duration. Returns whether the owner now holds
+        the lease.
+        """
+        raise NotImplementedError()
+
+    def release_daemon_lease(self, lease_group: str, lease_key: str, owner_id: str) -> None:
+        """Release the lease on a key, if it is held by the given owner."""
+        raise NotImplementedError()
+
+    def get_daemon_leases(self, lease_group: str) -> Sequence[DaemonLease]:
+        """Get the leases in a group, including expired leases."""
+        raise NotImplementedError()
+
+    def delete_expired_daemon_leases(self, lease_group: str) -> None:
+        """Delete the leases in a group that have expired."""
+        raise NotImplementedError()
+
     # Backfill storage
     @abstractmethod
     def get_backfills(
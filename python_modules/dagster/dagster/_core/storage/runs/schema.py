@@ -163,6 +163,22 @@
     db.Column("value", db.Text),
 )
 
+DaemonLeasesTable = db.Table(
+    "daemon_leases",
+    RunStorageSqlMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("lease_group", db.String(255), nullable=False),
+    db.Column("lease_key", db.String(255), nullable=False),
+    db.Column("owner_id", db.String(255), nullable=False),
+    db.Column("expiration_timestamp", db.types.TIMESTAMP, nullable=False),
+    db.Column("update_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
+)
+
 db.Index("idx_run_tags", RunTagsTable.c.key, RunTagsTable.c.value, mysql_length=64)
 db.Index(
     "idx_run_tags_run_idx", RunTagsTable.c.run_id, RunTagsTable.c.id, mysql_length={"run_id": 255}
@@ -207,3 +223,9 @@
     BackfillTagsTable.c.backfill_id,
     BackfillTagsTable.c.id,
 )
+db.Index(
+    "idx_daemon_leases",
+    DaemonLeasesTable.c.lease_group,
+    DaemonLeasesTable.c.lease_key,
+    unique=True,
+)
@@ -52,6 +52,7 @@
     BackfillTagsTable,
     BulkActionsTable,
     DaemonHeartbeatsTable,
+    DaemonLeasesTable,
     InstanceInfo,
     KeyValueStoreTable,
     RunsTable,
@@ -74,9 +75,14 @@
     ROOT_RUN_ID_TAG,
     RUN_FAILURE_REASON_TAG,
 )
-from dagster._daemon.types import DaemonHeartbeat
+from dagster._daemon.types import DaemonHeartbeat, DaemonLease
 from dagster._serdes import deserialize_value, serialize_value
-from dagster._time import datetime_from_timestamp, get_current_datetime, utc_datetime_from_naive
+from dagster._time import (
+    datetime_from_timestamp,
+    get_current_datetime,
+    get_current_timestamp,
+    utc_datetime_from_naive,
+)
 from dagster._utils import PrintFn
 from dagster._utils.merger import merge_dicts
 
@@ -815,6 +821,10 @@ def has_backfill_tags_table(self) -> bool:
         with self.connect() as conn:
             return BackfillTagsTable.name in db.inspect(conn).get_table_names()
 
+    def has_daemon_leases_table(self) -> bool:
+        with self.connect() as conn:
+            return DaemonLeasesTable.name in db.inspect(conn).get_table_names()
+
     # Daemon heartbeats
 
     def add_daemon_heartbeat(self, daemon_heartbeat: DaemonHeartbeat) -> None:
@@ -856,12 +866,108 @@ def wipe(self) -> None:
             conn.execute(SnapshotsTable.delete())
             conn.execute(DaemonHeartbeatsTable.delete())
             conn.execute(BulkActionsTable.delete())
+            if self.has_daemon_leases_table():
+                conn.execute(DaemonLeasesTable.delete())
 
     def wipe_daemon_heartbeats(self) -> None:
         with self.connect() as conn:
             # https://stackoverflow.com/a/54386260/324449
             conn.execute(DaemonHeartbeatsTable.delete())
 
+    # Daemon leases
+
+    def supports_daemon_leases(self) -> bool:
+        return self.has_daemon_leases_table()
+
+    def claim_daemon_lease(
+        self, lease_group: str, lease_key: str, owner_id: str, lease_duration_seconds: float
+    ) -> bool:
+        check.str_param(lease_group, "lease_group")
+        check.str_param(lease_key, "lease_key")
+        check.str_param(owner_id, "owner_id")
+        check.numeric_param(lease_duration_seconds, "lease_duration_seconds")
+
+        now = get_current_timestamp()
+        # lease timestamps are stored as naive UTC datetimes, so that they compare the same way in
+        # every dialect
+        now_datetime = datetime_from_timestamp(now).replace(tzinfo=None)
+        expiration_datetime = datetime_from_timestamp(now + lease_duration_seconds).replace(
+            tzinfo=None
+        )
+
+        with self.connect() as conn:
+            # insert, or take over the lease if it is already held by this owner or has expired
+            try:
+                conn.execute(
+                    DaemonLeasesTable.insert().values(
+                        lease_group=lease_group,
+                        lease_key=lease_key,
+                        owner_id=owner_id,
+                        expiration_timestamp=expiration_datetime,
+                    )
+                )
+                return True
+            except db_exc.IntegrityError:
+                result = conn.execute(
+                    DaemonLeasesTable.update()
+                    .where(DaemonLeasesTable.c.lease_group == lease_group)
+                    .where(DaemonLeasesTable.c.lease_key == lease_key)
+                    .where(
+                        db.or_(
+                            DaemonLeasesTable.c.owner_id == owner_id,
+                            DaemonLeasesTable.c.expiration_timestamp < now_datetime,
+                        )
+                    )
+                    .values(
+                        owner_id=owner_id,
+                        expiration_timestamp=expiration_datetime,
+                        update_timestamp=get_current_datetime(),
+                    )
+                )
+                return result.rowcount == 1
+
+    def release_daemon_lease(self, lease_group: str, lease_key: str, owner_id: str) -> None:
+        with self.connect() as conn:
+            conn.execute(
+                DaemonLeasesTable.delete()
+                .where(DaemonLeasesTable.c.lease_group == lease_group)
+                .where(DaemonLeasesTable.c.lease_key == lease_key)
+                .where(DaemonLeasesTable.c.owner_id == owner_id)
+            )
+
+    def get_daemon_leases(self, lease_group: str) -> Sequence[DaemonLease]:
+        rows = self.fetchall(
+            db_select(
+                [
+                    DaemonLeasesTable.c.lease_key,
+                    DaemonLeasesTable.c.owner_id,
+                    DaemonLeasesTable.c.expiration_timestamp,
+                ]
+            )
+            .where(DaemonLeasesTable.c.lease_group == lease_group)
+            .order_by(DaemonLeasesTable.c.lease_key.asc())
+        )
+        return [
+            DaemonLease(
+                lease_group=lease_group,
+                lease_key=row["lease_key"],
+                owner_id=row["owner_id"],
+                expiration_timestamp=utc_datetime_from_naive(
+                    row["expiration_timestamp"]
+                ).timestamp(),
+            )
+            for row in rows
+        ]
+
+    def delete_expired_daemon_leases(self, lease_group: str) -> None:
+        now_datetime = datetime_from_timestamp(get_current_timestamp()).replace(tzinfo=None)
+        with self.connect() as conn:
+            conn.execute(
+                DaemonLeasesTable.delete()
+                .where(DaemonLeasesTable.c.lease_group == lease_group)
+                .where(DaemonLeasesTable.c.expiration_timestamp < now_datetime)
+            )
+
     def _add_backfill_filters_to_table(
         self, table: db.Table, filters: Optional[BulkActionsFilter]
     ) -> db.Table:
@@ -134,6 +134,14 @@ def update_tick(self, tick: InstigatorTick) -> InstigatorTick:
             tick (InstigatorTick): The tick to update
         """
 
+    def update_ticks(self, ticks: Sequence[InstigatorTick]) -> Sequence[InstigatorTick]:
+        """Update several ticks already in storage.
+
+        Args:
+            ticks (Sequence[InstigatorTick]): The ticks to update
+        """
+        return [self.update_tick(tick) for tick in ticks]
+
     @abc.abstractmethod
     def purge_ticks(
         self,
@@ -430,6 +430,47 @@ def update_tick(self, tick: InstigatorTick) -> InstigatorTick:
 
         return tick
 
+    def update_ticks(self, ticks: Sequence[InstigatorTick]) -> Sequence[InstigatorTick]:
+        check.sequence_param(ticks, "ticks", of_type=InstigatorTick)
+        if not ticks:
+            return ticks
+
+        # the ticks are updated with one statement per set of columns, each executed with the
+        # parameters of every tick it updates
+        has_instigators_table = self.has_instigators_table()
+        params_by_sets_selector_id: dict[bool, list[dict[str, Any]]] = defaultdict(list)
+        for tick in ticks:
+            sets_selector_id = bool(has_instigators_table and tick.selector_id)
+            params_by_sets_selector_id[sets_selector_id].append(
+                {
+                    "tick_id": tick.tick_id,
+                    "new_status": tick.status.value,
+                    "new_type": tick.instigator_type.value,
+                    "new_timestamp": datetime_from_timestamp(tick.timestamp),
+                    "new_tick_body": serialize_value(tick.tick_data),
+                    "new_selector_id": tick.selector_id,
+                }
+            )
+
+        with self.connect() as conn:
+            for sets_selector_id, params in params_by_sets_selector_id.items():
+                values = {
+                    "status": db.bindparam("new_status"),
+                    "type": db.bindparam("new_type"),
+                    "timestamp": db.bindparam("new_timestamp"),
+                    "tick_body": db.bindparam("new_tick_body"),
+                }
+                if sets_selector_id:
+                    values["selector_id"] = db.bindparam("new_selector_id")
+                conn.execute(
+                    JobTickTable.update()
+                    .where(JobTickTable.c.id == db.bindparam("tick_id"))
+                    .values(**values),
+                    params,
+                )
+
+        return ticks
+
     def purge_ticks(
         self,
         origin_id: str,
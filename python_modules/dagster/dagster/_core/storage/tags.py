@@ -110,6 +110,12 @@
 RUN_METRICS_POLLING_INTERVAL_TAG = f"{HIDDEN_TAG_PREFIX}run_metrics_polling_interval"
 RUN_METRICS_PYTHON_RUNTIME_TAG = f"{HIDDEN_TAG_PREFIX}python_runtime_metrics"
 
+STEP_PROFILING_TAG = f"{SYSTEM_TAG_PREFIX}step_profiling"
+STEP_PROFILING_SAMPLE_INTERVAL_TAG = f"{SYSTEM_TAG_PREFIX}step_profiling_sample_interval"
+
+STEP_PRIORITIZATION_TAG = f"{SYSTEM_TAG_PREFIX}step_prioritization"
+CRITICAL_PATH_PRIORITIZATION = "critical_path"
+
 BACKFILL_TAGS = {BACKFILL_ID_TAG, PARENT_BACKFILL_ID_TAG, ROOT_BACKFILL_ID_TAG}
 
 POOL_TAG_PREFIX = f"{HIDDEN_TAG_PREFIX}pool/"
@@ -87,6 +87,10 @@ def daemon_type(cls) -> str:
     def __exit__(self, _exception_type, _exception_value, _traceback):
         pass
 
+    def allows_multiple_replicas(self, instance: DagsterInstance) -> bool:
+        """Whether several processes can run this daemon at once against the same instance."""
+        return False
+
     def run_daemon_loop(
         self,
         workspace_process_context: TContext,
@@ -180,6 +184,7 @@ def _check_add_heartbeat(
             self._last_heartbeat_time
             and last_stored_heartbeat
             and last_stored_heartbeat.daemon_id != daemon_uuid
+            and not self.allows_multiple_replicas(instance)
         ):
             self._logger.error(
                 "Another %s daemon is still sending heartbeats. You likely have multiple "
@@ -31,6 +31,8 @@
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import BaseWorkspaceRequestContext, IWorkspaceProcessContext
 from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
+from dagster._daemon.run_coordinator.run_queue_shards import RunQueueShards
+from dagster._daemon.run_coordinator.run_queue_state import RunQueueState
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._utils.tags import TagConcurrencyLimitsCounter
 
@@ -50,6 +52,8 @@ def __init__(self, interval_seconds, page_size=PAGE_SIZE) -> None:
         self._page_size = page_size
         self._global_concurrency_blocked_runs_lock = threading.Lock()
         self._global_concurrency_blocked_runs = set()
+        self._run_queue_state: Optional[RunQueueState] = None
+        self._run_queue_shards: Optional[RunQueueShards] = None
         super().__init__(interval_seconds)
 
     def _get_executor(self, max_workers) -> ThreadPoolExecutor:
@@ -66,12 +70,22 @@ def _get_executor(self, max_workers) -> ThreadPoolExecutor:
     def __exit__(self, _exception_type, _exception_value, _traceback):
         self._executor = None
         self._exit_stack.close()
+        if self._run_queue_shards:
+            self._run_queue_shards.release_all(self._logger)
+            self._run_queue_shards = None
         super().__exit__(_exception_type, _exception_value, _traceback)
 
     @classmethod
     def daemon_type(cls) -> str:
         return "QUEUED_RUN_COORDINATOR"
 
+    def allows_multiple_replicas(self, instance: DagsterInstance) -> bool:
+        run_coordinator = instance.run_coordinator
+        return (
+            isinstance(run_coordinator, QueuedRunCoordinator)
+            and run_coordinator.dequeue_sharding_config is not None
+        )
+
     def run_iteration(
         self,
         workspace_process_context: IWorkspaceProcessContext,
@@ -89,6 +103,15 @@ def run_iteration(
             check.failed("Got invalid run queue config")
 
         instance = workspace_process_context.instance
+        if run_coordinator.dequeue_sharding_config is not None:
+            yield from self._run_sharded_iteration(
+                workspace_process_context,
+                run_coordinator,
+                concurrency_config,
+                fixed_iteration_time=fixed_iteration_time,
+            )
+            return
+
         runs_to_dequeue = self._get_runs_to_dequeue(
             instance, concurrency_config, fixed_iteration_time=fixed_iteration_time
         )
@@ -100,6 +123,60 @@ def run_iteration(
             fixed_iteration_time=fixed_iteration_time,
         )
 
+    def _run_sharded_iteration(
+        self,
+        workspace_process_context: IWorkspaceProcessContext,
+        run_coordinator: QueuedRunCoordinator,
+        concurrency_config: ConcurrencyConfig,
+        fixed_iteration_time: Optional[float],
+    ) -> DaemonIterator:
+        instance = workspace_process_context.instance
+        sharding_config = check.not_none(run_coordinator.dequeue_sharding_config)
+        if self._run_queue_shards is None:
+            # only checked once, since it inspects the schema of the run storage
+            if not instance.run_storage.supports_daemon_leases():
+                check.failed(
+                    "dequeue_sharding requires a run storage with a daemon leases table. Run"
+                    " `dagster instance migrate` to add it."
+                )
+            self._run_queue_shards = RunQueueShards(sharding_config)
+        run_queue_shards = self._run_queue_shards
+
+        if not run_queue_shards.refresh(instance, self._logger):
+            return
+
+        # The runs to launch are chosen against the global limits, and moved out of the queue,
+        # while holding the admission lease, so that replicas choosing runs at the same time don't
+        # go over the limits together. The runs are launched after the lease is released.
+        if not run_queue_shards.claim_admission(instance):
+            self._logger.debug("Another replica is choosing runs to launch, waiting for it.")
+            return
+
+        try:
+            runs_to_dequeue = self._get_runs_to_dequeue(
+                instance,
+                concurrency_config,
+                fixed_iteration_time=fixed_iteration_time,
+                run_queue_shards=run_queue_shards,
+            )
+            claimed_runs = []
+            for run in runs_to_dequeue:
+                claimed_run = self._claim_run(instance, run, fixed_iteration_time)
+                if claimed_run:
+                    claimed_runs.append(claimed_run)
+                yield None
+        finally:
+            run_queue_shards.release_admission(instance)
+
+        yield from self._dequeue_runs_iter(
+            workspace_process_context,
+            run_coordinator,
+            claimed_runs,
+            concurrency_config,
+            fixed_iteration_time=fixed_iteration_time,
+            runs_claimed=True,
+        )
+
     def _dequeue_runs_iter(
         self,
         workspace_process_context: IWorkspaceProcessContext,
@@ -107,6 +184,7 @@ def _dequeue_runs_iter(
         runs_to_dequeue: list[DagsterRun],
         concurrency_config: ConcurrencyConfig,
         fixed_iteration_time: Optional[float],
+        runs_claimed: bool = False,
     ) -> Iterator[None]:
         if run_coordinator.dequeue_use_threads:
             yield from self._dequeue_runs_iter_threaded(
@@ -115,6 +193,7 @@ def _dequeue_runs_iter(
                 run_coordinator.dequeue_num_workers,
                 concurrency_config,
                 fixed_iteration_time=fixed_iteration_time,
+                runs_claimed=runs_claimed,
             )
         else:
             yield from self._dequeue_runs_iter_loop(
@@ -122,6 +201,7 @@ def _dequeue_runs_iter(
                 runs_to_dequeue,
                 concurrency_config,
                 fixed_iteration_time=fixed_iteration_time,
+                runs_claimed=runs_claimed,
             )
 
     def _dequeue_run_thread(
@@ -130,6 +210,7 @@ def _dequeue_run_thread(
         run: DagsterRun,
         concurrency_config: ConcurrencyConfig,
         fixed_iteration_time: Optional[float],
+        run_claimed: bool = False,
     ) -> bool:
         return self._dequeue_run(
             workspace_process_context.instance,
@@ -137,6 +218,7 @@ def _dequeue_run_thread(
             run,
             concurrency_config,
             fixed_iteration_time,
+            run_claimed=run_claimed,
         )
 
     def _dequeue_runs_iter_threaded(
@@ -146,6 +228,7 @@ def _dequeue_runs_iter_threaded(
         max_workers: Optional[int],
         concurrency_config: ConcurrencyConfig,
         fixed_iteration_time: Optional[float],
+        runs_claimed: bool = False,
     ) -> Iterator[None]:
         num_dequeued_runs = 0
 
@@ -156,6 +239,7 @@ def _dequeue_runs_iter_threaded(
                 run,
                 concurrency_config,
                 fixed_iteration_time=fixed_iteration_time,
+                run_claimed=runs_claimed,
             )
             for run in runs_to_dequeue
         ):
@@ -173,6 +257,7 @@ def _dequeue_runs_iter_loop(
         runs_to_dequeue: list[DagsterRun],
         concurrency_config: ConcurrencyConfig,
         fixed_iteration_time: Optional[float],
+        runs_claimed: bool = False,
     ) -> Iterator[None]:
         num_dequeued_runs = 0
         for run in runs_to_dequeue:
@@ -182,6 +267,7 @@ def _dequeue_runs_iter_loop(
                 run,
                 concurrency_config,
                 fixed_iteration_time=fixed_iteration_time,
+                run_claimed=runs_claimed,
             )
             yield None
             if run_launched:
@@ -195,6 +281,7 @@ def _get_runs_to_dequeue(
         instance: DagsterInstance,
         concurrency_config: ConcurrencyConfig,
         fixed_iteration_time: Optional[float],
+        run_queue_shards: Optional[RunQueueShards] = None,
     ) -> list[DagsterRun]:
         if not isinstance(instance.run_coordinator, QueuedRunCoordinator):
             check.failed(f"Expected QueuedRunCoordinator, got {instance.run_coordinator}")
@@ -204,7 +291,20 @@ def _get_runs_to_dequeue(
         max_concurrent_runs = run_queue_config.max_concurrent_runs
         tag_concurrency_limits = run_queue_config.tag_concurrency_limits
 
-        in_progress_run_records = self._get_in_progress_run_records(instance)
+        now = fixed_iteration_time or time.time()
+
+        run_queue_state = None
+        full_sync_interval_seconds = check.inst(
+            instance.run_coordinator, QueuedRunCoordinator
+        ).dequeue_full_sync_interval_seconds
+        if full_sync_interval_seconds is not None:
+            if self._run_queue_state is None:
+                self._run_queue_state = RunQueueState(full_sync_interval_seconds, self._page_size)
+            run_queue_state = self._run_queue_state
+            run_queue_state.refresh(instance, now, self._logger)
+            in_progress_run_records = run_queue_state.in_progress_run_records
+        else:
+            in_progress_run_records = self._get_in_progress_run_records(instance)
         in_progress_runs = [record.dagster_run for record in in_progress_run_records]
 
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
@@ -217,12 +317,6 @@ def _get_runs_to_dequeue(
                 )
                 return []
 
-        cursor = None
-        has_more = True
-        batch: list[DagsterRun] = []
-
-        now = fixed_iteration_time or time.time()
-
         with self._location_timeouts_lock:
             paused_location_names = {
                 location_name
@@ -237,6 +331,35 @@ def _get_runs_to_dequeue(
                 + ",".join(list(paused_location_names))
             )
 
+        if run_queue_state is not None:
+            # the queued runs are already in memory, so they are checked all at once
+            batch = [record.dagster_run for record in run_queue_state.queued_run_records]
+            if run_queue_shards is not None:
+                batch = run_queue_shards.filter_owned_runs(batch)
+            if not batch:
+                return batch
+
+            self._logger.info(
+                "Priority sorting and checking tag concurrency limits for queued runs."
+                + locations_clause
+            )
+            batch = self._priority_sort(batch)
+            batch = self._remove_blocked_runs(
+                batch,
+                run_queue_state.get_tag_concurrency_limits_counter(tag_concurrency_limits),
+                self._get_global_concurrency_limits_counter(
+                    instance, batch, in_progress_run_records, concurrency_config
+                ),
+                paused_location_names,
+            )
+            if max_runs_to_launch >= 1:
+                batch = batch[:max_runs_to_launch]
+            return batch
+
+        cursor = None
+        has_more = True
+        batch: list[DagsterRun] = []
+
         logged_this_iteration = False
         # Paginate through our runs list so we don't need to hold every run
         # in memory at once. The maximum number of runs we'll hold in memory is
@@ -258,6 +381,13 @@ def _get_runs_to_dequeue(
                 has_more = False
                 return batch
 
+            cursor = queued_runs[-1].run_id
+            if run_queue_shards is not None:
+                # the runs of the other shards are dequeued by other replicas
+                queued_runs = run_queue_shards.filter_owned_runs(queued_runs)
+                if not queued_runs:
+                    continue
+
             if not logged_this_iteration:
                 logged_this_iteration = True
                 self._logger.info(
@@ -265,8 +395,6 @@ def _get_runs_to_dequeue(
                     + locations_clause
                 )
 
-            cursor = queued_runs[-1].run_id
-
             tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
                 tag_concurrency_limits, in_progress_runs
             )
@@ -299,47 +427,84 @@ def _get_runs_to_dequeue(
             else:
                 global_concurrency_limits_counter = None
 
-            to_remove = []
-            for run in batch:
-                if tag_concurrency_limits_counter.is_blocked(run):
-                    to_remove.append(run)
-                    continue
-                else:
-                    tag_concurrency_limits_counter.update_counters_with_launched_item(run)
-
-                if (
-                    global_concurrency_limits_counter
-                    and global_concurrency_limits_counter.is_blocked(run)
-                ):
-                    to_remove.append(run)
-                    if run.run_id not in self._global_concurrency_blocked_runs:
-                        with self._global_concurrency_blocked_runs_lock:
-                            self._global_concurrency_blocked_runs.add(run.run_id)
-                        concurrency_blocked_info = json.dumps(
-                            global_concurrency_limits_counter.get_blocked_run_debug_info(run)
-                        )
-                        self._logger.info(
-                            f"Run {run.run_id} is blocked by global concurrency limits: {concurrency_blocked_info}"
-                        )
-                    continue
-                elif global_concurrency_limits_counter:
-                    global_concurrency_limits_counter.update_counters_with_launched_item(run)
-
-                location_name = (
-                    run.remote_job_origin.location_name if run.remote_job_origin else None
-                )
-                if location_name and location_name in paused_location_names:
-                    to_remove.append(run)
-                    continue
-
-            for run in to_remove:
-                batch.remove(run)
+            batch = self._remove_blocked_runs(
+                batch,
+                tag_concurrency_limits_counter,
+                global_concurrency_limits_counter,
+                paused_location_names,
+            )
 
             if max_runs_to_launch >= 1:
                 batch = batch[:max_runs_to_launch]
 
         return batch
 
+    def _get_global_concurrency_limits_counter(
+        self,
+        instance: DagsterInstance,
+        batch: Sequence[DagsterRun],
+        in_progress_run_records: Sequence[RunRecord],
+        concurrency_config: ConcurrencyConfig,
+    ) -> Optional[GlobalOpConcurrencyLimitsCounter]:
+        run_queue_config = check.not_none(concurrency_config.run_queue_config)
+        if not run_queue_config.should_block_op_concurrency_limited_runs:
+            return None
+
+        try:
+            return GlobalOpConcurrencyLimitsCounter(
+                instance,
+                batch,
+                in_progress_run_records,
+                concurrency_keys=instance.event_log_storage.get_concurrency_keys(),
+                pool_limits=instance.event_log_storage.get_pool_limits(),
+                slot_count_offset=run_queue_config.op_concurrency_slot_buffer,
+                pool_granularity=concurrency_config.pool_config.pool_granularity,
+            )
+        except:
+            self._logger.exception("Failed to initialize op concurrency counter")
+            # when we cannot initialize the global concurrency counter, we should fall back
+            # to not blocking any runs based on op concurrency limits
+            return None
+
+    def _remove_blocked_runs(
+        self,
+        batch: Sequence[DagsterRun],
+        tag_concurrency_limits_counter: TagConcurrencyLimitsCounter,
+        global_concurrency_limits_counter: Optional[GlobalOpConcurrencyLimitsCounter],
+        paused_location_names: set[str],
+    ) -> list[DagsterRun]:
+        """Returns the runs of the priority-sorted batch that can be launched, in order."""
+        runs_to_launch = []
+        for run in batch:
+            if tag_concurrency_limits_counter.is_blocked(run):
+                continue
+            else:
+                tag_concurrency_limits_counter.update_counters_with_launched_item(run)
+
+            if global_concurrency_limits_counter and global_concurrency_limits_counter.is_blocked(
+                run
+            ):
+                if run.run_id not in self._global_concurrency_blocked_runs:
+                    with self._global_concurrency_blocked_runs_lock:
+                        self._global_concurrency_blocked_runs.add(run.run_id)
+                    concurrency_blocked_info = json.dumps(
+                        global_concurrency_limits_counter.get_blocked_run_debug_info(run)
+                    )
+                    self._logger.info(
+                        f"Run {run.run_id} is blocked by global concurrency limits: {concurrency_blocked_info}"
+                    )
+                continue
+            elif global_concurrency_limits_counter:
+                global_concurrency_limits_counter.update_counters_with_launched_item(run)
+
+            location_name = run.remote_job_origin.location_name if run.remote_job_origin else None
+            if location_name and location_name in paused_location_names:
+                continue
+
+            runs_to_launch.append(run)
+
+        return runs_to_launch
+
     def _get_in_progress_run_records(self, instance: DagsterInstance) -> Sequence[RunRecord]:
         return instance.get_run_records(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
 
@@ -361,17 +526,22 @@ def _is_location_pausing_dequeues(self, location_name: str, now: float) -> bool:
                 and self._location_timeouts[location_name] > now
             )
 
-    def _dequeue_run(
+    def _claim_run(
         self,
         instance: DagsterInstance,
-        workspace: BaseWorkspaceRequestContext,
         run: DagsterRun,
-        concurrency_config: ConcurrencyConfig,
         fixed_iteration_time: Optional[float],
-    ) -> bool:
-        assert concurrency_config.run_queue_config
+    ) -> Optional[DagsterRun]:
+        """Moves the run out of the queue, so that it counts as in progress for the concurrency
+        limits, and returns the updated run. Returns None if the run should not be launched.
+        """
         # double check that the run is still queued before dequeing
-        run = check.not_none(instance.get_run_by_id(run.run_id))
+        latest_run = instance.get_run_by_id(run.run_id)
+        if latest_run is None:
+            # the in-memory run queue may still hold runs that were deleted since it was synced
+            self._logger.info("Run %s no longer exists, skipping", run.run_id)
+            return None
+        run = latest_run
         with self._global_concurrency_blocked_runs_lock:
             if run.run_id in self._global_concurrency_blocked_runs:
                 self._global_concurrency_blocked_runs.remove(run.run_id)
@@ -384,7 +554,7 @@ def _dequeue_run(
                 run.run_id,
                 run.status,
             )
-            return False
+            return None
 
         # Very old (pre 0.10.0) runs and programatically submitted runs may not have an
         # attached code location name
@@ -396,7 +566,7 @@ def _dequeue_run(
                 " to recover",
                 location_name,
             )
-            return False
+            return None
 
         launch_started_event = DagsterEvent(
             event_type_value=DagsterEventType.PIPELINE_STARTING.value,
@@ -405,7 +575,26 @@ def _dequeue_run(
 
         instance.report_dagster_event(launch_started_event, run_id=run.run_id)
 
-        run = check.not_none(instance.get_run_by_id(run.run_id))
+        return check.not_none(instance.get_run_by_id(run.run_id))
+
+    def _dequeue_run(
+        self,
+        instance: DagsterInstance,
+        workspace: BaseWorkspaceRequestContext,
+        run: DagsterRun,
+        concurrency_config: ConcurrencyConfig,
+        fixed_iteration_time: Optional[float],
+        run_claimed: bool = False,
+    ) -> bool:
+        assert concurrency_config.run_queue_config
+        if not run_claimed:
+            claimed_run = self._claim_run(instance, run, fixed_iteration_time)
+            if claimed_run is None:
+                return False
+            run = claimed_run
+
+        now = fixed_iteration_time or time.time()
+        location_name = run.remote_job_origin.location_name if run.remote_job_origin else None
 
         try:
             instance.run_launcher.launch_run(LaunchRunContext(dagster_run=run, workspace=workspace))
@@ -0,0 +1,156 @@
+import logging
+import uuid
+import zlib
+from collections.abc import Sequence
+from typing import Optional
+
+from dagster._core.instance import DagsterInstance
+from dagster._core.run_coordinator.queued_run_coordinator import RunQueueShardingConfig
+from dagster._core.storage.dagster_run import DagsterRun
+from dagster._time import get_current_timestamp
+
+RUN_QUEUE_REPLICAS_LEASE_GROUP = "run_queue_replicas"
+RUN_QUEUE_SHARDS_LEASE_GROUP = "run_queue_shards"
+RUN_QUEUE_ADMISSION_LEASE_GROUP = "run_queue_admission"
+RUN_QUEUE_ADMISSION_LEASE_KEY = "admission"
+
+
+def get_run_shard(run: DagsterRun, num_shards: int, shard_by: str) -> int:
+    """Returns the shard of the run queue that the run belongs to."""
+    if shard_by == "code_location":
+        # runs without a code location are all placed in the same shard
+        shard_key = run.remote_job_origin.location_name if run.remote_job_origin else ""
+    else:
+        shard_key = run.run_id
+    # a stable hash, so that every replica assigns the run to the same shard
+    return zlib.crc32(shard_key.encode("utf-8")) % num_shards
+
+
+class RunQueueShards:
+    """Tracks the shards of the run queue that a QueuedRunCoordinatorDaemon replica dequeues runs
+    from, when several replicas are running against the same instance.
+
+    Each replica holds a lease in the run storage that marks it as live, and renews it on every
+    iteration. The shards are spread evenly over the live replicas, ordered by their id: a replica
+    claims a lease on each of the shards assigned to it, and releases the leases on the shards that
+    are now assigned to another replica. When a replica stops, its leases expire after
+    `lease_duration_seconds`, and its shards are claimed by the remaining replicas. A shard is only
+    dequeued by the replica that holds its lease, so while the shards are being moved, a shard may
+    briefly not be dequeued by any replica, but never by two replicas at once.
+
+    The global limits (max_concurrent_runs, tag and op concurrency limits) are shared by all the
+    shards, so the runs to launch are chosen and moved out of the queue while holding the
+    admission lease, which at most one replica holds at a time.
+    """
+
+    def __init__(self, sharding_config: RunQueueShardingConfig):
+        self._sharding_config = sharding_config
+        self._replica_id = str(uuid.uuid4())
+        self._owned_shards: set[int] = set()
+        self._instance: Optional[DagsterInstance] = None
+
+    @property
+    def replica_id(self) -> str:
+        return self._replica_id
+
+    @property
+    def owned_shards(self) -> set[int]:
+        return self._owned_shards
+
+    def refresh(self, instance: DagsterInstance, logger: logging.Logger) -> set[int]:
+        """Renews the lease of this replica, and claims or releases shards so that this replica
+        holds the shards assigned to it. Returns the shards that this replica holds.
+        """
+        self._instance = instance
+        num_shards = self._sharding_config.num_shards
+        lease_duration_seconds = self._sharding_config.lease_duration_seconds
+
+        instance.run_storage.claim_daemon_lease(
+            RUN_QUEUE_REPLICAS_LEASE_GROUP,
+            self._replica_id,
+            self._replica_id,
+            lease_duration_seconds,
+        )
+        # every replica that ever ran leaves a row behind, clear out the ones that have expired
+        instance.run_storage.delete_expired_daemon_leases(RUN_QUEUE_REPLICAS_LEASE_GROUP)
+        # compared with the same clock that the lease expirations were computed with
+        now = get_current_timestamp()
+        live_replica_ids = sorted(
+            lease.owner_id
+            for lease in instance.run_storage.get_daemon_leases(RUN_QUEUE_REPLICAS_LEASE_GROUP)
+            if lease.expiration_timestamp > now
+        )
+        if self._replica_id not in live_replica_ids:
+            # the clocks of the replicas disagree, treat this replica as live regardless
+            live_replica_ids = sorted([*live_replica_ids, self._replica_id])
+
+        replica_index = live_replica_ids.index(self._replica_id)
+        target_shards = {
+            shard for shard in range(num_shards) if shard % len(live_replica_ids) == replica_index
+        }
+
+        owned_shards = set()
+        for shard in range(num_shards):
+            if shard in target_shards:
+                if instance.run_storage.claim_daemon_lease(
+                    RUN_QUEUE_SHARDS_LEASE_GROUP,
+                    str(shard),
+                    self._replica_id,
+                    lease_duration_seconds,
+                ):
+                    owned_shards.add(shard)
+            elif shard in self._owned_shards:
+                instance.run_storage.release_daemon_lease(
+                    RUN_QUEUE_SHARDS_LEASE_GROUP, str(shard), self._replica_id
+                )
+
+        if owned_shards != self._owned_shards:
+            logger.info(
+                f"Dequeuing runs from shards {sorted(owned_shards)} of {num_shards}, with"
+                f" {len(live_replica_ids)} live replicas."
+            )
+        self._owned_shards = owned_shards
+        return owned_shards
+
+    def filter_owned_runs(self, runs: Sequence[DagsterRun]) -> list[DagsterRun]:
+        return [
+            run
+            for run in runs
+            if get_run_shard(run, self._sharding_config.num_shards, self._sharding_config.shard_by)
+            in self._owned_shards
+        ]
+
+    def claim_admission(self, instance: DagsterInstance) -> bool:
+        return instance.run_storage.claim_daemon_lease(
+            RUN_QUEUE_ADMISSION_LEASE_GROUP,
+            RUN_QUEUE_ADMISSION_LEASE_KEY,
+            self._replica_id,
+            self._sharding_config.lease_duration_seconds,
+        )
+
+    def release_admission(self, instance: DagsterInstance) -> None:
+        instance.run_storage.release_daemon_lease(
+            RUN_QUEUE_ADMISSION_LEASE_GROUP, RUN_QUEUE_ADMISSION_LEASE_KEY, self._replica_id
+        )
+
+    def release_all(self, logger: logging.Logger) -> None:
+        """Releases every lease held by this replica, so that the other replicas can take over its
+        shards without waiting for the leases to expire.
+        """
+        instance = self._instance
+        if instance is None:
+            return
+
+        try:
+            for shard in self._owned_shards:
+                instance.run_storage.release_daemon_lease(
+                    RUN_QUEUE_SHARDS_LEASE_GROUP, str(shard), self._replica_id
+                )
+            self.release_admission(instance)
+            instance.run_storage.release_daemon_lease(
+                RUN_QUEUE_REPLICAS_LEASE_GROUP, self._replica_id, self._replica_id
+            )
+        except Exception:
+            logger.exception("Failed to release the run queue shard leases")
+        self._owned_shards = set()
+        self._instance = None
@@ -0,0 +1,162 @@
+import logging
+from collections.abc import Mapping, Sequence
+from typing import Any, Optional
+
+from dagster._core.event_api import RunStatusChangeRecordsFilter
+from dagster._core.events import EVENT_TYPE_TO_PIPELINE_RUN_STATUS
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.dagster_run import (
+    IN_PROGRESS_RUN_STATUSES,
+    DagsterRunStatus,
+    RunRecord,
+    RunsFilter,
+)
+from dagster._utils.tags import TagConcurrencyLimitsCounter
+
+
+class RunQueueState:
+    """In-memory view of the queued and in-progress runs, kept by the QueuedRunCoordinatorDaemon
+    across iterations so that it doesn't need to page through every queued run on each iteration.
+
+    On a full sync, every queued and in-progress run is read from the run storage. Between full
+    syncs, the view is updated from the run status change events stored since the last sync,
+    tracked with a storage id cursor: the runs that those events belong to are read again, and
+    placed in the view according to their current status. A full sync is done every
+    `full_sync_interval_seconds`, to pick up changes that aren't reported with run status events,
+    like deleted runs or added tags.
+
+    The tag concurrency counts of the in-progress runs are also kept across iterations, and updated
+    as runs start and finish.
+    """
+
+    def __init__(self, full_sync_interval_seconds: float, page_size: int):
+        self._full_sync_interval_seconds = full_sync_interval_seconds
+        self._page_size = page_size
+        self._queued_records: dict[str, RunRecord] = {}
+        self._in_progress_records: dict[str, RunRecord] = {}
+        self._storage_id_cursor: Optional[int] = None
+        self._last_full_sync_time: Optional[float] = None
+        self._tag_concurrency_limits: Optional[Sequence[Mapping[str, Any]]] = None
+        self._in_progress_tag_counter: Optional[TagConcurrencyLimitsCounter] = None
+
+    @property
+    def queued_run_records(self) -> Sequence[RunRecord]:
+        """The queued runs, in the order that they were created."""
+        return sorted(self._queued_records.values(), key=lambda record: record.storage_id)
+
+    @property
+    def in_progress_run_records(self) -> Sequence[RunRecord]:
+        return list(self._in_progress_records.values())
+
+    def get_tag_concurrency_limits_counter(
+        self, tag_concurrency_limits: Sequence[Mapping[str, Any]]
+    ) -> TagConcurrencyLimitsCounter:
+        """Returns a copy of the counter of the tag concurrency limits used by the in-progress runs,
+        to be updated with the runs launched in this iteration.
+        """
+        if self._in_progress_tag_counter is None or (
+            self._tag_concurrency_limits != tag_concurrency_limits
+        ):
+            self._tag_concurrency_limits = tag_concurrency_limits
+            self._in_progress_tag_counter = TagConcurrencyLimitsCounter(
+                list(tag_concurrency_limits),
+                [record.dagster_run for record in self._in_progress_records.values()],
+            )
+
+        return self._in_progress_tag_counter.copy()
+
+    def refresh(self, instance: DagsterInstance, now: float, logger: logging.Logger) -> None:
+        if (
+            self._last_full_sync_time is None
+            or self._storage_id_cursor is None
+            or now - self._last_full_sync_time >= self._full_sync_interval_seconds
+        ):
+            self._full_sync(instance, now)
+            logger.debug(
+                f"Read {len(self._queued_records)} queued runs and"
+                f" {len(self._in_progress_records)} in-progress runs from the run storage."
+            )
+        else:
+            self._apply_run_status_changes(instance)
+
+    def _full_sync(self, instance: DagsterInstance, now: float) -> None:
+        # read the cursor before the runs, so that run status changes stored while the runs are
+        # being read are applied on the next refresh
+        storage_id_cursor = instance.event_log_storage.get_maximum_record_id() or 0
+
+        queued_records: dict[str, RunRecord] = {}
+        cursor = None
+        while True:
+            records = instance.get_run_records(
+                RunsFilter(statuses=[DagsterRunStatus.QUEUED]),
+                cursor=cursor,
+                limit=self._page_size,
+                ascending=True,
+            )
+            for record in records:
+                queued_records[record.dagster_run.run_id] = record
+            if len(records) < self._page_size:
+                break
+            cursor = records[-1].dagster_run.run_id
+
+        self._queued_records = queued_records
+        self._in_progress_records = {
+            record.dagster_run.run_id: record
+            for record in instance.get_run_records(
+                filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+            )
+        }
+        self._in_progress_tag_counter = None
+        self._storage_id_cursor = storage_id_cursor
+        self._last_full_sync_time = now
+
+    def _apply_run_status_changes(self, instance: DagsterInstance) -> None:
+        changed_run_ids: set[str] = set()
+        max_storage_id = self._storage_id_cursor
+        for event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS.keys():
+            records_filter = RunStatusChangeRecordsFilter(
+                event_type,  # pyright: ignore[reportArgumentType]
+                after_storage_id=self._storage_id_cursor,
+            )
+            cursor = None
+            while True:
+                result = instance.fetch_run_status_changes(
+                    records_filter, limit=self._page_size, cursor=cursor, ascending=True
+                )
+                for event_record in result.records:
+                    changed_run_ids.add(event_record.run_id)
+                    max_storage_id = max(max_storage_id or 0, event_record.storage_id)
+                if not result.has_more:
+                    break
+                cursor = result.cursor
+
+        changed_run_id_list = list(changed_run_ids)
+        for i in range(0, len(changed_run_id_list), self._page_size):
+            run_ids = changed_run_id_list[i : i + self._page_size]
+            records_by_run_id = {
+                record.dagster_run.run_id: record
+                for record in instance.get_run_records(RunsFilter(run_ids=run_ids))
+            }
+            for run_id in run_ids:
+                self._update_run(run_id, records_by_run_id.get(run_id))
+
+        self._storage_id_cursor = max_storage_id
+
+    def _update_run(self, run_id: str, record: Optional[RunRecord]) -> None:
+        self._queued_records.pop(run_id, None)
+        previous_in_progress_record = self._in_progress_records.pop(run_id, None)
+        if previous_in_progress_record and self._in_progress_tag_counter:
+            self._in_progress_tag_counter.update_counters_with_finished_item(
+                previous_in_progress_record.dagster_run
+            )
+
+        if record is None:
+            # the run was deleted
+            return
+
+        if record.dagster_run.status == DagsterRunStatus.QUEUED:
+            self._queued_records[run_id] = record
+        elif record.dagster_run.status in IN_PROGRESS_RUN_STATUSES:
+            self._in_progress_records[run_id] = record
+            if self._in_progress_tag_counter:
+                self._in_progress_tag_counter.update_counters_with_launched_item(record.dagster_run)
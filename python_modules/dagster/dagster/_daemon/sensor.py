@@ -1,10 +1,12 @@
 import dataclasses
 import datetime
+import heapq
 import logging
+import random
 import sys
 import threading
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import AbstractContextManager
 from types import TracebackType
@@ -70,6 +72,10 @@
 
 MIN_INTERVAL_LOOP_TIME = 5
 
+# The shortest time that the sensor daemon waits between evaluations of the same sensor, so that a
+# sensor with no minimum interval doesn't keep the sensor daemon loop from sleeping
+MIN_SENSOR_DEADLINE_INTERVAL = 1
+
 # When retrying a tick, how long to wait before ignoring it and moving on to the next one
 # (To account for the rare case where the daemon is down for a long time, starts back up, and
 # there's an old in-progress tick left to finish that may no longer be correct to finish)
@@ -109,6 +115,55 @@ class BackfillSubmission(NamedTuple):
     backfill_id: str
 
 
+class SensorDeadlineQueue:
+    """Heap of the running sensors of the sensor daemon, ordered by the timestamp at which each
+    sensor is next due to be evaluated, so that each iteration of the sensor daemon only visits the
+    sensors that are due and can sleep until the next one is.
+    """
+
+    def __init__(self):
+        self._heap: list[tuple[float, str]] = []
+        # selector_id -> (deadline, min_interval). Heap entries whose deadline doesn't match the
+        # deadline stored here were superseded by a later call to `schedule` and are ignored.
+        self._deadlines: dict[str, tuple[float, Optional[int]]] = {}
+
+    def __contains__(self, selector_id: str) -> bool:
+        return selector_id in self._deadlines
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def get_min_interval(self, selector_id: str) -> Optional[int]:
+        entry = self._deadlines.get(selector_id)
+        return entry[1] if entry else None
+
+    def schedule(self, selector_id: str, deadline: float, min_interval: Optional[int]) -> None:
+        self._deadlines[selector_id] = (deadline, min_interval)
+        heapq.heappush(self._heap, (deadline, selector_id))
+
+    def _is_stale(self, deadline: float, selector_id: str) -> bool:
+        entry = self._deadlines.get(selector_id)
+        return entry is None or entry[0] != deadline
+
+    def pop_due(self, timestamp: float) -> Sequence[str]:
+        """Removes and returns the selector ids of the sensors due at the given timestamp, in the
+        order of their deadlines.
+        """
+        due = []
+        while self._heap and self._heap[0][0] <= timestamp:
+            deadline, selector_id = heapq.heappop(self._heap)
+            if self._is_stale(deadline, selector_id):
+                continue
+            del self._deadlines[selector_id]
+            due.append(selector_id)
+        return due
+
+    def next_deadline(self) -> Optional[float]:
+        while self._heap and self._is_stale(*self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+
 class SensorLaunchContext(AbstractContextManager):
     def __init__(
         self,
@@ -352,12 +407,14 @@ def execute_sensor_iteration_loop(
 ) -> "DaemonIterator":
     """Helper function that performs sensor evaluations on a tighter loop, while reusing grpc locations
     within a given daemon interval.  Rather than relying on the daemon machinery to run the
-    iteration loop every 30 seconds, sensors are continuously evaluated, every 5 seconds. We rely on
-    each sensor definition's min_interval to check that sensor evaluations are spaced appropriately.
+    iteration loop every 30 seconds, sensors are continuously evaluated, at least every 5 seconds.
+    Each sensor is scheduled to be evaluated once its min_interval has elapsed since its last tick,
+    and the loop wakes as soon as the next sensor is due.
     """
     from dagster._daemon.daemon import SpanMarker
 
     sensor_tick_futures: dict[str, Future] = {}
+    sensor_deadlines = SensorDeadlineQueue()
     while True:
         start_time = get_current_timestamp()
         if until and start_time >= until:
@@ -374,6 +431,7 @@ def execute_sensor_iteration_loop(
                 submit_threadpool_executor=submit_threadpool_executor,
                 sensor_tick_futures=sensor_tick_futures,
                 instrument_elapsed=instrument_elapsed,
+                sensor_deadlines=sensor_deadlines,
             )
         except Exception:
             error_info = DaemonErrorCapture.process_exception(
@@ -389,6 +447,9 @@ def execute_sensor_iteration_loop(
         end_time = get_current_timestamp()
         loop_duration = end_time - start_time
         sleep_time = max(0, MIN_INTERVAL_LOOP_TIME - loop_duration)
+        next_deadline = sensor_deadlines.next_deadline()
+        if next_deadline is not None:
+            sleep_time = min(sleep_time, max(0, next_deadline - end_time))
         shutdown_event.wait(sleep_time)
 
         yield None
@@ -402,7 +463,12 @@ def execute_sensor_iteration(
     sensor_tick_futures: Optional[dict[str, Future]] = None,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
     instrument_elapsed: ElapsedInstrumentation = default_elapsed_instrumentation,
+    sensor_deadlines: Optional[SensorDeadlineQueue] = None,
 ):
+    """Evaluates the running sensors that are due. If a SensorDeadlineQueue is passed, only the
+    sensors at the front of the queue are visited, and each evaluated sensor is scheduled again
+    for when its min_interval will have elapsed. Otherwise, every running sensor is visited.
+    """
     instance = workspace_process_context.instance
 
     current_workspace = {
@@ -438,9 +504,20 @@ def execute_sensor_iteration(
         yield
         return
 
-    for sensor in sensors.values():
-        sensor_name = sensor.name
-        sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
+    now = get_current_timestamp()
+    if sensor_deadlines is not None:
+        _schedule_new_sensors(sensor_deadlines, sensors, all_sensor_states, now)
+        # sensors that are no longer running are dropped from the queue once they are due
+        sensors_to_check = [
+            sensors[selector_id]
+            for selector_id in sensor_deadlines.pop_due(now)
+            if selector_id in sensors
+        ]
+    else:
+        sensors_to_check = list(sensors.values())
+
+    sensors_to_evaluate: list[tuple[RemoteSensor, InstigatorState]] = []
+    for sensor in sensors_to_check:
         sensor_state = all_sensor_states.get(sensor.selector_id)
         if not sensor_state:
             assert sensor.default_status == DefaultSensorStatus.RUNNING
@@ -456,22 +533,52 @@ def execute_sensor_iteration(
             )
             instance.add_instigator_state(sensor_state)
         elif is_under_min_interval(sensor_state, sensor):
+            if sensor_deadlines is not None:
+                # the sensor ticked since it was scheduled, e.g. in another daemon process
+                sensor_deadlines.schedule(
+                    sensor.selector_id,
+                    _get_next_due_timestamp(sensor_state, sensor),
+                    sensor.min_interval_seconds,
+                )
             continue
 
+        # when sensors are visited from a SensorDeadlineQueue, the time elapsed past the min
+        # interval is how late the sensor is relative to its deadline
         elapsed = get_elapsed(sensor_state)
         instrument_elapsed(sensor, elapsed, sensor.min_interval_seconds)
 
+        # only allow one tick per sensor to be in flight
+        if (
+            threadpool_executor
+            and sensor_tick_futures
+            and sensor.selector_id in sensor_tick_futures
+            and not sensor_tick_futures[sensor.selector_id].done()
+        ):
+            if sensor_deadlines is not None:
+                sensor_deadlines.schedule(
+                    sensor.selector_id, now + MIN_INTERVAL_LOOP_TIME, sensor.min_interval_seconds
+                )
+            continue
+
+        if sensor_deadlines is not None:
+            sensor_deadlines.schedule(
+                sensor.selector_id,
+                now + max(sensor.min_interval_seconds or 0, MIN_SENSOR_DEADLINE_INTERVAL),
+                sensor.min_interval_seconds,
+            )
+
+        sensors_to_evaluate.append((sensor, sensor_state))
+
+    latest_ticks = _get_latest_ticks_for_evaluation(
+        instance, sensors_to_evaluate, get_current_timestamp(), logger
+    )
+
+    for sensor, sensor_state in sensors_to_evaluate:
+        sensor_debug_crash_flags = debug_crash_flags.get(sensor.name) if debug_crash_flags else None
         if threadpool_executor:
             if sensor_tick_futures is None:
                 check.failed("sensor_tick_futures dict must be passed with threadpool_executor")
 
-            # only allow one tick per sensor to be in flight
-            if (
-                sensor.selector_id in sensor_tick_futures
-                and not sensor_tick_futures[sensor.selector_id].done()
-            ):
-                continue
-
             future = threadpool_executor.submit(
                 _process_tick,
                 workspace_process_context,
@@ -481,6 +588,7 @@ def execute_sensor_iteration(
                 sensor_debug_crash_flags,
                 tick_retention_settings,
                 submit_threadpool_executor,
+                latest_ticks,
             )
             sensor_tick_futures[sensor.selector_id] = future
             yield
@@ -496,15 +604,137 @@ def execute_sensor_iteration(
                 sensor_debug_crash_flags,
                 tick_retention_settings,
                 submit_threadpool_executor=None,
+                latest_ticks=latest_ticks,
             )
 
 
+def _get_next_due_timestamp(state: Optional[InstigatorState], remote_sensor: RemoteSensor) -> float:
+    instigator_data = _sensor_instigator_data(state) if state else None
+    if not instigator_data or not remote_sensor.min_interval_seconds:
+        return 0.0
+
+    return (
+        max(
+            instigator_data.last_tick_timestamp or 0,
+            instigator_data.last_tick_start_timestamp or 0,
+        )
+        + remote_sensor.min_interval_seconds
+    )
+
+
+def _schedule_new_sensors(
+    sensor_deadlines: SensorDeadlineQueue,
+    sensors: Mapping[str, RemoteSensor],
+    all_sensor_states: Mapping[str, InstigatorState],
+    now: float,
+) -> None:
+    """Adds the running sensors that aren't in the queue yet, or whose min_interval has changed,
+    to the queue. Sensors that are already due are spread over the next loop interval, so that
+    they aren't all evaluated at once when the daemon starts.
+    """
+    for selector_id, sensor in sensors.items():
+        if (
+            selector_id in sensor_deadlines
+            and sensor_deadlines.get_min_interval(selector_id) == sensor.min_interval_seconds
+        ):
+            continue
+
+        deadline = _get_next_due_timestamp(all_sensor_states.get(selector_id), sensor)
+        if deadline <= now:
+            max_jitter = min(sensor.min_interval_seconds or 0, MIN_INTERVAL_LOOP_TIME)
+            deadline = now + random.uniform(0, max_jitter)
+        sensor_deadlines.schedule(selector_id, deadline, sensor.min_interval_seconds)
+
+
+def _needs_latest_tick(instigator_data: Optional[SensorInstigatorData]) -> bool:
+    # if a last tick success timestamp was set, then the previous tick could not have been
+    # interrupted, so there is no need to fetch the previous tick
+    return not (instigator_data and instigator_data.last_tick_success_timestamp)
+
+
+def _should_resume_tick(tick: InstigatorTick, evaluation_timestamp: float) -> bool:
+    # a tick interrupted before it was able to request all of its runs is resumed if it hasn't
+    # been too long
+    return (
+        tick.status == TickStatus.STARTED
+        and evaluation_timestamp - tick.timestamp <= MAX_TIME_TO_RESUME_TICK_SECONDS
+        and len(tick.unsubmitted_run_ids_with_requests) > 0
+    )
+
+
+def _get_latest_ticks_for_evaluation(
+    instance: DagsterInstance,
+    sensors_to_evaluate: Sequence[tuple[RemoteSensor, InstigatorState]],
+    evaluation_timestamp: float,
+    logger: logging.Logger,
+) -> Mapping[str, Optional[InstigatorTick]]:
+    """Fetches the most recent tick of each sensor about to be evaluated that needs it, in one query
+    for all of the sensors, and moves any dangling STARTED ticks that won't be resumed into SKIPPED,
+    in one write for all of the sensors.
+
+    The sensors whose ticks are not in the returned mapping, because the batched query or write
+    failed, fetch their latest tick and move it into SKIPPED themselves when they are evaluated.
+    """
+    try:
+        latest_ticks = instance.get_latest_ticks(
+            [
+                (sensor.get_remote_origin_id(), sensor.selector_id)
+                for sensor, sensor_state in sensors_to_evaluate
+                if _needs_latest_tick(_sensor_instigator_data(sensor_state))
+            ]
+        )
+    except Exception:
+        DaemonErrorCapture.process_exception(
+            exc_info=sys.exc_info(),
+            logger=logger,
+            log_message="Failed to fetch the latest ticks of the sensors, fetching them for each sensor instead",
+        )
+        return {}
+
+    dangling_ticks = [
+        tick
+        for tick in latest_ticks.values()
+        if tick is not None
+        and tick.status == TickStatus.STARTED
+        and not _should_resume_tick(tick, evaluation_timestamp)
+    ]
+    if dangling_ticks:
+        for tick in dangling_ticks:
+            logger.warn(f"Moving dangling STARTED tick {tick.tick_id} into SKIPPED")
+        skipped_ticks = [tick.with_status(status=TickStatus.SKIPPED) for tick in dangling_ticks]
+        try:
+            instance.update_ticks(skipped_ticks)
+        except Exception:
+            DaemonErrorCapture.process_exception(
+                exc_info=sys.exc_info(),
+                logger=logger,
+                log_message="Failed to move the dangling sensor ticks into SKIPPED, moving them for each sensor instead",
+            )
+            dangling_tick_ids = {tick.tick_id for tick in dangling_ticks}
+            return {
+                selector_id: tick
+                for selector_id, tick in latest_ticks.items()
+                if tick is None or tick.tick_id not in dangling_tick_ids
+            }
+
+        # the sensors see their dangling ticks as skipped, rather than deciding again whether to
+        # resume them
+        skipped_ticks_by_id = {tick.tick_id: tick for tick in skipped_ticks}
+        return {
+            selector_id: skipped_ticks_by_id.get(tick.tick_id, tick) if tick is not None else None
+            for selector_id, tick in latest_ticks.items()
+        }
+
+    return latest_ticks
+
+
 def _get_evaluation_tick(
     instance: DagsterInstance,
     sensor: RemoteSensor,
     instigator_data: Optional[SensorInstigatorData],
     evaluation_timestamp: float,
     logger: logging.Logger,
+    latest_ticks: Optional[Mapping[str, Optional[InstigatorTick]]] = None,
 ) -> InstigatorTick:
     """Returns the current tick that the sensor should evaluate for. If there is unfinished work
     from the previous tick that must be resolved before proceeding, will return that previous tick.
@@ -514,28 +744,33 @@ def _get_evaluation_tick(
 
     consecutive_failure_count = 0
 
-    if instigator_data and instigator_data.last_tick_success_timestamp:
-        # if a last tick success timestamp was set, then the previous tick could not have been
-        # interrupted, so there is no need to fetch the previous tick
+    # a dangling tick fetched with the ticks of the other sensors has been moved into SKIPPED with
+    # them, and carries its failure count over like a dangling tick skipped below. Ticks skipped by
+    # an evaluation reset their failure counts, so the count of any other SKIPPED tick is 0.
+    dangling_tick_skipped = False
+    if not _needs_latest_tick(instigator_data):
         most_recent_tick = None
+    elif latest_ticks is not None and selector_id in latest_ticks:
+        most_recent_tick = latest_ticks[selector_id]
+        dangling_tick_skipped = (
+            most_recent_tick is not None and most_recent_tick.status == TickStatus.SKIPPED
+        )
     else:
         most_recent_tick = next(iter(instance.get_ticks(origin_id, selector_id, limit=1)), None)
 
     # check for unfinished work on the previous tick
     if most_recent_tick is not None:
-        if most_recent_tick.status in {TickStatus.FAILURE, TickStatus.STARTED}:
+        if (
+            most_recent_tick.status in {TickStatus.FAILURE, TickStatus.STARTED}
+            or dangling_tick_skipped
+        ):
             consecutive_failure_count = (
                 most_recent_tick.consecutive_failure_count or most_recent_tick.failure_count
             )
 
         has_unrequested_runs = len(most_recent_tick.unsubmitted_run_ids_with_requests) > 0
         if most_recent_tick.status == TickStatus.STARTED:
-            # if the previous tick was interrupted before it was able to request all of its runs,
-            # and it hasn't been too long, then resume execution of that tick
-            if (
-                evaluation_timestamp - most_recent_tick.timestamp <= MAX_TIME_TO_RESUME_TICK_SECONDS
-                and has_unrequested_runs
-            ):
+            if _should_resume_tick(most_recent_tick, evaluation_timestamp):
                 logger.warn(
                     f"Tick {most_recent_tick.tick_id} was interrupted part-way through, resuming"
                 )
@@ -584,6 +819,7 @@ def _process_tick_generator(
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     tick_retention_settings,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    latest_ticks: Optional[Mapping[str, Optional[InstigatorTick]]] = None,
 ):
     instance = workspace_process_context.instance
     error_info = None
@@ -607,6 +843,7 @@ def _process_tick_generator(
             _sensor_instigator_data(sensor_state),
             now.timestamp(),
             logger,
+            latest_ticks,
         )
 
         check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
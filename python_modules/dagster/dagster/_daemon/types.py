@@ -81,3 +81,34 @@ def __new__(
             healthy=check.opt_bool_param(healthy, "healthy"),
             last_heartbeat=check.opt_inst_param(last_heartbeat, "last_heartbeat", DaemonHeartbeat),
         )
+
+
+class DaemonLease(
+    NamedTuple(
+        "_DaemonLease",
+        [
+            ("lease_group", str),
+            ("lease_key", str),
+            ("owner_id", str),
+            ("expiration_timestamp", float),
+        ],
+    )
+):
+    """A lease on a key within a group of leases, held by a daemon process until it expires. Used to
+    divide work between several replicas of a daemon.
+    """
+
+    def __new__(
+        cls,
+        lease_group: str,
+        lease_key: str,
+        owner_id: str,
+        expiration_timestamp: float,
+    ):
+        return super().__new__(
+            cls,
+            lease_group=check.str_param(lease_group, "lease_group"),
+            lease_key=check.str_param(lease_key, "lease_key"),
+            owner_id=check.str_param(owner_id, "owner_id"),
+            expiration_timestamp=check.float_param(expiration_timestamp, "expiration_timestamp"),
+        )
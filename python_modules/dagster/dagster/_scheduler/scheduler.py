@@ -369,6 +369,7 @@ def launch_scheduled_runs(
         yield
         return
 
+    schedules_to_evaluate: list[tuple[RemoteSchedule, InstigatorState]] = []
     for schedule in running_schedules.values():
         error_info = None
         try:
@@ -386,10 +387,6 @@ def launch_scheduled_runs(
                 )
                 instance.add_instigator_state(schedule_state)
 
-            schedule_debug_crash_flags = (
-                debug_crash_flags.get(schedule_state.instigator_name) if debug_crash_flags else None
-            )
-
             if threadpool_executor:
                 if scheduler_run_futures is None:
                     check.failed(
@@ -414,16 +411,53 @@ def launch_scheduled_runs(
                         # only allow one tick per schedule to be in flight
                         continue
 
-                previous_iteration_times = iteration_times.get(schedule.selector_id)
-                if (
-                    previous_iteration_times
-                    and not previous_iteration_times.should_run_next_iteration(
-                        schedule, end_datetime_utc.timestamp()
-                    )
-                ):
-                    # Not enough time has passed for this schedule, don't bother creating a thread
-                    continue
+            previous_iteration_times = iteration_times.get(schedule.selector_id)
+            if previous_iteration_times and not previous_iteration_times.should_run_next_iteration(
+                schedule, end_datetime_utc.timestamp()
+            ):
+                # Not enough time has passed for this schedule, don't bother evaluating it
+                continue
+
+            schedules_to_evaluate.append((schedule, schedule_state))
+        except Exception:
+            error_info = DaemonErrorCapture.process_exception(
+                exc_info=sys.exc_info(),
+                logger=logger,
+                log_message=f"Scheduler caught an error for schedule {schedule.name}",
+            )
+            yield error_info
 
+    if not schedules_to_evaluate:
+        yield
+        return
+
+    # the latest ticks of the schedules are fetched in one query, rather than one per schedule
+    latest_ticks: Optional[Mapping[str, Optional[InstigatorTick]]]
+    try:
+        latest_ticks = instance.get_latest_ticks(
+            [
+                (schedule.get_remote_origin_id(), schedule.selector_id)
+                for schedule, _ in schedules_to_evaluate
+            ]
+        )
+    except Exception:
+        # each schedule fetches its own latest tick instead
+        DaemonErrorCapture.process_exception(
+            exc_info=sys.exc_info(),
+            logger=logger,
+            log_message="Failed to fetch the latest ticks of the schedules, fetching them for each schedule instead",
+        )
+        latest_ticks = None
+
+    for schedule, schedule_state in schedules_to_evaluate:
+        error_info = None
+        try:
+            schedule_debug_crash_flags = (
+                debug_crash_flags.get(schedule_state.instigator_name) if debug_crash_flags else None
+            )
+            previous_iteration_times = iteration_times.get(schedule.selector_id)
+
+            if threadpool_executor:
                 if previous_iteration_times:
                     scheduler_delay_instrumentation(
                         schedule.selector_id,
@@ -448,21 +482,12 @@ def launch_scheduled_runs(
                         if previous_iteration_times
                         else None
                     ),
+                    latest_ticks=latest_ticks,
                 )
-                scheduler_run_futures[schedule.selector_id] = future
+                check.not_none(scheduler_run_futures)[schedule.selector_id] = future
                 yield
 
             else:
-                previous_iteration_times = iteration_times.get(schedule.selector_id)
-                if (
-                    previous_iteration_times
-                    and not previous_iteration_times.should_run_next_iteration(
-                        schedule, end_datetime_utc.timestamp()
-                    )
-                ):
-                    # Not enough time has passed for this schedule, don't bother executing
-                    continue
-
                 # evaluate the schedules in a loop, synchronously, yielding to allow the schedule daemon to
                 # heartbeat
                 found_iteration_times = False
@@ -482,6 +507,7 @@ def launch_scheduled_runs(
                         if previous_iteration_times
                         else None
                     ),
+                    latest_ticks=latest_ticks,
                 ):
                     if isinstance(yielded_value, ScheduleIterationTimes):
                         check.invariant(
@@ -518,6 +544,7 @@ def launch_scheduled_runs_for_schedule(
     schedule_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     in_memory_last_iteration_timestamp: Optional[float],
+    latest_ticks: Optional[Mapping[str, Optional[InstigatorTick]]] = None,
 ) -> ScheduleIterationTimes:
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
@@ -534,6 +561,7 @@ def launch_scheduled_runs_for_schedule(
         schedule_debug_crash_flags,
         submit_threadpool_executor=submit_threadpool_executor,
         in_memory_last_iteration_timestamp=in_memory_last_iteration_timestamp,
+        latest_ticks=latest_ticks,
     ):
         if isinstance(yielded_value, ScheduleIterationTimes):
             iteration_times = yielded_value
@@ -553,14 +581,19 @@ def launch_scheduled_runs_for_schedule_iterator(
     schedule_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     in_memory_last_iteration_timestamp: Optional[float],
+    latest_ticks: Optional[Mapping[str, Optional[InstigatorTick]]] = None,
 ) -> Generator[Union[None, SerializableErrorInfo, ScheduleIterationTimes], None, None]:
     schedule_state = check.inst_param(schedule_state, "schedule_state", InstigatorState)
     end_datetime_utc = check.inst_param(end_datetime_utc, "end_datetime_utc", datetime.datetime)
     instance = workspace_process_context.instance
 
     instigator_origin_id = remote_schedule.get_remote_origin_id()
-    ticks = instance.get_ticks(instigator_origin_id, remote_schedule.selector_id, limit=1)
-    latest_tick: Optional[InstigatorTick] = ticks[0] if ticks else None
+    latest_tick: Optional[InstigatorTick]
+    if latest_ticks is not None and remote_schedule.selector_id in latest_ticks:
+        latest_tick = latest_ticks[remote_schedule.selector_id]
+    else:
+        ticks = instance.get_ticks(instigator_origin_id, remote_schedule.selector_id, limit=1)
+        latest_tick = ticks[0] if ticks else None
 
     instigator_data = cast("ScheduleInstigatorData", schedule_state.instigator_data)
     start_timestamp_utc: float = instigator_data.start_timestamp or 0
@@ -1,3 +1,4 @@
+import math
 import re
 import warnings
 from collections import defaultdict
@@ -9,7 +10,13 @@
 
 from dagster import _check as check
 from dagster._core.errors import DagsterInvalidDefinitionError
-from dagster._core.storage.tags import SYSTEM_TAG_PREFIX, USER_EDITABLE_SYSTEM_TAGS
+from dagster._core.storage.tags import (
+    CRITICAL_PATH_PRIORITIZATION,
+    STEP_PRIORITIZATION_TAG,
+    STEP_PROFILING_SAMPLE_INTERVAL_TAG,
+    SYSTEM_TAG_PREFIX,
+    USER_EDITABLE_SYSTEM_TAGS,
+)
 
 if TYPE_CHECKING:
     from dagster._core.execution.plan.step import ExecutionStep
@@ -19,6 +26,7 @@
 class TagConcurrencyLimitsCounter:
     """Helper object that keeps track of when the tag concurrency limits are met."""
 
+    _tag_concurrency_limits: Sequence[Mapping[str, Any]]
     _key_limits: dict[str, int]
     _key_value_limits: dict[tuple[str, str], int]
     _unique_value_limits: dict[str, int]
@@ -30,10 +38,15 @@ def __init__(
         self,
         tag_concurrency_limits: Sequence[Mapping[str, Any]],
         in_progress_tagged_items: Sequence[Union["DagsterRun", "ExecutionStep"]],
+        *,
+        key_counts: Optional[Mapping[str, int]] = None,
+        key_value_counts: Optional[Mapping[tuple[str, str], int]] = None,
+        unique_value_counts: Optional[Mapping[tuple[str, str], int]] = None,
     ):
         check.opt_list_param(tag_concurrency_limits, "tag_concurrency_limits", of_type=dict)
         check.list_param(in_progress_tagged_items, "in_progress_tagged_items")
 
+        self._tag_concurrency_limits = tag_concurrency_limits
         self._key_limits = {}
         self._key_value_limits = {}
         self._unique_value_limits = {}
@@ -50,9 +63,10 @@ def __init__(
             else:
                 self._unique_value_limits[key] = limit
 
-        self._key_counts = defaultdict(lambda: 0)
-        self._key_value_counts = defaultdict(lambda: 0)
-        self._unique_value_counts = defaultdict(lambda: 0)
+        # counts carried over from another counter, before the in progress items are added
+        self._key_counts = defaultdict(lambda: 0, key_counts or {})
+        self._key_value_counts = defaultdict(lambda: 0, key_value_counts or {})
+        self._unique_value_counts = defaultdict(lambda: 0, unique_value_counts or {})
 
         # initialize counters based on current in progress item
         for item in in_progress_tagged_items:
@@ -94,6 +108,33 @@ def update_counters_with_launched_item(
             if key in self._unique_value_limits:
                 self._unique_value_counts[tag_tuple] += 1
 
+    def update_counters_with_finished_item(
+        self, item: Union["DagsterRun", "ExecutionStep"]
+    ) -> None:
+        """Remove an item that is no longer in progress from the counters."""
+        for key, value in item.tags.items():
+            if key in self._key_limits:
+                self._key_counts[key] = max(0, self._key_counts[key] - 1)
+
+            tag_tuple = (key, value)
+            if tag_tuple in self._key_value_limits:
+                self._key_value_counts[tag_tuple] = max(0, self._key_value_counts[tag_tuple] - 1)
+
+            if key in self._unique_value_limits:
+                self._unique_value_counts[tag_tuple] = max(
+                    0, self._unique_value_counts[tag_tuple] - 1
+                )
+
+    def copy(self) -> "TagConcurrencyLimitsCounter":
+        """Returns a counter with the same limits and counts, that can be updated independently."""
+        return TagConcurrencyLimitsCounter(
+            self._tag_concurrency_limits,
+            [],
+            key_counts=self._key_counts,
+            key_value_counts=self._key_value_counts,
+            unique_value_counts=self._unique_value_counts,
+        )
+
 
 def get_boolean_tag_value(tag_value: Optional[str], default_value: bool = False) -> bool:
     if tag_value is None:
@@ -102,6 +143,20 @@ def get_boolean_tag_value(tag_value: Optional[str], default_value: bool = False)
     return get_boolean_string_value(tag_value)
 
 
+def get_step_profiling_sample_interval(tag_value: Optional[str]) -> Optional[float]:
+    """Returns the interval in seconds set by the step profiling sample interval tag, or None if
+    the tag is not set to a positive number.
+    """
+    if not tag_value:
+        return None
+
+    try:
+        sample_interval = float(tag_value)
+    except ValueError:
+        return None
+    return sample_interval if math.isfinite(sample_interval) and sample_interval > 0 else None
+
+
 # ########################
 # ##### NORMALIZATION
 # ########################
@@ -191,6 +246,20 @@ def normalize_tags(
                 )
             normalized_tags[key] = value
 
+    sample_interval_tag = normalized_tags.get(STEP_PROFILING_SAMPLE_INTERVAL_TAG)
+    if sample_interval_tag and get_step_profiling_sample_interval(sample_interval_tag) is None:
+        raise DagsterInvalidDefinitionError(
+            f'Invalid value "{sample_interval_tag}" for tag {STEP_PROFILING_SAMPLE_INTERVAL_TAG},'
+            " expected a positive number of seconds."
+        )
+
+    prioritization_tag = normalized_tags.get(STEP_PRIORITIZATION_TAG)
+    if prioritization_tag and prioritization_tag != CRITICAL_PATH_PRIORITIZATION:
+        raise DagsterInvalidDefinitionError(
+            f'Invalid value "{prioritization_tag}" for tag {STEP_PRIORITIZATION_TAG}, expected'
+            f' "{CRITICAL_PATH_PRIORITIZATION}".'
+        )
+
     # Issue errors (strict=True) or warnings (strict=False) for any invalid tag keys that are too
     # long or contain invalid characters.
     if invalid_tag_keys:
@@ -619,6 +619,30 @@ def test_update_sensor_tick_to_skip(self, storage):
         assert tick.run_ids == []
         assert tick.error is None
 
+    def test_update_sensor_ticks(self, storage):
+        assert storage
+
+        current_time = time.time()
+        one = storage.create_tick(self.build_sensor_tick(current_time, name="sensor_one"))
+        two = storage.create_tick(self.build_sensor_tick(current_time, name="sensor_two"))
+        three = storage.create_tick(self.build_sensor_tick(current_time, name="sensor_three"))
+
+        storage.update_ticks(
+            [
+                one.with_status(TickStatus.SKIPPED),
+                two.with_status(TickStatus.SUCCESS).with_run_info(run_id="run_one"),
+            ]
+        )
+        storage.update_ticks([])
+
+        (one,) = storage.get_ticks("sensor_one", "sensor_one")
+        assert one.status == TickStatus.SKIPPED
+        (two,) = storage.get_ticks("sensor_two", "sensor_two")
+        assert two.status == TickStatus.SUCCESS
+        assert two.run_ids == ["run_one"]
+        (three,) = storage.get_ticks("sensor_three", "sensor_three")
+        assert three.status == TickStatus.STARTED
+
     def test_update_sensor_tick_to_failure(self, storage):
         assert storage
 
@@ -1,3 +1,4 @@
+import json
 from typing import cast
 from unittest.mock import MagicMock
 
@@ -14,8 +15,12 @@
     DefaultPartitionsSubset,
     TimeWindowPartitionsSubset,
 )
+from dagster._core.definitions.partitions.subset.key_ranges import RangeEncodedPartitionKeySet
 from dagster._core.definitions.partitions.utils import PersistedTimeWindow
-from dagster._core.errors import DagsterInvalidDeserializationVersionError
+from dagster._core.errors import (
+    DagsterDefinitionChangedDeserializationError,
+    DagsterInvalidDeserializationVersionError,
+)
 from dagster._core.test_utils import freeze_time
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._time import create_datetime
@@ -59,6 +64,64 @@ def test_static_partitions_subset_current_version_serialization():
     assert deserialized.get_partition_keys() == {"baz", "foo"}
 
 
+def test_static_partitions_subset_range_encoding():
+    keys = [f"key_{i:04}" for i in range(2000)]
+    partitions_def = dg.StaticPartitionsDefinition(keys)
+    subset = partitions_def.empty_subset().with_partition_keys([*keys[10:500], "key_1999"])
+    other = partitions_def.empty_subset().with_partition_keys(keys[400:600])
+    assert isinstance(subset, DefaultPartitionsSubset)
+    assert isinstance(subset.subset, RangeEncodedPartitionKeySet)
+
+    assert len(subset) == 491
+    assert "key_0010" in subset and "key_1999" in subset and "key_0009" not in subset
+    assert subset.get_partition_key_ranges(partitions_def) == [
+        dg.PartitionKeyRange("key_0010", "key_0499"),
+        dg.PartitionKeyRange("key_1999", "key_1999"),
+    ]
+    assert set((subset | other).get_partition_keys()) == {*keys[10:600], "key_1999"}
+    assert set((subset & other).get_partition_keys()) == set(keys[400:500])
+    assert set((subset - other).get_partition_keys()) == {*keys[10:400], "key_1999"}
+    assert set(subset.get_partition_keys_not_in_subset(partitions_def)) == {
+        *keys[:10],
+        *keys[500:1999],
+    }
+
+    # behaves like a subset of plain partition keys, including keys not in the definition
+    plain_subset = DefaultPartitionsSubset({*keys[10:500], "key_1999"})
+    assert subset == plain_subset and plain_subset == subset
+    assert set((plain_subset - other).get_partition_keys()) == {*keys[10:400], "key_1999"}
+    with_missing_key = subset.with_partition_keys(["nonexistent"])
+    assert "nonexistent" in with_missing_key and len(with_missing_key) == 492
+
+    serialized = with_missing_key.serialize()
+    assert json.loads(serialized) == {
+        "version": DefaultPartitionsSubset.RANGES_SERIALIZATION_VERSION,
+        "partition_keys_id": partitions_def.get_serializable_unique_identifier(),
+        "ranges": [["key_0010", "key_0499"], ["key_1999", "key_1999"]],
+        "subset": ["nonexistent"],
+    }
+    assert partitions_def.can_deserialize_subset(serialized, None, None)
+    assert partitions_def.can_deserialize_subset(serialized, None, "StaticPartitionsDefinition")
+    assert partitions_def.deserialize_subset(serialized) == with_missing_key
+
+    # the ranges can't be read once keys are inserted into or removed from the definition
+    for changed_partitions_def in [
+        dg.StaticPartitionsDefinition([*keys[:100], "inserted", *keys[100:]]),
+        dg.StaticPartitionsDefinition([*keys[:100], *keys[101:]]),
+        dg.StaticPartitionsDefinition(keys[:1000]),
+    ]:
+        assert not changed_partitions_def.can_deserialize_subset(
+            serialized, None, "StaticPartitionsDefinition"
+        )
+        assert not changed_partitions_def.can_deserialize_subset(serialized, None, None)
+        with pytest.raises(DagsterDefinitionChangedDeserializationError):
+            changed_partitions_def.deserialize_subset(serialized)
+
+    # serdes stores plain partition keys, independent of the definition's key order
+    assert deserialize_value(serialize_value(subset)) == plain_subset
+    assert isinstance(deserialize_value(serialize_value(subset)).subset, set)  # pyright: ignore[reportAttributeAccessIssue]
+
+
 def test_time_window_subset_cannot_deserialize_invalid_version():
     daily_partitions_def = dg.DailyPartitionsDefinition(start_date="2023-01-01")
     serialized_subset = (
@@ -0,0 +1,155 @@
+import datetime
+
+import dagster as dg
+from dagster._core.storage.event_log.asset_record_cache import (
+    AssetRecordCache,
+    AssetRecordCacheStats,
+)
+from dagster._core.test_utils import environ, freeze_time
+from dagster._time import get_current_datetime
+
+
+def test_asset_record_cache_lru():
+    cache = AssetRecordCache(max_size=2, ttl_seconds=60)
+    a, b, c = dg.AssetKey("a"), dg.AssetKey("b"), dg.AssetKey("c")
+    fetched = []
+    updated_after = []
+
+    def _fetch(keys):
+        fetched.append(list(keys))
+        return {key: key.to_user_string() for key in keys if key != c}
+
+    def _get_updated(updated_keys):
+        def _get_updated_asset_keys(after_storage_id, limit):
+            updated_after.append(after_storage_id)
+            return updated_keys
+
+        return _get_updated_asset_keys
+
+    assert cache.get_or_fetch([a, b], 1, _get_updated(set()), _fetch) == {a: "a", b: "b"}
+    assert cache.get_or_fetch([a, b, a], 1, _get_updated(set()), _fetch) == {a: "a", b: "b"}
+    assert fetched == [[a, b]]
+    # the index is only read for updated keys once the max storage id moves
+    assert updated_after == []
+
+    # an event for a after the previous max storage id invalidates its cached value
+    assert cache.get_or_fetch([a, b], 2, _get_updated({a}), _fetch) == {a: "a", b: "b"}
+    assert fetched[-1] == [a]
+    assert updated_after == [1]
+
+    # missing values are cached too, and the least recently used key is evicted
+    assert cache.get_or_fetch([c], 2, _get_updated(set()), _fetch) == {c: None}
+    assert cache.get_or_fetch([c], 2, _get_updated(set()), _fetch) == {c: None}
+    assert cache.get_or_fetch([b], 2, _get_updated(set()), _fetch) == {b: "b"}
+    assert fetched[-1] == [b]
+
+    cache.invalidate([c])
+    assert cache.get_or_fetch([c], 2, _get_updated(set()), _fetch) == {c: None}
+    assert fetched[-1] == [c]
+
+    stats = cache.stats
+    assert stats.hits == 4
+    assert stats.misses == 6
+    assert stats.size == 2
+    assert stats.max_size == 2
+
+
+def test_asset_record_cache_invalidation():
+    cache = AssetRecordCache(max_size=10, ttl_seconds=60)
+    a, b = dg.AssetKey("a"), dg.AssetKey("b")
+    fetched = []
+
+    def _fetch(keys):
+        fetched.append(list(keys))
+        return {key: key.to_user_string() for key in keys}
+
+    def _no_updates(after_storage_id, limit):
+        return set()
+
+    def _too_many_updates(after_storage_id, limit):
+        assert limit == 10
+        return None
+
+    start = get_current_datetime()
+    with freeze_time(start):
+        cache.get_or_fetch([a, b], 5, _no_updates, _fetch)
+
+        # too many updated keys to read, so every entry is dropped
+        cache.get_or_fetch([a, b], 6, _too_many_updates, _fetch)
+        assert fetched[-1] == [a, b]
+
+        # events were deleted, so every entry is dropped without reading the updated keys
+        cache.get_or_fetch([a, b], 3, _too_many_updates, _fetch)
+        assert fetched[-1] == [a, b]
+        cache.get_or_fetch([a, b], None, _too_many_updates, _fetch)
+        assert fetched[-1] == [a, b]
+        assert len(fetched) == 4
+
+    # entries that are older than the ttl are refetched, even if no events were written
+    with freeze_time(start + datetime.timedelta(seconds=30)):
+        cache.invalidate([a])
+        cache.get_or_fetch([a], None, _no_updates, _fetch)
+    with freeze_time(start + datetime.timedelta(seconds=61)):
+        cache.get_or_fetch([a, b], None, _no_updates, _fetch)
+    assert fetched[-2:] == [[a], [b]]
+
+
+def test_instance_asset_record_cache():
+    a, b = dg.AssetKey("a"), dg.AssetKey("b")
+    with environ({"DAGSTER_ASSET_RECORD_CACHE_SIZE": "100"}):
+        with dg.instance_for_test() as instance:
+            instance.report_runless_asset_event(dg.AssetMaterialization(a, metadata={"n": 1}))
+            instance.report_runless_asset_event(dg.AssetObservation(b))
+
+            events = instance.get_latest_materialization_events([a, b])
+            assert events[a] and events[a].asset_materialization.metadata["n"].value == 1  # pyright: ignore[reportOptionalMemberAccess]
+            assert events[b] is None
+            assert instance.get_latest_materialization_events([a, b]) == events
+            assert instance.get_asset_record_cache_stats()[
+                "get_latest_materialization_events"
+            ] == AssetRecordCacheStats(hits=2, misses=2, size=2, max_size=100)
+
+            instance.report_runless_asset_event(dg.AssetMaterialization(a, metadata={"n": 2}))
+            latest = instance.get_latest_materialization_event(a)
+            assert latest and latest.asset_materialization.metadata["n"].value == 2  # pyright: ignore[reportOptionalMemberAccess]
+
+            records = instance.get_asset_records([b, a])
+            assert [record.asset_entry.asset_key for record in records] == [b, a]
+            assert instance.get_asset_records([b, a]) == records
+            assert instance.get_asset_record_cache_stats()["get_asset_records"].hits == 2
+
+            instance.wipe_assets([a])
+            assert instance.get_latest_materialization_event(a) is None
+            assert [
+                record.asset_entry.asset_key for record in instance.get_asset_records([b, a])
+            ] == [b]
+
+
+def test_instance_asset_record_cache_disabled():
+    with dg.instance_for_test() as instance:
+        assert instance.get_asset_record_cache_stats() == {}
+
+
+def test_instance_asset_record_cache_other_process_writes():
+    a, b = dg.AssetKey("a"), dg.AssetKey("b")
+    with environ({"DAGSTER_ASSET_RECORD_CACHE_SIZE": "100"}):
+        with dg.instance_for_test() as instance:
+            other_instance = dg.DagsterInstance.from_ref(instance.get_ref())
+            instance.report_runless_asset_event(dg.AssetMaterialization(a, metadata={"n": 1}))
+            instance.report_runless_asset_event(dg.AssetMaterialization(b))
+            instance.get_latest_materialization_events([a, b])
+
+            other_instance.report_runless_asset_event(dg.AssetMaterialization(a, metadata={"n": 2}))
+            events = instance.get_latest_materialization_events([a, b])
+            assert events[a] and events[a].asset_materialization.metadata["n"].value == 2  # pyright: ignore[reportOptionalMemberAccess]
+            # only the asset with new events is refetched
+            assert instance.get_asset_record_cache_stats()[
+                "get_latest_materialization_events"
+            ] == AssetRecordCacheStats(hits=1, misses=3, size=2, max_size=100)
+
+            # sqlite does not write wipe events to the index shard, so a wipe from another
+            # process is only seen once the cached entry expires
+            other_instance.wipe_assets([b])
+            with freeze_time(get_current_datetime() + datetime.timedelta(seconds=61)):
+                assert instance.get_latest_materialization_events([a, b])[b] is None
+            other_instance.dispose()
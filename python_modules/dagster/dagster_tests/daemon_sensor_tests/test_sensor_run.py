@@ -39,6 +39,7 @@
     InstigatorState,
     InstigatorStatus,
     SensorInstigatorData,
+    TickData,
     TickStatus,
 )
 from dagster._core.test_utils import (
@@ -47,10 +48,18 @@
     freeze_time,
     wait_for_futures,
 )
+from dagster._core.utils import make_new_run_id
 from dagster._core.workspace.context import WorkspaceProcessContext
 from dagster._daemon import get_default_daemon_logger
 from dagster._daemon.daemon import SpanMarker
-from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._daemon.sensor import (
+    MAX_TIME_TO_RESUME_TICK_SECONDS,
+    SensorDeadlineQueue,
+    _get_evaluation_tick,
+    _get_latest_ticks_for_evaluation,
+    execute_sensor_iteration,
+    execute_sensor_iteration_loop,
+)
 from dagster._record import copy
 from dagster._time import create_datetime, get_current_datetime
 from dagster._vendored.dateutil.relativedelta import relativedelta
@@ -1636,6 +1645,9 @@ def test_launch_once(caplog, executor, instance, workspace_context, remote_repo)
     with (
         freeze_time(freeze_datetime),
         patch.object(dg.DagsterInstance, "get_ticks", wraps=instance.get_ticks) as mock_get_ticks,
+        patch.object(
+            dg.DagsterInstance, "get_latest_ticks", wraps=instance.get_latest_ticks
+        ) as mock_get_latest_ticks,
     ):
         sensor = remote_repo.get_sensor("run_key_sensor")
         instance.add_instigator_state(
@@ -1654,15 +1666,18 @@ def test_launch_once(caplog, executor, instance, workspace_context, remote_repo)
 
         evaluate_sensors(workspace_context, executor)
 
-        # call another time to get previous tick
-        assert mock_get_ticks.call_count == 2
+        # the previous tick is fetched with the latest ticks of the other sensors
+        assert mock_get_ticks.call_count == 1
+        mock_get_latest_ticks.assert_called_once_with(
+            [(sensor.get_remote_origin_id(), sensor.selector_id)]
+        )
 
         wait_for_all_runs_to_start(instance)
 
         assert instance.get_runs_count() == 1
         run = instance.get_runs()[0]
         ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
-        assert mock_get_ticks.call_count == 3
+        assert mock_get_ticks.call_count == 2
 
         assert len(ticks) == 1
         validate_tick(
@@ -1678,10 +1693,14 @@ def test_launch_once(caplog, executor, instance, workspace_context, remote_repo)
     with (
         freeze_time(freeze_datetime),
         patch.object(dg.DagsterInstance, "get_ticks", wraps=instance.get_ticks) as mock_get_ticks,
+        patch.object(
+            dg.DagsterInstance, "get_latest_ticks", wraps=instance.get_latest_ticks
+        ) as mock_get_latest_ticks,
     ):
         evaluate_sensors(workspace_context, executor)
         # did not need to get ticks on this call, as the preivous tick evaluated successfully
         assert mock_get_ticks.call_count == 0
+        mock_get_latest_ticks.assert_called_once_with([])
 
         assert instance.get_runs_count() == 1
         ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
@@ -1716,10 +1735,14 @@ def test_launch_once(caplog, executor, instance, workspace_context, remote_repo)
     with (
         freeze_time(freeze_datetime),
         patch.object(dg.DagsterInstance, "get_ticks", wraps=instance.get_ticks) as mock_get_ticks,
+        patch.object(
+            dg.DagsterInstance, "get_latest_ticks", wraps=instance.get_latest_ticks
+        ) as mock_get_latest_ticks,
     ):
         evaluate_sensors(workspace_context, executor)
         # did not need to get ticks on this call either
         assert mock_get_ticks.call_count == 0
+        mock_get_latest_ticks.assert_called_once_with([])
 
         ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
 
@@ -1732,6 +1755,117 @@ def test_launch_once(caplog, executor, instance, workspace_context, remote_repo)
         )
 
 
+def test_batched_tick_read_failure(caplog, executor, instance, workspace_context, remote_repo):
+    freeze_datetime = create_datetime(year=2019, month=2, day=27, hour=23, minute=59, second=59)
+    sensor = remote_repo.get_sensor("run_key_sensor")
+    instance.add_instigator_state(
+        InstigatorState(
+            sensor.get_remote_origin(),
+            InstigatorType.SENSOR,
+            InstigatorStatus.RUNNING,
+        )
+    )
+    # a tick left in STARTED too long ago to be resumed
+    dangling_tick = instance.create_tick(
+        TickData(
+            instigator_origin_id=sensor.get_remote_origin_id(),
+            instigator_name=sensor.name,
+            instigator_type=InstigatorType.SENSOR,
+            status=TickStatus.STARTED,
+            timestamp=(freeze_datetime - relativedelta(days=1)).timestamp(),
+            selector_id=sensor.selector_id,
+        )
+    )
+
+    with (
+        freeze_time(freeze_datetime),
+        patch.object(
+            dg.DagsterInstance, "get_latest_ticks", side_effect=Exception("batch read failed")
+        ),
+    ):
+        evaluate_sensors(workspace_context, executor)
+
+    # the sensor fetched its latest tick itself, and skipped the dangling tick
+    assert "Failed to fetch the latest ticks of the sensors" in caplog.text
+    ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
+    assert len(ticks) == 2
+    validate_tick(ticks[0], sensor, freeze_datetime, TickStatus.SUCCESS)
+    assert ticks[1].tick_id == dangling_tick.tick_id
+    assert ticks[1].status == TickStatus.SKIPPED
+
+
+def test_batched_tick_update_failure(caplog, executor, instance, workspace_context, remote_repo):
+    freeze_datetime = create_datetime(year=2019, month=2, day=27, hour=23, minute=59, second=59)
+    sensor = remote_repo.get_sensor("run_key_sensor")
+    instance.add_instigator_state(
+        InstigatorState(
+            sensor.get_remote_origin(),
+            InstigatorType.SENSOR,
+            InstigatorStatus.RUNNING,
+        )
+    )
+    dangling_tick = instance.create_tick(
+        TickData(
+            instigator_origin_id=sensor.get_remote_origin_id(),
+            instigator_name=sensor.name,
+            instigator_type=InstigatorType.SENSOR,
+            status=TickStatus.STARTED,
+            timestamp=(freeze_datetime - relativedelta(days=1)).timestamp(),
+            selector_id=sensor.selector_id,
+        )
+    )
+
+    with (
+        freeze_time(freeze_datetime),
+        patch.object(
+            dg.DagsterInstance, "update_ticks", side_effect=Exception("batch write failed")
+        ),
+    ):
+        evaluate_sensors(workspace_context, executor)
+
+    # the dangling tick was moved into SKIPPED by the sensor itself
+    assert "Failed to move the dangling sensor ticks into SKIPPED" in caplog.text
+    ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
+    assert len(ticks) == 2
+    validate_tick(ticks[0], sensor, freeze_datetime, TickStatus.SUCCESS)
+    assert ticks[1].tick_id == dangling_tick.tick_id
+    assert ticks[1].status == TickStatus.SKIPPED
+
+
+def test_batched_resumable_tick_expires_before_evaluation(instance, remote_repo):
+    sensor = remote_repo.get_sensor("run_key_sensor")
+    sensor_state = InstigatorState(
+        sensor.get_remote_origin(),
+        InstigatorType.SENSOR,
+        InstigatorStatus.RUNNING,
+    )
+    logger = get_default_daemon_logger("SensorDaemon")
+    now = time.time()
+    interrupted_tick = instance.create_tick(
+        TickData(
+            instigator_origin_id=sensor.get_remote_origin_id(),
+            instigator_name=sensor.name,
+            instigator_type=InstigatorType.SENSOR,
+            status=TickStatus.STARTED,
+            timestamp=now - MAX_TIME_TO_RESUME_TICK_SECONDS + 1,
+            selector_id=sensor.selector_id,
+            run_requests=[dg.RunRequest(run_key="interrupted")],
+            reserved_run_ids=[make_new_run_id()],
+        )
+    )
+
+    # still resumable when the ticks of all the sensors are fetched
+    latest_ticks = _get_latest_ticks_for_evaluation(instance, [(sensor, sensor_state)], now, logger)
+    assert latest_ticks[sensor.selector_id].status == TickStatus.STARTED  # pyright: ignore[reportOptionalMemberAccess]
+
+    # but no longer when the sensor is evaluated, so it is skipped rather than left STARTED
+    tick = _get_evaluation_tick(instance, sensor, None, now + 10, logger, latest_ticks)
+    assert tick.tick_id != interrupted_tick.tick_id
+    ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
+    assert [t.tick_id for t in ticks] == [tick.tick_id, interrupted_tick.tick_id]
+    assert ticks[1].status == TickStatus.SKIPPED
+
+
 def test_duplicate_run_key_within_tick_launches_once(
     executor: ThreadPoolExecutor,
     instance: DagsterInstance,
@@ -1749,6 +1883,9 @@ def test_duplicate_run_key_within_tick_launches_once(
     with (
         freeze_time(freeze_datetime),
         patch.object(dg.DagsterInstance, "get_ticks", wraps=instance.get_ticks) as mock_get_ticks,
+        patch.object(
+            dg.DagsterInstance, "get_latest_ticks", wraps=instance.get_latest_ticks
+        ) as mock_get_latest_ticks,
     ):
         sensor = remote_repo.get_sensor("dup_run_key_sensor")
         instance.add_instigator_state(
@@ -1767,8 +1904,11 @@ def test_duplicate_run_key_within_tick_launches_once(
 
         evaluate_sensors(workspace_context, executor)
 
-        # call another time to get previous tick
-        assert mock_get_ticks.call_count == 2
+        # the previous tick is fetched with the latest ticks of the other sensors
+        assert mock_get_ticks.call_count == 1
+        mock_get_latest_ticks.assert_called_once_with(
+            [(sensor.get_remote_origin_id(), sensor.selector_id)]
+        )
 
         wait_for_all_runs_to_start(instance)
 
@@ -1776,7 +1916,7 @@ def test_duplicate_run_key_within_tick_launches_once(
         run = instance.get_runs()[0]
         assert run.tags["foo"] == "bar"
         ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
-        assert mock_get_ticks.call_count == 3
+        assert mock_get_ticks.call_count == 2
 
         assert len(ticks) == 1
         validate_tick(
@@ -1903,6 +2043,88 @@ def fake_sleep(s):
         assert sum(sleeps) == 65
 
 
+def test_custom_interval_sensor_wakes_at_deadline(
+    monkeypatch, executor, instance, workspace_context, remote_repo
+):
+    freeze_datetime = create_datetime(year=2019, month=2, day=28)
+
+    with ExitStack() as stack:
+        stack.enter_context(freeze_time(freeze_datetime))
+        sleeps = []
+
+        def fake_sleep(s):
+            sleeps.append(s)
+
+            stack.enter_context(freeze_time(get_current_datetime() + datetime.timedelta(seconds=s)))
+
+        monkeypatch.setattr(time, "sleep", fake_sleep)
+
+        shutdown_event = mock.MagicMock()
+        shutdown_event.wait.side_effect = fake_sleep
+
+        # 60 second custom interval
+        sensor = remote_repo.get_sensor("custom_interval_sensor")
+
+        instance.add_instigator_state(
+            InstigatorState(
+                sensor.get_remote_origin(),
+                InstigatorType.SENSOR,
+                InstigatorStatus.RUNNING,
+            )
+        )
+
+        evaluate_sensors(workspace_context, executor)
+        ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
+        assert len(ticks) == 1
+
+        # start the loop off of the loop interval, so that the loop has to cut its sleep short to
+        # evaluate the sensor as soon as it is due
+        fake_sleep(2)
+        list(
+            execute_sensor_iteration_loop(
+                workspace_context,
+                get_default_daemon_logger("dagster.daemon.SensorDaemon"),
+                shutdown_event=shutdown_event,
+                until=(freeze_datetime + relativedelta(seconds=65)).timestamp(),
+            )
+        )
+
+        ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
+        assert len(ticks) == 2
+        validate_tick(
+            ticks[0],
+            sensor,
+            freeze_datetime + relativedelta(seconds=60),
+            TickStatus.SKIPPED,
+        )
+        assert 3 in sleeps
+
+
+def test_sensor_deadline_queue():
+    queue = SensorDeadlineQueue()
+    assert queue.next_deadline() is None
+    assert queue.pop_due(100) == []
+
+    queue.schedule("a", 30, 30)
+    queue.schedule("b", 10, 10)
+    queue.schedule("c", 20, 10)
+    assert len(queue) == 3
+    assert queue.next_deadline() == 10
+
+    # rescheduling a sensor supersedes its earlier deadline
+    queue.schedule("b", 40, 10)
+    assert queue.next_deadline() == 20
+    assert queue.get_min_interval("b") == 10
+
+    assert queue.pop_due(5) == []
+    assert queue.pop_due(30) == ["c", "a"]
+    assert "a" not in queue
+    assert queue.next_deadline() == 40
+    assert queue.pop_due(40) == ["b"]
+    assert len(queue) == 0
+    assert queue.next_deadline() is None
+
+
 def test_sensor_start_stop(executor, instance, workspace_context, remote_repo):
     freeze_datetime = create_datetime(year=2019, month=2, day=27)
     with freeze_time(freeze_datetime):
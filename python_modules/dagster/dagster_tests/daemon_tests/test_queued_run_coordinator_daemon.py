@@ -25,6 +25,7 @@
 from dagster._core.workspace.context import WorkspaceRequestContext
 from dagster._core.workspace.load_target import EmptyWorkspaceTarget, PythonFileTarget
 from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
+from dagster._daemon.run_coordinator.run_queue_shards import get_run_shard
 from dagster._record import copy
 from dagster._time import create_datetime
 
@@ -1433,3 +1434,225 @@ def instance(self, run_coordinator_config, concurrency_config):  # pyright: igno
     @pytest.fixture()
     def daemon(self, page_size):
         return QueuedRunCoordinatorDaemon(interval_seconds=1, page_size=page_size)
+
+
+class TestIncrementalRunQueue:
+    FULL_SYNC_INTERVAL_SECONDS = 60
+
+    @pytest.fixture
+    def instance(self):
+        overrides = {
+            "run_coordinator": {
+                "module": "dagster._core.run_coordinator",
+                "class": "QueuedRunCoordinator",
+                "config": {
+                    "max_concurrent_runs": 2,
+                    "dequeue_full_sync_interval_seconds": self.FULL_SYNC_INTERVAL_SECONDS,
+                },
+            },
+            "run_launcher": {
+                "module": "dagster._core.test_utils",
+                "class": "MockedRunLauncher",
+                "config": {},
+            },
+        }
+
+        with dg.instance_for_test(overrides=overrides) as instance:
+            yield instance
+
+    @pytest.fixture()
+    def workspace_context(self, instance):
+        with create_test_daemon_workspace_context(
+            workspace_load_target=EmptyWorkspaceTarget(), instance=instance
+        ) as workspace_context:
+            yield workspace_context
+
+    @pytest.fixture(scope="module")
+    def job_handle(self) -> Iterator[JobHandle]:
+        with get_foo_job_handle() as handle:
+            yield handle
+
+    def create_run(self, instance, job_handle, **kwargs):
+        return create_run_for_test(
+            instance,
+            remote_job_origin=job_handle.get_remote_origin(),
+            job_code_origin=job_handle.get_python_origin(),
+            job_name="foo",
+            **kwargs,
+        )
+
+    def create_queued_run(self, instance, job_handle, **kwargs):
+        run = self.create_run(instance, job_handle, status=DagsterRunStatus.NOT_STARTED, **kwargs)
+        instance.report_dagster_event(DagsterEvent.job_enqueue(run), run_id=run.run_id)
+        return instance.get_run_by_id(run.run_id)
+
+    def launched_run_ids(self, instance):
+        return [run.run_id for run in instance.run_launcher.queue()]
+
+    def test_run_status_changes_applied_between_syncs(
+        self, instance, workspace_context, job_handle
+    ):
+        daemon = QueuedRunCoordinatorDaemon(interval_seconds=1, page_size=2)
+        start = time.time()
+
+        run_ids = [make_new_run_id() for _ in range(4)]
+        for run_id in run_ids[:3]:
+            self.create_queued_run(instance, job_handle, run_id=run_id)
+
+        list(daemon.run_iteration(workspace_context, fixed_iteration_time=start))
+        assert self.launched_run_ids(instance) == run_ids[:2]
+
+        # the launched runs are in progress, so no more runs can be launched
+        list(daemon.run_iteration(workspace_context, fixed_iteration_time=start + 1))
+        assert self.launched_run_ids(instance) == run_ids[:2]
+
+        # runs that finish and runs that are enqueued are picked up from the run status events
+        instance.report_run_failed(instance.get_run_by_id(run_ids[0]))
+        instance.report_run_failed(instance.get_run_by_id(run_ids[1]))
+        self.create_queued_run(instance, job_handle, run_id=run_ids[3])
+
+        list(daemon.run_iteration(workspace_context, fixed_iteration_time=start + 2))
+        assert self.launched_run_ids(instance) == run_ids
+
+    def test_full_sync(self, instance, workspace_context, job_handle):
+        daemon = QueuedRunCoordinatorDaemon(interval_seconds=1, page_size=2)
+        start = time.time()
+
+        in_progress_run = self.create_run(instance, job_handle, status=DagsterRunStatus.STARTED)
+        in_progress_run_2 = self.create_run(instance, job_handle, status=DagsterRunStatus.STARTED)
+        deleted_run = self.create_queued_run(instance, job_handle)
+
+        list(daemon.run_iteration(workspace_context, fixed_iteration_time=start))
+        assert self.launched_run_ids(instance) == []
+
+        instance.delete_run(deleted_run.run_id)
+        instance.report_run_failed(in_progress_run)
+        instance.report_run_failed(in_progress_run_2)
+        # a run moved into the queue without a run status event is only seen on the next full sync
+        unreported_run = self.create_run(instance, job_handle, status=DagsterRunStatus.QUEUED)
+
+        # the deleted run is still in memory, but is skipped when dequeued
+        list(daemon.run_iteration(workspace_context, fixed_iteration_time=start + 1))
+        assert self.launched_run_ids(instance) == []
+
+        list(
+            daemon.run_iteration(
+                workspace_context,
+                fixed_iteration_time=start + self.FULL_SYNC_INTERVAL_SECONDS,
+            )
+        )
+        assert self.launched_run_ids(instance) == [unreported_run.run_id]
+
+
+class TestShardedRunQueue:
+    NUM_SHARDS = 4
+    LEASE_DURATION_SECONDS = 30
+
+    @pytest.fixture
+    def instance(self):
+        overrides = {
+            "run_coordinator": {
+                "module": "dagster._core.run_coordinator",
+                "class": "QueuedRunCoordinator",
+                "config": {
+                    "max_concurrent_runs": 4,
+                    "dequeue_sharding": {
+                        "num_shards": self.NUM_SHARDS,
+                        "lease_duration_seconds": self.LEASE_DURATION_SECONDS,
+                    },
+                },
+            },
+            "run_launcher": {
+                "module": "dagster._core.test_utils",
+                "class": "MockedRunLauncher",
+                "config": {},
+            },
+        }
+
+        with dg.instance_for_test(overrides=overrides) as instance:
+            yield instance
+
+    @pytest.fixture()
+    def workspace_context(self, instance):
+        with create_test_daemon_workspace_context(
+            workspace_load_target=EmptyWorkspaceTarget(), instance=instance
+        ) as workspace_context:
+            yield workspace_context
+
+    @pytest.fixture(scope="module")
+    def job_handle(self) -> Iterator[JobHandle]:
+        with get_foo_job_handle() as handle:
+            yield handle
+
+    def create_queued_run(self, instance, job_handle, run_id):
+        run = create_run_for_test(
+            instance,
+            remote_job_origin=job_handle.get_remote_origin(),
+            job_code_origin=job_handle.get_python_origin(),
+            job_name="foo",
+            run_id=run_id,
+            status=DagsterRunStatus.NOT_STARTED,
+        )
+        instance.report_dagster_event(DagsterEvent.job_enqueue(run), run_id=run.run_id)
+        return instance.get_run_by_id(run.run_id)
+
+    def make_run_ids_in_shards(self, shards, count):
+        run_ids = []
+        while len(run_ids) < count:
+            run_id = make_new_run_id()
+            shard = get_run_shard(
+                dg.DagsterRun(job_name="foo", run_id=run_id), self.NUM_SHARDS, "run_id"
+            )
+            if shard in shards:
+                run_ids.append(run_id)
+        return run_ids
+
+    def launched_run_ids(self, instance):
+        return {run.run_id for run in instance.run_launcher.queue()}
+
+    def test_sharded_dequeue(self, instance, workspace_context, job_handle):
+        start = create_datetime(2024, 1, 1)
+        daemon_a = QueuedRunCoordinatorDaemon(interval_seconds=1)
+        daemon_b = QueuedRunCoordinatorDaemon(interval_seconds=1)
+        assert daemon_a.allows_multiple_replicas(instance)
+
+        with freeze_time(start):
+            # the replicas register themselves, and the shards are moved to the new replica
+            for daemon in [daemon_a, daemon_b, daemon_a, daemon_b]:
+                list(daemon.run_iteration(workspace_context))
+
+            shards_a = daemon_a._run_queue_shards.owned_shards  # noqa: SLF001
+            shards_b = daemon_b._run_queue_shards.owned_shards  # noqa: SLF001
+            assert len(shards_a) == len(shards_b) == self.NUM_SHARDS // 2
+            assert shards_a | shards_b == set(range(self.NUM_SHARDS))
+
+            run_ids_a = self.make_run_ids_in_shards(shards_a, 4)
+            run_ids_b = self.make_run_ids_in_shards(shards_b, 4)
+            for run_id in run_ids_a + run_ids_b:
+                self.create_queued_run(instance, job_handle, run_id)
+
+            # each replica only launches runs from its own shards
+            list(daemon_a.run_iteration(workspace_context))
+            assert self.launched_run_ids(instance) == set(run_ids_a)
+
+            # max_concurrent_runs applies across all the replicas
+            list(daemon_b.run_iteration(workspace_context))
+            assert self.launched_run_ids(instance) == set(run_ids_a)
+
+            instance.report_run_failed(instance.get_run_by_id(run_ids_a[0]))
+            instance.report_run_failed(instance.get_run_by_id(run_ids_a[1]))
+            list(daemon_b.run_iteration(workspace_context))
+            launched_run_ids = self.launched_run_ids(instance)
+            assert len(launched_run_ids) == 6
+            assert len(launched_run_ids & set(run_ids_b)) == 2
+
+            for run_id in launched_run_ids:
+                instance.report_run_failed(instance.get_run_by_id(run_id))
+
+        # replica a stops, so its leases expire and its shards are moved to replica b
+        with freeze_time(start + datetime.timedelta(seconds=self.LEASE_DURATION_SECONDS + 1)):
+            list(daemon_b.run_iteration(workspace_context))
+            assert daemon_b._run_queue_shards.owned_shards == set(  # noqa: SLF001
+                range(self.NUM_SHARDS)
+            )
+            assert self.launched_run_ids(instance) == set(run_ids_a + run_ids_b)
@@ -0,0 +1,95 @@
+import dagster as dg
+from dagster import AutomationCondition
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    get_independent_entity_key_levels,
+)
+from dagster._core.instance import DagsterInstance
+
+
+def _get_asset_graph():
+    @dg.asset
+    def a1() -> None: ...
+
+    @dg.asset(deps=[a1])
+    def a2() -> None: ...
+
+    @dg.asset(deps=[a2], check_specs=[dg.AssetCheckSpec("c", asset="a3")])
+    def a3(): ...
+
+    @dg.asset
+    def b1() -> None: ...
+
+    @dg.asset(deps=[b1])
+    def b2() -> None: ...
+
+    @dg.asset
+    def lone() -> None: ...
+
+    # not subsettable, so x and y are requested together
+    @dg.multi_asset(specs=[dg.AssetSpec("x"), dg.AssetSpec("y")])
+    def xy(): ...
+
+    return dg.Definitions(assets=[a1, a2, a3, b1, b2, lone, xy]).resolve_asset_graph()
+
+
+def _as_set(levels):
+    # the order of independent groups is not part of what is checked here
+    return {tuple(tuple(level) for level in component) for component in levels}
+
+
+def test_independent_entity_key_levels() -> None:
+    asset_graph = _get_asset_graph()
+    ak = dg.AssetKey
+    check_key = dg.AssetCheckKey(ak("a3"), "c")
+
+    levels = get_independent_entity_key_levels(
+        asset_graph, {node.key for node in asset_graph.nodes}
+    )
+    assert _as_set(levels) == _as_set(
+        [
+            [[ak("a1")], [ak("a2")], [ak("a3")], [check_key]],
+            [[ak("b1")], [ak("b2")]],
+            [[ak("lone")]],
+            [[ak("x"), ak("y")]],
+        ]
+    )
+
+    # a2 is not evaluated, so a1 and a3 don't depend on each other within an evaluation
+    levels = get_independent_entity_key_levels(
+        asset_graph, {ak("a1"), ak("a3"), check_key, ak("x"), ak("b2")}
+    )
+    assert _as_set(levels) == _as_set(
+        [
+            [[ak("a1")]],
+            [[ak("a3")], [check_key]],
+            [[ak("b2")]],
+            [[ak("x")]],
+        ]
+    )
+
+
+def test_results_in_topological_order() -> None:
+    @dg.asset(automation_condition=AutomationCondition.missing())
+    def root() -> None: ...
+
+    chain = [root]
+    for i in range(5):
+        chain.append(
+            dg.asset(
+                name=f"chain_{i}",
+                deps=[chain[-1]],
+                automation_condition=AutomationCondition.missing(),
+            )(lambda: None)
+        )
+    lone_assets = [
+        dg.asset(name=f"lone_{i}", automation_condition=AutomationCondition.missing())(lambda: None)
+        for i in range(5)
+    ]
+    defs = dg.Definitions(assets=[*chain, *lone_assets])
+    topo_order = [
+        key for level in defs.resolve_asset_graph().toposorted_entity_keys_by_level for key in level
+    ]
+
+    result = dg.evaluate_automation_conditions(defs=defs, instance=DagsterInstance.ephemeral())
+    assert [r.key for r in result.results] == topo_order
+    assert result.total_requested == 11
@@ -2085,3 +2085,80 @@ def test_reverse_pagination_negative_end_offset():
     assert get_paginated_partition_keys(
         partitions_def, current_time=current_time, ascending=False
     ) == list(reversed(all_keys))
+
+
+@pytest.mark.parametrize(
+    "cron_schedule, fmt",
+    [
+        ("0 * * * *", "%Y-%m-%d-%H:%M"),
+        ("15 * * * *", "%Y-%m-%d-%H:%M"),
+        ("*/15 * * * *", "%Y-%m-%d-%H:%M"),
+        ("30 7 * * *", "%Y-%m-%d"),
+        ("5 3 * * 3", "%Y-%m-%d"),
+        ("0 0 * * 7", "%Y-%m-%d"),
+        ("10 4 15 * *", "%Y-%m-%d"),
+        ("0 0 1 * *", "%Y-%m-%d%z"),
+    ],
+)
+@pytest.mark.parametrize("end_offset", [0, 2, -1])
+def test_time_window_partitions_arithmetic_fast_path(monkeypatch, cron_schedule, fmt, end_offset):
+    from dagster._core.definitions.partitions.definition import time_window
+
+    kwargs = dict(
+        start=create_datetime(2021, 3, 4, 5, 6),
+        end=create_datetime(2023, 2, 1),
+        fmt=fmt,
+        cron_schedule=cron_schedule,
+        end_offset=end_offset,
+    )
+    fast_partitions_def = TimeWindowPartitionsDefinition(**kwargs)
+    assert fast_partitions_def._cron_ticks is not None  # noqa: SLF001
+    with monkeypatch.context() as m:
+        m.setattr(time_window, "get_cron_ticks", lambda *args: None)
+        partitions_def = TimeWindowPartitionsDefinition(**kwargs)
+        assert partitions_def._cron_ticks is None  # noqa: SLF001
+
+    for current_time in [create_datetime(2021, 1, 1), create_datetime(2022, 6, 1, 0, 1)]:
+        with partition_loading_context(current_time):
+            partition_keys = partitions_def.get_partition_keys()
+            assert fast_partitions_def.get_partition_keys() == partition_keys
+            assert (
+                fast_partitions_def.get_last_partition_window()
+                == partitions_def.get_last_partition_window()
+            )
+            assert fast_partitions_def.get_num_partitions() == partitions_def.get_num_partitions()
+            assert fast_partitions_def.get_partition_keys_between_indexes(
+                2, 7
+            ) == partitions_def.get_partition_keys_between_indexes(2, 7)
+
+            for index in [0, len(partition_keys) // 2, len(partition_keys) - 1]:
+                if not partition_keys:
+                    break
+                partition_key = partition_keys[index]
+                assert fast_partitions_def.get_partition_key_at_index(index) == partition_key
+                assert fast_partitions_def.get_index_of_partition_key(partition_key) == index
+                assert fast_partitions_def.time_window_for_partition_key(
+                    partition_key
+                ) == partitions_def.time_window_for_partition_key(partition_key)
+                assert fast_partitions_def.get_partition_key_for_timestamp(
+                    current_time.timestamp() - 1
+                ) == partitions_def.get_partition_key_for_timestamp(current_time.timestamp() - 1)
+
+            if len(partition_keys) > 2:
+                key_range = dg.PartitionKeyRange(partition_keys[1], partition_keys[-1])
+                assert fast_partitions_def.get_partition_keys_in_range(
+                    key_range
+                ) == partitions_def.get_partition_keys_in_range(key_range)
+
+    with pytest.raises(ValueError):
+        fast_partitions_def.get_index_of_partition_key("2020-01-01")
+
+
+def test_time_window_partitions_no_fast_path_with_dst():
+    partitions_def = dg.DailyPartitionsDefinition(
+        start_date="2021-01-01", timezone="America/Los_Angeles"
+    )
+    assert partitions_def._cron_ticks is None  # noqa: SLF001
+    with partition_loading_context(create_datetime(2021, 1, 10)):
+        assert partitions_def.get_partition_key_at_index(3) == "2021-01-04"
+        assert partitions_def.get_index_of_partition_key("2021-01-04") == 3
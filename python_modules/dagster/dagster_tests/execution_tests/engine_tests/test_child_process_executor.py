@@ -1,16 +1,23 @@
 import os
+import threading
 import time
 from multiprocessing import get_context
 from multiprocessing.process import BaseProcess
 
 import pytest
 from dagster._core.executor.child_process_executor import (
+    PROCESS_DEAD_AND_QUEUE_EMPTY,
+    TICK,
     ChildProcessCommand,
     ChildProcessCrashException,
     ChildProcessDoneEvent,
     ChildProcessEvent,
+    ChildProcessEventMultiplexer,
+    ChildProcessEventReader,
+    ChildProcessEventSender,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    _poll_for_event,
     execute_child_process_command,
 )
 from dagster._utils import segfault
@@ -47,6 +54,49 @@ def execute(self):  # pyright: ignore[reportIncompatibleMethodOverride]
         segfault()
 
 
+class SleepThenYieldCommand(ChildProcessCommand):
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def execute(self):
+        time.sleep(self.seconds)
+        yield self.seconds
+
+
+class YieldThenCrashCommand(ChildProcessCommand):
+    def execute(self):
+        yield "before crash"
+        time.sleep(0.1)
+        os._exit(1)
+
+
+class BlockingPickle:
+    """Blocks the sender thread while it is being pickled, until released."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.released = threading.Event()
+
+    def __reduce__(self):
+        self.started.set()
+        self.released.wait()
+        return (str, ("blocked",))
+
+
+def _close_pipe_and_sleep(connection, seconds):
+    connection.close()
+    time.sleep(seconds)
+
+
+def _drain(event_reader):
+    events = []
+    while not event_reader.at_eof:
+        event = event_reader.get(TICK)
+        if event is not None:
+            events.append(event)
+    return events
+
+
 class LongRunningCommand(ChildProcessCommand):
     def execute(self):  # pyright: ignore[reportIncompatibleMethodOverride]
         time.sleep(0.5)
@@ -115,3 +165,111 @@ def test_child_process_segfault():
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing_ctx, LongRunningCommand()))
+
+
+def test_event_sender_batches_events_put_during_a_send():
+    read_connection, write_connection = multiprocessing_ctx.Pipe(duplex=False)
+    sender = ChildProcessEventSender(write_connection)
+    blocking = BlockingPickle()
+    sender.put(blocking)
+    assert blocking.started.wait(5)
+
+    # the sender thread is busy sending the first batch, so these are sent together
+    for i in range(10):
+        sender.put(i)
+    blocking.released.set()
+    sender.close()
+
+    assert read_connection.recv() == ["blocked"]
+    assert read_connection.recv() == list(range(10))
+    with pytest.raises(EOFError):
+        read_connection.recv()
+    read_connection.close()
+
+
+def test_event_sender_skips_unpicklable_event():
+    read_connection, write_connection = multiprocessing_ctx.Pipe(duplex=False)
+    sender = ChildProcessEventSender(write_connection)
+    blocking = BlockingPickle()
+    sender.put(blocking)
+    assert blocking.started.wait(5)
+
+    # sent in a single batch that fails to pickle, so the events are then sent one at a time
+    sender.put(1)
+    sender.put(lambda: None)
+    sender.put(2)
+    blocking.released.set()
+    sender.close()
+
+    event_reader = ChildProcessEventReader(read_connection)
+    assert _drain(event_reader) == ["blocked", 1, 2]
+    assert event_reader.get(0) is None
+    event_reader.close()
+
+
+def test_poll_waits_for_exit_after_eof():
+    read_connection, write_connection = multiprocessing_ctx.Pipe(duplex=False)
+    process = multiprocessing_ctx.Process(
+        target=_close_pipe_and_sleep, args=(write_connection, 0.5)
+    )
+    process.start()
+    write_connection.close()
+    event_reader = ChildProcessEventReader(read_connection)
+
+    # the pipe reaches EOF well before the process exits, which is waited on rather than
+    # polling the readable end of the pipe in a loop
+    num_polls = 0
+    while _poll_for_event(process, event_reader) != PROCESS_DEAD_AND_QUEUE_EMPTY:
+        num_polls += 1
+    assert event_reader.at_eof
+    assert num_polls <= 0.5 / TICK + 5
+    process.join()
+    event_reader.close()
+
+
+def test_multiplexed_child_process_crash():
+    event_multiplexer = ChildProcessEventMultiplexer()
+    events = []
+    with pytest.raises(ChildProcessCrashException) as exc:
+        for event in execute_child_process_command(
+            multiprocessing_ctx, YieldThenCrashCommand(), event_multiplexer
+        ):
+            if event is None:
+                event_multiplexer.wait(5)
+            elif not isinstance(event, (ChildProcessEvent, BaseProcess)):
+                events.append(event)
+    assert exc.value.exit_code == 1
+    assert events == ["before crash"]
+
+
+def test_multiplexer_wakes_on_any_child():
+    event_multiplexer = ChildProcessEventMultiplexer()
+    start = time.time()
+    iterators = [
+        execute_child_process_command(
+            multiprocessing_ctx, SleepThenYieldCommand(seconds), event_multiplexer
+        )
+        for seconds in [0.2, 0.4, 10]
+    ]
+    processes = []
+    results = []
+    while len(results) < 2:
+        made_progress = False
+        for iterator in iterators:
+            event = next(iterator, None)
+            if isinstance(event, BaseProcess):
+                processes.append(event)
+            elif event is not None and not isinstance(event, ChildProcessEvent):
+                results.append(event)
+            made_progress = made_progress or event is not None
+        if not made_progress:
+            event_multiplexer.wait(30)
+
+    # woken by each of the two fast children, rather than waiting on the slow one
+    assert results == [0.2, 0.4]
+    assert time.time() - start < 10
+
+    processes[-1].kill()
+    processes[-1].join()
+    for iterator in iterators:
+        iterator.close()
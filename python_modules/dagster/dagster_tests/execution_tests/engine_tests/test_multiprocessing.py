@@ -1,6 +1,8 @@
+import multiprocessing
 import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 import dagster as dg
 import pytest
@@ -56,6 +58,36 @@ def test_explicit_spawn():
             assert result.output_for_node("adder") == 11
 
 
+@pytest.mark.parametrize("max_steps_per_worker, expected_num_workers", [(None, 1), (2, 2), (1, 4)])
+def test_worker_pool_execution(max_steps_per_worker, expected_num_workers):
+    with dg.instance_for_test() as instance:
+        recon_job = dg.reconstructable(define_diamond_job)
+        with dg.execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "max_concurrent": 1,
+                            "worker_pool": {"max_steps_per_worker": max_steps_per_worker},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            worker_pids = {
+                event.pid
+                for event in result.all_events
+                if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+            }
+            assert len(worker_pids) == expected_num_workers
+            assert os.getpid() not in worker_pids
+
+
 @pytest.mark.skipif(os.name == "nt", reason="No forkserver on windows")
 def test_forkserver_execution():
     with dg.instance_for_test() as instance:
@@ -95,6 +127,56 @@ def test_forkserver_preload():
 }
 
 
+# pid of the process that most recently loaded define_preload_check_job
+_preload_check_job_loaded_in_pid = None
+
+
+def define_preload_check_job() -> dg.JobDefinition:
+    global _preload_check_job_loaded_in_pid  # noqa: PLW0603
+    _preload_check_job_loaded_in_pid = os.getpid()
+
+    @dg.op
+    def loaded_in_other_process() -> bool:
+        return _preload_check_job_loaded_in_pid != os.getpid()
+
+    @dg.job
+    def preload_check_job():
+        loaded_in_other_process()
+
+    return preload_check_job
+
+
+def _execute_preload_check_job(start_method_config) -> bool:
+    with dg.instance_for_test() as instance:
+        with dg.execute_job(
+            dg.reconstructable(define_preload_check_job),
+            run_config={
+                "execution": {"config": {"multiprocess": {"start_method": start_method_config}}},
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            return result.output_for_node("loaded_in_other_process")
+
+
+@pytest.mark.skipif(os.name == "nt", reason="No forkserver on windows")
+@pytest.mark.parametrize(
+    "start_method_config, expected_preloaded",
+    [
+        ({"spawn": {}}, False),
+        ({"forkserver": {}}, False),
+        ({"forkserver": {"preload_definitions": True}}, True),
+    ],
+)
+def test_forkserver_preload_definitions(start_method_config, expected_preloaded):
+    # the forkserver is started once per process, so each case runs in a new process
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        preloaded = executor.submit(_execute_preload_check_job, start_method_config).result()
+    assert preloaded == expected_preloaded
+
+
 def define_diamond_job() -> dg.JobDefinition:
     @dg.op
     def return_two():
@@ -422,6 +504,21 @@ def test_crash_multiprocessing():
             # )
 
 
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_crash_worker_pool():
+    with dg.instance_for_test() as instance:
+        with dg.execute_job(
+            dg.reconstructable(sys_exit_job),
+            run_config={"execution": {"config": {"multiprocess": {"worker_pool": {}}}}},
+            instance=instance,
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("sys_exit")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"  # pyright: ignore[reportOptionalMemberAccess]
+
+
 # segfault test
 @dg.op
 def segfault_op(context):
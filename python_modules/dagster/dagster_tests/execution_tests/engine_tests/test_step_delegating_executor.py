@@ -590,3 +590,120 @@ def _unblock_concurrency_key(instance, timeout):
                 # second that the steps are blocked, in addition to the processing of any step
                 # events
                 assert instance.event_log_storage.get_records_for_run_calls(result.run_id) <= 3  # pyright: ignore[reportAttributeAccessIssue]
+
+
+class BatchingStepHandler(TestStepHandler):
+    launch_batch_sizes: list[int] = []
+    health_check_batch_sizes: list[int] = []
+    fail_batched_health_checks = False
+
+    @property
+    def name(self):
+        return "BatchingStepHandler"
+
+    def launch_steps(self, step_handler_contexts):
+        BatchingStepHandler.launch_batch_sizes.append(len(step_handler_contexts))
+        return super().launch_steps(step_handler_contexts)
+
+    def check_steps_health(self, step_handler_contexts):
+        BatchingStepHandler.health_check_batch_sizes.append(len(step_handler_contexts))
+        if BatchingStepHandler.fail_batched_health_checks:
+            raise Exception("Batched health check failed")
+        return {
+            step_handler_context.execute_step_args.step_keys_to_execute[0]: (  # pyright: ignore[reportOptionalSubscript]
+                CheckStepHealthResult.healthy()
+            )
+            for step_handler_context in step_handler_contexts
+        }
+
+    @classmethod
+    def reset(cls):
+        TestStepHandler.reset()
+        cls.launch_batch_sizes = []
+        cls.health_check_batch_sizes = []
+        cls.fail_batched_health_checks = False
+
+
+@dg.executor(
+    name="batching_step_delegating_executor",
+    requirements=dg.multiple_process_executor_requirements(),
+    config_schema=dg.Permissive(),
+)
+def batching_step_delegating_executor(exc_init):
+    return StepDelegatingExecutor(
+        BatchingStepHandler(),
+        **(merge_dicts({"retries": RetryMode.DISABLED}, exc_init.executor_config)),
+    )
+
+
+@dg.job(executor_def=batching_step_delegating_executor)
+def batching_three_op_job():
+    for i in range(3):
+        slow_op.alias(f"slow_op_{i}")()
+
+
+@pytest.mark.parametrize("fail_batched_health_checks", [False, True])
+def test_batched_launches_and_health_checks(fail_batched_health_checks):
+    BatchingStepHandler.reset()
+    BatchingStepHandler.fail_batched_health_checks = fail_batched_health_checks
+    with dg.instance_for_test() as instance:
+        result = dg.execute_job(
+            dg.reconstructable(batching_three_op_job),
+            instance=instance,
+            run_config={"execution": {"config": {"check_step_health_interval_seconds": 0}}},
+        )
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    # the three steps are ready at once, so are launched together
+    assert BatchingStepHandler.launch_batch_sizes == [3]
+    assert TestStepHandler.launch_step_count == 3
+    # and their health is checked together while they are all running
+    assert 3 in BatchingStepHandler.health_check_batch_sizes
+    if fail_batched_health_checks:
+        # each step is checked separately when the batched check fails
+        assert TestStepHandler.check_step_health_count >= 3
+    else:
+        assert TestStepHandler.check_step_health_count == 0
+
+
+class FailingLaunchStepHandler(TestStepHandler):
+    @property
+    def name(self):
+        return "FailingLaunchStepHandler"
+
+    def launch_step(self, step_handler_context):
+        raise Exception("Launch failed")
+
+
+@dg.executor(
+    name="failing_launch_step_delegating_executor",
+    requirements=dg.multiple_process_executor_requirements(),
+    config_schema=dg.Permissive(),
+)
+def failing_launch_step_delegating_executor(exc_init):
+    return StepDelegatingExecutor(
+        FailingLaunchStepHandler(),
+        **(merge_dicts({"retries": RetryMode.DISABLED}, exc_init.executor_config)),
+    )
+
+
+@dg.job(executor_def=failing_launch_step_delegating_executor)
+def failing_launch_job():
+    for i in range(2):
+        slow_op.alias(f"slow_op_{i}")()
+
+
+def test_failed_launch_does_not_terminate_unlaunched_steps():
+    TestStepHandler.reset()
+    with dg.instance_for_test() as instance:
+        result = dg.execute_job(
+            dg.reconstructable(failing_launch_job), instance=instance, raise_on_error=False
+        )
+
+    assert not result.success
+    # the steps were never launched, so the launch error is reported rather than an error from
+    # terminating them
+    assert TestStepHandler.terminate_step_count == 0
+    (run_failure_event,) = [event for event in result.all_events if event.is_run_failure]
+    assert "Launch failed" in str(run_failure_event)
@@ -0,0 +1,208 @@
+import asyncio
+import threading
+import time
+
+import dagster as dg
+from dagster._core.events import DagsterEventType
+
+NUM_OPS = 4
+
+_lock = threading.Lock()
+_running: dict[str, int] = {"current": 0, "max": 0}
+_event_loops: set[int] = set()
+
+
+def _reset_counters() -> None:
+    _running["current"] = 0
+    _running["max"] = 0
+    _event_loops.clear()
+
+
+class _track_running:
+    def __enter__(self):
+        with _lock:
+            _running["current"] += 1
+            _running["max"] = max(_running["max"], _running["current"])
+
+    def __exit__(self, *args):
+        with _lock:
+            _running["current"] -= 1
+
+
+@dg.op
+def sleepy_op() -> int:
+    with _track_running():
+        time.sleep(0.3)
+    return 1
+
+
+@dg.op(tags={"database": "warehouse"})
+def warehouse_op() -> int:
+    with _track_running():
+        time.sleep(0.3)
+    return 1
+
+
+@dg.op
+async def async_sleepy_op() -> int:
+    _event_loops.add(id(asyncio.get_running_loop()))
+    with _track_running():
+        await asyncio.sleep(0.3)
+    return 1
+
+
+@dg.op
+def total(values: list[int]) -> int:
+    return sum(values)
+
+
+def define_sleepy_job():
+    @dg.job(executor_def=dg.threadpool_executor)
+    def sleepy_job():
+        total([sleepy_op.alias(f"sleepy_{i}")() for i in range(NUM_OPS)])
+
+    return sleepy_job
+
+
+def define_warehouse_job():
+    @dg.job(executor_def=dg.threadpool_executor)
+    def warehouse_job():
+        total([warehouse_op.alias(f"warehouse_{i}")() for i in range(NUM_OPS)])
+
+    return warehouse_job
+
+
+def define_async_job():
+    @dg.job(executor_def=dg.threadpool_executor)
+    def async_job():
+        total([async_sleepy_op.alias(f"async_{i}")() for i in range(NUM_OPS)])
+
+    return async_job
+
+
+def test_threadpool_executor_runs_steps_concurrently():
+    _reset_counters()
+    with dg.instance_for_test() as instance:
+        with dg.execute_job(
+            dg.reconstructable(define_sleepy_job),
+            instance=instance,
+            run_config={"execution": {"config": {"max_concurrent": NUM_OPS}}},
+        ) as result:
+            assert result.success
+            assert result.output_for_node("total") == NUM_OPS
+    assert _running["max"] == NUM_OPS
+
+
+def test_threadpool_executor_max_concurrent():
+    _reset_counters()
+    with dg.instance_for_test() as instance:
+        with dg.execute_job(
+            dg.reconstructable(define_sleepy_job),
+            instance=instance,
+            run_config={"execution": {"config": {"max_concurrent": 2}}},
+        ) as result:
+            assert result.success
+            assert result.output_for_node("total") == NUM_OPS
+    assert _running["max"] == 2
+
+
+def test_threadpool_executor_tag_concurrency_limits():
+    _reset_counters()
+    with dg.instance_for_test() as instance:
+        with dg.execute_job(
+            dg.reconstructable(define_warehouse_job),
+            instance=instance,
+            run_config={
+                "execution": {
+                    "config": {
+                        "max_concurrent": NUM_OPS,
+                        "tag_concurrency_limits": [
+                            {"key": "database", "value": "warehouse", "limit": 1}
+                        ],
+                    }
+                }
+            },
+        ) as result:
+            assert result.success
+    assert _running["max"] == 1
+
+
+def test_threadpool_executor_shares_event_loop():
+    _reset_counters()
+    with dg.instance_for_test() as instance:
+        with dg.execute_job(
+            dg.reconstructable(define_async_job),
+            instance=instance,
+            run_config={"execution": {"config": {"max_concurrent": NUM_OPS}}},
+        ) as result:
+            assert result.success
+            assert result.output_for_node("total") == NUM_OPS
+    assert _running["max"] == NUM_OPS
+    assert len(_event_loops) == 1
+
+
+@dg.op
+def fails() -> int:
+    raise Exception("failed")
+
+
+@dg.op
+def downstream(value: int) -> int:
+    return value
+
+
+_hook_calls: list[str] = []
+
+
+@dg.failure_hook
+def record_failure(context):
+    _hook_calls.append(context.op.name)
+
+
+_attempts: dict[str, int] = {"count": 0}
+
+
+@dg.op(retry_policy=dg.RetryPolicy(max_retries=2))
+def flaky() -> int:
+    _attempts["count"] += 1
+    if _attempts["count"] < 3:
+        raise Exception("flaky")
+    return 1
+
+
+def define_failing_job():
+    @dg.job(executor_def=dg.threadpool_executor, hooks={record_failure})
+    def failing_job():
+        downstream(fails())
+        sleepy_op()
+        downstream.alias("flaky_downstream")(flaky())
+
+    return failing_job
+
+
+def test_threadpool_executor_failures_and_retries():
+    _hook_calls.clear()
+    _attempts["count"] = 0
+    with dg.instance_for_test() as instance:
+        with dg.execute_job(dg.reconstructable(define_failing_job), instance=instance) as result:
+            assert not result.success
+            step_events = {
+                event.step_key: event.event_type
+                for event in result.all_events
+                if event.event_type
+                in {
+                    DagsterEventType.STEP_SUCCESS,
+                    DagsterEventType.STEP_FAILURE,
+                    DagsterEventType.STEP_SKIPPED,
+                }
+            }
+            # steps downstream of a failure are not executed
+            assert step_events == {
+                "fails": DagsterEventType.STEP_FAILURE,
+                "sleepy_op": DagsterEventType.STEP_SUCCESS,
+                "flaky": DagsterEventType.STEP_SUCCESS,
+                "flaky_downstream": DagsterEventType.STEP_SUCCESS,
+            }
+            assert result.output_for_node("flaky_downstream") == 1
+    assert _attempts["count"] == 3
+    assert _hook_calls == ["fails"]
@@ -0,0 +1,218 @@
+import time
+
+import dagster as dg
+import pytest
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.critical_path import (
+    get_critical_path_lengths,
+    get_critical_path_sort_key_fn,
+    get_historical_step_durations,
+    get_step_sort_key_fn,
+    simulate_makespan,
+)
+from dagster._core.storage.tags import PRIORITY_TAG, STEP_PRIORITIZATION_TAG
+
+
+@dg.op
+def short() -> int:
+    return 1
+
+
+@dg.op
+def slow() -> int:
+    time.sleep(0.3)
+    return 1
+
+
+@dg.op
+def chain_start() -> int:
+    return 1
+
+
+@dg.op
+def chain_end(value: int) -> int:
+    return value
+
+
+@dg.job
+def history_job():
+    slow()
+    chain_end(chain_start())
+
+
+@dg.op(out=dg.DynamicOut())
+def emit():
+    for i in range(3):
+        yield dg.DynamicOutput(i, mapping_key=str(i))
+
+
+@dg.op
+def double(x: int) -> int:
+    return x * 2
+
+
+@dg.op
+def total(values: list[int]) -> int:
+    return sum(values)
+
+
+@dg.job
+def dynamic_job():
+    total(emit().map(double).collect())
+    short()
+
+
+def _get_step_order(sort_key_fn, plan):
+    return sorted(
+        plan.get_steps_to_execute_in_topo_order(),
+        key=lambda step: (sort_key_fn(step), step.key),
+    )
+
+
+def test_critical_path_lengths():
+    step_deps = {"a": set(), "b": {"a"}, "c": {"a"}, "d": {"b", "c"}, "e": set()}
+    durations = {"a": 1.0, "b": 5.0, "c": 2.0, "d": 1.0}
+    # e has no known duration, so is assumed to take the median of the known durations
+    assert get_critical_path_lengths(step_deps, durations) == {
+        "a": 7.0,
+        "b": 6.0,
+        "c": 3.0,
+        "d": 1.0,
+        "e": 1.5,
+    }
+    assert get_critical_path_lengths(step_deps, {}) == {
+        "a": 3.0,
+        "b": 2.0,
+        "c": 2.0,
+        "d": 1.0,
+        "e": 1.0,
+    }
+
+
+def test_simulate_makespan():
+    step_deps = {
+        "a1": set(),
+        "a2": set(),
+        "a3": set(),
+        "a4": set(),
+        "z1": set(),
+        "z2": {"z1"},
+        "z3": {"z2"},
+    }
+    durations = {key: 1.0 for key in step_deps}
+
+    # ordered by key, the chain starts only once the independent steps are done
+    assert simulate_makespan(step_deps, durations, 2, lambda _step_key: 0.0) == 5.0
+
+    lengths = get_critical_path_lengths(step_deps, durations)
+    assert simulate_makespan(step_deps, durations, 2, lambda step_key: -lengths[step_key]) == 4.0
+
+    # without a concurrency limit, the order makes no difference
+    assert simulate_makespan(step_deps, durations, 10, lambda _step_key: 0.0) == 3.0
+
+
+def test_critical_path_sort_key_fn():
+    plan = create_execution_plan(dynamic_job)
+    sort_key_fn = get_critical_path_sort_key_fn(plan, {})
+    # the dynamic chain unlocks the most steps
+    assert [step.key for step in _get_step_order(sort_key_fn, plan)] == ["emit", "short"]
+
+    sort_key_fn = get_critical_path_sort_key_fn(
+        plan, {"emit": 1.0, "double": 1.0, "total": 1.0, "short": 10.0}
+    )
+    assert [step.key for step in _get_step_order(sort_key_fn, plan)] == ["short", "emit"]
+
+
+def test_priority_tag_takes_precedence():
+    @dg.op(tags={PRIORITY_TAG: "1"})
+    def prioritized() -> int:
+        return 1
+
+    @dg.job
+    def prioritized_job():
+        prioritized()
+        chain_end(chain_start())
+
+    plan = create_execution_plan(prioritized_job)
+    sort_key_fn = get_critical_path_sort_key_fn(plan, {"chain_start": 10.0, "chain_end": 10.0})
+    assert [step.key for step in _get_step_order(sort_key_fn, plan)] == [
+        "prioritized",
+        "chain_start",
+        "chain_end",
+    ]
+
+
+def test_historical_step_durations():
+    with dg.instance_for_test() as instance:
+        assert get_historical_step_durations(instance, "dynamic_job") == {}
+
+        assert dynamic_job.execute_in_process(instance=instance).success
+        durations = get_historical_step_durations(instance, "dynamic_job")
+        # the mapped steps share the durations of their node
+        assert set(durations.keys()) == {"emit", "double", "total", "short"}
+
+        assert history_job.execute_in_process(instance=instance).success
+        plan = create_execution_plan(history_job)
+        durations = get_historical_step_durations(instance, "history_job")
+        assert durations["slow"] >= 0.3
+
+        # the chain has more steps, but the single slow step takes longer
+        sort_key_fn = get_critical_path_sort_key_fn(plan, durations)
+        assert _get_step_order(sort_key_fn, plan)[0].key == "slow"
+        sort_key_fn = get_critical_path_sort_key_fn(plan, {})
+        assert _get_step_order(sort_key_fn, plan)[0].key == "chain_start"
+
+
+def test_step_sort_key_fn_from_tags():
+    plan = create_execution_plan(history_job)
+    with dg.instance_for_test() as instance:
+        run = instance.create_run_for_job(history_job)
+        assert get_step_sort_key_fn(instance, run, plan) is None
+
+        run = instance.create_run_for_job(
+            history_job, tags={STEP_PRIORITIZATION_TAG: "critical_path"}
+        )
+        assert get_step_sort_key_fn(instance, run, plan) is not None
+
+        with pytest.raises(dg.DagsterInvalidDefinitionError, match="fastest"):
+            instance.create_run_for_job(history_job, tags={STEP_PRIORITIZATION_TAG: "fastest"})
+
+    with pytest.raises(dg.DagsterInvalidDefinitionError, match="fastest"):
+
+        @dg.job(tags={STEP_PRIORITIZATION_TAG: "fastest"})
+        def invalid_job():
+            short()
+
+    # runs stored before the tag was validated fall back to ordering steps by priority alone
+    run = dg.DagsterRun(job_name="history_job", tags={STEP_PRIORITIZATION_TAG: "fastest"})
+    with dg.instance_for_test() as instance:
+        assert get_step_sort_key_fn(instance, run, plan) is None
+
+
+@dg.op
+def aside() -> int:
+    return 1
+
+
+def define_threadpool_job():
+    @dg.job(executor_def=dg.threadpool_executor)
+    def threadpool_job():
+        aside()
+        chain_end(chain_start())
+
+    return threadpool_job
+
+
+@pytest.mark.parametrize("prioritization", [None, "critical_path"])
+def test_threadpool_execution_order(prioritization):
+    with dg.instance_for_test() as instance:
+        with dg.execute_job(
+            dg.reconstructable(define_threadpool_job),
+            instance=instance,
+            run_config={"execution": {"config": {"max_concurrent": 1}}},
+            tags={STEP_PRIORITIZATION_TAG: prioritization} if prioritization else None,
+        ) as result:
+            assert result.success
+            step_starts = [event.step_key for event in result.all_events if event.is_step_start]
+    # with one step at a time, steps otherwise start in the order they became executable
+    assert step_starts[0] == ("chain_start" if prioritization else "aside")
@@ -0,0 +1,182 @@
+import os
+from unittest import mock
+
+import dagster as dg
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.plan_cache import (
+    EXECUTION_PLAN_CACHE_DIR_ENV_VAR,
+    EXECUTION_PLAN_CACHE_MAX_ENTRIES_ENV_VAR,
+)
+from dagster._core.execution.plan.state import KnownExecutionState
+from dagster._core.snap.execution_plan_snapshot import snapshot_from_execution_plan
+
+
+@dg.op(out=dg.DynamicOut())
+def emit():
+    for i in range(3):
+        yield dg.DynamicOutput(i, mapping_key=str(i))
+
+
+@dg.op
+def double(x: int) -> int:
+    return x * 2
+
+
+@dg.op
+def total(values: list[int]) -> int:
+    return sum(values)
+
+
+@dg.job
+def dynamic_job():
+    total(emit().map(double).collect())
+
+
+JOB_SNAPSHOT_ID = dynamic_job.get_job_snapshot_id()
+
+KNOWN_STATE = KnownExecutionState(dynamic_mappings={"emit": {"result": ["0", "1", "2"]}})
+
+
+def _assert_same_plan(plan: ExecutionPlan, expected: ExecutionPlan) -> None:
+    assert snapshot_from_execution_plan(plan, JOB_SNAPSHOT_ID) == snapshot_from_execution_plan(
+        expected, JOB_SNAPSHOT_ID
+    )
+
+
+def test_cached_plan_matches_built_plan(tmp_path):
+    for step_keys_to_execute, known_state in [
+        (None, None),
+        (["emit"], None),
+        (None, KNOWN_STATE),
+        (["double[1]", "total"], KNOWN_STATE),
+    ]:
+        expected = create_execution_plan(
+            dynamic_job, step_keys_to_execute=step_keys_to_execute, known_state=known_state
+        )
+        with mock.patch.dict(os.environ, {EXECUTION_PLAN_CACHE_DIR_ENV_VAR: str(tmp_path)}):
+            # the first plan is built and cached, the second rehydrated from the cache
+            for _ in range(2):
+                plan = create_execution_plan(
+                    dynamic_job,
+                    step_keys_to_execute=step_keys_to_execute,
+                    known_state=known_state,
+                    job_snapshot_id=JOB_SNAPSHOT_ID,
+                )
+                _assert_same_plan(plan, expected)
+
+    # every selection and known state shares the one entry for the job and run config
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_cached_plan_is_not_rebuilt(tmp_path):
+    with mock.patch.dict(os.environ, {EXECUTION_PLAN_CACHE_DIR_ENV_VAR: str(tmp_path)}):
+        create_execution_plan(dynamic_job, job_snapshot_id=JOB_SNAPSHOT_ID)
+
+        with mock.patch.object(ExecutionPlan, "build", side_effect=Exception("rebuilt")):
+            plan = create_execution_plan(
+                dynamic_job,
+                step_keys_to_execute=["emit"],
+                job_snapshot_id=JOB_SNAPSHOT_ID,
+            )
+    assert plan.step_keys_to_execute == ["emit"]
+
+
+@dg.op(config_schema={"date": str})
+def configured(context: dg.OpExecutionContext, value: int) -> str:
+    return f"{context.op_config['date']}: {value}"
+
+
+@dg.job
+def configured_job():
+    configured()
+
+
+CONFIGURED_JOB_SNAPSHOT_ID = configured_job.get_job_snapshot_id()
+
+
+def _configured_run_config(date: str, **run_config) -> dict:
+    return {"ops": {"configured": {"config": {"date": date}, "inputs": {"value": 1}}}, **run_config}
+
+
+def test_cache_keyed_by_plan_shaping_run_config(tmp_path):
+    with mock.patch.dict(os.environ, {EXECUTION_PLAN_CACHE_DIR_ENV_VAR: str(tmp_path)}):
+        # config values are not part of the plan, so runs that only differ in them share an entry
+        for date in ["2024-01-01", "2024-01-02"]:
+            create_execution_plan(
+                configured_job,
+                run_config=_configured_run_config(
+                    date, loggers={"console": {"config": {"log_level": "DEBUG"}}}
+                ),
+                job_snapshot_id=CONFIGURED_JOB_SNAPSHOT_ID,
+            )
+        assert len(os.listdir(tmp_path)) == 1
+
+        create_execution_plan(
+            configured_job,
+            run_config=_configured_run_config(
+                "2024-01-01", execution={"config": {"in_process": {}}}
+            ),
+            job_snapshot_id=CONFIGURED_JOB_SNAPSHOT_ID,
+        )
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    with mock.patch.dict(
+        os.environ,
+        {
+            EXECUTION_PLAN_CACHE_DIR_ENV_VAR: str(tmp_path),
+            EXECUTION_PLAN_CACHE_MAX_ENTRIES_ENV_VAR: "2",
+        },
+    ):
+        create_execution_plan(dynamic_job, job_snapshot_id=JOB_SNAPSHOT_ID)
+        (dynamic_entry,) = os.listdir(tmp_path)
+        create_execution_plan(
+            configured_job,
+            run_config=_configured_run_config("2024-01-01"),
+            job_snapshot_id=CONFIGURED_JOB_SNAPSHOT_ID,
+        )
+        (configured_entry,) = set(os.listdir(tmp_path)) - {dynamic_entry}
+        for i, entry in enumerate([dynamic_entry, configured_entry]):
+            os.utime(os.path.join(tmp_path, entry), (i + 1, i + 1))
+
+        # reading the dynamic job's entry marks it as the most recently used
+        create_execution_plan(dynamic_job, job_snapshot_id=JOB_SNAPSHOT_ID)
+        create_execution_plan(
+            configured_job,
+            run_config=_configured_run_config(
+                "2024-01-01", execution={"config": {"in_process": {}}}
+            ),
+            job_snapshot_id=CONFIGURED_JOB_SNAPSHOT_ID,
+        )
+        entries = os.listdir(tmp_path)
+    assert len(entries) == 2
+    assert dynamic_entry in entries and configured_entry not in entries
+
+
+def test_corrupt_cache_entry_is_replaced(tmp_path):
+    with mock.patch.dict(os.environ, {EXECUTION_PLAN_CACHE_DIR_ENV_VAR: str(tmp_path)}):
+        create_execution_plan(dynamic_job, job_snapshot_id=JOB_SNAPSHOT_ID)
+        (entry,) = os.listdir(tmp_path)
+        with open(os.path.join(tmp_path, entry), "w") as f:
+            f.write("not a snapshot")
+
+        plan = create_execution_plan(dynamic_job, job_snapshot_id=JOB_SNAPSHOT_ID)
+        _assert_same_plan(plan, create_execution_plan(dynamic_job))
+        assert len(os.listdir(tmp_path)) == 1
+
+
+def test_multiprocess_run_with_cache(tmp_path):
+    with mock.patch.dict(os.environ, {EXECUTION_PLAN_CACHE_DIR_ENV_VAR: str(tmp_path)}):
+        with dg.instance_for_test() as instance:
+            with dg.execute_job(
+                dg.reconstructable(define_multiprocess_job), instance=instance
+            ) as result:
+                assert result.success
+                assert result.output_for_node("total") == 6
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def define_multiprocess_job():
+    return dynamic_job
@@ -443,3 +443,61 @@ def test_active_concurrency_changing_default(use_tags):
                             event_specific_data=StepSuccessData(duration_ms=1.0),
                         )
                     )
+
+
+def define_wide_job(width):
+    @dg.op
+    def root():
+        return 1
+
+    @dg.op
+    def branch(x):
+        return x
+
+    @dg.op(ins={"xs": dg.In(dg.Nothing)})
+    def collect():
+        pass
+
+    @dg.job
+    def wide_job():
+        value = root()
+        collect(xs=[branch.alias(f"branch_{i}")(value) for i in range(width)])
+
+    return wide_job
+
+
+def test_active_execution_resolves_downstream_steps_incrementally():
+    width = 500
+    wide_job = define_wide_job(width)
+
+    with create_execution_plan(wide_job).start(RetryMode.ENABLED) as active_execution:
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["root"]
+        active_execution.mark_step_produced_output(StepOutputHandle("root", "result"))
+        active_execution.mark_success("root")
+
+        branch_steps = active_execution.get_steps_to_execute()
+        # steps made ready by the same resolution keep the plan's ordering
+        plan_order = [
+            key
+            for key in active_execution._plan.get_executable_step_deps()  # noqa: SLF001
+            if key.startswith("branch_")
+        ]
+        assert [step.key for step in branch_steps] == plan_order
+        assert len(branch_steps) == width
+
+        # an immediately retried step is scheduled again, and holds back its dependents
+        active_execution.mark_up_for_retry("branch_0")
+        for step in branch_steps[1:]:
+            active_execution.mark_success(step.key)
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["branch_0"]
+
+        # collect only depends on the retried step now, and is abandoned when it fails
+        assert active_execution._unresolved_dep_counts["collect"] == 1  # noqa: SLF001
+        active_execution.mark_failed("branch_0")
+        assert active_execution.get_steps_to_execute() == []
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["collect"]
+        active_execution.mark_abandoned("collect")
+
+        assert active_execution.is_complete
+        assert not active_execution._pending_dependents  # noqa: SLF001
@@ -0,0 +1,188 @@
+import time
+import tracemalloc
+
+import dagster as dg
+import pytest
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.step_profiler import (
+    COMPUTE_PHASE,
+    INPUT_LOADING_PHASE,
+    STEP_PHASES,
+    STEP_PROFILE_METADATA_PREFIX,
+    StepProfiler,
+)
+from dagster._core.storage.tags import STEP_PROFILING_SAMPLE_INTERVAL_TAG, STEP_PROFILING_TAG
+
+
+class SlowIOManager(dg.IOManager):
+    def handle_output(self, context, obj):
+        time.sleep(0.1)
+
+    def load_input(self, context):
+        time.sleep(0.1)
+        return 1
+
+
+@dg.op
+def produce() -> int:
+    return 1
+
+
+def _spin(seconds: float) -> int:
+    # busy-waits, so that the time is spent in this frame on CPU
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += 1
+    return total
+
+
+@dg.op
+def consume(value: int) -> list[int]:
+    _spin(0.2)
+    return [value] * 100_000
+
+
+@dg.op
+def fails(value: int):
+    raise Exception("failed")
+
+
+def test_step_profiling():
+    @dg.job(resource_defs={"io_manager": SlowIOManager()})
+    def profiled_job():
+        consume(produce())
+
+    result = profiled_job.execute_in_process(tags={STEP_PROFILING_TAG: "true"})
+    assert result.success
+
+    metadata = {
+        event.step_key: event.step_success_data.metadata
+        for event in result.all_events
+        if event.is_step_success
+    }
+    consume_metadata = metadata["consume"]
+    for phase in STEP_PHASES:
+        for measure in ["wall_time_ms", "cpu_time_ms", "net_allocated_bytes"]:
+            assert f"{STEP_PROFILE_METADATA_PREFIX}{phase}/{measure}" in consume_metadata
+
+    def _value(key):
+        return consume_metadata[f"{STEP_PROFILE_METADATA_PREFIX}{key}"].value
+
+    assert _value("input_loading/wall_time_ms") >= 100
+    assert _value("output_handling/wall_time_ms") >= 100
+    assert _value("compute/wall_time_ms") >= 200
+    assert _value("compute/cpu_time_ms") >= 100
+    # sleeping while loading the input uses little CPU time
+    assert _value("input_loading/cpu_time_ms") < _value("input_loading/wall_time_ms")
+    assert _value("compute/peak_allocated_bytes") >= 100_000 * 8
+    assert f"{STEP_PROFILE_METADATA_PREFIX}stack_samples" not in consume_metadata
+
+    assert not tracemalloc.is_tracing()
+
+
+def test_step_profiling_disabled():
+    @dg.job
+    def unprofiled_job():
+        consume(produce())
+
+    result = unprofiled_job.execute_in_process()
+    assert result.success
+    for event in result.all_events:
+        if event.is_step_success:
+            assert event.step_success_data.metadata == {}
+
+
+def test_step_profiling_op_tag_and_stack_samples():
+    @dg.op(tags={STEP_PROFILING_SAMPLE_INTERVAL_TAG: "0.01"})
+    def sampled() -> int:
+        return _spin(0.2)
+
+    @dg.job
+    def sampled_job():
+        sampled()
+        produce()
+
+    result = sampled_job.execute_in_process()
+    assert result.success
+
+    metadata = {
+        event.step_key: event.step_success_data.metadata
+        for event in result.all_events
+        if event.is_step_success
+    }
+    assert metadata["produce"] == {}
+    stack_samples = metadata["sampled"][f"{STEP_PROFILE_METADATA_PREFIX}stack_samples"].value
+    lines = stack_samples.splitlines()
+    assert lines
+    # folded stacks, from the outermost frame to the innermost, followed by a sample count
+    assert any(line.rsplit(" ", 1)[0].split(";")[-1].startswith("_spin") for line in lines)
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in lines)
+
+
+def test_step_profiling_failure():
+    @dg.job
+    def failing_job():
+        fails(produce())
+
+    result = failing_job.execute_in_process(tags={STEP_PROFILING_TAG: "true"}, raise_on_error=False)
+    assert not result.success
+    (failure_event,) = [event for event in result.all_events if event.is_step_failure]
+    assert (
+        f"{STEP_PROFILE_METADATA_PREFIX}compute/wall_time_ms"
+        in failure_event.step_failure_data.metadata
+    )
+    assert not tracemalloc.is_tracing()
+
+
+def test_step_profiling_invalid_sample_interval():
+    with pytest.raises(dg.DagsterInvalidDefinitionError, match="often"):
+
+        @dg.op(tags={STEP_PROFILING_SAMPLE_INTERVAL_TAG: "often"})
+        def invalid_op(): ...
+
+    @dg.job
+    def profiled_job():
+        produce()
+
+    with dg.instance_for_test() as instance:
+        with pytest.raises(dg.DagsterInvalidDefinitionError, match="-1"):
+            instance.create_run_for_job(
+                profiled_job, tags={STEP_PROFILING_SAMPLE_INTERVAL_TAG: "-1"}
+            )
+
+    # runs stored before the tag was validated are profiled without sampling stacks
+    step = create_execution_plan(profiled_job).get_step_by_key("produce")
+    run = dg.DagsterRun(
+        job_name="profiled_job",
+        tags={STEP_PROFILING_TAG: "true", STEP_PROFILING_SAMPLE_INTERVAL_TAG: "often"},
+    )
+    profiler = StepProfiler.for_step(step, run)
+    assert profiler
+    assert f"{STEP_PROFILE_METADATA_PREFIX}stack_samples" not in profiler.get_metadata()
+
+
+def test_step_profiling_peak_not_reported_for_shared_process():
+    profiler = StepProfiler()
+    other_profiler = StepProfiler()
+    profiler.start()
+    with profiler.profile_phase(INPUT_LOADING_PHASE):
+        # the other step resets the peak of the process while this phase is measured
+        other_profiler.start()
+        with other_profiler.profile_phase(INPUT_LOADING_PHASE):
+            pass
+        other_profiler.finish()
+    with profiler.profile_phase(COMPUTE_PHASE):
+        pass
+
+    metadata = profiler.get_metadata()
+    assert (
+        f"{STEP_PROFILE_METADATA_PREFIX}{INPUT_LOADING_PHASE}/peak_allocated_bytes" not in metadata
+    )
+    assert f"{STEP_PROFILE_METADATA_PREFIX}{COMPUTE_PHASE}/peak_allocated_bytes" in metadata
+    other_metadata = other_profiler.get_metadata()
+    assert (
+        f"{STEP_PROFILE_METADATA_PREFIX}{INPUT_LOADING_PHASE}/peak_allocated_bytes"
+        not in other_metadata
+    )
+    assert not tracemalloc.is_tracing()
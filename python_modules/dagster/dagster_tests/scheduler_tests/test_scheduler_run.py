@@ -6,6 +6,7 @@
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Optional, cast
+from unittest.mock import patch
 
 import dagster as dg
 import pytest
@@ -1357,6 +1358,38 @@ def test_launch_failure(
             )
 
 
+@pytest.mark.parametrize("executor", get_schedule_executors())
+def test_batched_tick_read_failure(
+    caplog,
+    instance: DagsterInstance,
+    workspace_context: WorkspaceProcessContext,
+    remote_repo: RemoteRepository,
+    executor: ThreadPoolExecutor,
+):
+    schedule = remote_repo.get_schedule("simple_schedule")
+    freeze_datetime = feb_27_2019_start_of_day()
+    with freeze_time(freeze_datetime):
+        instance.start_schedule(schedule)
+
+        with patch.object(
+            dg.DagsterInstance, "get_latest_ticks", side_effect=Exception("batch read failed")
+        ):
+            evaluate_schedules(workspace_context, executor, get_current_datetime())
+
+        # the schedule fetched its latest tick itself
+        assert "Failed to fetch the latest ticks of the schedules" in caplog.text
+        assert instance.get_runs_count() == 1
+        ticks = instance.get_ticks(schedule.get_remote_origin_id(), schedule.selector_id)
+        assert len(ticks) == 1
+        validate_tick(
+            ticks[0],
+            schedule,
+            freeze_datetime,
+            TickStatus.SUCCESS,
+            [run.run_id for run in instance.get_runs()],
+        )
+
+
 @pytest.mark.parametrize("executor", get_schedule_executors())
 def test_schedule_mutation(
     instance: DagsterInstance,
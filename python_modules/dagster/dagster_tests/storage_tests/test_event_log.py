@@ -29,6 +29,7 @@
 from dagster._core.storage.sql import create_engine
 from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._core.storage.sqlite_storage import DagsterSqliteStorage
+from dagster._core.test_utils import environ
 from dagster._core.utils import make_new_run_id
 from dagster._utils.test import ConcurrencyEnabledSqliteTestEventLogStorage
 from sqlalchemy import __version__ as sqlalchemy_version
@@ -37,6 +38,7 @@
 from dagster_tests.storage_tests.utils.event_log_storage import (
     TestEventLogStorage,
     _synthesize_events,
+    create_test_event_log_record,
 )
 
 
@@ -154,6 +156,35 @@ def test_concurrent_sqlite_event_log_connections(self, storage):
         assert not excs, excs
 
 
+class TestPooledSqliteEventLogStorage(TestSqliteEventLogStorage):
+    __test__ = True
+
+    @pytest.fixture(name="instance", scope="function")
+    def instance(self):  # pyright: ignore[reportIncompatibleMethodOverride]
+        # a pool smaller than the number of shards used by most tests, to exercise eviction
+        with environ({"DAGSTER_SQLITE_SHARD_POOL_SIZE": "2"}):
+            with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmpdir_path:
+                with dg.instance_for_test(temp_dir=tmpdir_path) as instance:
+                    yield instance
+
+    def test_shard_engines_are_bounded(self, storage):
+        run_ids = [make_new_run_id() for _ in range(4)]
+
+        def _write_events(run_id):
+            for i in range(10):
+                storage.store_event(create_test_event_log_record(str(i), run_id=run_id))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(_write_events, run_ids))
+
+        for run_id in run_ids:
+            assert len(storage.get_logs_for_run(run_id)) == 10
+        assert list(storage._shard_engines) == [run_ids[-2], run_ids[-1]]  # noqa: SLF001
+
+        storage.dispose()
+        assert not storage._shard_engines  # noqa: SLF001
+
+
 class TestConsolidatedSqliteEventLogStorage(TestEventLogStorage):
     __test__ = True
 
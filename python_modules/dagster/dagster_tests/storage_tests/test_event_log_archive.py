@@ -0,0 +1,272 @@
+import os
+import tempfile
+from datetime import timedelta
+
+import dagster as dg
+import pytest
+from click.testing import CliRunner
+from dagster._cli.instance import archive_event_logs_command
+from dagster._core.events import DagsterEventType
+from dagster._core.storage.event_log.archive import (
+    UNARCHIVED_EVENT_TYPES,
+    LocalEventLogArchiveStore,
+    archive_event_logs,
+    deserialize_event_log_archive,
+    get_event_log_archive_cursor,
+)
+from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
+from dagster._core.storage.sqlalchemy_compat import db_select
+from dagster._core.test_utils import instance_for_test
+
+
+@dg.op
+def emit_logs(context):
+    for i in range(5):
+        context.log.info(f"log {i}")
+    return 1
+
+
+@dg.op
+def add_one(context, num):
+    context.log.info("adding one")
+    return num + 1
+
+
+@dg.job
+def logging_job():
+    add_one(emit_logs())
+
+
+@dg.asset
+def an_asset():
+    return 1
+
+
+@pytest.fixture
+def archive_instance():
+    with tempfile.TemporaryDirectory() as archive_dir:
+        with instance_for_test(
+            overrides={
+                "event_log_archive": {
+                    "archive_store": {
+                        "module": "dagster._core.storage.event_log.archive",
+                        "class": "LocalEventLogArchiveStore",
+                        "config": {"base_dir": archive_dir},
+                    },
+                    "older_than_days": 30,
+                }
+            }
+        ) as instance:
+            yield instance
+
+
+def _count_event_log_rows(instance, run_id):
+    storage = instance.event_log_storage
+    with storage.run_connection(run_id) as conn:
+        return len(
+            conn.execute(
+                db_select([SqlEventLogStorageTable.c.id]).where(
+                    SqlEventLogStorageTable.c.run_id == run_id
+                )
+            ).fetchall()
+        )
+
+
+def test_archive_store_roundtrip():
+    with tempfile.TemporaryDirectory() as archive_dir:
+        store = LocalEventLogArchiveStore(archive_dir)
+        assert not store.has("abcdef")
+        assert store.get("abcdef") is None
+        store.put("abcdef", b"data")
+        assert store.has("abcdef")
+        assert store.get("abcdef") == b"data"
+        assert os.path.exists(os.path.join(archive_dir, "ab", "abcdef.archive"))
+        store.delete("abcdef")
+        assert not store.has("abcdef")
+        store.delete("abcdef")
+
+
+def test_archive_finished_runs(archive_instance):
+    result = logging_job.execute_in_process(instance=archive_instance)
+    assert result.success
+    run_id = result.run_id
+
+    storage = archive_instance.event_log_storage
+    records_before = storage.get_records_for_run(run_id).records
+    stats_before = storage.get_stats_for_run(run_id)
+    step_stats_before = storage.get_step_stats_for_run(run_id)
+    num_rows_before = _count_event_log_rows(archive_instance, run_id)
+
+    # nothing is old enough to archive
+    assert archive_event_logs(archive_instance) == []
+
+    assert archive_event_logs(archive_instance, older_than=timedelta(0)) == [run_id]
+
+    archive_store = archive_instance.event_log_archive_store
+    assert archive_store.has(run_id)
+    archived = deserialize_event_log_archive(archive_store.get(run_id))
+    num_rows_after = _count_event_log_rows(archive_instance, run_id)
+    assert num_rows_after < num_rows_before
+    assert num_rows_after + len(archived) == num_rows_before
+
+    # only events serving cross-run queries remain in the event log table
+    for record in storage.get_event_records(
+        dg.EventRecordsFilter(event_type=DagsterEventType.RUN_SUCCESS)
+    ):
+        assert record.run_id == run_id
+
+    # reads are served transparently from the archive
+    records_after = storage.get_records_for_run(run_id).records
+    assert [record.storage_id for record in records_after] == [
+        record.storage_id for record in records_before
+    ]
+    assert [record.event_log_entry for record in records_after] == [
+        record.event_log_entry for record in records_before
+    ]
+    stats_after = storage.get_stats_for_run(run_id)
+    assert stats_after.steps_succeeded == stats_before.steps_succeeded == 2
+    assert stats_after.start_time == pytest.approx(stats_before.start_time)
+    assert stats_after.end_time == pytest.approx(stats_before.end_time)
+    assert storage.get_step_stats_for_run(run_id) == step_stats_before
+
+    # filtering and pagination
+    step_success_records = storage.get_records_for_run(
+        run_id, of_type=DagsterEventType.STEP_SUCCESS
+    ).records
+    assert len(step_success_records) == 2
+    first_page = storage.get_records_for_run(run_id, limit=3)
+    assert first_page.has_more
+    second_page = storage.get_records_for_run(run_id, cursor=first_page.cursor, limit=3)
+    assert [record.storage_id for record in [*first_page.records, *second_page.records]] == [
+        record.storage_id for record in records_before[:6]
+    ]
+    descending = storage.get_records_for_run(run_id, ascending=False).records
+    assert [record.storage_id for record in descending] == [
+        record.storage_id for record in reversed(records_before)
+    ]
+
+    # archiving again is a no-op
+    assert archive_event_logs(archive_instance, older_than=timedelta(0)) == []
+
+    archive_instance.delete_run(run_id)
+    assert not archive_store.has(run_id)
+
+
+def test_archive_keeps_asset_events(archive_instance):
+    result = dg.materialize([an_asset], instance=archive_instance)
+    assert result.success
+
+    assert archive_event_logs(archive_instance, older_than=timedelta(0)) == [result.run_id]
+
+    archived = deserialize_event_log_archive(
+        archive_instance.event_log_archive_store.get(result.run_id)
+    )
+    assert not any(
+        event_type in {event_type.value for event_type in UNARCHIVED_EVENT_TYPES}
+        for event_type in archived.dagster_event_types
+    )
+    assert archive_instance.get_latest_materialization_event(dg.AssetKey("an_asset"))
+    assert len(archive_instance.fetch_materializations(dg.AssetKey("an_asset"), limit=10).records)
+
+
+def test_reads_past_archive_skip_it(archive_instance, monkeypatch):
+    result = logging_job.execute_in_process(instance=archive_instance)
+    run_id = result.run_id
+    assert archive_event_logs(archive_instance, older_than=timedelta(0)) == [run_id]
+
+    storage = archive_instance.event_log_storage
+    archive_store = archive_instance.event_log_archive_store
+    get_calls = []
+    get_archive = archive_store.get
+
+    def _spy_get(archived_run_id):
+        get_calls.append(archived_run_id)
+        return get_archive(archived_run_id)
+
+    monkeypatch.setattr(archive_store, "get", _spy_get)
+
+    connection = storage.get_records_for_run(run_id)
+    assert len(get_calls) <= 1
+    num_get_calls = len(get_calls)
+
+    # polling from the end of the run, as an event watcher does, does not read the archive
+    for _ in range(3):
+        assert storage.get_records_for_run(run_id, cursor=connection.cursor).records == []
+    assert len(get_calls) == num_get_calls
+
+    # reads from before the end of the archive still include the archived events
+    first_page = storage.get_records_for_run(run_id, limit=2)
+    assert len(storage.get_records_for_run(run_id, cursor=first_page.cursor).records) == len(
+        connection.records
+    ) - len(first_page.records)
+
+
+def test_archive_resumes_from_cursor(archive_instance, monkeypatch):
+    run_ids = [logging_job.execute_in_process(instance=archive_instance).run_id for _ in range(3)]
+
+    storage = archive_instance.event_log_storage
+    checked_run_ids = []
+    archive_events_for_run = storage.archive_events_for_run
+
+    def _spy_archive_events_for_run(run_id):
+        checked_run_ids.append(run_id)
+        return archive_events_for_run(run_id)
+
+    monkeypatch.setattr(storage, "archive_events_for_run", _spy_archive_events_for_run)
+
+    # runs are archived in the order they were created, and a call that stops at its limit is
+    # resumed from the last run it archived
+    assert archive_event_logs(archive_instance, older_than=timedelta(0), limit=1) == run_ids[:1]
+    assert get_event_log_archive_cursor(archive_instance).run_id == run_ids[0]
+    assert archive_event_logs(archive_instance, older_than=timedelta(0), limit=1) == run_ids[1:2]
+    assert checked_run_ids == run_ids[:2]
+
+    # the last run is archived and every finished run is behind the cursor
+    assert archive_event_logs(archive_instance, older_than=timedelta(0)) == run_ids[2:]
+    cursor = get_event_log_archive_cursor(archive_instance)
+    assert cursor.updated_after is not None
+    assert cursor.updated_before is None
+
+    # archived runs are not paged through again, while runs finished since are archived
+    checked_run_ids.clear()
+    assert archive_event_logs(archive_instance, older_than=timedelta(0)) == []
+    assert checked_run_ids == []
+    new_run_id = logging_job.execute_in_process(instance=archive_instance).run_id
+    assert archive_event_logs(archive_instance, older_than=timedelta(0)) == [new_run_id]
+    assert checked_run_ids == [new_run_id]
+
+
+def test_archive_restarts_window_of_deleted_cursor_run(archive_instance):
+    run_ids = [logging_job.execute_in_process(instance=archive_instance).run_id for _ in range(2)]
+    assert archive_event_logs(archive_instance, older_than=timedelta(0), limit=1) == run_ids[:1]
+
+    archive_instance.delete_run(run_ids[0])
+    assert archive_event_logs(archive_instance, older_than=timedelta(0)) == run_ids[1:]
+
+
+def test_archive_event_logs_command(archive_instance):
+    result = logging_job.execute_in_process(instance=archive_instance)
+
+    runner = CliRunner()
+    cli_result = runner.invoke(archive_event_logs_command, [])
+    assert cli_result.exit_code == 0, cli_result.output
+    assert "Archived the event logs of 0 runs." in cli_result.output
+
+    cli_result = runner.invoke(archive_event_logs_command, ["--older-than-days", "0"])
+    assert cli_result.exit_code == 0, cli_result.output
+    assert "Archived the event logs of 1 runs." in cli_result.output
+    assert archive_instance.event_log_archive_store.has(result.run_id)
+
+
+def test_archive_event_logs_command_requires_store():
+    with instance_for_test():
+        cli_result = CliRunner().invoke(archive_event_logs_command, ["--older-than-days", "0"])
+        assert cli_result.exit_code != 0
+        assert "No event log archive store is configured" in cli_result.output
+
+
+def test_archive_requires_store():
+    with instance_for_test() as instance:
+        result = logging_job.execute_in_process(instance=instance)
+        with pytest.raises(dg.DagsterInvariantViolationError):
+            instance.event_log_storage.archive_events_for_run(result.run_id)
@@ -0,0 +1,219 @@
+import os
+import weakref
+
+import dagster as dg
+import pytest
+from dagster import HandoffIOManager
+
+_fallback_outputs: list[str] = []
+_values: dict[str, object] = {}
+
+
+class RecordingIOManager(dg.ConfigurableIOManager):
+    def handle_output(self, context: dg.OutputContext, obj: object) -> None:
+        _fallback_outputs.append(context.step_key)
+        _values[context.step_key] = obj
+
+    def load_input(self, context: dg.InputContext) -> object:
+        return _values[context.upstream_output.step_key]  # pyright: ignore[reportOptionalMemberAccess]
+
+
+_produced: dict[str, object] = {}
+
+
+@dg.op
+def produce() -> list[int]:
+    value = [1, 2, 3]
+    _produced["value"] = value
+    return value
+
+
+@dg.op
+def consume(value: list[int]) -> bool:
+    return value is _produced["value"]
+
+
+def test_in_process_handoff_by_reference():
+    _fallback_outputs.clear()
+
+    @dg.job(
+        resource_defs={"io_manager": HandoffIOManager(fallback_io_manager=RecordingIOManager())}
+    )
+    def handoff_job():
+        consume(produce())
+
+    result = handoff_job.execute_in_process()
+    assert result.success
+    assert result.output_for_node("consume") is True
+    # stored with the fallback as well, for re-execution
+    assert _fallback_outputs == ["produce", "consume"]
+
+
+class DiscardingIOManager(dg.ConfigurableIOManager):
+    def handle_output(self, context: dg.OutputContext, obj: object) -> None:
+        pass
+
+    def load_input(self, context: dg.InputContext) -> object:
+        raise Exception("not stored")
+
+
+class Payload:
+    pass
+
+
+_payload_refs: list[weakref.ref] = []
+
+
+@dg.op
+def produce_payload() -> Payload:
+    payload = Payload()
+    _payload_refs.append(weakref.ref(payload))
+    return payload
+
+
+@dg.op
+def consume_payload(payload: Payload) -> None:
+    assert _payload_refs[0]() is payload
+
+
+@dg.op(ins={"start": dg.In(dg.Nothing)})
+def after_consume_payload() -> None:
+    # the IO manager dropped its reference to the payload once its only consumer loaded it
+    assert _payload_refs[0]() is None
+
+
+def define_payload_job():
+    @dg.job(
+        resource_defs={"io_manager": HandoffIOManager(fallback_io_manager=DiscardingIOManager())},
+        executor_def=dg.in_process_executor,
+    )
+    def payload_job():
+        after_consume_payload(consume_payload(produce_payload()))
+
+    return payload_job
+
+
+def test_in_process_handoff_releases_loaded_values():
+    _payload_refs.clear()
+
+    with dg.instance_for_test() as instance:
+        with dg.execute_job(dg.reconstructable(define_payload_job), instance=instance) as result:
+            assert result.success
+
+
+def test_in_process_handoff_stores_assets_with_fallback():
+    _fallback_outputs.clear()
+
+    @dg.asset
+    def upstream() -> int:
+        return 1
+
+    @dg.asset
+    def downstream(upstream: int) -> int:
+        return upstream + 1
+
+    result = dg.materialize(
+        [upstream, downstream],
+        resources={"io_manager": HandoffIOManager(fallback_io_manager=RecordingIOManager())},
+    )
+    assert result.success
+    assert result.output_for_node("downstream") == 2
+    assert sorted(_fallback_outputs) == ["downstream", "upstream"]
+
+
+@dg.op
+def produce_array():
+    import numpy as np
+
+    return np.arange(10)
+
+
+@dg.op
+def produce_dict() -> dict:
+    return {"a": 1}
+
+
+@dg.op
+def combine(array, values: dict) -> int:
+    return int(array.sum()) + values["a"]
+
+
+def define_multiprocess_handoff_job():
+    @dg.job(
+        resource_defs={"io_manager": HandoffIOManager(fallback_io_manager=dg.FilesystemIOManager())}
+    )
+    def multiprocess_handoff_job():
+        combine(produce_array(), produce_dict())
+
+    return multiprocess_handoff_job
+
+
+def define_persisted_multiprocess_handoff_job():
+    @dg.job(
+        resource_defs={
+            "io_manager": HandoffIOManager(
+                fallback_io_manager=dg.FilesystemIOManager(), persist_mapped_outputs=True
+            )
+        }
+    )
+    def persisted_multiprocess_handoff_job():
+        combine(produce_array(), produce_dict())
+
+    return persisted_multiprocess_handoff_job
+
+
+def test_multiprocess_handoff():
+    pytest.importorskip("numpy")
+
+    with dg.instance_for_test() as instance:
+        handoff_dir = os.path.join(instance.storage_directory(), "handoff")
+        with dg.execute_job(
+            dg.reconstructable(define_multiprocess_handoff_job), instance=instance
+        ) as result:
+            assert result.success
+            assert result.output_for_node("combine") == 46
+
+            run_dir = os.path.join(instance.storage_directory(), result.run_id)
+            # the array is only memory-mapped, while the outputs that can't be are stored by the
+            # fallback
+            assert not os.path.exists(os.path.join(run_dir, "produce_array", "result"))
+            assert os.path.exists(os.path.join(run_dir, "produce_dict", "result"))
+            mapped_path = os.path.join(handoff_dir, result.run_id, "produce_array", "result.npy")
+            assert os.path.exists(mapped_path)
+
+        # the files of the finished run are deleted when the IO manager is next initialized
+        with dg.execute_job(
+            dg.reconstructable(define_multiprocess_handoff_job), instance=instance
+        ) as result:
+            assert result.success
+            assert not os.path.exists(mapped_path)
+
+
+def test_multiprocess_handoff_persist_mapped_outputs():
+    pytest.importorskip("numpy")
+
+    with dg.instance_for_test() as instance:
+        handoff_dir = os.path.join(instance.storage_directory(), "handoff")
+        with dg.execute_job(
+            dg.reconstructable(define_persisted_multiprocess_handoff_job), instance=instance
+        ) as result:
+            assert result.success
+            assert result.output_for_node("combine") == 46
+
+            run_dir = os.path.join(instance.storage_directory(), result.run_id)
+            assert os.path.exists(os.path.join(run_dir, "produce_array", "result"))
+            assert os.path.exists(os.path.join(run_dir, "produce_dict", "result"))
+            # the array was memory-mapped by its only consumer, which then deleted the file
+            assert os.listdir(os.path.join(handoff_dir, result.run_id, "produce_array")) == []
+
+            reexecution_options = dg.ReexecutionOptions(
+                parent_run_id=result.run_id, step_selection=["combine"]
+            )
+
+        with dg.execute_job(
+            dg.reconstructable(define_persisted_multiprocess_handoff_job),
+            instance=instance,
+            reexecution_options=reexecution_options,
+        ) as reexecution_result:
+            assert reexecution_result.success
+            assert reexecution_result.output_for_node("combine") == 46
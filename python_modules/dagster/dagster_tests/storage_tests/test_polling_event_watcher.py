@@ -7,8 +7,14 @@
 import dagster as dg
 import dagster._check as check
 from dagster._core.events import DagsterEventType, EngineEventData
-from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+    SqlPollingEventWatcher,
+    polling_event_watcher,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.polling_event_watcher import LocalEventWatcherNotifier
 from dagster._core.utils import make_new_run_id
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
@@ -62,6 +68,46 @@ def dispose(self) -> None:
             self._watcher = None
 
 
+class ConsolidatedSqliteNotifyingEventLogStorage(ConsolidatedSqliteEventLogStorage):
+    """Consolidated SQLite-backed event log storage that uses a SqlPollingEventWatcher with a local
+    notifier, so that all watched runs are fetched in a single query and new events are pushed to
+    the watcher as they are stored.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._notifier = LocalEventWatcherNotifier()
+        self._watcher: Optional[SqlPollingEventWatcher] = None
+
+    def store_event(self, event: dg.EventLogEntry) -> None:
+        super().store_event(event)
+        self._notifier.notify(event.run_id)
+
+    def watch(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        callback: Callable[[dg.EventLogEntry, str], None],
+    ):
+        if self._watcher is None:
+            self._watcher = SqlPollingEventWatcher(self, notifier=self._notifier)
+
+        self._watcher.watch_run(run_id, cursor, callback)
+
+    def end_watch(
+        self,
+        run_id: str,
+        handler: Callable[[dg.EventLogEntry, str], None],
+    ):
+        if self._watcher:
+            self._watcher.unwatch_run(run_id, handler)
+
+    def dispose(self) -> None:
+        if self._watcher:
+            self._watcher.close()
+            self._watcher = None
+
+
 RUN_ID = make_new_run_id()
 
 
@@ -147,3 +193,151 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def _wait_for(condition: Callable[[], bool], attempts: int = 20) -> None:
+    while not condition() and attempts > 0:
+        time.sleep(0.1)
+        attempts -= 1
+
+
+def test_shared_watcher_multiple_runs():
+    run_id_1 = make_new_run_id()
+    run_id_2 = make_new_run_id()
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteNotifyingEventLogStorage(tmpdir_path)
+        queried_cursors = []
+        get_records_for_runs = storage.get_records_for_runs
+
+        def _spy_get_records_for_runs(after_storage_id_by_run_id, limit=None):
+            queried_cursors.append(dict(after_storage_id_by_run_id))
+            return get_records_for_runs(after_storage_id_by_run_id, limit=limit)
+
+        storage.get_records_for_runs = _spy_get_records_for_runs
+        try:
+            watched_1 = []
+            watched_2 = []
+
+            storage.store_event(create_event(1, run_id_1))
+            storage.store_event(create_event(2, run_id_2))
+
+            storage.watch(run_id_1, None, lambda event, _cursor: watched_1.append(event))
+            storage.watch(run_id_2, None, lambda event, _cursor: watched_2.append(event))
+
+            storage.store_event(create_event(3, run_id_1))
+            storage.store_event(create_event(4, run_id_2))
+            storage.store_event(create_event(5, run_id_1))
+
+            _wait_for(lambda: len(watched_1) == 3 and len(watched_2) == 2)
+            assert [int(evt.message) for evt in watched_1] == [1, 3, 5]
+            assert [int(evt.message) for evt in watched_2] == [2, 4]
+
+            # a run watched later still receives its full history
+            run_id_3 = make_new_run_id()
+            storage.store_event(create_event(6, run_id_3))
+            watched_3 = []
+            storage.watch(run_id_3, None, lambda event, _cursor: watched_3.append(event))
+            _wait_for(lambda: len(watched_3) == 1)
+            assert [int(evt.message) for evt in watched_3] == [6]
+            assert len(watched_1) == 3
+            assert len(watched_2) == 2
+
+            # runs are only read from their own cursor in the shared query, and newly watched runs
+            # are read separately
+            assert queried_cursors
+            assert all(
+                storage_id is not None
+                for cursors in queried_cursors
+                for storage_id in cursors.values()
+            )
+        finally:
+            storage.dispose()
+
+
+def test_shared_watcher_late_committed_event():
+    run_id_1 = make_new_run_id()
+    run_id_2 = make_new_run_id()
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteNotifyingEventLogStorage(tmpdir_path)
+        get_records_for_runs = storage.get_records_for_runs
+        uncommitted_run_ids = set()
+
+        def _get_committed_records_for_runs(after_storage_id_by_run_id, limit=None):
+            return [
+                record
+                for record in get_records_for_runs(after_storage_id_by_run_id, limit=limit)
+                if record.run_id not in uncommitted_run_ids
+            ]
+
+        storage.get_records_for_runs = _get_committed_records_for_runs
+        try:
+            watched_1 = []
+            watched_2 = []
+            storage.store_event(create_event(1, run_id_1))
+            storage.store_event(create_event(2, run_id_2))
+            storage.watch(run_id_1, None, lambda event, _cursor: watched_1.append(event))
+            storage.watch(run_id_2, None, lambda event, _cursor: watched_2.append(event))
+            _wait_for(lambda: len(watched_1) == 1 and len(watched_2) == 1)
+
+            # the event of the second run is given a lower storage id than the event of the first
+            # run, but is only visible to the watcher after it
+            uncommitted_run_ids.add(run_id_2)
+            storage.store_event(create_event(3, run_id_2))
+            storage.store_event(create_event(4, run_id_1))
+            _wait_for(lambda: len(watched_1) == 2)
+            uncommitted_run_ids.clear()
+            storage.store_event(create_event(5, run_id_1))
+
+            _wait_for(lambda: len(watched_1) == 3 and len(watched_2) == 2)
+            assert [int(evt.message) for evt in watched_1] == [1, 4, 5]
+            assert [int(evt.message) for evt in watched_2] == [2, 3]
+        finally:
+            storage.dispose()
+
+
+def test_shared_watcher_run_without_events():
+    run_id = make_new_run_id()
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteNotifyingEventLogStorage(tmpdir_path)
+        queried_cursors = []
+        get_records_for_runs = storage.get_records_for_runs
+
+        def _spy_get_records_for_runs(after_storage_id_by_run_id, limit=None):
+            queried_cursors.append(dict(after_storage_id_by_run_id))
+            return get_records_for_runs(after_storage_id_by_run_id, limit=limit)
+
+        storage.get_records_for_runs = _spy_get_records_for_runs
+        try:
+            watched = []
+            storage.watch(run_id, None, lambda event, _cursor: watched.append(event))
+
+            # once read, the run is polled from a starting cursor in the shared query
+            _wait_for(lambda: any(run_id in cursors for cursors in queried_cursors))
+            assert queried_cursors[0] == {run_id: 0}
+
+            storage.store_event(create_event(1, run_id))
+            _wait_for(lambda: len(watched) == 1)
+            assert [int(evt.message) for evt in watched] == [1]
+        finally:
+            storage.dispose()
+
+
+def test_notifier_wakes_watcher(monkeypatch):
+    # poll periods long enough that only notifications can deliver events within the test
+    monkeypatch.setattr(polling_event_watcher, "INIT_POLL_PERIOD", 60.0)
+    monkeypatch.setattr(polling_event_watcher, "MAX_POLL_PERIOD", 60.0)
+
+    run_id = make_new_run_id()
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteNotifyingEventLogStorage(tmpdir_path)
+        try:
+            watched = []
+            storage.watch(run_id, None, lambda event, _cursor: watched.append(event))
+
+            storage.store_event(create_event(1, run_id))
+            _wait_for(lambda: len(watched) == 1)
+            storage.store_event(create_event(2, run_id))
+            _wait_for(lambda: len(watched) == 2)
+            assert [int(evt.message) for evt in watched] == [1, 2]
+        finally:
+            storage.dispose()
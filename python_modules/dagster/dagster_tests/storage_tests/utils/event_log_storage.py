@@ -48,6 +48,7 @@
 from dagster._core.definitions.partitions.subset import AllPartitionsSubset
 from dagster._core.event_api import EventLogCursor
 from dagster._core.events import (
+    BUFFERABLE_EVENTS,
     EVENT_TYPE_TO_PIPELINE_RUN_STATUS,
     AssetMaterializationPlannedData,
     AssetObservationData,
@@ -63,7 +64,11 @@
 from dagster._core.execution.api import execute_run
 from dagster._core.execution.plan.handle import StepHandle
 from dagster._core.execution.plan.objects import StepFailureData, StepSuccessData
-from dagster._core.execution.stats import StepEventStatus
+from dagster._core.execution.stats import (
+    StepEventStatus,
+    build_run_stats_from_events,
+    build_run_step_stats_from_events,
+)
 from dagster._core.instance import RUNLESS_JOB_NAME, RUNLESS_RUN_ID
 from dagster._core.loader import LoadingContextForTest
 from dagster._core.remote_representation.external_data import PartitionsSnap
@@ -79,7 +84,7 @@
     EVENT_LOG_DATA_MIGRATIONS,
     migrate_asset_key_data,
 )
-from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
+from dagster._core.storage.event_log.schema import RunStatsTable, SqlEventLogStorageTable
 from dagster._core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 from dagster._core.storage.sqlalchemy_compat import db_select
@@ -883,6 +888,71 @@ def test_event_log_step_stats(
         assert len(d_stats.expectation_results) == 2
         assert len(c_stats.attempts_list) == 1
 
+    def test_materialized_run_stats(self, storage: EventLogStorage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        def _run_start_record(run_id, timestamp):
+            return dg.EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message="",
+                run_id=run_id,
+                timestamp=timestamp,
+                dagster_event=dg.DagsterEvent(DagsterEventType.PIPELINE_START.value, "nonce"),
+            )
+
+        def _is_tracked(run_id):
+            with storage.run_connection(run_id) as conn:
+                return bool(
+                    conn.execute(
+                        db_select([RunStatsTable.c.id]).where(RunStatsTable.c.run_id == run_id)
+                    ).fetchone()
+                )
+
+        def _assert_stats_match_events(run_id):
+            logs = storage.get_logs_for_run(run_id)
+            stats = storage.get_stats_for_run(run_id)
+            expected_stats = build_run_stats_from_events(run_id, logs)
+            assert stats._replace(start_time=None) == expected_stats._replace(start_time=None)
+            assert stats.start_time == pytest.approx(expected_stats.start_time)
+
+            step_stats = sorted(storage.get_step_stats_for_run(run_id), key=lambda s: s.step_key)
+            expected_step_stats = sorted(
+                build_run_step_stats_from_events(run_id, logs), key=lambda s: s.step_key
+            )
+            assert step_stats == expected_step_stats
+            assert [s.step_key for s in storage.get_step_stats_for_run(run_id, ["B", "D"])] == [
+                "B",
+                "D",
+            ]
+
+        # runs that start after the stats tables exist are tracked as their events are stored
+        tracked_run_id = make_new_run_id()
+        storage.store_event(_run_start_record(tracked_run_id, time.time() - 400))
+        assert _is_tracked(tracked_run_id)
+        for record in _stats_records(run_id=tracked_run_id):
+            storage.store_event(record)
+        _assert_stats_match_events(tracked_run_id)
+        assert storage.get_stats_for_run(tracked_run_id).steps_succeeded == 2
+        assert storage.get_stats_for_run(tracked_run_id).materializations == 3
+
+        # runs without a start event are computed from the event log until they are backfilled
+        untracked_run_id = make_new_run_id()
+        for record in _stats_records(run_id=untracked_run_id):
+            storage.store_event(record)
+        assert not _is_tracked(untracked_run_id)
+        _assert_stats_match_events(untracked_run_id)
+
+        storage.reindex_events(force=True)
+        assert _is_tracked(untracked_run_id)
+        _assert_stats_match_events(untracked_run_id)
+        _assert_stats_match_events(tracked_run_id)
+
+        storage.delete_events(tracked_run_id)
+        assert not _is_tracked(tracked_run_id)
+        assert storage.get_stats_for_run(tracked_run_id).steps_succeeded == 0
+
     def test_secondary_index(self, storage: EventLogStorage):
         if not isinstance(storage, SqlEventLogStorage) or isinstance(
             storage, InMemoryEventLogStorage
@@ -938,6 +1008,119 @@ def test_basic_get_logs_for_run(self, test_run_id, storage):
 
         assert _event_types(out_events) == _event_types(events)
 
+    def test_buffered_event_writes(self, test_run_id, storage, monkeypatch):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        monkeypatch.setenv("DAGSTER_EVENT_LOG_BUFFER_SIZE", "100")
+        monkeypatch.setenv("DAGSTER_EVENT_LOG_BUFFER_INTERVAL_SECONDS", "3600")
+
+        def _count_stored_events():
+            with storage.run_connection(run_id=test_run_id) as conn:
+                return len(
+                    conn.execute(
+                        db_select([SqlEventLogStorageTable.c.id]).where(
+                            SqlEventLogStorageTable.c.run_id == test_run_id
+                        )
+                    ).fetchall()
+                )
+
+        events, _result = _synthesize_events(return_one_op_func, run_id=test_run_id)
+        last_non_bufferable_index = max(
+            i
+            for i, event in enumerate(events)
+            if event.is_dagster_event and event.dagster_event_type not in BUFFERABLE_EVENTS
+        )
+        for event in events[: last_non_bufferable_index + 1]:
+            storage.store_event(event)
+
+        # every event up to a non-bufferable event has been written
+        assert _count_stored_events() == last_non_bufferable_index + 1
+
+        engine_event = dg.EventLogEntry(
+            error_info=None,
+            level="debug",
+            user_message="",
+            run_id=test_run_id,
+            timestamp=time.time(),
+            dagster_event=dg.DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                "nonce",
+                event_specific_data=EngineEventData.in_process(999),
+            ),
+        )
+        storage.store_event(engine_event)
+        assert _count_stored_events() == last_non_bufferable_index + 1
+
+        # reads from the same storage see buffered events
+        out_events = storage.get_logs_for_run(test_run_id)
+        assert _count_stored_events() == last_non_bufferable_index + 2
+        assert _event_types(out_events) == _event_types(
+            [*events[: last_non_bufferable_index + 1], engine_event]
+        )
+
+        # size limit
+        monkeypatch.setenv("DAGSTER_EVENT_LOG_BUFFER_SIZE", "2")
+        storage.store_event(engine_event)
+        assert _count_stored_events() == last_non_bufferable_index + 2
+        storage.store_event(engine_event)
+        assert _count_stored_events() == last_non_bufferable_index + 4
+
+        storage.store_event(engine_event)
+        storage.flush_buffered_events()
+        assert _count_stored_events() == last_non_bufferable_index + 5
+
+    def test_buffered_event_writes_flush_and_discard(self, test_run_id, storage, monkeypatch):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        monkeypatch.setenv("DAGSTER_EVENT_LOG_BUFFER_SIZE", "100")
+        monkeypatch.setenv("DAGSTER_EVENT_LOG_BUFFER_INTERVAL_SECONDS", "0.1")
+
+        def _engine_event(run_id):
+            return dg.EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message="",
+                run_id=run_id,
+                timestamp=time.time(),
+                dagster_event=dg.DagsterEvent(
+                    DagsterEventType.ENGINE_EVENT.value,
+                    "nonce",
+                    event_specific_data=EngineEventData.in_process(999),
+                ),
+            )
+
+        def _count_stored_events(run_id):
+            with storage.run_connection(run_id=run_id) as conn:
+                return len(
+                    conn.execute(
+                        db_select([SqlEventLogStorageTable.c.id]).where(
+                            SqlEventLogStorageTable.c.run_id == run_id
+                        )
+                    ).fetchall()
+                )
+
+        # buffered events are written in the background, without another event for the run
+        storage.store_event(_engine_event(test_run_id))
+        start = time.time()
+        while _count_stored_events(test_run_id) == 0 and time.time() - start < 10:
+            time.sleep(0.05)
+        assert _count_stored_events(test_run_id) == 1
+
+        # buffered events of deleted runs are dropped
+        monkeypatch.setenv("DAGSTER_EVENT_LOG_BUFFER_INTERVAL_SECONDS", "3600")
+        storage.store_event(_engine_event(test_run_id))
+        storage.delete_events(test_run_id)
+        storage.flush_buffered_events()
+        assert _count_stored_events(test_run_id) == 0
+
+        other_run_id = make_new_run_id()
+        storage.store_event(_engine_event(other_run_id))
+        storage.wipe()
+        storage.flush_buffered_events()
+        assert _count_stored_events(other_run_id) == 0
+
     def test_get_logs_for_run_cursor_limit(self, test_run_id, storage):
         events, result = _synthesize_events(return_one_op_func, run_id=test_run_id)
 
@@ -16,7 +16,7 @@
     ASSET_PARTITION_RANGE_END_TAG,
     ASSET_PARTITION_RANGE_START_TAG,
 )
-from dagster._core.test_utils import create_run_for_test
+from dagster._core.test_utils import create_run_for_test, environ
 from dagster._core.utils import make_new_run_id
 from dagster._utils import Counter, traced_counter
 
@@ -274,6 +274,64 @@ def asset1():
         assert len(materialized_keys) == 1
         assert "2022-02-01" in materialized_keys
 
+    def test_cached_status_incremental_writes(self, instance):
+        partitions_def = dg.DailyPartitionsDefinition(start_date="2022-01-01")
+
+        @dg.asset(partitions_def=partitions_def)
+        def asset1():
+            return 1
+
+        asset_key = dg.AssetKey("asset1")
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = dg.define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+
+        def _stored_status():
+            record = next(iter(instance.get_asset_records([asset_key])))
+            return record.asset_entry.cached_status
+
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-01")
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status
+        assert _stored_status() == cached_status
+
+        # rematerializing a partition advances the cursor without touching the serialized subset
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-01")
+        updated_status = get_and_update_asset_status_cache_value(
+            instance, asset_key, partitions_def
+        )
+        assert updated_status
+        assert updated_status.latest_storage_id > cached_status.latest_storage_id
+        assert (
+            updated_status.serialized_materialized_partition_subset
+            == cached_status.serialized_materialized_partition_subset
+        )
+        assert _stored_status() == updated_status
+
+        with environ({"DAGSTER_ASSET_STATUS_CACHE_WRITE_INTERVAL": "1000000"}):
+            asset_job.execute_in_process(instance=instance, partition_key="2022-02-02")
+            for _ in range(2):
+                deferred_status = get_and_update_asset_status_cache_value(
+                    instance, asset_key, partitions_def
+                )
+                assert deferred_status
+                assert set(
+                    deferred_status.deserialize_materialized_partition_subsets(
+                        partitions_def
+                    ).get_partition_keys()
+                ) == {"2022-02-01", "2022-02-02"}
+                # the write is deferred, and the new events are reapplied on every read
+                assert _stored_status() == updated_status
+
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-03")
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status
+        assert set(
+            cached_status.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+        ) == {"2022-02-01", "2022-02-02", "2022-02-03"}
+        assert _stored_status() == cached_status
+
     def test_dynamic_partitions_status_not_cached(self, instance):
         dynamic_fn = lambda _current_time: ["a_partition"]
         dynamic = dg.DynamicPartitionsDefinition(dynamic_fn)
@@ -1370,6 +1370,56 @@ def test_wipe_heartbeats(self, storage: RunStorage):
         storage.add_daemon_heartbeat(added_heartbeat)
         storage.wipe_daemon_heartbeats()
 
+    def test_daemon_leases(self, storage: RunStorage):
+        if not storage.supports_daemon_leases():
+            pytest.skip("storage does not support daemon leases")
+
+        start = create_datetime(2024, 1, 1)
+        with freeze_time(start):
+            assert storage.claim_daemon_lease("group", "a", "owner_1", 60)
+            assert storage.claim_daemon_lease("group", "b", "owner_1", 60)
+
+            # held by another owner
+            assert not storage.claim_daemon_lease("group", "a", "owner_2", 60)
+            # renewed by the same owner
+            assert storage.claim_daemon_lease("group", "a", "owner_1", 120)
+            # same key in another group
+            assert storage.claim_daemon_lease("other_group", "a", "owner_2", 60)
+
+            leases = storage.get_daemon_leases("group")
+            assert [(lease.lease_key, lease.owner_id) for lease in leases] == [
+                ("a", "owner_1"),
+                ("b", "owner_1"),
+            ]
+            assert leases[0].expiration_timestamp == start.timestamp() + 120
+            assert leases[1].expiration_timestamp == start.timestamp() + 60
+
+            # only released by its owner
+            storage.release_daemon_lease("group", "b", "owner_2")
+            assert len(storage.get_daemon_leases("group")) == 2
+            storage.release_daemon_lease("group", "b", "owner_1")
+            assert [lease.lease_key for lease in storage.get_daemon_leases("group")] == ["a"]
+            assert storage.claim_daemon_lease("group", "b", "owner_2", 60)
+
+        with freeze_time(start + timedelta(seconds=90)):
+            # "a" has not expired yet
+            assert not storage.claim_daemon_lease("group", "a", "owner_2", 60)
+
+        with freeze_time(start + timedelta(seconds=121)):
+            # expired leases can be taken over by another owner
+            assert storage.claim_daemon_lease("group", "a", "owner_2", 60)
+            assert [lease.owner_id for lease in storage.get_daemon_leases("group")] == [
+                "owner_2",
+                "owner_2",
+            ]
+
+        with freeze_time(start + timedelta(seconds=150)):
+            assert storage.claim_daemon_lease("group", "c", "owner_1", 60)
+            storage.delete_expired_daemon_leases("group")
+            assert [lease.lease_key for lease in storage.get_daemon_leases("group")] == ["a", "c"]
+            # other groups are left alone
+            assert len(storage.get_daemon_leases("other_group")) == 1
+
     def test_get_runs_not_in_backfills(self, storage: RunStorage):
         origin = self.fake_partition_set_origin("fake_partition_set")
         backfills = storage.get_backfills()
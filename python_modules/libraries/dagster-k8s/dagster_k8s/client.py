@@ -2,6 +2,7 @@
 import os
 import sys
 import time
+from collections.abc import Mapping
 from enum import Enum
 from typing import Any, Callable, Optional, TypeVar
 
@@ -495,6 +496,37 @@ def _get_job_status():
 
         return k8s_api_retry(_get_job_status, max_retries=3, timeout=wait_time_between_attempts)
 
+    def get_job_statuses_by_label(
+        self,
+        namespace: str,
+        label_selector: str,
+        wait_time_between_attempts=DEFAULT_WAIT_BETWEEN_ATTEMPTS,
+    ) -> Mapping[str, Optional[V1JobStatus]]:
+        """Get the status of every Kubernetes Job in a namespace matching a label selector, by
+        job name, with one list call per page of jobs.
+        """
+        check.str_param(namespace, "namespace")
+        check.str_param(label_selector, "label_selector")
+
+        statuses = {}
+        continue_token = None
+        while True:
+
+            def _list_jobs():
+                return self.batch_api.list_namespaced_job(
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    _continue=continue_token,
+                )
+
+            jobs = k8s_api_retry(_list_jobs, max_retries=3, timeout=wait_time_between_attempts)
+            for job in jobs.items:
+                statuses[job.metadata.name] = job.status
+
+            continue_token = jobs.metadata._continue if jobs.metadata else None  # noqa: SLF001
+            if not continue_token:
+                return statuses
+
     def delete_job(
         self,
         job_name,
@@ -1,5 +1,6 @@
 import os
-from collections.abc import Iterator
+from collections import defaultdict
+from collections.abc import Iterator, Mapping, Sequence
 from typing import Optional, cast
 
 import kubernetes.config
@@ -27,6 +28,7 @@
 )
 from dagster._utils.cached_method import cached_method
 from dagster._utils.merger import merge_dicts
+from kubernetes.client.models import V1JobStatus
 
 from dagster_k8s.client import DagsterKubernetesClient
 from dagster_k8s.container_context import K8sContainerContext
@@ -40,7 +42,7 @@
     get_user_defined_k8s_config,
 )
 from dagster_k8s.launcher import K8sRunLauncher
-from dagster_k8s.utils import get_deployment_id_label
+from dagster_k8s.utils import get_deployment_id_label, sanitize_k8s_label
 
 _K8S_EXECUTOR_CONFIG_SCHEMA = merge_dicts(
     DagsterK8sJobConfig.config_type_job(),
@@ -376,6 +378,20 @@ def launch_step(self, step_handler_context: StepHandlerContext) -> Iterator[Dags
         namespace = check.not_none(container_context.namespace)
         self._api_client.create_namespaced_job_with_retries(body=job, namespace=namespace)
 
+    def _get_health_check_result(
+        self, step_key: str, job_name: str, status: Optional[V1JobStatus]
+    ) -> CheckStepHealthResult:
+        if not status:
+            return CheckStepHealthResult.unhealthy(
+                reason=f"Kubernetes job {job_name} for step {step_key} could not be found."
+            )
+        if status.failed:
+            return CheckStepHealthResult.unhealthy(
+                reason=f"Discovered failed Kubernetes job {job_name} for step {step_key}.",
+            )
+
+        return CheckStepHealthResult.healthy()
+
     def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckStepHealthResult:
         step_key = self._get_step_key(step_handler_context)
 
@@ -387,16 +403,34 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckSt
             namespace=container_context.namespace,  # pyright: ignore[reportArgumentType]
             job_name=job_name,
         )
-        if not status:
-            return CheckStepHealthResult.unhealthy(
-                reason=f"Kubernetes job {job_name} for step {step_key} could not be found."
+        return self._get_health_check_result(step_key, job_name, status)
+
+    def check_steps_health(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> Mapping[str, CheckStepHealthResult]:
+        # the jobs of every step of a run in a namespace are listed with one call, selecting them
+        # by the run id label, rather than reading the status of each job separately
+        job_names_by_namespace_and_run_id: dict[tuple[str, str], dict[str, str]] = defaultdict(dict)
+        for step_handler_context in step_handler_contexts:
+            step_key = self._get_step_key(step_handler_context)
+            namespace = check.not_none(self._get_container_context(step_handler_context).namespace)
+            run_id = step_handler_context.execute_step_args.run_id
+            job_names_by_namespace_and_run_id[(namespace, run_id)][step_key] = (
+                self._get_k8s_step_job_name(step_handler_context)
             )
-        if status.failed:
-            return CheckStepHealthResult.unhealthy(
-                reason=f"Discovered failed Kubernetes job {job_name} for step {step_key}.",
+
+        results = {}
+        for (namespace, run_id), job_names in job_names_by_namespace_and_run_id.items():
+            statuses = self._api_client.get_job_statuses_by_label(
+                namespace=namespace,
+                label_selector=f"dagster/run-id={sanitize_k8s_label(run_id)}",
             )
+            for step_key, job_name in job_names.items():
+                results[step_key] = self._get_health_check_result(
+                    step_key, job_name, statuses.get(job_name)
+                )
 
-        return CheckStepHealthResult.healthy()
+        return results
 
     def terminate_step(self, step_handler_context: StepHandlerContext) -> Iterator[DagsterEvent]:
         step_key = self._get_step_key(step_handler_context)
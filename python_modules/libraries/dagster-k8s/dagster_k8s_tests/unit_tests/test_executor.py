@@ -842,3 +842,64 @@ def test_per_step_k8s_config_dynamic_job(k8s_run_launcher_instance: DagsterInsta
 
     assert raw_k8s_config.container_config["resources"] == FOURTH_RESOURCES_TAGS
     assert raw_k8s_config.container_config["working_dir"] == "MY_WORKING_DIR"
+
+
+@job(
+    executor_def=k8s_job_executor,
+    resource_defs={"io_manager": fs_io_manager},
+)
+def two_steps():
+    @op
+    def first():
+        return 1
+
+    @op
+    def second():
+        return 2
+
+    first()
+    second()
+
+
+def test_step_handler_check_steps_health(kubeconfig_file, k8s_instance):
+    mock_k8s_client_batch_api = mock.MagicMock()
+    handler = K8sStepHandler(
+        image="bizbuz",
+        container_context=K8sContainerContext(namespace="foo"),
+        load_incluster_config=False,
+        kubeconfig_file=kubeconfig_file,
+        k8s_client_batch_api=mock_k8s_client_batch_api,
+    )
+
+    run = create_run_for_test(
+        k8s_instance,
+        job_name="two_steps",
+        job_code_origin=reconstructable(two_steps).get_python_origin(),
+    )
+    step_handler_contexts = [
+        _step_handler_context(
+            job_def=reconstructable(two_steps),
+            dagster_run=run,
+            instance=k8s_instance,
+            executor=_get_executor(k8s_instance, reconstructable(two_steps)),
+            step=step_key,
+        )
+        for step_key in ["first", "second"]
+    ]
+
+    first_job = mock.Mock(status=mock.Mock(failed=None))
+    first_job.metadata.name = handler._get_k8s_step_job_name(step_handler_contexts[0])  # noqa: SLF001
+    mock_k8s_client_batch_api.list_namespaced_job.return_value = mock.Mock(
+        items=[first_job], metadata=mock.Mock(_continue=None)
+    )
+
+    results = handler.check_steps_health(step_handler_contexts)
+
+    # the jobs of both steps are listed with a single call
+    mock_k8s_client_batch_api.list_namespaced_job.assert_called_once_with(
+        namespace="foo", label_selector=f"dagster/run-id={run.run_id}", _continue=None
+    )
+    mock_k8s_client_batch_api.read_namespaced_job_status.assert_not_called()
+    assert results["first"].is_healthy
+    assert not results["second"].is_healthy
+    assert "could not be found" in str(results["second"].unhealthy_reason)
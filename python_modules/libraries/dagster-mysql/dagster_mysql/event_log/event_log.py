@@ -67,6 +67,7 @@ def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] =
             poolclass=db_pool.NullPool,
         )
         self._secondary_index_cache = {}
+        self._table_exists_cache: dict[str, bool] = {}
 
         table_names = retry_mysql_connection_fn(db.inspect(self._engine).get_table_names)
 
@@ -85,6 +86,8 @@ def _init_db(self) -> None:
         with self._connect() as conn:
             SqlEventLogStorageMetadata.create_all(conn)
             stamp_alembic_rev(mysql_alembic_config(__file__), conn)
+        # tables may have been added
+        self._table_exists_cache = {}
 
     def optimize_for_webserver(
         self, statement_timeout: int, pool_recycle: int, max_overflow: int
@@ -103,6 +106,8 @@ def upgrade(self) -> None:
         alembic_config = mysql_alembic_config(__file__)
         with self._connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
+        # tables may have been added
+        self._table_exists_cache = {}
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
@@ -183,8 +188,13 @@ def index_connection(self) -> ContextManager[Connection]:
         return self._connect()
 
     def has_table(self, table_name: str) -> bool:
-        with self._connect() as conn:
-            return table_name in db.inspect(conn).get_table_names()
+        # checked for every stored event, so the result is cached until the schema is upgraded
+        if table_name not in self._table_exists_cache:
+            with self._connect() as conn:
+                self._table_exists_cache[table_name] = (
+                    table_name in db.inspect(conn).get_table_names()
+                )
+        return self._table_exists_cache[table_name]
 
     def has_secondary_index(self, name: str) -> bool:
         if name not in self._secondary_index_cache:
@@ -210,6 +220,7 @@ def end_watch(self, run_id: str, handler: EventHandlerFn) -> None:
             self._event_watcher.unwatch_run(run_id, handler)
 
     def dispose(self) -> None:
+        self.close_event_write_buffer()
         if self._event_watcher:
             self._event_watcher.close()
             self._event_watcher = None
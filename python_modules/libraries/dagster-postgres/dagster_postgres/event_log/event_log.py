@@ -1,3 +1,5 @@
+import logging
+import time
 from collections.abc import Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from typing import Any, ContextManager, Optional, cast  # noqa: UP035
@@ -6,6 +8,7 @@
 import sqlalchemy as db
 import sqlalchemy.dialects as db_dialects
 import sqlalchemy.pool as db_pool
+from dagster._config import Field
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
@@ -31,9 +34,19 @@
 )
 from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._serdes import ConfigurableClass, ConfigurableClassData, deserialize_value
+from dagster._time import get_current_datetime
 from sqlalchemy import event
 from sqlalchemy.engine import Connection
 
+from dagster_postgres.event_log.event_watcher import PostgresEventWatcherNotifier
+from dagster_postgres.event_log.partitioning import (
+    EventLogPartitioning,
+    EventLogPartitionStrategy,
+    create_partitioned_event_logs_table,
+    event_log_partitioning_config,
+    is_event_logs_table_partitioned,
+    maintain_storage_id_partitions,
+)
 from dagster_postgres.utils import (
     create_pg_connection,
     pg_alembic_config,
@@ -45,6 +58,9 @@
 
 CHANNEL_NAME = "run_events"
 
+# How often each process checks that upcoming partitions of the event_logs table exist
+PARTITION_MAINTENANCE_INTERVAL_SECONDS = 60 * 60
+
 
 class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """Postgres-backed event log storage.
@@ -73,6 +89,21 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     Note that the fields in this config are :py:class:`~dagster.StringSource` and
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
 
+    Setting ``use_listen_notify: true`` in the event log storage config makes run event watchers
+    (e.g. UI subscriptions) LISTEN for the notifications sent on each stored event, so that new
+    events are delivered without waiting for the next poll. This holds one additional connection
+    open per process that watches runs.
+
+    Setting ``event_log_partitioning`` creates the ``event_logs`` table as a natively partitioned
+    table, which keeps vacuums and index maintenance proportional to the size of each partition
+    rather than to the whole table. The ``storage_id`` strategy partitions by range of storage id,
+    so that queries for the events after a cursor skip the partitions of older events. Upcoming
+    partitions are created automatically, ids past them go to a default partition, and partitions
+    whose newest event is older than ``retention_days`` are detached (or dropped, with
+    ``expired_partition_action: drop``). The ``run_id_hash`` strategy partitions by hash of the run
+    id, so that queries for the events of a run only read a single partition. Partitioning only
+    applies when the table is created; an existing ``event_logs`` table is left unpartitioned.
+
     """
 
     def __init__(
@@ -80,12 +111,18 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        use_listen_notify: bool = False,
+        event_log_partitioning: Optional[EventLogPartitioning] = None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
         )
+        self.use_listen_notify = check.bool_param(use_listen_notify, "use_listen_notify")
+        self.event_log_partitioning = check.opt_inst_param(
+            event_log_partitioning, "event_log_partitioning", EventLogPartitioning
+        )
 
         # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
         self._engine = create_engine(
@@ -94,6 +131,10 @@ def __init__(
         self._event_watcher: Optional[SqlPollingEventWatcher] = None
 
         self._secondary_index_cache = {}
+        self._table_exists_cache: dict[str, bool] = {}
+        # None until the table is checked to be partitioned by storage id, at which point this tracks
+        # when upcoming partitions were last ensured to exist
+        self._last_partition_maintenance_time: Optional[float] = None
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
         # revision because alembic config may be shared with other storage classes)
@@ -104,13 +145,63 @@ def __init__(
                 self.reindex_events()
                 self.reindex_assets()
 
+        if self._is_storage_id_partitioned():
+            self.maintain_event_log_partitions()
+
         super().__init__()
 
     def _init_db(self) -> None:
         with self._connect() as conn:
             with conn.begin():
+                if self.event_log_partitioning:
+                    # create the partitioned table first, which create_all then skips
+                    create_partitioned_event_logs_table(conn, self.event_log_partitioning)
                 SqlEventLogStorageMetadata.create_all(conn)
                 stamp_alembic_rev(pg_alembic_config(__file__), conn)
+        # tables may have been added
+        self._table_exists_cache = {}
+
+    def _is_storage_id_partitioned(self) -> bool:
+        if (
+            not self.event_log_partitioning
+            or self.event_log_partitioning.strategy != EventLogPartitionStrategy.STORAGE_ID
+        ):
+            return False
+        if self._last_partition_maintenance_time is None:
+            with self._connect() as conn:
+                if not is_event_logs_table_partitioned(conn):
+                    logging.warning(
+                        "event_log_partitioning is configured, but the existing event_logs table"
+                        " is not partitioned. Events will be stored in the unpartitioned table."
+                    )
+                    self.event_log_partitioning = None
+                    return False
+            self._last_partition_maintenance_time = 0.0
+        return True
+
+    def maintain_event_log_partitions(self) -> None:
+        """Creates the upcoming partitions of an event_logs table partitioned by storage id, and
+        detaches or drops the partitions that are past the configured retention period.
+        """
+        check.invariant(
+            self._is_storage_id_partitioned(),
+            "The event_logs table is not partitioned by storage id",
+        )
+        with self.index_transaction() as conn:
+            maintain_storage_id_partitions(
+                conn,
+                cast("EventLogPartitioning", self.event_log_partitioning),
+                get_current_datetime(),
+            )
+        self._last_partition_maintenance_time = time.monotonic()
+
+    def _maybe_maintain_event_log_partitions(self) -> None:
+        if (
+            self._last_partition_maintenance_time is not None
+            and time.monotonic() - self._last_partition_maintenance_time
+            > PARTITION_MAINTENANCE_INTERVAL_SECONDS
+        ):
+            self.maintain_event_log_partitions()
 
     def optimize_for_webserver(
         self, statement_timeout: int, pool_recycle: int, max_overflow: int
@@ -136,6 +227,8 @@ def upgrade(self) -> None:
         alembic_config = pg_alembic_config(__file__)
         with self._connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
+        # tables may have been added
+        self._table_exists_cache = {}
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
@@ -143,7 +236,11 @@ def inst_data(self) -> Optional[ConfigurableClassData]:
 
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return pg_config()
+        return {
+            **pg_config(),
+            "use_listen_notify": Field(bool, is_required=False, default_value=False),
+            "event_log_partitioning": event_log_partitioning_config(),
+        }
 
     @classmethod
     def from_config_value(
@@ -153,11 +250,19 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            use_listen_notify=config_value.get("use_listen_notify", False),
+            event_log_partitioning=(
+                EventLogPartitioning.from_config_value(config_value["event_log_partitioning"])
+                if config_value.get("event_log_partitioning")
+                else None
+            ),
         )
 
     @staticmethod
     def create_clean_storage(
-        conn_string: str, should_autocreate_tables: bool = True
+        conn_string: str,
+        should_autocreate_tables: bool = True,
+        event_log_partitioning: Optional[EventLogPartitioning] = None,
     ) -> "PostgresEventLogStorage":
         engine = create_engine(
             conn_string, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
@@ -167,7 +272,9 @@ def create_clean_storage(
         finally:
             engine.dispose()
 
-        return PostgresEventLogStorage(conn_string, should_autocreate_tables)
+        return PostgresEventLogStorage(
+            conn_string, should_autocreate_tables, event_log_partitioning=event_log_partitioning
+        )
 
     def store_event(self, event: EventLogEntry) -> None:
         """Store an event corresponding to a run.
@@ -176,6 +283,11 @@ def store_event(self, event: EventLogEntry) -> None:
             event (EventLogEntry): The event to store.
         """
         check.inst_param(event, "event", EventLogEntry)
+        if self.buffer_event_write(event):
+            return
+
+        self._maybe_maintain_event_log_partitions()
+
         insert_event_statement = self.prepare_insert_event(event)  # from SqlEventLogStorage.py
         with self._connect() as conn:
             result = conn.execute(
@@ -186,7 +298,7 @@ def store_event(self, event: EventLogEntry) -> None:
             res = result.fetchone()
             result.close()
 
-            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+            # wakes event watchers configured with `use_listen_notify`
             conn.execute(
                 db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
                 {"notify_id": res[0] + "_" + str(res[1])},  # type: ignore
@@ -210,6 +322,8 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+        self.update_run_stats_for_events([event])
+
     def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
         check.sequence_param(events, "event", of_type=EventLogEntry)
 
@@ -225,11 +339,20 @@ def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
         if len(events) == 0:
             return
 
+        for run_id in {entry.run_id for entry in events}:
+            self.flush_buffered_events(run_id)
+
+        self._maybe_maintain_event_log_partitions()
         insert_event_statement = self.prepare_insert_event_batch(events)
         with self._connect() as conn:
             result = conn.execute(insert_event_statement.returning(SqlEventLogStorageTable.c.id))
             event_ids = [cast("int", row[0]) for row in result.fetchall()]
 
+            conn.execute(
+                db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                {"notify_id": events[-1].run_id + "_" + str(event_ids[-1])},
+            )
+
         # We only update the asset table with the last event
         self.store_asset_event(events[-1], event_ids[-1])
 
@@ -238,6 +361,29 @@ def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
 
         self.store_asset_event_tags(events, event_ids)
 
+        self.update_run_stats_for_events(events)
+
+    def _write_buffered_events(self, run_id: str, events: Sequence[EventLogEntry]) -> None:
+        if not events:
+            return
+
+        self._maybe_maintain_event_log_partitions()
+        # buffered events are never asset or asset check events, so only the event log table needs
+        # to be written
+        with self._connect() as conn:
+            result = conn.execute(
+                self.prepare_insert_event_batch(events).returning(SqlEventLogStorageTable.c.id)
+            )
+            event_ids = [cast("int", row[0]) for row in result.fetchall()]
+
+            # wakes event watchers configured with `use_listen_notify`
+            conn.execute(
+                db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                {"notify_id": run_id + "_" + str(event_ids[-1])},
+            )
+
+        self.update_run_stats_for_events(events)
+
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         if not (event.dagster_event and event.dagster_event.asset_key):
@@ -331,7 +477,13 @@ def index_transaction(self) -> Iterator[Connection]:
                     yield conn
 
     def has_table(self, table_name: str) -> bool:
-        return bool(self._engine.dialect.has_table(self._engine.connect(), table_name))
+        # checked for every stored event, so the result is cached until the schema is upgraded
+        if table_name not in self._table_exists_cache:
+            with self._connect() as conn:
+                self._table_exists_cache[table_name] = bool(
+                    self._engine.dialect.has_table(conn, table_name)
+                )
+        return self._table_exists_cache[table_name]
 
     def has_secondary_index(self, name: str) -> bool:
         if name not in self._secondary_index_cache:
@@ -352,7 +504,14 @@ def watch(
         if cursor and EventLogCursor.parse(cursor).is_offset_cursor():
             check.failed("Cannot call `watch` with an offset cursor")
         if self._event_watcher is None:
-            self._event_watcher = SqlPollingEventWatcher(self)
+            self._event_watcher = SqlPollingEventWatcher(
+                self,
+                notifier=(
+                    PostgresEventWatcherNotifier(self.postgres_url, CHANNEL_NAME)
+                    if self.use_listen_notify
+                    else None
+                ),
+            )
 
         self._event_watcher.watch_run(run_id, cursor, callback)
 
@@ -370,6 +529,7 @@ def end_watch(self, run_id: str, handler: EventHandlerFn) -> None:
             self._event_watcher.unwatch_run(run_id, handler)
 
     def dispose(self) -> None:
+        self.close_event_write_buffer()
         if self._event_watcher:
             self._event_watcher.close()
             self._event_watcher = None
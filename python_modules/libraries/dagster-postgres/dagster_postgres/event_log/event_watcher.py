@@ -0,0 +1,92 @@
+import logging
+import select
+import threading
+from typing import Callable, Optional
+
+import dagster._check as check
+import psycopg2.extensions
+import sqlalchemy.pool as db_pool
+from dagster._core.storage.event_log.polling_event_watcher import EventWatcherNotifier
+from dagster._core.storage.sql import create_engine
+
+from dagster_postgres.utils import retry_pg_connection_fn
+
+# How long to block waiting for a notification before checking whether the listener should exit
+LISTEN_TIMEOUT = 1.0  # 1s
+RECONNECT_WAIT = 5.0  # 5s
+
+
+def run_id_from_notify_payload(payload: str) -> Optional[str]:
+    # payloads are formatted as `{run_id}_{storage_id}`
+    run_id, sep, _ = payload.rpartition("_")
+    return run_id if sep else None
+
+
+class PostgresEventWatcherNotifier(EventWatcherNotifier):
+    """Notification backend that wakes the event watcher using Postgres LISTEN/NOTIFY.
+
+    `PostgresEventLogStorage` issues a NOTIFY on the given channel for every stored event. This
+    notifier holds a single dedicated connection that LISTENs on that channel, reconnecting if the
+    connection is lost.
+    """
+
+    def __init__(self, postgres_url: str, channel: str):
+        self._postgres_url = check.str_param(postgres_url, "postgres_url")
+        self._channel = check.str_param(channel, "channel")
+        self._should_thread_exit = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, on_new_event: Callable[[Optional[str]], None]) -> None:
+        check.invariant(self._thread is None, "PostgresEventWatcherNotifier already started")
+        self._thread = threading.Thread(
+            target=self._listen,
+            args=(on_new_event,),
+            name="postgres-event-watch-listen",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._should_thread_exit.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _listen(self, on_new_event: Callable[[Optional[str]], None]) -> None:
+        engine = create_engine(
+            self._postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
+        )
+        try:
+            while not self._should_thread_exit.is_set():
+                try:
+                    self._listen_on_connection(engine, on_new_event)
+                except Exception:
+                    logging.exception(
+                        "Error listening for event notifications, reconnecting in %s seconds",
+                        RECONNECT_WAIT,
+                    )
+                    # missed notifications are picked up by the watcher's polling in the meantime
+                    on_new_event(None)
+                    self._should_thread_exit.wait(RECONNECT_WAIT)
+        finally:
+            engine.dispose()
+
+    def _listen_on_connection(self, engine, on_new_event: Callable[[Optional[str]], None]) -> None:
+        raw_conn = retry_pg_connection_fn(engine.raw_connection)
+        try:
+            pg_conn = raw_conn.driver_connection
+            # notifications are only delivered outside of a transaction
+            pg_conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with pg_conn.cursor() as curs:
+                curs.execute(f"LISTEN {self._channel};")
+
+            while not self._should_thread_exit.is_set():
+                if select.select([pg_conn], [], [], LISTEN_TIMEOUT) == ([], [], []):
+                    continue
+
+                pg_conn.poll()
+                while pg_conn.notifies:
+                    notify = pg_conn.notifies.pop(0)
+                    on_new_event(run_id_from_notify_payload(notify.payload))
+        finally:
+            raw_conn.close()
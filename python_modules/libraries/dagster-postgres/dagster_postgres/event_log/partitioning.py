@@ -0,0 +1,347 @@
+import logging
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, NamedTuple, Optional
+
+import dagster._check as check
+import sqlalchemy as db
+from dagster._config import Field, Selector
+from dagster._core.storage.event_log import SqlEventLogStorageTable
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+EVENT_LOGS_TABLE_NAME = "event_logs"
+# Holds the events whose storage ids are not covered by any other partition, so that inserts never
+# fail if partition maintenance falls behind
+EVENT_LOGS_DEFAULT_PARTITION_NAME = f"{EVENT_LOGS_TABLE_NAME}_default"
+
+# Arbitrary key for the advisory lock that serializes partition maintenance across processes
+EVENT_LOG_PARTITION_MAINTENANCE_LOCK_ID = 6_110_294_573
+
+
+class EventLogPartitionStrategy(Enum):
+    STORAGE_ID = "storage_id"
+    RUN_ID_HASH = "run_id_hash"
+
+
+class ExpiredPartitionAction(Enum):
+    DETACH = "detach"
+    DROP = "drop"
+
+
+def event_log_partitioning_config() -> Field:
+    return Field(
+        Selector(
+            {
+                "storage_id": {
+                    "partition_size": Field(int, is_required=False, default_value=10_000_000),
+                    "premake_partitions": Field(int, is_required=False, default_value=4),
+                    "retention_days": Field(int, is_required=False),
+                    "expired_partition_action": Field(
+                        str, is_required=False, default_value=ExpiredPartitionAction.DETACH.value
+                    ),
+                },
+                "run_id_hash": {
+                    "num_partitions": Field(int, is_required=False, default_value=16),
+                },
+            }
+        ),
+        is_required=False,
+        description=(
+            "Create the event_logs table as a natively partitioned table, either by range of storage"
+            " id or by hash of the run id. Only applies when the table is created."
+        ),
+    )
+
+
+class EventLogPartitioning(
+    NamedTuple(
+        "_EventLogPartitioning",
+        [
+            ("strategy", EventLogPartitionStrategy),
+            ("partition_size", int),
+            ("premake_partitions", int),
+            ("retention_days", Optional[int]),
+            ("expired_partition_action", ExpiredPartitionAction),
+            ("num_partitions", int),
+        ],
+    )
+):
+    """Describes how the event_logs table is partitioned.
+
+    Storage id partitioned tables are partitioned by range on the ``id`` column, with
+    ``partition_size`` storage ids per partition, so that queries for the events after a storage id
+    cursor only read the partitions that can hold them. Partitions for the next
+    ``premake_partitions`` ranges are created ahead of time, along with a default partition for any
+    id past them. Partitions whose newest event is older than ``retention_days`` are detached (or
+    dropped).
+
+    Run id partitioned tables are partitioned by hash of the ``run_id`` column into
+    ``num_partitions`` partitions, all of which are created with the table.
+    """
+
+    def __new__(
+        cls,
+        strategy: EventLogPartitionStrategy,
+        partition_size: int = 10_000_000,
+        premake_partitions: int = 4,
+        retention_days: Optional[int] = None,
+        expired_partition_action: ExpiredPartitionAction = ExpiredPartitionAction.DETACH,
+        num_partitions: int = 16,
+    ):
+        check.invariant(partition_size > 0, "partition_size must be positive")
+        check.invariant(premake_partitions >= 0, "premake_partitions must not be negative")
+        check.invariant(
+            retention_days is None or retention_days > 0, "retention_days must be positive"
+        )
+        check.invariant(num_partitions > 0, "num_partitions must be positive")
+        return super().__new__(
+            cls,
+            strategy=check.inst_param(strategy, "strategy", EventLogPartitionStrategy),
+            partition_size=partition_size,
+            premake_partitions=premake_partitions,
+            retention_days=retention_days,
+            expired_partition_action=check.inst_param(
+                expired_partition_action, "expired_partition_action", ExpiredPartitionAction
+            ),
+            num_partitions=num_partitions,
+        )
+
+    @staticmethod
+    def from_config_value(config_value: Mapping[str, Any]) -> "EventLogPartitioning":
+        check.invariant(len(config_value) == 1, "Expected exactly one partitioning strategy")
+        strategy_name, strategy_config = next(iter(config_value.items()))
+        strategy = EventLogPartitionStrategy(strategy_name)
+        if strategy == EventLogPartitionStrategy.STORAGE_ID:
+            return EventLogPartitioning(
+                strategy=strategy,
+                partition_size=strategy_config.get("partition_size", 10_000_000),
+                premake_partitions=strategy_config.get("premake_partitions", 4),
+                retention_days=strategy_config.get("retention_days"),
+                expired_partition_action=ExpiredPartitionAction(
+                    strategy_config.get(
+                        "expired_partition_action", ExpiredPartitionAction.DETACH.value
+                    )
+                ),
+            )
+        return EventLogPartitioning(
+            strategy=strategy, num_partitions=strategy_config.get("num_partitions", 16)
+        )
+
+    @property
+    def partition_column(self) -> str:
+        return "id" if self.strategy == EventLogPartitionStrategy.STORAGE_ID else "run_id"
+
+    @property
+    def partition_by_clause(self) -> str:
+        if self.strategy == EventLogPartitionStrategy.STORAGE_ID:
+            return "RANGE (id)"
+        return "HASH (run_id)"
+
+
+def _partitioned_event_logs_table(partitioning: EventLogPartitioning) -> db.Table:
+    # Postgres requires the partition key to be part of the primary key of a partitioned table, so
+    # run id partitioned tables are rebuilt with a composite (id, run_id) primary key. The id column
+    # keeps its sequence, so storage ids remain globally unique and increasing.
+    metadata = db.MetaData()
+    columns = []
+    for column in SqlEventLogStorageTable.columns:
+        if column.primary_key:
+            columns.append(
+                db.Column(column.name, column.type, primary_key=True, autoincrement=True)
+            )
+        elif column.name == partitioning.partition_column:
+            columns.append(db.Column(column.name, column.type, primary_key=True))
+        else:
+            columns.append(db.Column(column.name, column.type, nullable=column.nullable))
+
+    table = db.Table(
+        EVENT_LOGS_TABLE_NAME,
+        metadata,
+        *columns,
+        postgresql_partition_by=partitioning.partition_by_clause,
+    )
+    for index in SqlEventLogStorageTable.indexes:
+        db.Index(
+            index.name,
+            *[table.c[column.name] for column in index.columns],
+            unique=index.unique,
+            postgresql_where=index.dialect_options["postgresql"]["where"],
+        )
+    return table
+
+
+def create_partitioned_event_logs_table(conn: Connection, partitioning: EventLogPartitioning):
+    """Creates the event_logs table and its indexes as a partitioned table, along with its initial
+    partitions. Must be called before the remaining event log tables are created from the shared
+    metadata, which skips tables that already exist.
+    """
+    table = _partitioned_event_logs_table(partitioning)
+    conn.execute(CreateTable(table))
+    for index in table.indexes:
+        conn.execute(CreateIndex(index))
+
+    if partitioning.strategy == EventLogPartitionStrategy.RUN_ID_HASH:
+        for remainder in range(partitioning.num_partitions):
+            conn.execute(
+                db.text(
+                    f"CREATE TABLE {EVENT_LOGS_TABLE_NAME}_h{remainder}"
+                    f" PARTITION OF {EVENT_LOGS_TABLE_NAME}"
+                    f" FOR VALUES WITH (MODULUS {partitioning.num_partitions},"
+                    f" REMAINDER {remainder})"
+                )
+            )
+    else:
+        conn.execute(
+            db.text(
+                f"CREATE TABLE {EVENT_LOGS_DEFAULT_PARTITION_NAME}"
+                f" PARTITION OF {EVENT_LOGS_TABLE_NAME} DEFAULT"
+            )
+        )
+        create_future_storage_id_partitions(conn, partitioning)
+
+
+def is_event_logs_table_partitioned(conn: Connection) -> bool:
+    return bool(
+        conn.execute(
+            db.text(
+                "SELECT 1 FROM pg_partitioned_table pt"
+                " JOIN pg_class c ON c.oid = pt.partrelid"
+                " WHERE c.relname = :table_name AND pg_table_is_visible(c.oid)"
+            ),
+            {"table_name": EVENT_LOGS_TABLE_NAME},
+        ).fetchone()
+    )
+
+
+def get_storage_id_partition_names(conn: Connection) -> Sequence[str]:
+    """The names of the storage id range partitions, in ascending order of storage id. The default
+    partition is not included.
+    """
+    rows = conn.execute(
+        db.text(
+            "SELECT c.relname FROM pg_inherits i"
+            " JOIN pg_class c ON c.oid = i.inhrelid"
+            " JOIN pg_class p ON p.oid = i.inhparent"
+            " WHERE p.relname = :table_name AND pg_table_is_visible(p.oid)"
+        ),
+        {"table_name": EVENT_LOGS_TABLE_NAME},
+    ).fetchall()
+    return sorted(
+        row[0] for row in rows if _storage_id_partition_index_from_name(row[0]) is not None
+    )
+
+
+def _storage_id_partition_name(partition_index: int) -> str:
+    # zero padded, so that partition names sort in storage id order
+    return f"{EVENT_LOGS_TABLE_NAME}_p{partition_index:08d}"
+
+
+def _storage_id_partition_index_from_name(partition_name: str) -> Optional[int]:
+    prefix = f"{EVENT_LOGS_TABLE_NAME}_p"
+    if not partition_name.startswith(prefix):
+        return None
+    try:
+        return int(partition_name[len(prefix) :])
+    except ValueError:
+        return None
+
+
+def _get_max_storage_id(conn: Connection) -> int:
+    return conn.execute(
+        db.text(f"SELECT coalesce(max(id), 0) FROM {EVENT_LOGS_TABLE_NAME}")
+    ).scalar()
+
+
+def create_future_storage_id_partitions(
+    conn: Connection, partitioning: EventLogPartitioning
+) -> Sequence[str]:
+    """Creates the partitions covering the current storage id and the next premake_partitions
+    ranges, returning the names of the partitions that were created.
+    """
+    size = partitioning.partition_size
+    current_index = _get_max_storage_id(conn) // size
+    created = []
+    for partition_index in range(
+        current_index, current_index + partitioning.premake_partitions + 1
+    ):
+        start, end = partition_index * size, (partition_index + 1) * size
+        partition_name = _storage_id_partition_name(partition_index)
+        # a partition cannot be created over rows that were already stored in the default partition
+        if conn.execute(
+            db.text(
+                f"SELECT 1 FROM {EVENT_LOGS_DEFAULT_PARTITION_NAME}"
+                " WHERE id >= :start AND id < :end LIMIT 1"
+            ),
+            {"start": start, "end": end},
+        ).fetchone():
+            logging.warning(
+                "Storage ids %s to %s are stored in the default event log partition, so partition"
+                " %s was not created",
+                start,
+                end,
+                partition_name,
+            )
+            continue
+        result = conn.execute(
+            db.text(
+                f"CREATE TABLE IF NOT EXISTS {partition_name}"
+                f" PARTITION OF {EVENT_LOGS_TABLE_NAME}"
+                f" FOR VALUES FROM ({start}) TO ({end})"
+            )
+        )
+        result.close()
+        created.append(partition_name)
+    return created
+
+
+def remove_expired_storage_id_partitions(
+    conn: Connection, partitioning: EventLogPartitioning, now: datetime
+) -> Sequence[str]:
+    """Detaches (or drops) the partitions that are no longer written to and whose newest event is
+    older than the retention period, returning the names of the partitions that were removed.
+    """
+    if partitioning.retention_days is None:
+        return []
+
+    # event timestamps are stored as naive UTC datetimes
+    cutoff = (now - timedelta(days=partitioning.retention_days)).astimezone(timezone.utc)
+    cutoff = cutoff.replace(tzinfo=None)
+    current_index = _get_max_storage_id(conn) // partitioning.partition_size
+    removed = []
+    for partition_name in get_storage_id_partition_names(conn):
+        partition_index = _storage_id_partition_index_from_name(partition_name)
+        if partition_index is None or partition_index >= current_index:
+            continue
+        newest_timestamp = conn.execute(
+            db.text(f"SELECT timestamp FROM {partition_name} ORDER BY id DESC LIMIT 1")
+        ).scalar()
+        if newest_timestamp is not None and newest_timestamp > cutoff:
+            continue
+        conn.execute(
+            db.text(f"ALTER TABLE {EVENT_LOGS_TABLE_NAME} DETACH PARTITION {partition_name}")
+        )
+        if partitioning.expired_partition_action == ExpiredPartitionAction.DROP:
+            conn.execute(db.text(f"DROP TABLE {partition_name}"))
+        logging.info("Removed expired event log partition %s", partition_name)
+        removed.append(partition_name)
+    return removed
+
+
+def maintain_storage_id_partitions(
+    conn: Connection, partitioning: EventLogPartitioning, now: datetime
+) -> bool:
+    """Creates upcoming partitions and removes expired ones, given a connection that has begun a
+    transaction. Returns False without doing anything if another process is already maintaining
+    the partitions.
+    """
+    acquired = conn.execute(
+        db.text("SELECT pg_try_advisory_xact_lock(:lock_id)"),
+        {"lock_id": EVENT_LOG_PARTITION_MAINTENANCE_LOCK_ID},
+    ).scalar()
+    if not acquired:
+        return False
+    create_future_storage_id_partitions(conn, partitioning)
+    remove_expired_storage_id_partitions(conn, partitioning, now)
+    return True
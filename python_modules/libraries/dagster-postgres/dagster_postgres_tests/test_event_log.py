@@ -1,14 +1,28 @@
 import gc
 import time
 from contextlib import contextmanager
+from datetime import timedelta
+from unittest import mock
 
 import objgraph
 import pytest
+import sqlalchemy as db
 import yaml
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.test_utils import ensure_dagster_tests_import, instance_for_test
 from dagster._core.utils import make_new_run_id
+from dagster._time import get_current_datetime
 from dagster_postgres.event_log import PostgresEventLogStorage
+from dagster_postgres.event_log.event_log import CHANNEL_NAME
+from dagster_postgres.event_log.event_watcher import PostgresEventWatcherNotifier
+from dagster_postgres.event_log.partitioning import (
+    EVENT_LOGS_DEFAULT_PARTITION_NAME,
+    EventLogPartitioning,
+    EventLogPartitionStrategy,
+    ExpiredPartitionAction,
+    get_storage_id_partition_names,
+    maintain_storage_id_partitions,
+)
 
 ensure_dagster_tests_import()
 from dagster_tests.storage_tests.utils.event_log_storage import (
@@ -140,3 +154,163 @@ def test_load_from_config(self, hostname):
                 from_explicit = explicit_instance._event_storage  # noqa: SLF001
 
                 assert from_url.postgres_url == from_explicit.postgres_url  # pyright: ignore[reportAttributeAccessIssue]
+
+
+class TestStorageIdPartitionedPostgresEventLogStorage(TestPostgresEventLogStorage):
+    __test__ = True
+
+    @pytest.fixture(name="instance", scope="function")
+    def instance(self, conn_string):  # pyright: ignore[reportIncompatibleMethodOverride]
+        PostgresEventLogStorage.create_clean_storage(
+            conn_string,
+            event_log_partitioning=EventLogPartitioning(
+                EventLogPartitionStrategy.STORAGE_ID, partition_size=1000
+            ),
+        ).dispose()
+
+        with instance_for_test(
+            overrides={
+                "run_storage": {
+                    "module": "dagster_postgres.run_storage",
+                    "class": "PostgresRunStorage",
+                    "config": {"postgres_url": conn_string},
+                },
+                "event_log_storage": {
+                    "module": "dagster_postgres.event_log",
+                    "class": "PostgresEventLogStorage",
+                    "config": {
+                        "postgres_url": conn_string,
+                        "event_log_partitioning": {"storage_id": {"partition_size": 1000}},
+                    },
+                },
+                "schedule_storage": {
+                    "module": "dagster_postgres.schedule_storage",
+                    "class": "PostgresScheduleStorage",
+                    "config": {"postgres_url": conn_string},
+                },
+            }
+        ) as instance:
+            yield instance
+
+    def test_event_logs_table_is_partitioned(self, storage):
+        with storage.index_connection() as conn:
+            partition_names = get_storage_id_partition_names(conn)
+        # the partition for the current storage ids, and one for each of the next four ranges
+        assert len(partition_names) == 5
+
+    def test_cursor_queries_return_lagging_events(self, storage):
+        run_id = make_new_run_id()
+        storage.store_event(create_test_event_log_record("0", run_id=run_id))
+        # events are returned by storage id, regardless of how far their timestamps lag behind
+        for i in range(1, 3):
+            storage.store_event(
+                create_test_event_log_record(str(i), run_id=run_id)._replace(
+                    timestamp=time.time() - timedelta(days=30).total_seconds()
+                )
+            )
+        records = storage.get_records_for_run(run_id).records
+        assert len(records) == 3
+
+        cursor = str(EventLogCursor.from_storage_id(records[0].storage_id))
+        assert [
+            record.storage_id for record in storage.get_records_for_run(run_id, cursor).records
+        ] == [record.storage_id for record in records[1:]]
+
+
+def test_maintain_storage_id_partitions(conn_string):
+    partitioning = EventLogPartitioning(
+        EventLogPartitionStrategy.STORAGE_ID,
+        partition_size=2,
+        premake_partitions=1,
+        retention_days=3,
+        expired_partition_action=ExpiredPartitionAction.DROP,
+    )
+    storage = PostgresEventLogStorage.create_clean_storage(
+        conn_string, event_log_partitioning=partitioning
+    )
+    try:
+        run_id = make_new_run_id()
+        # ids past the premade partitions are stored in the default partition
+        for i in range(6):
+            storage.store_event(create_test_event_log_record(str(i), run_id=run_id))
+        assert len(storage.get_logs_for_run(run_id)) == 6
+        with storage.index_connection() as conn:
+            assert conn.execute(
+                db.text(f"SELECT count(*) FROM {EVENT_LOGS_DEFAULT_PARTITION_NAME}")
+            ).scalar()
+
+        now = get_current_datetime()
+        with storage.index_transaction() as conn:
+            assert maintain_storage_id_partitions(conn, partitioning, now + timedelta(days=10))
+            partition_names = get_storage_id_partition_names(conn)
+
+        # partitions whose events are past the retention period were dropped, and upcoming
+        # partitions that do not overlap the default partition were created
+        assert partition_names
+        assert "event_logs_p00000000" not in partition_names
+        assert len(storage.get_logs_for_run(run_id)) < 6
+    finally:
+        storage.dispose()
+
+
+def test_run_id_hash_partitioned_event_logs(conn_string):
+    storage = PostgresEventLogStorage.create_clean_storage(
+        conn_string,
+        event_log_partitioning=EventLogPartitioning(
+            EventLogPartitionStrategy.RUN_ID_HASH, num_partitions=4
+        ),
+    )
+    try:
+        run_ids = [make_new_run_id() for _ in range(8)]
+        for run_id in run_ids:
+            storage.store_event(create_test_event_log_record("message", run_id=run_id))
+
+        for run_id in run_ids:
+            assert len(storage.get_logs_for_run(run_id)) == 1
+
+        storage.delete_events(run_ids[0])
+        assert len(storage.get_logs_for_run(run_ids[0])) == 0
+        assert len(storage.get_logs_for_run(run_ids[1])) == 1
+    finally:
+        storage.dispose()
+
+
+def test_buffered_event_writes_notify(conn_string, monkeypatch):
+    monkeypatch.setenv("DAGSTER_EVENT_LOG_BUFFER_SIZE", "100")
+    monkeypatch.setenv("DAGSTER_EVENT_LOG_BUFFER_INTERVAL_SECONDS", "3600")
+
+    notified_run_ids = []
+    notifier = PostgresEventWatcherNotifier(conn_string, CHANNEL_NAME)
+    notifier.start(notified_run_ids.append)
+    try:
+        with _clean_storage(conn_string) as storage:
+            run_id = make_new_run_id()
+            with mock.patch.object(
+                storage,
+                "_maybe_maintain_event_log_partitions",
+                wraps=storage._maybe_maintain_event_log_partitions,  # noqa: SLF001
+            ) as maintain_partitions:
+                # wait for the notifier to start listening
+                while not notified_run_ids:
+                    storage.store_event(
+                        create_test_event_log_record("listening", run_id=make_new_run_id())
+                    )
+                    storage.flush_buffered_events()
+                    time.sleep(0.1)
+
+                storage.store_event(create_test_event_log_record("1", run_id=run_id))
+                storage.store_event(create_test_event_log_record("2", run_id=run_id))
+                assert run_id not in notified_run_ids
+                maintain_partitions.reset_mock()
+
+                storage.flush_buffered_events(run_id)
+                assert maintain_partitions.call_count == 1
+
+            attempts = 20
+            while run_id not in notified_run_ids and attempts > 0:
+                time.sleep(0.1)
+                attempts -= 1
+            assert run_id in notified_run_ids
+            assert len(storage.get_logs_for_run(run_id)) == 2
+    finally:
+        notifier.stop()